@@ -0,0 +1,76 @@
+import os
+import time
+import shutil
+import argparse
+import tempfile
+
+import numpy as np
+from paz.datasets import VOC
+
+
+description = 'Benchmark of loading VOC annotations with a compiled cache'
+parser = argparse.ArgumentParser(description=description)
+parser.add_argument('-n', '--num_images', type=int, default=5000,
+                    help='Number of synthetic annotation files')
+parser.add_argument('-r', '--repeats', type=int, default=3,
+                    help='Number of loads per method')
+args = parser.parse_args()
+
+
+OBJECT = """    <object>
+        <name>{}</name><difficult>0</difficult>
+        <bndbox><xmin>{}</xmin><ymin>{}</ymin><xmax>{}</xmax><ymax>{}</ymax>
+        </bndbox>
+    </object>
+"""
+
+
+def write_VOC(path, num_images):
+    class_names = ['cat', 'dog', 'person', 'car', 'bird']
+    annotations_path = os.path.join(path, 'VOC2007', 'Annotations')
+    split_path = os.path.join(path, 'VOC2007', 'ImageSets', 'Main')
+    os.makedirs(annotations_path)
+    os.makedirs(split_path)
+    image_names = ['%06d' % image_arg for image_arg in range(num_images)]
+    for image_name in image_names:
+        objects = []
+        for object_arg in range(np.random.randint(1, 6)):
+            x_min, y_min = np.random.randint(1, 200, 2)
+            objects.append(OBJECT.format(
+                np.random.choice(class_names), x_min, y_min,
+                x_min + 50, y_min + 50))
+        annotation = ('<annotation><filename>%s.jpg</filename><size>'
+                      '<width>500</width><height>375</height></size>\n%s'
+                      '</annotation>' % (image_name, ''.join(objects)))
+        filepath = os.path.join(annotations_path, image_name + '.xml')
+        with open(filepath, 'w') as filedata:
+            filedata.write(annotation)
+    with open(os.path.join(split_path, 'test.txt'), 'w') as filedata:
+        filedata.write('\n'.join(image_names) + '\n')
+
+
+def time_load(path, cache_path, repeats):
+    times = []
+    for repeat_arg in range(repeats):
+        start = time.perf_counter()
+        data = VOC(path, 'test', cache_path=cache_path).load_data()
+        len(data)
+        times.append(time.perf_counter() - start)
+    return 1000 * np.median(times)
+
+
+path = tempfile.mkdtemp() + '/'
+try:
+    write_VOC(path, args.num_images)
+    cache_path = os.path.join(path, 'cache')
+    start = time.perf_counter()
+    VOC(path, 'test', cache_path=cache_path).load_data()
+    compile_time = 1000 * (time.perf_counter() - start)
+    print('{:>24} {:>12}'.format('method', 'time [ms]'))
+    print('{:>24} {:>12.1f}'.format(
+        'XML parsing', time_load(path, None, args.repeats)))
+    print('{:>24} {:>12.1f}'.format('parsing and compiling', compile_time))
+    print('{:>24} {:>12.1f}'.format(
+        'compiled cache', time_load(path, cache_path, args.repeats)))
+finally:
+    shutil.rmtree(path)
@@ -0,0 +1,50 @@
+import time
+import argparse
+
+import numpy as np
+from paz import processors as pr
+
+
+description = 'Benchmark of box postprocessing with lists and Boxes2D'
+parser = argparse.ArgumentParser(description=description)
+parser.add_argument('-n', '--num_boxes', type=int, default=200,
+                    help='Number of detections per frame')
+parser.add_argument('-r', '--repeats', type=int, default=200,
+                    help='Number of processed frames per method')
+args = parser.parse_args()
+
+
+CLASS_NAMES = ['background'] + ['class_%d' % arg for arg in range(20)]
+
+
+def build_box_data(num_boxes):
+    boxes = np.random.uniform(0.0, 0.6, (num_boxes, 2))
+    sizes = np.random.uniform(0.05, 0.4, (num_boxes, 2))
+    class_scores = np.random.uniform(0.0, 1.0, (num_boxes, len(CLASS_NAMES)))
+    return np.concatenate([boxes, boxes + sizes, class_scores], axis=1)
+
+
+def postprocess(box_data, image, array_backed):
+    boxes2D = pr.ToBoxes2D(CLASS_NAMES, array_backed=array_backed)(box_data)
+    boxes2D = pr.FilterClassBoxes2D(CLASS_NAMES[1:])(boxes2D)
+    boxes2D = pr.DenormalizeBoxes2D()(image, boxes2D)
+    boxes2D = pr.OffsetBoxes2D([0.1, 0.1])(boxes2D)
+    boxes2D = pr.SquareBoxes2D()(boxes2D)
+    boxes2D = pr.ClipBoxes2D()(image, boxes2D)
+    boxes2D = pr.RoundBoxes2D()(boxes2D)
+    return pr.CropBoxes2D()(image, boxes2D)
+
+
+def time_postprocess(box_data, image, array_backed, repeats):
+    start = time.perf_counter()
+    for repeat_arg in range(repeats):
+        postprocess(box_data, image, array_backed)
+    return 1000 * (time.perf_counter() - start) / repeats
+
+
+box_data = build_box_data(args.num_boxes)
+image = np.zeros((480, 640, 3), dtype=np.uint8)
+print('{:>16} {:>16}'.format('messages', 'time/frame [ms]'))
+for name, array_backed in [('list of Box2D', False), ('Boxes2D', True)]:
+    print('{:>16} {:>16.3f}'.format(name, time_postprocess(
+        box_data, image, array_backed, args.repeats)))
@@ -0,0 +1,74 @@
+import os
+import time
+import shutil
+import argparse
+import tempfile
+
+import cv2
+import numpy as np
+from paz import processors as pr
+from paz.abstract import SequentialProcessor
+from paz.backend.image import ImageSource, ReducedImageSource, LRUImageCache
+from paz.backend.image import build_image_store
+
+
+description = 'Benchmark of the epoch time of image sources for LoadImage'
+parser = argparse.ArgumentParser(description=description)
+parser.add_argument('-n', '--num_images', type=int, default=500,
+                    help='Number of synthetic JPEG images')
+parser.add_argument('-H', '--height', type=int, default=375,
+                    help='Height of the images')
+parser.add_argument('-W', '--width', type=int, default=500,
+                    help='Width of the images')
+parser.add_argument('-s', '--size', type=int, default=300,
+                    help='Size to which images are resized')
+parser.add_argument('-e', '--epochs', type=int, default=2,
+                    help='Number of epochs per source')
+args = parser.parse_args()
+
+
+def write_images(path, num_images, shape):
+    image_paths = []
+    for image_arg in range(num_images):
+        # smooth images compress like photographs
+        image = np.random.randint(0, 256, (shape[0] // 8, shape[1] // 8, 3))
+        image = cv2.resize(image.astype(np.uint8), (shape[1], shape[0]))
+        image_path = os.path.join(path, '%06d.jpg' % image_arg)
+        cv2.imwrite(image_path, image)
+        image_paths.append(image_path)
+    return image_paths
+
+
+def time_epochs(source, image_paths, size, epochs):
+    pipeline = SequentialProcessor([
+        pr.LoadImage(source=source), pr.ResizeImage((size, size)),
+        pr.CastImage(float)])
+    times = []
+    for epoch_arg in range(epochs):
+        start = time.perf_counter()
+        for image_path in np.random.permutation(image_paths):
+            pipeline(str(image_path))
+        times.append(time.perf_counter() - start)
+    return times
+
+
+path = tempfile.mkdtemp()
+try:
+    image_paths = write_images(path, args.num_images,
+                               (args.height, args.width))
+    start = time.perf_counter()
+    store = build_image_store(image_paths, os.path.join(path, 'store'),
+                              max_size=max(args.height, args.width))
+    build_time = time.perf_counter() - start
+    sources = [('disk', ImageSource()),
+               ('LRU cache', LRUImageCache()),
+               ('sharded store', store),
+               ('reduced JPEG', ReducedImageSource((args.size, args.size)))]
+    print('store built in {:.2f} s'.format(build_time))
+    print('{:>16} {:>16} {:>16}'.format(
+        'source', 'first epoch [s]', 'last epoch [s]'))
+    for name, source in sources:
+        times = time_epochs(source, image_paths, args.size, args.epochs)
+        print('{:>16} {:>16.3f} {:>16.3f}'.format(name, times[0], times[-1]))
+finally:
+    shutil.rmtree(path)
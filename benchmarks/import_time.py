@@ -0,0 +1,43 @@
+import argparse
+import subprocess
+import sys
+
+import numpy as np
+
+
+description = 'Benchmark of the import time of paz modules'
+parser = argparse.ArgumentParser(description=description)
+parser.add_argument('-r', '--repeats', type=int, default=5,
+                    help='Number of fresh interpreters per module')
+parser.add_argument('-m', '--modules', nargs='+', default=[
+    'paz.backend.boxes', 'paz.backend.image', 'paz.abstract',
+    'paz.processors', 'paz.datasets', 'paz.pipelines', 'paz.applications',
+    'paz.models', 'tensorflow'], help='Modules to import')
+args = parser.parse_args()
+
+
+# runs in a fresh interpreter such that no module is cached
+SCRIPT = """
+import sys, time
+start = time.perf_counter()
+import {}
+print(time.perf_counter() - start, 'tensorflow' in sys.modules)
+"""
+
+
+def time_import(module_name):
+    outputs = subprocess.run(
+        [sys.executable, '-c', SCRIPT.format(module_name)],
+        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, check=True)
+    import_time, loads_tensorflow = outputs.stdout.decode().split()
+    return float(import_time), loads_tensorflow == 'True'
+
+
+print('{:>20} {:>12} {:>12}'.format('module', 'time [s]', 'tensorflow'))
+for module_name in args.modules:
+    times = []
+    for repeat_arg in range(args.repeats):
+        import_time, loads_tensorflow = time_import(module_name)
+        times.append(import_time)
+    print('{:>20} {:>12.3f} {:>12}'.format(
+        module_name, np.median(times), str(loads_tensorflow)))
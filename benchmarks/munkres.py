@@ -0,0 +1,51 @@
+import argparse
+import time
+import numpy as np
+from paz.processors import Munkres
+
+
+description = 'Benchmark of the linear assignment solver used for grouping'
+parser = argparse.ArgumentParser(description=description)
+parser.add_argument('-s', '--sizes', nargs='+', type=int,
+                    default=[30, 100, 300], help='Number of candidates')
+parser.add_argument('-r', '--repeats', type=int, default=5,
+                    help='Number of repetitions per size')
+parser.add_argument('--seed', type=int, default=777, help='Random seed')
+args = parser.parse_args()
+
+try:
+    from scipy.optimize import linear_sum_assignment
+except ImportError:
+    linear_sum_assignment = None
+
+
+def time_function(function, cost_matrix, repeats):
+    times = []
+    for repeat_arg in range(repeats):
+        start = time.perf_counter()
+        outputs = function(cost_matrix)
+        times.append(time.perf_counter() - start)
+    return np.median(times), outputs
+
+
+rng = np.random.default_rng(args.seed)
+munkres = Munkres()
+print('{:>6} {:>14} {:>14} {:>8}'.format(
+    'size', 'paz [ms]', 'scipy [ms]', 'match'))
+for size in args.sizes:
+    # tag distances as produced in GroupKeypointsByTag
+    tags = rng.normal(size=(size, 1))
+    grouped_tags = tags + rng.normal(scale=0.1, size=(size, 1))
+    cost_matrix = np.abs(tags - grouped_tags.T)
+    paz_time, assignments = time_function(
+        munkres.compute, cost_matrix, args.repeats)
+    rows, cols = np.array(assignments).T
+    paz_cost = cost_matrix[rows, cols].sum()
+    if linear_sum_assignment is None:
+        scipy_time, match = np.nan, '-'
+    else:
+        scipy_time, (rows, cols) = time_function(
+            linear_sum_assignment, cost_matrix, args.repeats)
+        match = np.isclose(paz_cost, cost_matrix[rows, cols].sum())
+    print('{:>6} {:>14.3f} {:>14.3f} {:>8}'.format(
+        size, 1000 * paz_time, 1000 * scipy_time, str(match)))
@@ -0,0 +1,53 @@
+import os
+import json
+import time
+import shutil
+import argparse
+import tempfile
+
+import numpy as np
+from paz.datasets import FAT, get_class_names
+
+
+description = 'Benchmark of parsing FAT annotations with worker processes'
+parser = argparse.ArgumentParser(description=description)
+parser.add_argument('-n', '--num_frames', type=int, default=10000,
+                    help='Number of synthetic frames per side')
+parser.add_argument('-w', '--num_workers', nargs='+', type=int,
+                    default=[0, 2, 4, os.cpu_count()],
+                    help='Number of worker processes')
+args = parser.parse_args()
+
+
+def write_FAT(path, num_frames, num_scenes=10):
+    class_names = [name + '_16k' for name in get_class_names('FAT')[1:]]
+    for scene_arg in range(num_scenes):
+        scene_path = os.path.join(path, 'mixed', 'scene_%d' % scene_arg)
+        os.makedirs(scene_path)
+        for frame_arg in range(num_frames // num_scenes):
+            for side in ['left', 'right']:
+                name = os.path.join(scene_path, '%06d.%s' % (frame_arg, side))
+                open(name + '.jpg', 'wb').close()
+                objects = []
+                for object_arg in range(np.random.randint(1, 8)):
+                    y_min, x_min = np.random.randint(0, 400, 2).tolist()
+                    objects.append({
+                        'class': str(np.random.choice(class_names)),
+                        'bounding_box': {
+                            'top_left': [y_min, x_min],
+                            'bottom_right': [y_min + 50, x_min + 50]}})
+                with open(name + '.json', 'w') as filedata:
+                    json.dump({'objects': objects}, filedata)
+
+
+path = tempfile.mkdtemp() + '/'
+try:
+    write_FAT(path, args.num_frames)
+    print('{:>12} {:>12}'.format('workers', 'time [s]'))
+    for num_workers in args.num_workers:
+        start = time.perf_counter()
+        FAT(path, num_workers=num_workers).load_data()
+        print('{:>12} {:>12.2f}'.format(
+            num_workers, time.perf_counter() - start))
+finally:
+    shutil.rmtree(path)
@@ -0,0 +1,64 @@
+import argparse
+import time
+
+import numpy as np
+from paz import processors as pr
+from paz.abstract import SequentialProcessor
+from paz.pipelines import SSDPreprocess, EfficientDetPreprocess
+from paz.pipelines import PreprocessImage
+
+
+description = 'Benchmark of fused elementwise processors in pipelines'
+parser = argparse.ArgumentParser(description=description)
+parser.add_argument('-r', '--repeats', type=int, default=50,
+                    help='Number of calls per pipeline')
+parser.add_argument('-H', '--height', type=int, default=480,
+                    help='Height of the input image')
+parser.add_argument('-W', '--width', type=int, default=640,
+                    help='Width of the input image')
+args = parser.parse_args()
+
+
+class Model(object):
+    """Stands in for a Keras model, pipelines only read its input shape."""
+    def __init__(self, size):
+        self.input_shape = (None, size, size, 3)
+
+
+def time_pipeline(pipeline, image, repeats):
+    pipeline(image)
+    times = []
+    for repeat_arg in range(repeats):
+        start = time.perf_counter()
+        pipeline(image)
+        times.append(time.perf_counter() - start)
+    return 1000 * np.median(times)
+
+
+image = np.random.randint(0, 256, (args.height, args.width, 3), 'uint8')
+pipelines = [
+    ('SSDPreprocess 300', SSDPreprocess(Model(300))),
+    ('SSDPreprocess 512', SSDPreprocess(Model(512))),
+    ('EfficientDet 512', EfficientDetPreprocess(Model(512))),
+    ('EfficientDet 1536', EfficientDetPreprocess(Model(1536))),
+    ('PreprocessImage', PreprocessImage((224, 224), pr.BGR_IMAGENET_MEAN)),
+    ('Mask tail', SequentialProcessor([
+        pr.NormalizeImage(), pr.ReplaceLowerThanThreshold(0.15),
+        pr.DenormalizeImage(), pr.CastImage('uint8')]))]
+
+print('{:>20} {:>14} {:>14} {:>14} {:>10}'.format(
+    'pipeline', 'original [ms]', 'fused [ms]', 'buffers [ms]', 'speedup'))
+for name, pipeline in pipelines:
+    fused_pipeline = pr.compile_pipeline(pipeline)
+    buffered_pipeline = pr.compile_pipeline(pipeline, reuse_buffers=True)
+    outputs = pipeline(image)
+    fused_outputs = fused_pipeline(image)
+    if isinstance(outputs, tuple):
+        outputs, fused_outputs = outputs[0], fused_outputs[0]
+    assert np.allclose(outputs, fused_outputs, atol=1e-4)
+    original_time = time_pipeline(pipeline, image, args.repeats)
+    fused_time = time_pipeline(fused_pipeline, image, args.repeats)
+    buffered_time = time_pipeline(buffered_pipeline, image, args.repeats)
+    print('{:>20} {:>14.3f} {:>14.3f} {:>14.3f} {:>9.2f}x'.format(
+        name, original_time, fused_time, buffered_time,
+        original_time / min(fused_time, buffered_time)))
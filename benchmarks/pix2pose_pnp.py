@@ -0,0 +1,102 @@
+import time
+import argparse
+
+import numpy as np
+from paz import processors as pr
+from paz.abstract import Box2D
+from paz.backend.camera import Camera
+from paz.models import UNET_VGG16
+from paz.pipelines import PIX2YCBTools6D, MultiInstanceMultiClassPIX2POSE6D
+
+
+description = ('Benchmark of correspondence subsampling and concurrent PnP '
+               'RANSAC in PIX2YCBTools6D')
+parser = argparse.ArgumentParser(description=description)
+parser.add_argument('-i', '--image_path', type=str, default=None,
+                    help='Image with YCB tools. A blank image if not given')
+parser.add_argument('-p', '--pretrained', action='store_true',
+                    help='Use PIX2YCBTools6D with its detector and weights. '
+                    'Otherwise models are randomly initialized and boxes '
+                    'are fixed')
+parser.add_argument('-r', '--repeats', type=int, default=5,
+                    help='Number of processed frames per configuration')
+parser.add_argument('-w', '--num_workers', type=int, default=4,
+                    help='Number of threads solving PnP')
+args = parser.parse_args()
+
+
+NAME_TO_SIZES = {
+    '035_power_drill': np.array([1840, 1874, 572]) / 10000,
+    '051_large_clamp': np.array([2022, 1652, 362]) / 10000,
+    '037_scissors': np.array([960, 2014, 156]) / 10000}
+
+BOXES2D = [
+    Box2D(np.array([691, 324, 850, 510]), 0.97, '037_scissors'),
+    Box2D(np.array([326, 471, 550, 679]), 0.80, '035_power_drill'),
+    Box2D(np.array([436, 453, 706, 679]), 0.88, '051_large_clamp'),
+    Box2D(np.array([210, 469, 428, 679]), 0.79, '051_large_clamp')]
+
+
+def build_pipeline(camera, pretrained):
+    if pretrained:
+        return PIX2YCBTools6D(camera, draw=False)
+    name_to_model = {}
+    for name in NAME_TO_SIZES.keys():
+        name_to_model[name] = UNET_VGG16(3, (128, 128, 3), weights=None)
+
+    def detect(image):
+        return {'boxes2D': [Box2D(box2D.coordinates, box2D.score,
+                                  box2D.class_name) for box2D in BOXES2D]}
+
+    return MultiInstanceMultiClassPIX2POSE6D(
+        detect, name_to_model, NAME_TO_SIZES, camera, [0.25, 0.25],
+        draw=False)
+
+
+def configure(pipeline, max_points, num_workers):
+    pipeline.subsample = pr.SubsampleCorrespondences(max_points)
+    pipeline.solvePnP_batch = pr.SolveChangingObjectPnPRANSACBatch(
+        pipeline.solvePnP.camera_intrinsics, num_workers=num_workers)
+
+
+def compute_points(pipeline, image):
+    boxes2D = pipeline.detect(image)['boxes2D']
+    boxes2D = pipeline.clip(image, pipeline.postprocess_boxes(boxes2D))
+    points2D, points3D = [], []
+    for crop, box2D in zip(pipeline.crop(image, boxes2D), boxes2D):
+        p2D, p3D = pipeline.estimate_points(crop, box2D)
+        points2D.append(p2D)
+        points3D.append(p3D)
+    return boxes2D, points2D, points3D
+
+
+def time_function(function, repeats):
+    function()
+    start = time.perf_counter()
+    for repeat_arg in range(repeats):
+        function()
+    return 1000 * (time.perf_counter() - start) / repeats
+
+
+if args.image_path is None:
+    image = np.zeros((720, 1280, 3), dtype=np.uint8)
+else:
+    from paz.backend.image import load_image
+    image = load_image(args.image_path)
+camera = Camera()
+camera.intrinsics_from_HFOV(55, image.shape)
+pipeline = build_pipeline(camera, args.pretrained)
+boxes2D, points2D, points3D = compute_points(pipeline, image)
+print('correspondences per object:', [len(p3D) for p3D in points3D])
+
+configurations = [(None, 0), (None, args.num_workers),
+                  (2000, 0), (500, 0), (500, args.num_workers)]
+print('{:>12} {:>8} {:>14} {:>16}'.format(
+    'max points', 'workers', 'PnP [ms]', 'frame [ms]'))
+for max_points, num_workers in configurations:
+    configure(pipeline, max_points, num_workers)
+    PnP_time = time_function(lambda: pipeline.estimate_poses(
+        boxes2D, points2D, points3D), args.repeats)
+    frame_time = time_function(lambda: pipeline(image), args.repeats)
+    print('{:>12} {:>8} {:>14.1f} {:>16.1f}'.format(
+        str(max_points), num_workers, PnP_time, frame_time))
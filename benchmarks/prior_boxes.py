@@ -0,0 +1,101 @@
+import argparse
+import os
+import tempfile
+import time
+from itertools import product
+
+import numpy as np
+from paz.backend import anchors
+from paz.models.detection import utils
+
+
+description = 'Benchmark of prior box and anchor box generation at startup'
+parser = argparse.ArgumentParser(description=description)
+parser.add_argument('-r', '--repeats', type=int, default=5,
+                    help='Number of repetitions per configuration')
+parser.add_argument('-s', '--image_sizes', nargs='+', type=int,
+                    default=[512, 896, 1536], help='EfficientDet input sizes')
+args = parser.parse_args()
+
+
+def create_prior_boxes_with_lists(configuration_name):
+    """Prior box generation with list concatenation used as reference."""
+    configuration = utils.get_prior_box_configuration(configuration_name)
+    image_size = configuration['image_size']
+    mean = []
+    for feature_map_arg, feature_map_size in enumerate(
+            configuration['feature_map_sizes']):
+        step = configuration['steps'][feature_map_arg]
+        min_size = configuration['min_sizes'][feature_map_arg]
+        max_size = configuration['max_sizes'][feature_map_arg]
+        for y, x in product(range(feature_map_size), repeat=2):
+            f_k = image_size / step
+            center_x, center_y = (x + 0.5) / f_k, (y + 0.5) / f_k
+            s_k = min_size / image_size
+            mean = mean + [center_x, center_y, s_k, s_k]
+            s_k_prime = np.sqrt(s_k * (max_size / image_size))
+            mean = mean + [center_x, center_y, s_k_prime, s_k_prime]
+            for aspect_ratio in configuration['aspect_ratios'][
+                    feature_map_arg]:
+                root_ratio = np.sqrt(aspect_ratio)
+                mean = mean + [center_x, center_y,
+                               s_k * root_ratio, s_k / root_ratio]
+                mean = mean + [center_x, center_y,
+                               s_k / root_ratio, s_k * root_ratio]
+    return np.asarray(mean).reshape((-1, 4))
+
+
+class Branch(object):
+    """Stands in for a branch tensor, anchors only read its shape."""
+    def __init__(self, size):
+        self.shape = (None, size, size, 64)
+
+
+def time_function(function, repeats, clear_cache=None):
+    times = []
+    for repeat_arg in range(repeats):
+        if clear_cache is not None:
+            clear_cache()
+        start = time.perf_counter()
+        outputs = function()
+        times.append(time.perf_counter() - start)
+    return 1000 * np.median(times), outputs
+
+
+def time_loading(boxes, repeats):
+    filepath = os.path.join(tempfile.mkdtemp(), 'boxes.npy')
+    np.save(filepath, boxes)
+    load_time, loaded_boxes = time_function(
+        lambda: np.load(filepath), repeats)
+    os.remove(filepath)
+    return load_time
+
+
+print('{:>16} {:>10} {:>12} {:>12} {:>12} {:>12}'.format(
+    'configuration', 'boxes', 'lists [ms]', 'cold [ms]',
+    'cached [ms]', 'npy [ms]'))
+for configuration_name in ['VOC', 'COCO']:
+    lists_time, reference = time_function(
+        lambda: create_prior_boxes_with_lists(configuration_name), 1)
+    cold_time, prior_boxes = time_function(
+        lambda: utils.create_prior_boxes(configuration_name), args.repeats,
+        utils._create_prior_boxes.cache_clear)
+    cached_time, prior_boxes = time_function(
+        lambda: utils.create_prior_boxes(configuration_name), args.repeats)
+    assert np.array_equal(reference, prior_boxes)
+    print('{:>16} {:>10} {:>12.2f} {:>12.2f} {:>12.3f} {:>12.3f}'.format(
+        'SSD ' + configuration_name, len(prior_boxes), lists_time,
+        cold_time, cached_time, time_loading(prior_boxes, args.repeats)))
+
+for image_size in args.image_sizes:
+    branches = [Branch(int(np.ceil(image_size / 2 ** level)))
+                for level in range(3, 8)]
+    build_args = ((image_size, image_size), branches, 3, [1.0, 2.0, 0.5], 4.)
+    cold_time, anchor_boxes = time_function(
+        lambda: anchors.build_anchors(*build_args), args.repeats,
+        anchors._build_anchors.cache_clear)
+    cached_time, anchor_boxes = time_function(
+        lambda: anchors.build_anchors(*build_args), args.repeats)
+    print('{:>16} {:>10} {:>12} {:>12.2f} {:>12.3f} {:>12.3f}'.format(
+        'EfficientDet %d' % image_size, len(anchor_boxes), '-', cold_time,
+        cached_time, time_loading(anchor_boxes, args.repeats)))
@@ -0,0 +1,67 @@
+import argparse
+import time
+import tracemalloc
+import numpy as np
+from paz.abstract import Processor, SequentialProcessor, GeneratingSequence
+from paz import processors as pr
+
+
+description = 'Benchmark of batch allocation in sequences'
+parser = argparse.ArgumentParser(description=description)
+parser.add_argument('-b', '--batch_size', type=int, default=16,
+                    help='Batch size')
+parser.add_argument('-s', '--image_size', type=int, default=512,
+                    help='Image size')
+parser.add_argument('-p', '--num_priors', type=int, default=24564,
+                    help='Number of prior boxes of the encoded boxes')
+parser.add_argument('-c', '--num_classes', type=int, default=81,
+                    help='Number of classes of the encoded boxes')
+parser.add_argument('-n', '--num_steps', type=int, default=10,
+                    help='Number of batches per measurement')
+args = parser.parse_args()
+
+
+class GenerateSample(Processor):
+    """Returns a fixed image and encoded boxes such that the benchmark
+    measures only the batching of the sequence.
+    """
+    def __init__(self, image_size, num_priors, num_classes):
+        super(GenerateSample, self).__init__()
+        self.image = np.random.randint(
+            0, 256, (image_size, image_size, 3)).astype('uint8')
+        self.boxes = np.random.rand(
+            num_priors, 4 + num_classes).astype('float32')
+
+    def call(self):
+        return self.image, self.boxes
+
+
+image_shape = [args.image_size, args.image_size, 3]
+boxes_shape = [args.num_priors, 4 + args.num_classes]
+pipeline = SequentialProcessor([
+    GenerateSample(args.image_size, args.num_priors, args.num_classes),
+    pr.SequenceWrapper({0: {'image': image_shape}},
+                       {1: {'boxes': boxes_shape}})])
+
+configurations = {
+    'float64': {},
+    'uint8/float32': {'dtypes': {'image': 'uint8', 'boxes': 'float32'}},
+    'uint8/float32 reused': {
+        'dtypes': {'image': 'uint8', 'boxes': 'float32'}, 'num_buffers': 2}}
+
+print('{:>22} {:>16} {:>16}'.format(
+    'batches', 'time [ms/batch]', 'peak alloc [MB]'))
+for name, kwargs in configurations.items():
+    sequence = GeneratingSequence(
+        pipeline, args.batch_size, args.num_steps, **kwargs)
+    for batch_index in range(2):
+        sequence[batch_index]
+    tracemalloc.start()
+    start = time.perf_counter()
+    for batch_index in range(args.num_steps):
+        inputs, labels = sequence[batch_index]
+    duration = (time.perf_counter() - start) / args.num_steps
+    allocated = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print('{:>22} {:>16.2f} {:>16.1f}'.format(
+        name, 1000 * duration, allocated / 1e6))
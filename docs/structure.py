@@ -13,6 +13,7 @@ from paz.abstract import messages
 from paz.abstract import processor
 from paz.abstract import loader
 from paz.abstract import sequence
+from paz.abstract import profiler
 from paz import models
 from paz import processors
 from paz.optimization import losses
@@ -21,6 +22,7 @@ from paz import datasets
 from paz import pipelines
 from paz.utils import logger
 from paz.utils import documentation
+from paz.utils import weights
 
 EXCLUDE = {}
 
@@ -45,18 +47,24 @@ PAGES = [
             boxes.apply_non_max_suppression,
             boxes.nms_per_class,
             boxes._nms_per_class,
+            boxes.batched_nms_per_class,
+            boxes.batched_nms_per_image,
             boxes.pre_filter_nms,
             boxes.merge_nms_box_with_class,
             boxes.suppress_other_class_scores,
             boxes.offset,
+            boxes.offset_boxes,
             boxes.clip,
+            boxes.clip_boxes,
             boxes.compute_iou,
             boxes.compute_ious,
             boxes.decode,
             boxes.denormalize_box,
+            boxes.denormalize_boxes,
             boxes.encode,
             boxes.flip_left_right,
             boxes.make_box_square,
+            boxes.make_boxes_square,
             boxes.match,
             boxes.nms_per_class,
             boxes.to_image_coordinates,
@@ -96,6 +104,8 @@ PAGES = [
             keypoints.denormalize_keypoints2D,
             keypoints.project_to_image,
             keypoints.solve_PnP_RANSAC,
+            keypoints.solve_PnP_RANSAC_batch,
+            keypoints.subsample_correspondences,
             keypoints.arguments_to_image_points2D,
             keypoints.cascade_classifier,
             keypoints.project_points3D,
@@ -159,7 +169,12 @@ PAGES = [
             (camera.VideoPlayer, [camera.VideoPlayer.step,
                                   camera.VideoPlayer.run,
                                   camera.VideoPlayer.record,
-                                  camera.VideoPlayer.record_from_file])
+                                  camera.VideoPlayer.record_from_file]),
+            (camera.AsyncVideoPlayer, [
+                camera.AsyncVideoPlayer.run,
+                camera.AsyncVideoPlayer.record,
+                camera.AsyncVideoPlayer.record_from_file,
+                camera.AsyncVideoPlayer.stop])
         ],
     },
 
@@ -194,6 +209,7 @@ PAGES = [
         'page': 'backend/image.md',
         'functions': [
             image.resize_image,
+            image.resize_image_channels,
             image.convert_color_space,
             image.load_image,
             image.show_image,
@@ -227,7 +243,17 @@ PAGES = [
             image.calculate_image_center,
             image.get_affine_transform,
             image.get_scaling_factor,
-            image.scale_resize
+            image.scale_resize,
+            image.standardize_image,
+            image.get_image_size,
+            image.compute_reduction,
+            image.build_image_store
+        ],
+        'classes': [
+            (image.ImageSource, [image.ImageSource.load]),
+            image.ReducedImageSource,
+            (image.LRUImageCache, [image.LRUImageCache.clear]),
+            image.ShardedImageStore
         ],
     },
 
@@ -356,6 +382,20 @@ PAGES = [
     },
 
 
+    {
+        'page': 'models/registry.md',
+        'classes': [
+            models.WeightsFile
+        ],
+        'functions': [
+            models.get_model,
+            models.preload_models,
+            models.warm_up_model,
+            models.clear_models
+        ],
+    },
+
+
     {
         'page': 'datasets.md',
         'classes': [
@@ -366,7 +406,14 @@ PAGES = [
             datasets.OpenImages,
             datasets.CityScapes,
             datasets.Shapes,
-            datasets.Omniglot
+            datasets.Omniglot,
+            (datasets.CompiledAnnotations, [
+                datasets.CompiledAnnotations.to_list])
+        ],
+        'functions': [
+            datasets.compile_annotations,
+            datasets.load_compiled_annotations,
+            datasets.load_cached_data
         ],
     },
 
@@ -443,7 +490,8 @@ PAGES = [
             processors.GetNonZeroArguments,
             processors.FlipLeftRightImage,
             processors.DivideStandardDeviationImage,
-            processors.ScaledResize
+            processors.ScaledResize,
+            processors.StandardizeImage
         ]
     },
 
@@ -497,9 +545,11 @@ PAGES = [
             processors.CropBoxes2D,
             processors.ToBoxes2D,
             processors.MatchBoxes,
+            processors.MatchBoxesBatch,
             processors.EncodeBoxes,
             processors.DecodeBoxes,
             processors.NonMaximumSuppressionPerClass,
+            processors.NonMaximumSuppressionPerImage,
             processors.MergeNMSBoxWithClass,
             processors.FilterBoxes,
             processors.OffsetBoxes2D,
@@ -518,6 +568,7 @@ PAGES = [
         'page': 'processors/keypoints.md',
         'classes': [
             processors.ChangeKeypointsCoordinateSystem,
+            processors.ChangeKeypointsCoordinateSystemBatch,
             processors.DenormalizeKeypoints,
             processors.NormalizeKeypoints,
             processors.PartitionKeypoints,
@@ -565,11 +616,24 @@ PAGES = [
         ]
     },
 
+    {
+        'page': 'processors/compiler.md',
+        'classes': [
+            processors.FuseElementwise
+        ],
+        'functions': [
+            processors.compile_pipeline,
+            processors.is_elementwise
+        ]
+    },
+
     {
         'page': 'processors/pose.md',
         'classes': [
             processors.SolvePNP,
             processors.SolveChangingObjectPnPRANSAC,
+            processors.SolveChangingObjectPnPRANSACBatch,
+            processors.SubsampleCorrespondences,
             processors.Translation3DFromBoxWidth
         ]
     },
@@ -646,6 +710,7 @@ PAGES = [
             pipelines.AugmentBoxes,
             pipelines.AugmentDetection,
             pipelines.PreprocessBoxes,
+            pipelines.PreprocessBoxesBatch,
             pipelines.PostprocessBoxes2D,
             pipelines.DetectSingleShot,
             pipelines.DetectHaarCascade,
@@ -653,6 +718,7 @@ PAGES = [
             pipelines.SSD512MinimalHandPose,
             pipelines.SSDPreprocess,
             pipelines.SSDPostprocess,
+            pipelines.SSDPostprocessBatch,
             pipelines.DetectSingleShotEfficientDet,
             pipelines.EfficientDetPreprocess,
             pipelines.EfficientDetPostprocess,
@@ -770,6 +836,11 @@ PAGES = [
         'page': 'abstract/messages.md',
         'classes': [
             (messages.Box2D, [messages.Box2D.contains]),
+            (messages.Boxes2D, [messages.Boxes2D.get_class_names,
+                                messages.Boxes2D.select_classes,
+                                messages.Boxes2D.to_boxes2D,
+                                messages.Boxes2D.from_boxes2D]),
+            messages.Box2DView,
             messages.Pose6D
         ]
     },
@@ -798,6 +869,22 @@ PAGES = [
         ]
     },
 
+    {
+        'page': 'abstract/profiler.md',
+        'classes': [
+            (profiler.Profiler, [
+                profiler.Profiler.start,
+                profiler.Profiler.stop,
+                profiler.Profiler.reset,
+                profiler.Profiler.to_table,
+                profiler.Profiler.to_chrome_trace])
+        ],
+        'functions': [
+            processor.set_profiler,
+            profiler.compute_output_bytes
+        ]
+    },
+
     {
         'page': 'abstract/loader.md',
         'classes': [
@@ -825,4 +912,22 @@ PAGES = [
 
     },
 
+    {
+        'page': 'utils/weights.md',
+        'classes': [
+            (weights.WeightsStore, [weights.WeightsStore.resolve,
+                                    weights.WeightsStore.prefetch,
+                                    weights.WeightsStore.verify_file])
+        ],
+        'functions': [
+            weights.get_weights_store,
+            weights.set_weights_store,
+            weights.get_weights_file,
+            weights.load_weights,
+            weights.prefetch_applications,
+            weights.compute_file_hash
+        ]
+
+    },
+
 ]
@@ -1,4 +1,10 @@
 from .loader import Loader
-from .sequence import GeneratingSequence, ProcessingSequence
-from .messages import Box2D, Pose6D
+from .messages import Box2D, Boxes2D, Box2DView, Pose6D
 from .processor import Processor, SequentialProcessor
+from .profiler import Profiler
+
+from ..utils.lazy import lazy_attributes
+
+# sequences inherit from keras and import TensorFlow
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    '.sequence': ['GeneratingSequence', 'ProcessingSequence']})
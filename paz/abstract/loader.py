@@ -1,3 +1,39 @@
+from concurrent.futures import ProcessPoolExecutor
+
+
+def _parse_shard(parse, filepaths):
+    return [parse(filepath) for filepath in filepaths]
+
+
+def parse_files(parse, filepaths, num_workers=0, shards_per_worker=4):
+    """Applies ``parse`` to every file. If ``num_workers`` is larger than
+    zero the list of files is split into contiguous shards that are parsed
+    in a process pool. Results are returned in the order of ``filepaths``.
+
+    # Arguments
+        parse: Function taking a file path. It must be picklable e.g. a
+            module function or a method of a picklable loader.
+        filepaths: List of strings with the paths of the files.
+        num_workers: Int. Number of worker processes. If ``0`` files are
+            parsed serially in the calling process.
+        shards_per_worker: Int. Number of shards per worker. More shards
+            balance files with different parsing times.
+
+    # Returns
+        List with the output of ``parse`` for each file.
+    """
+    if (num_workers == 0) or (len(filepaths) == 0):
+        return _parse_shard(parse, filepaths)
+    num_shards = min(len(filepaths), num_workers * shards_per_worker)
+    shard_size = -(-len(filepaths) // num_shards)
+    shards = [filepaths[arg:arg + shard_size]
+              for arg in range(0, len(filepaths), shard_size)]
+    with ProcessPoolExecutor(num_workers) as executor:
+        parsed_shards = executor.map(
+            _parse_shard, [parse] * len(shards), shards)
+        return [output for shard in parsed_shards for output in shard]
+
+
 class Loader(object):
     """Abstract class for loading a dataset.
 
@@ -6,6 +42,8 @@ class Loader(object):
         split: String. Dataset split e.g. traing, val, test.
         class_names: List of strings. Label names of the classes.
         name: String. Dataset name.
+        num_workers: Int. Number of processes used for parsing annotation
+            files. If ``0`` files are parsed serially.
 
     # Properties
         name: Str.
@@ -13,15 +51,18 @@ class Loader(object):
         split: Str or Flag.
         class_names: List of strings.
         num_classes: Int.
+        num_workers: Int.
 
     # Methods
         load_data()
+        parse_files()
     """
-    def __init__(self, path, split, class_names, name):
+    def __init__(self, path, split, class_names, name, num_workers=0):
         self.path = path
         self.split = split
         self.class_names = class_names
         self.name = name
+        self.num_workers = num_workers
 
     def load_data(self):
         """Abstract method for loading dataset.
@@ -32,6 +73,19 @@ class Loader(object):
         """
         raise NotImplementedError()
 
+    def parse_files(self, parse, filepaths):
+        """Parses annotation files using ``num_workers`` processes.
+        See ``parse_files``.
+
+        # Arguments
+            parse: Function taking a file path e.g. a method of the loader.
+            filepaths: List of strings with the paths of the files.
+
+        # Returns
+            List with the output of ``parse`` for each file in order.
+        """
+        return parse_files(parse, filepaths, self.num_workers)
+
     # Name of the dataset (VOC2007, COCO, OpenImagesV4, etc)
     @property
     def name(self):
@@ -1,3 +1,5 @@
+import numpy as np
+
 from ..backend.groups.quaternion import rotation_vector_to_quaternion
 
 
@@ -86,6 +88,218 @@ class Box2D(object):
         return (inside_range_x and inside_range_y)
 
 
+class Boxes2D(object):
+    """Bounding boxes 2D stored as a structure of arrays. Processors
+    transform all boxes at once instead of iterating over ``Box2D``
+    messages. Indexing with an int or iterating returns ``Box2D`` views
+    that read and write the arrays of the ``Boxes2D``.
+
+    # Arguments
+        coordinates: Array of shape ``(num_boxes, 4)`` with the
+            ``[x_min, y_min, x_max, y_max]`` coordinates.
+        scores: Float or array of shape ``(num_boxes)``.
+        class_args: Int or array of shape ``(num_boxes)`` with indices
+            into ``class_names``.
+        class_names: List of class names. Default ``[None]``.
+
+    # Properties
+        coordinates: Array of shape ``(num_boxes, 4)``.
+        scores: Array of shape ``(num_boxes)``.
+        class_args: Array of ints of shape ``(num_boxes)``.
+        class_names: List of strings.
+        centers: Array of shape ``(num_boxes, 2)``.
+        widths: Array of shape ``(num_boxes)``.
+        heights: Array of shape ``(num_boxes)``.
+
+    # Methods
+        get_class_names()
+        select_classes()
+        to_boxes2D()
+        from_boxes2D()
+    """
+    __slots__ = ('_coordinates', 'scores', 'class_args', 'class_names')
+
+    def __init__(self, coordinates, scores=1.0, class_args=0,
+                 class_names=None):
+        self.coordinates = coordinates
+        num_boxes = len(self._coordinates)
+        self.scores = np.array(np.broadcast_to(scores, num_boxes), float)
+        self.class_args = np.array(np.broadcast_to(class_args, num_boxes), int)
+        if class_names is None:
+            class_names = [None]
+        self.class_names = list(class_names)
+
+    @property
+    def coordinates(self):
+        return self._coordinates
+
+    @coordinates.setter
+    def coordinates(self, coordinates):
+        coordinates = np.asarray(coordinates).reshape(-1, 4)
+        if np.any(coordinates[:, 0] >= coordinates[:, 2]):
+            raise ValueError('Invalid coordinate input x_min >= x_max')
+        if np.any(coordinates[:, 1] >= coordinates[:, 3]):
+            raise ValueError('Invalid coordinate input y_min >= y_max')
+        self._coordinates = coordinates
+
+    @property
+    def centers(self):
+        x_centers = (self._coordinates[:, 0] + self._coordinates[:, 2]) / 2.0
+        y_centers = (self._coordinates[:, 1] + self._coordinates[:, 3]) / 2.0
+        return np.stack([x_centers, y_centers], axis=1)
+
+    @property
+    def widths(self):
+        return np.abs(self._coordinates[:, 2] - self._coordinates[:, 0])
+
+    @property
+    def heights(self):
+        return np.abs(self._coordinates[:, 3] - self._coordinates[:, 1])
+
+    def get_class_names(self):
+        """Returns the class name of every box.
+
+        # Returns
+            List of strings.
+        """
+        return [self.class_names[class_arg] for class_arg in
+                self.class_args.tolist()]
+
+    def select_classes(self, class_names):
+        """Selects the boxes of the given classes.
+
+        # Arguments
+            class_names: List of strings.
+
+        # Returns
+            Boolean array of shape ``(num_boxes)``.
+        """
+        valid_class_args = [class_arg for class_arg, class_name in
+                            enumerate(self.class_names)
+                            if class_name in class_names]
+        return np.isin(self.class_args, valid_class_args)
+
+    def __len__(self):
+        return len(self._coordinates)
+
+    def __getitem__(self, arg):
+        if isinstance(arg, (int, np.integer)):
+            if arg < 0:
+                arg = arg + len(self)
+            if not (0 <= arg < len(self)):
+                raise IndexError('Box index out of range')
+            return Box2DView(self, int(arg))
+        boxes2D = Boxes2D.__new__(Boxes2D)
+        boxes2D._coordinates = self._coordinates[arg]
+        boxes2D.scores = self.scores[arg]
+        boxes2D.class_args = self.class_args[arg]
+        boxes2D.class_names = list(self.class_names)
+        return boxes2D
+
+    def __iter__(self):
+        for arg in range(len(self)):
+            yield Box2DView(self, arg)
+
+    def __repr__(self):
+        return "Boxes2D({} boxes, {})".format(len(self), self.class_names)
+
+    def to_boxes2D(self):
+        """Copies all boxes into a list of independent ``Box2D`` messages.
+
+        # Returns
+            List of ``Box2D`` messages.
+        """
+        return [Box2D(coordinates, score, class_name) for
+                coordinates, score, class_name in zip(
+                    self._coordinates.tolist(), self.scores.tolist(),
+                    self.get_class_names())]
+
+    @classmethod
+    def from_boxes2D(cls, boxes2D, class_names=None):
+        """Builds a ``Boxes2D`` from ``Box2D`` messages.
+
+        # Arguments
+            boxes2D: List of ``Box2D`` messages.
+            class_names: List of class names. If ``None`` the class names
+                are taken in order of appearance.
+
+        # Returns
+            ``Boxes2D``.
+        """
+        class_names = [] if class_names is None else list(class_names)
+        class_to_arg = dict(zip(class_names, range(len(class_names))))
+        coordinates, scores, class_args = [], [], []
+        for box2D in boxes2D:
+            if box2D.class_name not in class_to_arg:
+                class_to_arg[box2D.class_name] = len(class_names)
+                class_names.append(box2D.class_name)
+            coordinates.append(list(box2D.coordinates))
+            scores.append(box2D.score)
+            class_args.append(class_to_arg[box2D.class_name])
+        if len(class_names) == 0:
+            class_names = None
+        return cls(np.array(coordinates).reshape(-1, 4), np.array(scores),
+                   np.array(class_args, dtype=int), class_names)
+
+
+class Box2DView(Box2D):
+    """``Box2D`` of a ``Boxes2D`` message. Its properties read and write
+    the arrays of the ``Boxes2D``.
+
+    # Arguments
+        boxes2D: ``Boxes2D`` message.
+        arg: Int. Index of the box.
+    """
+    __slots__ = ('boxes2D', 'arg')
+
+    def __init__(self, boxes2D, arg):
+        self.boxes2D = boxes2D
+        self.arg = arg
+
+    @property
+    def coordinates(self):
+        return self.boxes2D.coordinates[self.arg]
+
+    @coordinates.setter
+    def coordinates(self, coordinates):
+        x_min, y_min, x_max, y_max = coordinates
+        if x_min >= x_max:
+            raise ValueError('Invalid coordinate input x_min >= x_max')
+        if y_min >= y_max:
+            raise ValueError('Invalid coordinate input y_min >= y_max')
+        boxes, coordinates = self.boxes2D.coordinates, np.asarray(coordinates)
+        # integer boxes are promoted instead of truncating new coordinates
+        if (np.issubdtype(boxes.dtype, np.integer) and
+                not np.issubdtype(coordinates.dtype, np.integer)):
+            boxes = boxes.astype(np.result_type(boxes, coordinates))
+            self.boxes2D._coordinates = boxes
+        boxes[self.arg] = coordinates
+
+    @property
+    def score(self):
+        return self.boxes2D.scores[self.arg]
+
+    @score.setter
+    def score(self, score):
+        self.boxes2D.scores[self.arg] = score
+
+    @property
+    def class_name(self):
+        return self.boxes2D.class_names[self.boxes2D.class_args[self.arg]]
+
+    @class_name.setter
+    def class_name(self, class_name):
+        class_names = self.boxes2D.class_names
+        if class_name not in class_names:
+            class_names.append(class_name)
+        self.boxes2D.class_args[self.arg] = class_names.index(class_name)
+
+    @property
+    def center(self):
+        x_min, y_min, x_max, y_max = self.coordinates
+        return (x_min + x_max) / 2.0, (y_min + y_max) / 2.0
+
+
 class Pose6D(object):
     """ Pose estimation results with 6D coordinates.
 
@@ -1,3 +1,17 @@
+_profiler = None
+
+
+def set_profiler(profiler):
+    """Sets the profiler used by all processors. Profiling is disabled
+    when ``profiler`` is ``None``.
+
+    # Arguments
+        profiler: ``Profiler`` or ``None``.
+    """
+    global _profiler
+    _profiler = profiler
+
+
 class Processor(object):
     """Abstract class for creating a processor unit.
 
@@ -51,7 +65,9 @@ class Processor(object):
         raise NotImplementedError
 
     def __call__(self, *args, **kwargs):
-        return self.call(*args, **kwargs)
+        if _profiler is None:
+            return self.call(*args, **kwargs)
+        return _profiler.profile(self, self.call, args, kwargs)
 
 
 class SequentialProcessor(object):
@@ -104,6 +120,11 @@ class SequentialProcessor(object):
         self.processors.append(processor)
 
     def __call__(self, *args, **kwargs):
+        if _profiler is None:
+            return self._call_processors(*args, **kwargs)
+        return _profiler.profile(self, self._call_processors, args, kwargs)
+
+    def _call_processors(self, *args, **kwargs):
         # first call can take list or dictionary values.
         args = self.processors[0](*args, **kwargs)
         # further calls can be a tuple or single values.
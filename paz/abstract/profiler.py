@@ -0,0 +1,201 @@
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+from . import processor as processor_module
+
+
+def compute_output_bytes(outputs):
+    """Computes the number of bytes of the arrays in the given outputs.
+
+    # Arguments
+        outputs: Numpy array or (nested) list, tuple or dictionary with
+            numpy arrays.
+
+    # Returns
+        Int. Number of bytes of all arrays found in ``outputs``.
+    """
+    if isinstance(outputs, np.ndarray):
+        return outputs.nbytes
+    if isinstance(outputs, dict):
+        outputs = outputs.values()
+    elif not isinstance(outputs, (list, tuple)):
+        return 0
+    return sum(compute_output_bytes(output) for output in outputs)
+
+
+class Profiler(object):
+    """Records the wall time, number of calls and optionally the output
+    bytes of every ``Processor`` and ``SequentialProcessor`` called while
+    the profiler is active. Records are aggregated by the path of names of
+    the nested processors e.g. ``DetectSingleShot/Predict``.
+
+    # Arguments
+        record_bytes: Boolean. If ``True`` the bytes of the numpy arrays
+            returned by each processor are recorded.
+        max_events: Int. Maximum number of calls stored for the Chrome
+            trace. Aggregated records are always updated.
+
+    # Methods
+        start()
+        stop()
+        reset()
+        to_table()
+        to_chrome_trace()
+
+    # Example
+    ```python
+    with Profiler(record_bytes=True) as profiler:
+        detect(image)
+    print(profiler.to_table())
+    profiler.to_chrome_trace('trace.json')
+    ```
+    """
+    def __init__(self, record_bytes=False, max_events=100000):
+        self.record_bytes = record_bytes
+        self.max_events = max_events
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Removes all recorded calls."""
+        with self._lock:
+            self.records = OrderedDict()
+            self.events = []
+            self._origin = time.perf_counter()
+
+    def start(self):
+        """Activates the profiler. Only one profiler can be active."""
+        processor_module.set_profiler(self)
+        return self
+
+    def stop(self):
+        """Deactivates the profiler."""
+        processor_module.set_profiler(None)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        self.stop()
+
+    def _get_stack(self):
+        if not hasattr(self._local, 'stack'):
+            self._local.stack = []
+        return self._local.stack
+
+    def profile(self, processor, function, args, kwargs):
+        """Calls ``function`` and records it under the name of
+        ``processor`` nested inside the processors currently running.
+
+        # Arguments
+            processor: ``Processor`` or ``SequentialProcessor``.
+            function: Callable with the logic of the processor.
+            args: Tuple with the positional arguments of ``function``.
+            kwargs: Dictionary with the keyword arguments of ``function``.
+
+        # Returns
+            Outputs of ``function``.
+        """
+        stack = self._get_stack()
+        if len(stack) > 0:
+            path = stack[-1][0] + (processor.name,)
+        else:
+            path = (processor.name,)
+        frame = [path, 0.0]
+        stack.append(frame)
+        start = time.perf_counter()
+        try:
+            outputs = function(*args, **kwargs)
+        finally:
+            duration = time.perf_counter() - start
+            stack.pop()
+            if len(stack) > 0:
+                stack[-1][1] = stack[-1][1] + duration
+        num_bytes = 0
+        if self.record_bytes:
+            num_bytes = compute_output_bytes(outputs)
+        self._record(path, start, duration, frame[1], num_bytes)
+        return outputs
+
+    def _record(self, path, start, duration, children_duration, num_bytes):
+        with self._lock:
+            if path not in self.records:
+                self.records[path] = {
+                    'calls': 0, 'time': 0.0, 'self_time': 0.0, 'bytes': 0}
+            record = self.records[path]
+            record['calls'] = record['calls'] + 1
+            record['time'] = record['time'] + duration
+            record['self_time'] = (
+                record['self_time'] + duration - children_duration)
+            record['bytes'] = record['bytes'] + num_bytes
+            if len(self.events) < self.max_events:
+                self.events.append((path, start - self._origin, duration,
+                                    threading.get_ident(), num_bytes))
+
+    def _sort_paths(self):
+        children = OrderedDict()
+        for path in self.records:
+            children.setdefault(path[:-1], []).append(path)
+        sorted_paths = []
+
+        def add_children(parent_path):
+            for path in children.get(parent_path, []):
+                sorted_paths.append(path)
+                add_children(path)
+        add_children(())
+        return sorted_paths
+
+    def to_table(self):
+        """Exports the aggregated records as a text table in which nested
+        processors are indented below their parents.
+
+        # Returns
+            String.
+        """
+        header = '{:<48} {:>8} {:>12} {:>12} {:>12}'.format(
+            'processor', 'calls', 'total [ms]', 'mean [ms]', 'self [ms]')
+        if self.record_bytes:
+            header = header + ' {:>12}'.format('output [MB]')
+        rows = [header, '-' * len(header)]
+        for path in self._sort_paths():
+            record = self.records[path]
+            name = '  ' * (len(path) - 1) + path[-1]
+            total_time = 1000.0 * record['time']
+            row = '{:<48} {:>8d} {:>12.3f} {:>12.3f} {:>12.3f}'.format(
+                name[:48], record['calls'], total_time,
+                total_time / record['calls'], 1000.0 * record['self_time'])
+            if self.record_bytes:
+                row = row + ' {:>12.3f}'.format(record['bytes'] / 1e6)
+            rows.append(row)
+        return '\n'.join(rows)
+
+    def to_chrome_trace(self, filepath=None):
+        """Exports the recorded calls in the Chrome trace event format,
+        which can be opened in ``chrome://tracing`` or Perfetto.
+
+        # Arguments
+            filepath: String. If given the trace is written as JSON.
+
+        # Returns
+            Dictionary with the trace events.
+        """
+        trace_events = []
+        for path, start, duration, thread_id, num_bytes in self.events:
+            event = {'name': path[-1], 'cat': '/'.join(path[:-1]),
+                     'ph': 'X', 'ts': 1e6 * start, 'dur': 1e6 * duration,
+                     'pid': os.getpid(), 'tid': thread_id,
+                     'args': {'path': '/'.join(path)}}
+            if self.record_bytes:
+                event['args']['bytes'] = num_bytes
+            trace_events.append(event)
+        trace = {'traceEvents': trace_events, 'displayTimeUnit': 'ms'}
+        if filepath is not None:
+            with open(filepath, 'w') as filedata:
+                json.dump(trace, filedata)
+        return trace
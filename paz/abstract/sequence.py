@@ -1,10 +1,84 @@
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+import multiprocessing
+import random
+import threading
+
 from tensorflow.keras.utils import Sequence
 import numpy as np
 from .processor import SequentialProcessor
 
 
+_WORKER_PIPELINE = None
+
+
+def seed_worker(seed, worker_arg):
+    """Seeds the global random number generators of a worker such that
+    every worker draws an independent stream of random numbers.
+
+    # Arguments
+        seed: Int or ``None``. Base seed shared by all workers. If ``None``
+            fresh entropy is taken from the operating system.
+        worker_arg: Int. Index of the worker.
+    """
+    seed_sequence = np.random.SeedSequence(seed, spawn_key=(worker_arg,))
+    numpy_seed, python_seed = seed_sequence.generate_state(2)
+    np.random.seed(numpy_seed)
+    random.seed(int(python_seed))
+
+
+def _initialize_worker(pipeline, seed, worker_counter):
+    global _WORKER_PIPELINE
+    _WORKER_PIPELINE = pipeline
+    with worker_counter.get_lock():
+        worker_arg = worker_counter.value
+        worker_counter.value = worker_counter.value + 1
+    seed_worker(seed, worker_arg)
+
+
+def _process_sample(*args):
+    return _WORKER_PIPELINE(*args)
+
+
 class SequenceExtra(Sequence):
-    def __init__(self, pipeline, batch_size, as_list=False):
+    """Base sequence that dispatches the outputs of a ``pipeline`` in
+    batches.
+
+    # Arguments
+        pipeline: ``SequentialProcessor`` ending in a ``SequenceWrapper``.
+        batch_size: Int.
+        as_list: Bool, if True ``inputs`` and ``labels`` are dispatched as
+            lists. If false ``inputs`` and ``labels`` are dispatched as
+            dictionaries.
+        num_workers: Int. Number of workers used for processing the
+            samples of a batch in parallel. If ``0`` samples are processed
+            serially in the calling thread.
+        use_multiprocessing: Bool. If True workers are processes, otherwise
+            threads. Processes scale with the number of cores but require
+            a picklable ``pipeline`` and samples. Threads only scale for
+            processors that release the GIL e.g. OpenCV and numpy calls.
+        prefetch: Int. Number of batches following the requested one that
+            are submitted to the workers ahead of time.
+        seed: Int or ``None``. Base seed of the worker processes. Every
+            process seeds ``numpy`` and ``random`` with its own stream
+            derived from ``seed`` and its worker index.
+        dtypes: Dictionary with input or label names as keys and their
+            batch dtypes as values e.g. ``{'image': 'uint8'}``. Names not
+            given are batched as ``float64``.
+        num_buffers: Int. Number of batch buffers that are allocated once
+            and reused in turns. A returned batch is overwritten after
+            ``num_buffers`` further batches are requested. If ``0`` new
+            arrays are allocated for every batch.
+        batch_processors: Dictionary with input or label names as keys and
+            functions as values. A function receives the list with the
+            values of all samples of a batch and returns their batch array
+            e.g. ``PreprocessBoxesBatch``. If ``None`` the
+            ``batch_processors`` of the ``pipeline`` are used if it has any.
+    """
+    def __init__(self, pipeline, batch_size, as_list=False, num_workers=0,
+                 use_multiprocessing=False, prefetch=0, seed=None,
+                 dtypes=None, num_buffers=0, batch_processors=None):
         if not isinstance(pipeline, SequentialProcessor):
             raise ValueError('``processor`` must be a ``SequentialProcessor``')
         self.output_wrapper = pipeline.processors[-1]
@@ -15,19 +89,165 @@ class SequenceExtra(Sequence):
         self.ordered_label_names = self.output_wrapper.ordered_label_names
         self.batch_size = batch_size
         self.as_list = as_list
+        if (num_workers == 0) and (prefetch > 0):
+            raise ValueError('``prefetch`` requires ``num_workers`` > 0')
+        self.num_workers = num_workers
+        self.use_multiprocessing = use_multiprocessing
+        self.prefetch = prefetch
+        self.seed = seed
+        self.dtypes = {} if dtypes is None else dtypes
+        self.num_buffers = num_buffers
+        if batch_processors is None:
+            batch_processors = getattr(pipeline, 'batch_processors', {})
+        self.batch_processors = batch_processors
+        self._executor = None
+        self._prefetched = OrderedDict()
+        self._buffers = []
+        self._buffer_arg = 0
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_executor'] = None
+        state['_prefetched'] = OrderedDict()
+        state['_buffers'] = []
+        state['_buffer_arg'] = 0
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def _get_executor(self):
+        if self._executor is None:
+            if self.use_multiprocessing:
+                worker_counter = multiprocessing.Value('i', 0)
+                self._executor = ProcessPoolExecutor(
+                    self.num_workers, initializer=_initialize_worker,
+                    initargs=(self.pipeline, self.seed, worker_counter))
+            else:
+                self._executor = ThreadPoolExecutor(self.num_workers)
+        return self._executor
+
+    def close(self):
+        """Cancels all prefetched batches and shuts down the workers.
+        """
+        with self._lock:
+            for futures in self._prefetched.values():
+                self._cancel(futures)
+            self._prefetched.clear()
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+    def _cancel(self, futures):
+        for future in futures:
+            future.cancel()
+
+    def _submit_batch(self, batch_index):
+        executor = self._get_executor()
+        if self.use_multiprocessing:
+            function = _process_sample
+        else:
+            function = self.pipeline
+        futures = []
+        for args in self._get_samples_arguments(batch_index):
+            futures.append(executor.submit(function, *args))
+        return futures
+
+    def _pop_prefetched(self, batch_index):
+        return self._prefetched.pop(batch_index, None)
+
+    def _update_prefetched(self, batch_index):
+        window_start = batch_index + 1
+        window_stop = min(window_start + self.prefetch, len(self))
+        prefetch_indices = range(window_start, window_stop)
+        for prefetch_index in list(self._prefetched.keys()):
+            if prefetch_index not in prefetch_indices:
+                self._cancel(self._prefetched.pop(prefetch_index))
+        for prefetch_index in prefetch_indices:
+            if prefetch_index not in self._prefetched:
+                futures = self._submit_batch(prefetch_index)
+                self._prefetched[prefetch_index] = futures
+
+    def _get_samples_arguments(self, batch_index):
+        """Returns a list with the arguments given to the ``pipeline``
+        for every sample of the batch.
+        """
+        raise NotImplementedError
+
+    def process_samples(self, batch_index):
+        """Runs the ``pipeline`` for every sample of the batch.
+
+        # Arguments
+            batch_index: Int.
+
+        # Returns
+            List of processed samples.
+        """
+        if self.num_workers == 0:
+            samples = []
+            for args in self._get_samples_arguments(batch_index):
+                samples.append(self.pipeline(*args))
+            return samples
+
+        with self._lock:
+            futures = self._pop_prefetched(batch_index)
+            if futures is None:
+                futures = self._submit_batch(batch_index)
+            if self.prefetch > 0:
+                self._update_prefetched(batch_index)
+        return [future.result() for future in futures]
 
     def make_empty_batches(self, name_to_shape):
         batch = {}
         for name, shape in name_to_shape.items():
-            batch[name] = np.zeros((self.batch_size, *shape))
+            dtype = self.dtypes.get(name, np.float64)
+            batch[name] = np.zeros((self.batch_size, *shape), dtype=dtype)
         return batch
 
+    def _get_empty_batches(self):
+        if self.num_buffers == 0:
+            inputs = self.make_empty_batches(self.inputs_name_to_shape)
+            labels = self.make_empty_batches(self.labels_name_to_shape)
+            return inputs, labels
+        with self._lock:
+            buffer_arg = self._buffer_arg
+            self._buffer_arg = (buffer_arg + 1) % self.num_buffers
+            if buffer_arg == len(self._buffers):
+                inputs = self.make_empty_batches(self.inputs_name_to_shape)
+                labels = self.make_empty_batches(self.labels_name_to_shape)
+                self._buffers.append((inputs, labels))
+            return self._buffers[buffer_arg]
+
     def _to_list(self, batch, names):
         return [batch[name] for name in names]
 
     def _place_sample(self, sample, sample_arg, batch):
         for name, data in sample.items():
-            batch[name][sample_arg] = data
+            if name not in self.batch_processors:
+                batch[name][sample_arg] = data
+
+    def _place_batch_processed(self, samples, key, batch):
+        for name, values in batch.items():
+            if name in self.batch_processors:
+                sample_values = [sample[key][name] for sample in samples]
+                values[:len(samples)] = self.batch_processors[name](
+                    sample_values)
+
+    def _place_samples(self, samples, inputs, labels):
+        for sample_arg, sample in enumerate(samples):
+            self._place_sample(sample['inputs'], sample_arg, inputs)
+            self._place_sample(sample['labels'], sample_arg, labels)
+        if len(samples) > 0:
+            self._place_batch_processed(samples, 'inputs', inputs)
+            self._place_batch_processed(samples, 'labels', labels)
+        if self.num_buffers > 0:
+            for batch in [inputs, labels]:
+                for values in batch.values():
+                    values[len(samples):] = 0
+        return inputs, labels
 
     def _get_unprocessed_batch(self, data, batch_index):
         batch_arg_A = self.batch_size * (batch_index)
@@ -36,8 +256,7 @@ class SequenceExtra(Sequence):
         return unprocessed_batch
 
     def __getitem__(self, batch_index):
-        inputs = self.make_empty_batches(self.inputs_name_to_shape)
-        labels = self.make_empty_batches(self.labels_name_to_shape)
+        inputs, labels = self._get_empty_batches()
         inputs, labels = self.process_batch(inputs, labels, batch_index)
         if self.as_list:
             inputs = self._to_list(inputs, self.ordered_input_names)
@@ -58,23 +277,41 @@ class ProcessingSequence(SequenceExtra):
         as_list: Bool, if True ``inputs`` and ``labels`` are dispatched as
             lists. If false ``inputs`` and ``labels`` are dispatched as
             dictionaries.
+        num_workers: Int. Number of workers processing the samples of a
+            batch in parallel. If ``0`` samples are processed serially.
+        use_multiprocessing: Bool. If True workers are processes, otherwise
+            threads.
+        prefetch: Int. Number of following batches processed ahead of
+            time. Prefetched batches are only used if batches are requested
+            in order e.g. ``model.fit(..., shuffle=False)``.
+        seed: Int or ``None``. Base seed of the worker processes.
+        dtypes: Dictionary with input or label names as keys and their
+            batch dtypes as values. Names not given are batched as
+            ``float64``.
+        num_buffers: Int. Number of batch buffers reused in turns. If ``0``
+            new arrays are allocated for every batch.
+        batch_processors: Dictionary with input or label names as keys and
+            functions processing the values of a whole batch as values.
     """
-    def __init__(self, processor, batch_size, data, as_list=False):
+    def __init__(self, processor, batch_size, data, as_list=False,
+                 num_workers=0, use_multiprocessing=False, prefetch=0,
+                 seed=None, dtypes=None, num_buffers=0, batch_processors=None):
         self.data = data
         super(ProcessingSequence, self).__init__(
-            processor, batch_size, as_list)
+            processor, batch_size, as_list, num_workers,
+            use_multiprocessing, prefetch, seed, dtypes, num_buffers,
+            batch_processors)
 
     def __len__(self):
         return int(np.ceil(len(self.data) / float(self.batch_size)))
 
-    def process_batch(self, inputs, labels, batch_index):
+    def _get_samples_arguments(self, batch_index):
         unprocessed_batch = self._get_unprocessed_batch(self.data, batch_index)
+        return [(sample.copy(),) for sample in unprocessed_batch]
 
-        for sample_arg, unprocessed_sample in enumerate(unprocessed_batch):
-            sample = self.pipeline(unprocessed_sample.copy())
-            self._place_sample(sample['inputs'], sample_arg, inputs)
-            self._place_sample(sample['labels'], sample_arg, labels)
-        return inputs, labels
+    def process_batch(self, inputs, labels, batch_index):
+        samples = self.process_samples(batch_index)
+        return self._place_samples(samples, inputs, labels)
 
 
 class GeneratingSequence(SequenceExtra):
@@ -87,18 +324,49 @@ class GeneratingSequence(SequenceExtra):
         as_list: Bool, if True ``inputs`` and ``labels`` are dispatched as
             lists. If false ``inputs`` and ``labels`` are dispatched as
             dictionaries.
+        num_workers: Int. Number of workers generating the samples of a
+            batch in parallel. If ``0`` samples are generated serially.
+        use_multiprocessing: Bool. If True workers are processes, otherwise
+            threads.
+        prefetch: Int. Number of batches generated ahead of time. Since
+            generated batches do not depend on the batch index any
+            prefetched batch is used for the next request.
+        seed: Int or ``None``. Base seed of the worker processes.
+        dtypes: Dictionary with input or label names as keys and their
+            batch dtypes as values. Names not given are batched as
+            ``float64``.
+        num_buffers: Int. Number of batch buffers reused in turns. If ``0``
+            new arrays are allocated for every batch.
+        batch_processors: Dictionary with input or label names as keys and
+            functions processing the values of a whole batch as values.
     """
-    def __init__(self, processor, batch_size, num_steps, as_list=False):
+    def __init__(self, processor, batch_size, num_steps, as_list=False,
+                 num_workers=0, use_multiprocessing=False, prefetch=0,
+                 seed=None, dtypes=None, num_buffers=0, batch_processors=None):
         self.num_steps = num_steps
         super(GeneratingSequence, self).__init__(
-            processor, batch_size, as_list)
+            processor, batch_size, as_list, num_workers,
+            use_multiprocessing, prefetch, seed, dtypes, num_buffers,
+            batch_processors)
+        self._num_submitted = 0
 
     def __len__(self):
         return self.num_steps
 
+    def _get_samples_arguments(self, batch_index):
+        return [() for sample_arg in range(self.batch_size)]
+
+    def _pop_prefetched(self, batch_index):
+        if len(self._prefetched) == 0:
+            return None
+        return self._prefetched.popitem(last=False)[1]
+
+    def _update_prefetched(self, batch_index):
+        while len(self._prefetched) < self.prefetch:
+            futures = self._submit_batch(batch_index)
+            self._prefetched[self._num_submitted] = futures
+            self._num_submitted = self._num_submitted + 1
+
     def process_batch(self, inputs, labels, batch_index):
-        for sample_arg in range(self.batch_size):
-            sample = self.pipeline()
-            self._place_sample(sample['inputs'], sample_arg, inputs)
-            self._place_sample(sample['labels'], sample_arg, labels)
-        return inputs, labels
+        samples = self.process_samples(batch_index)
+        return self._place_samples(samples, inputs, labels)
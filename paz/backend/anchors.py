@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 import numpy as np
 from .boxes import to_center_form
 
@@ -10,6 +12,8 @@ def build_anchors(image_shape, branches, num_scales, aspect_ratios, scale):
     define regions of image where objects are likely to be found. They
     help object detector to accurately localize and classify objects at
     the same time handling variations in object size and shape.
+    Anchor boxes are computed once per configuration and branch shapes
+    in every process and copies are returned for every following call.
 
     # Arguments
         image_shape: List, input image shape.
@@ -21,18 +25,29 @@ def build_anchors(image_shape, branches, num_scales, aspect_ratios, scale):
     # Returns
         anchor_boxes: Array of shape `(num_boxes, 4)`.
     """
+    feature_shapes = tuple(
+        tuple(int(size) for size in branch.shape[1:3]) for branch in branches)
+    anchor_boxes = _build_anchors(tuple(image_shape), feature_shapes,
+                                  num_scales, tuple(aspect_ratios), scale)
+    return anchor_boxes.copy()
+
+
+@lru_cache(maxsize=32)
+def _build_anchors(image_shape, feature_shapes, num_scales,
+                   aspect_ratios, scale):
     num_scale_aspect = num_scales * len(aspect_ratios)
-    args = (image_shape, branches, num_scale_aspect)
     octave = build_octaves(num_scales, aspect_ratios)
     aspect = build_aspect(num_scales, aspect_ratios)
     scales = build_scales(scale, num_scale_aspect)
     anchor_boxes = []
-    for branch_arg in range(len(branches)):
-        stride = build_strides(branch_arg, *args)
+    for feature_shape in feature_shapes:
+        stride = _compute_strides(image_shape, feature_shape, num_scale_aspect)
         boxes = make_branch_boxes(*stride, octave, aspect, scales, image_shape)
         anchor_boxes.append(boxes.reshape([-1, 4]))
     anchor_boxes = np.concatenate(anchor_boxes, axis=0).astype('float32')
-    return to_center_form(anchor_boxes)
+    anchor_boxes = to_center_form(anchor_boxes)
+    anchor_boxes.flags.writeable = False
+    return anchor_boxes
 
 
 def build_octaves(num_scales, aspect_ratios):
@@ -168,8 +183,13 @@ def build_strides(branch_arg, image_shape, branches, num_scale_aspect):
     # Returns
         Tuple: Containing strides in y and x direction.
     """
+    feature_shape = branches[branch_arg].shape[1:3]
+    return _compute_strides(image_shape, feature_shape, num_scale_aspect)
+
+
+def _compute_strides(image_shape, feature_shape, num_scale_aspect):
     H_image, W_image = image_shape
-    feature_H, feature_W = branches[branch_arg].shape[1:3]
+    feature_H, feature_W = feature_shape
     features_H = np.repeat(feature_H, num_scale_aspect).astype('float32')
     features_W = np.repeat(feature_W, num_scale_aspect).astype('float32')
     strides_y = H_image / features_H
@@ -192,11 +212,17 @@ def make_branch_boxes(stride_y, stride_x, octave,
     # Returns
         branch_boxes: Array of shape `(num_boxes,num_scale_aspect,4)`.
     """
-    branch_boxes = []
-    for branch_config in zip(stride_y, stride_x, scales, octave, aspect):
-        boxes = compute_box_coordinates(image_shape, *branch_config)
-        branch_boxes.append(np.expand_dims(boxes.T, axis=1))
-    branch_boxes = np.concatenate(branch_boxes, axis=1)
+    base_anchor = build_base_anchor(stride_y, stride_x, scales, octave)
+    aspect_size = compute_aspect_size(aspect)
+    anchor_half_W, anchor_half_H = compute_anchor_dims(
+        *base_anchor, *aspect_size, image_shape)
+    center_x, center_y = compute_anchor_centres(
+        stride_y[0], stride_x[0], image_shape)
+    x_min = center_x[:, None] - anchor_half_W
+    y_min = center_y[:, None] - anchor_half_H
+    x_max = center_x[:, None] + anchor_half_W
+    y_max = center_y[:, None] + anchor_half_H
+    branch_boxes = np.stack((x_min, y_min, x_max, y_max), axis=2)
     return branch_boxes
 
 
@@ -5,36 +5,38 @@ def to_center_form(boxes):
     """Transform from corner coordinates to center coordinates.
 
     # Arguments
-        boxes: Numpy array with shape `(num_boxes, 4)`.
+        boxes: Numpy array with shape `(num_boxes, 4)` or
+            `(batch_size, num_boxes, 4)`.
 
     # Returns
-        Numpy array with shape `(num_boxes, 4)`.
+        Numpy array with the same shape as `boxes`.
     """
-    x_min, y_min = boxes[:, 0:1], boxes[:, 1:2]
-    x_max, y_max = boxes[:, 2:3], boxes[:, 3:4]
+    x_min, y_min = boxes[..., 0:1], boxes[..., 1:2]
+    x_max, y_max = boxes[..., 2:3], boxes[..., 3:4]
     center_x = (x_max + x_min) / 2.0
     center_y = (y_max + y_min) / 2.0
     W = x_max - x_min
     H = y_max - y_min
-    return np.concatenate([center_x, center_y, W, H], axis=1)
+    return np.concatenate([center_x, center_y, W, H], axis=-1)
 
 
 def to_corner_form(boxes):
     """Transform from center coordinates to corner coordinates.
 
     # Arguments
-        boxes: Numpy array with shape `(num_boxes, 4)`.
+        boxes: Numpy array with shape `(num_boxes, 4)` or
+            `(batch_size, num_boxes, 4)`.
 
     # Returns
-        Numpy array with shape `(num_boxes, 4)`.
+        Numpy array with the same shape as `boxes`.
     """
-    center_x, center_y = boxes[:, 0:1], boxes[:, 1:2]
-    W, H = boxes[:, 2:3], boxes[:, 3:4]
+    center_x, center_y = boxes[..., 0:1], boxes[..., 1:2]
+    W, H = boxes[..., 2:3], boxes[..., 3:4]
     x_min = center_x - (W / 2.0)
     x_max = center_x + (W / 2.0)
     y_min = center_y - (H / 2.0)
     y_max = center_y + (H / 2.0)
-    return np.concatenate([x_min, y_min, x_max, y_max], axis=1)
+    return np.concatenate([x_min, y_min, x_max, y_max], axis=-1)
 
 
 def encode(matched, priors, variances=[0.1, 0.1, 0.2, 0.2]):
@@ -42,51 +44,54 @@ def encode(matched, priors, variances=[0.1, 0.1, 0.2, 0.2]):
     boxes we have matched (based on jaccard overlap) with the prior boxes.
 
     # Arguments
-        matched: Numpy array of shape `(num_priors, 4)` with boxes in
-            point-form.
+        matched: Numpy array of shape `(num_priors, 4)` or
+            `(batch_size, num_priors, 4)` with boxes in point-form.
         priors: Numpy array of shape `(num_priors, 4)` with boxes in
             center-form.
         variances: (list[float]) Variances of priorboxes
 
     # Returns
-        encoded boxes: Numpy array of shape `(num_priors, 4)`.
+        encoded boxes: Numpy array of shape `(num_priors, 4)` or
+            `(batch_size, num_priors, 4)`.
     """
-    boxes = matched[:, :4]
+    boxes = matched[..., :4]
     boxes = to_center_form(boxes)
-    center_difference_x = boxes[:, 0:1] - priors[:, 0:1]
+    center_difference_x = boxes[..., 0:1] - priors[:, 0:1]
     encoded_center_x = center_difference_x / priors[:, 2:3]
-    center_difference_y = boxes[:, 1:2] - priors[:, 1:2]
+    center_difference_y = boxes[..., 1:2] - priors[:, 1:2]
     encoded_center_y = center_difference_y / priors[:, 3:4]
     encoded_center_x = encoded_center_x / variances[0]
     encoded_center_y = encoded_center_y / variances[1]
-    encoded_W = np.log((boxes[:, 2:3] / priors[:, 2:3]) + 1e-8)
-    encoded_H = np.log((boxes[:, 3:4] / priors[:, 3:4]) + 1e-8)
+    encoded_W = np.log((boxes[..., 2:3] / priors[:, 2:3]) + 1e-8)
+    encoded_H = np.log((boxes[..., 3:4] / priors[:, 3:4]) + 1e-8)
     encoded_W = encoded_W / variances[2]
     encoded_H = encoded_H / variances[3]
     encoded_boxes = [encoded_center_x, encoded_center_y, encoded_W, encoded_H]
-    return np.concatenate(encoded_boxes + [matched[:, 4:]], axis=1)
+    return np.concatenate(encoded_boxes + [matched[..., 4:]], axis=-1)
 
 
 def decode(predictions, priors, variances=[0.1, 0.1, 0.2, 0.2]):
     """Decode default boxes into the ground truth boxes
 
     # Arguments
-        loc: Numpy array of shape `(num_priors, 4)`.
+        loc: Numpy array of shape `(num_priors, 4)` or
+            `(batch_size, num_priors, 4)`.
         priors: Numpy array of shape `(num_priors, 4)`.
         variances: List of two floats. Variances of prior boxes.
 
     # Returns
-        decoded boxes: Numpy array of shape `(num_priors, 4)`.
+        decoded boxes: Numpy array of shape `(num_priors, 4)` or
+            `(batch_size, num_priors, 4)`.
     """
-    center_x = predictions[:, 0:1] * priors[:, 2:3] * variances[0]
+    center_x = predictions[..., 0:1] * priors[:, 2:3] * variances[0]
     center_x = center_x + priors[:, 0:1]
-    center_y = predictions[:, 1:2] * priors[:, 3:4] * variances[1]
+    center_y = predictions[..., 1:2] * priors[:, 3:4] * variances[1]
     center_y = center_y + priors[:, 1:2]
-    W = priors[:, 2:3] * np.exp(predictions[:, 2:3] * variances[2])
-    H = priors[:, 3:4] * np.exp(predictions[:, 3:4] * variances[3])
-    boxes = np.concatenate([center_x, center_y, W, H], axis=1)
+    W = priors[:, 2:3] * np.exp(predictions[..., 2:3] * variances[2])
+    H = priors[:, 3:4] * np.exp(predictions[..., 3:4] * variances[3])
+    boxes = np.concatenate([center_x, center_y, W, H], axis=-1)
     boxes = to_corner_form(boxes)
-    return np.concatenate([boxes, predictions[:, 4:]], 1)
+    return np.concatenate([boxes, predictions[..., 4:]], -1)
 
 
 def compute_ious(boxes_A, boxes_B):
@@ -98,20 +103,23 @@ def compute_ious(boxes_A, boxes_B):
     `(x_max, y_max)` corner.
 
     # Arguments
-        boxes_A: Numpy array with shape `(num_boxes_A, 4)`.
+        boxes_A: Numpy array with shape `(num_boxes_A, 4)` or
+            `(batch_size, num_boxes_A, 4)`.
         boxes_B: Numpy array with shape `(num_boxes_B, 4)`.
 
     # Returns
-        Numpy array of shape `(num_boxes_A, num_boxes_B)`.
+        Numpy array of shape `(num_boxes_A, num_boxes_B)` or
+            `(batch_size, num_boxes_A, num_boxes_B)`.
     """
-    xy_min = np.maximum(boxes_A[:, None, 0:2], boxes_B[:, 0:2])
-    xy_max = np.minimum(boxes_A[:, None, 2:4], boxes_B[:, 2:4])
+    xy_min = np.maximum(boxes_A[..., :, None, 0:2], boxes_B[:, 0:2])
+    xy_max = np.minimum(boxes_A[..., :, None, 2:4], boxes_B[:, 2:4])
     intersection = np.maximum(0.0, xy_max - xy_min)
-    intersection_area = intersection[:, :, 0] * intersection[:, :, 1]
-    areas_A = (boxes_A[:, 2] - boxes_A[:, 0]) * (boxes_A[:, 3] - boxes_A[:, 1])
+    intersection_area = intersection[..., 0] * intersection[..., 1]
+    areas_A = ((boxes_A[..., 2] - boxes_A[..., 0]) *
+               (boxes_A[..., 3] - boxes_A[..., 1]))
     areas_B = (boxes_B[:, 2] - boxes_B[:, 0]) * (boxes_B[:, 3] - boxes_B[:, 1])
     # broadcasting for outer sum i.e. a sum of all possible combinations
-    union_area = (areas_A[:, np.newaxis] + areas_B) - intersection_area
+    union_area = (areas_A[..., np.newaxis] + areas_B) - intersection_area
     union_area = np.maximum(union_area, 1e-8)
     return np.clip(intersection_area / union_area, 0.0, 1.0)
 
@@ -204,17 +212,63 @@ def match(boxes, prior_boxes, iou_threshold=0.5):
     per_prior_which_box_arg = np.argmax(ious, 0)
 
     #  overwriting per_prior_which_box_arg if they are the best prior box
+    #  repeated prior args are assigned in order i.e. the last box wins
     per_box_which_prior_arg = np.argmax(ious, 1)
     per_prior_which_box_iou[per_box_which_prior_arg] = 2
-    for box_arg in range(len(per_box_which_prior_arg)):
-        best_prior_box_arg = per_box_which_prior_arg[box_arg]
-        per_prior_which_box_arg[best_prior_box_arg] = box_arg
+    box_args = np.arange(len(per_box_which_prior_arg))
+    per_prior_which_box_arg[per_box_which_prior_arg] = box_args
 
     matches = boxes[per_prior_which_box_arg]
     matches[per_prior_which_box_iou < iou_threshold, 4] = 0
     return matches
 
 
+def match_batch(boxes, prior_boxes, iou_threshold=0.5, dtype=np.float32):
+    """Matches the prior boxes with the ground truth boxes of a whole batch
+    at once. Follows the same rules as ``match`` without python loops.
+
+    # Arguments
+        boxes: List with a numpy array of shape `(num_boxes, 4 + 1)` per
+            sample, where the first four coordinates correspond to box
+            coordinates and the last coordinate is the class argument.
+            Samples can have a different number of boxes.
+        prior_boxes: Numpy array of shape `(num_prior_boxes, 4)`.
+            where the four coordinates are in center form coordinates.
+        iou_threshold: Float between [0, 1]. Intersection over union
+            used to determine which box is considered a positive box.
+        dtype: Numpy dtype used for computing the intersection over unions
+            and for the returned matches.
+
+    # Returns
+        numpy array of shape `(batch_size, num_prior_boxes, 4 + 1)`.
+            Priors of samples without boxes are matched to the background.
+    """
+    batch_size = len(boxes)
+    num_boxes = np.array([len(sample_boxes) for sample_boxes in boxes])
+    max_num_boxes = max(np.max(num_boxes, initial=0), 1)
+    valid_mask = np.arange(max_num_boxes) < num_boxes[:, None]
+    padded_boxes = np.zeros((batch_size, max_num_boxes, 5), dtype=dtype)
+    if np.any(valid_mask):
+        padded_boxes[valid_mask] = np.concatenate(boxes, axis=0)
+    prior_boxes = to_corner_form(prior_boxes.astype(dtype))
+    ious = compute_ious(padded_boxes, prior_boxes)
+    ious[np.logical_not(valid_mask)] = -1.0
+    per_prior_which_box_iou = np.max(ious, axis=1)
+    per_prior_which_box_arg = np.argmax(ious, axis=1)
+
+    #  overwriting per_prior_which_box_arg if they are the best prior box
+    per_box_which_prior_arg = np.argmax(ious, axis=2)
+    batch_args, box_args = np.nonzero(valid_mask)
+    prior_args = per_box_which_prior_arg[batch_args, box_args]
+    per_prior_which_box_iou[batch_args, prior_args] = 2
+    per_prior_which_box_arg[batch_args, prior_args] = box_args
+
+    matches = np.take_along_axis(
+        padded_boxes, per_prior_which_box_arg[:, :, None], axis=1)
+    matches[per_prior_which_box_iou < iou_threshold, 4] = 0
+    return matches
+
+
 def compute_iou(box, boxes):
     """Calculates the intersection over union between 'box' and all 'boxes'.
     Both `box` and `boxes` are in corner coordinates.
@@ -415,6 +469,195 @@ def pre_filter_nms(class_arg, class_predictions, epsilon):
     return scores, mask
 
 
+def batched_nms_per_class(box_data, nms_thresh=.45, epsilon=0.01, top_k=200):
+    """Applies non maximum suppression to all classes at once.
+    This function returns the same output as ``nms_per_class`` but
+    instead of iterating the greedy suppression per class, it builds the
+    top-k candidates of every class into a padded array, precomputes
+    their intersection over union matrices and runs the suppression of
+    all classes simultaneously.
+
+    # Arguments
+        box_data: Array of shape `(num_boxes, 4 + num_classes)`
+            containing the box coordinates as well as the predicted
+            scores of all the classes for all non suppressed boxes.
+        nms_thresh: Float, Non-maximum suppression threshold.
+        epsilon: Float, Filter scores with a lower confidence
+            value before performing non-maximum supression.
+        top_k: Int, Maximum number of boxes per class outputted by nms.
+
+    # Returns
+        Tuple: Containing an array non suppressed boxes of shape
+            `(num_nms_boxes, 4 + num_classes)` and an array
+            of corresponding class labels of shape `(num_nms_boxes, )`.
+    """
+    return batched_nms_per_image(box_data[None], nms_thresh, epsilon, top_k)[0]
+
+
+def batched_nms_per_image(box_data, nms_thresh=.45, epsilon=0.01, top_k=200,
+                          chunk_size=2 ** 22):
+    """Applies non maximum suppression per class to a batch of images.
+    The candidates of every class of every image are suppressed at once
+    as in ``batched_nms_per_class``. Their intersection over unions are
+    computed for groups of classes with at most ``chunk_size`` values,
+    such that memory does not grow with the batch size. Boxes with less
+    precision than float32 are upcast to float32.
+
+    # Arguments
+        box_data: Array of shape `(batch_size, num_boxes, 4 + num_classes)`
+            containing the box coordinates as well as the predicted
+            scores of all the classes for all the boxes of every image.
+        nms_thresh: Float, Non-maximum suppression threshold.
+        epsilon: Float, Filter scores with a lower confidence
+            value before performing non-maximum supression.
+        top_k: Int, Maximum number of boxes per class outputted by nms.
+        chunk_size: Int, Maximum number of intersection over union values
+            computed at once.
+
+    # Returns
+        List of length `batch_size` containing for every image the
+            tuple returned by ``nms_per_class``.
+    """
+    batch_size, num_boxes, box_size = box_data.shape
+    dtype = np.result_type(float, box_data.dtype)
+    sorted_args, image_args, class_args = [], [], []
+    for image_arg, class_predictions in enumerate(box_data[..., 4:]):
+        image_sorted_args, image_class_args = _sort_nms_candidates(
+            class_predictions, epsilon, top_k)
+        sorted_args.extend(image_sorted_args)
+        image_args.extend([image_arg] * len(image_class_args))
+        class_args.extend(image_class_args)
+    candidate_args, valid_mask = _pad_nms_candidates(sorted_args)
+
+    boxes = box_data[..., :4].reshape(-1, 4)
+    image_args = np.array(image_args, dtype=int)
+    flat_candidate_args = candidate_args + (image_args * num_boxes)[:, None]
+    num_candidates = candidate_args.shape[1]
+    iou_dtype = np.result_type(boxes.dtype, np.float32)
+    chunk_classes = max(1, chunk_size // max(1, num_candidates ** 2))
+    keep_mask = np.zeros_like(valid_mask)
+    for start in range(0, len(flat_candidate_args), chunk_classes):
+        chunk = slice(start, start + chunk_classes)
+        chunk_boxes = boxes[flat_candidate_args[chunk]].astype(iou_dtype)
+        ious = _compute_candidates_ious(chunk_boxes)
+        keep_mask[chunk] = _suppress_candidates(
+            ious, valid_mask[chunk], nms_thresh)
+
+    num_selected = np.sum(keep_mask, axis=1)
+    box_data = box_data.reshape(-1, box_size)
+    selections = box_data[flat_candidate_args[keep_mask]].astype(dtype)
+    class_labels = np.repeat(np.array(class_args, dtype=int), num_selected)
+    image_splits = np.bincount(
+        image_args, weights=num_selected, minlength=batch_size)
+    image_splits = np.cumsum(image_splits.astype(int))[:-1]
+    nms_boxes = np.split(selections, image_splits)
+    class_labels = np.split(class_labels, image_splits)
+    return list(zip(nms_boxes, class_labels))
+
+
+def _sort_nms_candidates(class_predictions, epsilon, top_k):
+    """Sorts the scores of every class and selects its top-k candidates.
+    Scores are sorted exactly as in ``apply_non_max_suppression`` in
+    order to keep the same selection order as ``nms_per_class``.
+
+    # Arguments
+        class_predictions: Array of shape `(num_boxes, num_classes)`.
+        epsilon: Float, threshold value for score filtering.
+        top_k: Int, Maximum number of candidates per class.
+
+    # Returns
+        Tuple: Containing a list with an array of box indices sorted in
+            descending score order for every class having candidates,
+            and an array with the class indices of these classes.
+    """
+    score_mask = class_predictions >= epsilon
+    class_args = np.flatnonzero(np.any(score_mask, axis=0))
+    sorted_args = []
+    for class_arg in class_args:
+        box_args = np.flatnonzero(score_mask[:, class_arg])
+        scores = class_predictions[box_args, class_arg]
+        sorted_score_args = np.argsort(scores)[-top_k:][::-1]
+        sorted_args.append(box_args[sorted_score_args])
+    return sorted_args, class_args
+
+
+def _pad_nms_candidates(sorted_args):
+    """Pads the sorted candidates of every class into a single array.
+
+    # Arguments
+        sorted_args: List of arrays with the sorted box indices.
+
+    # Returns
+        Tuple: Containing an array of box indices of shape
+            `(num_classes, num_candidates)` and a boolean mask of the
+            same shape indicating the non-padded candidates.
+    """
+    num_candidates = max([len(args) for args in sorted_args], default=0)
+    candidate_args = np.zeros((len(sorted_args), num_candidates), dtype=int)
+    valid_mask = np.zeros((len(sorted_args), num_candidates), dtype=bool)
+    for row_arg, args in enumerate(sorted_args):
+        candidate_args[row_arg, :len(args)] = args
+        valid_mask[row_arg, :len(args)] = True
+    return candidate_args, valid_mask
+
+
+def _compute_candidates_ious(boxes):
+    """Computes the intersection over union between all candidates of
+    every class. The operations are performed in the same order as in
+    ``apply_non_max_suppression`` to obtain identical values for boxes
+    of the same type.
+
+    # Arguments
+        boxes: Array of shape `(num_classes, num_candidates, 4)`.
+
+    # Returns
+        Array of shape `(num_classes, num_candidates, num_candidates)`.
+    """
+    x_min, y_min = boxes[..., 0], boxes[..., 1]
+    x_max, y_max = boxes[..., 2], boxes[..., 3]
+    areas = (x_max - x_min) * (y_max - y_min)
+    # intermediate results are written in-place to avoid temporaries
+    inner_box_widths = np.minimum(x_max[:, None, :], x_max[:, :, None])
+    inner_box_widths -= np.maximum(x_min[:, None, :], x_min[:, :, None])
+    np.maximum(inner_box_widths, 0.0, out=inner_box_widths)
+    inner_box_heights = np.minimum(y_max[:, None, :], y_max[:, :, None])
+    inner_box_heights -= np.maximum(y_min[:, None, :], y_min[:, :, None])
+    np.maximum(inner_box_heights, 0.0, out=inner_box_heights)
+    intersections = np.multiply(
+        inner_box_widths, inner_box_heights, out=inner_box_widths)
+    unions = areas[:, None, :] + areas[:, :, None]
+    unions -= intersections
+    with np.errstate(divide='ignore', invalid='ignore'):
+        intersec_over_union = np.divide(intersections, unions, out=unions)
+    return intersec_over_union
+
+
+def _suppress_candidates(ious, valid_mask, nms_thresh):
+    """Greedily suppresses overlapping candidates of all classes at once.
+
+    # Arguments
+        ious: Array of shape `(num_classes, num_candidates, num_candidates)`
+            with the intersection over union between sorted candidates.
+        valid_mask: Boolean array of shape `(num_classes, num_candidates)`.
+        nms_thresh: Float, Non-maximum suppression threshold.
+
+    # Returns
+        Boolean array of shape `(num_classes, num_candidates)` indicating
+            the kept candidates.
+    """
+    overlap_mask = np.logical_not(ious <= nms_thresh)
+    suppressed_mask = np.logical_not(valid_mask)
+    keep_mask = np.zeros_like(valid_mask)
+    for candidate_arg in range(valid_mask.shape[1]):
+        keep = np.logical_not(suppressed_mask[:, candidate_arg])
+        if not np.any(keep):
+            continue
+        keep_mask[:, candidate_arg] = keep
+        overlaps = overlap_mask[:, candidate_arg, candidate_arg + 1:]
+        suppressed_mask[:, candidate_arg + 1:] |= keep[:, None] & overlaps
+    return keep_mask
+
+
 def merge_nms_box_with_class(box_data, class_labels):
     """Merges box coordinates with their corresponding class
     defined by `class_labels` which is decided by best box geometry
@@ -496,16 +739,16 @@ def to_one_hot(class_indices, num_classes):
     """ Transform from class index to one-hot encoded vector.
 
     # Arguments
-        class_indices: Numpy array. One dimensional array specifying
-            the index argument of the class for each sample.
+        class_indices: Numpy array. Array specifying the index argument of
+            the class for each sample.
         num_classes: Integer. Total number of classes.
 
     # Returns
-        Numpy array with shape `(num_samples, num_classes)`.
+        Numpy array with shape `(*class_indices.shape, num_classes)`.
     """
-    one_hot_vectors = np.zeros((len(class_indices), num_classes))
-    for vector_arg, class_args in enumerate(class_indices):
-        one_hot_vectors[vector_arg, class_args] = 1.0
+    class_indices = np.asarray(class_indices, dtype=int)
+    one_hot_vectors = np.zeros((*class_indices.shape, num_classes))
+    np.put_along_axis(one_hot_vectors, class_indices[..., None], 1.0, -1)
     return one_hot_vectors
 
 
@@ -604,6 +847,100 @@ def denormalize_box(box, image_shape):
     return (x_min, y_min, x_max, y_max)
 
 
+def make_boxes_square(boxes):
+    """Makes the coordinates of many boxes square with sides equal to their
+        longest original side. Vectorized version of ``make_box_square``.
+
+    # Arguments
+        boxes: Numpy array with shape `(num_boxes, 4)` with point corner
+            coordinates.
+
+    # Returns
+        Numpy array with shape `(num_boxes, 4)` and the type of ``boxes``.
+    """
+    boxes = np.asarray(boxes)[:, :4]
+    x_min, y_min, x_max, y_max = boxes.T
+    center_x = (x_max + x_min) / 2.0
+    center_y = (y_max + y_min) / 2.0
+    width = x_max - x_min
+    height = y_max - y_min
+    half_box = np.maximum(width, height) / 2.0
+    square_x, square_y = height >= width, width > height
+    squared_boxes = boxes.copy()
+    squared_boxes[:, 0] = np.where(
+        square_x, np.trunc(center_x - half_box), x_min)
+    squared_boxes[:, 2] = np.where(
+        square_x, np.trunc(center_x + half_box), x_max)
+    squared_boxes[:, 1] = np.where(
+        square_y, np.trunc(center_y - half_box), y_min)
+    squared_boxes[:, 3] = np.where(
+        square_y, np.trunc(center_y + half_box), y_max)
+    return squared_boxes
+
+
+def offset_boxes(boxes, offset_scales):
+    """Apply offsets to the coordinates of many boxes. Vectorized version
+        of ``offset``.
+
+    # Arguments
+        boxes: Numpy array with shape `(num_boxes, 4)` with point corner
+            coordinates.
+        offset_scales: List of floats having x and y scales respectively.
+
+    # Returns
+        Numpy array of ints with shape `(num_boxes, 4)`.
+    """
+    x_min, y_min, x_max, y_max = np.asarray(boxes).T
+    x_offset_scale, y_offset_scale = offset_scales
+    x_offset = (x_max - x_min) * x_offset_scale
+    y_offset = (y_max - y_min) * y_offset_scale
+    # offsets are applied to the same sides as ``offset``
+    boxes = np.stack([x_min - x_offset, y_min - y_offset,
+                      x_max + y_offset, y_max + x_offset], axis=1)
+    return np.trunc(boxes).astype(int)
+
+
+def clip_boxes(boxes, image_shape):
+    """Clip many boxes to valid image coordinates. Vectorized version of
+        ``clip``.
+
+    # Arguments
+        boxes: Numpy array with shape `(num_boxes, 4)` with point corner
+            coordinates.
+        image_shape: List of two integers indicating height and width of image
+            respectively.
+
+    # Returns
+        Numpy array with shape `(num_boxes, 4)` and the type of ``boxes``.
+    """
+    height, width = image_shape[:2]
+    clipped_boxes = np.array(boxes)
+    clipped_boxes[:, :2] = np.maximum(clipped_boxes[:, :2], 0)
+    clipped_boxes[:, 2] = np.minimum(clipped_boxes[:, 2], width)
+    clipped_boxes[:, 3] = np.minimum(clipped_boxes[:, 3], height)
+    return clipped_boxes
+
+
+def denormalize_boxes(boxes, image_shape):
+    """Scales the corner coordinates of many boxes from normalized values to
+        image dimensions. Vectorized version of ``denormalize_box``.
+
+    # Arguments
+        boxes: Numpy array with shape `(num_boxes, 4)` with normalized
+            corner coordinates.
+        image_shape: List of integers with (height, width).
+
+    # Returns
+        Numpy array of ints with shape `(num_boxes, 4)`.
+    """
+    boxes = np.asarray(boxes)[:, :4]
+    height, width = image_shape
+    denormalized_boxes = np.empty(boxes.shape, dtype=int)
+    denormalized_boxes[:, 0::2] = boxes[:, 0::2] * width
+    denormalized_boxes[:, 1::2] = boxes[:, 1::2] * height
+    return denormalized_boxes
+
+
 def flip_left_right(boxes, width):
     """Flips box coordinates from left-to-right and vice-versa.
     # Arguments
@@ -1,3 +1,7 @@
+import queue
+import threading
+import time
+
 import cv2
 import numpy as np
 
@@ -258,3 +262,296 @@ class VideoPlayer(object):
 
         writer.release()
         cv2.destroyAllWindows()
+
+
+def put_frame(frame_queue, frame, drop_oldest=True, stop_event=None,
+              timeout=0.1, max_wait=None):
+    """Puts a frame in a bounded queue.
+
+    # Arguments
+        frame_queue: Instance of ``queue.Queue``.
+        frame: Array or ``None``.
+        drop_oldest: Boolean. If ``True`` and the queue is full, the oldest
+            frames are removed to make space for ``frame``. Otherwise the
+            call blocks until space is available.
+        stop_event: Instance of ``threading.Event``. If set while blocking
+            the frame is discarded.
+        timeout: Float. Seconds between checks of ``stop_event``.
+        max_wait: Float or ``None``. Seconds after which a blocked call
+            discards ``frame`` e.g. if the consumer of the queue died.
+
+    # Returns
+        Int. Number of frames dropped from the queue, including ``frame``
+            if it was discarded after ``max_wait`` seconds.
+    """
+    num_dropped = 0
+    start_time = time.perf_counter()
+    while True:
+        if stop_event is not None and stop_event.is_set():
+            return num_dropped
+        if ((max_wait is not None) and
+                (time.perf_counter() - start_time) > max_wait):
+            return num_dropped + 1
+        try:
+            if drop_oldest:
+                frame_queue.put_nowait(frame)
+            else:
+                frame_queue.put(frame, timeout=timeout)
+            return num_dropped
+        except queue.Full:
+            if drop_oldest:
+                try:
+                    frame_queue.get_nowait()
+                    num_dropped = num_dropped + 1
+                except queue.Empty:
+                    pass
+
+
+class AsyncVideoPlayer(VideoPlayer):
+    """Performs visualization inferences in a real-time video with frame
+    capture and video writing running on their own threads. Frames are
+    passed between threads through bounded queues, such that camera I/O
+    and video encoding do not add to the latency of the ``pipeline``.
+
+    # Properties
+        image_size: List of two integers. Output size of the displayed image.
+        pipeline: Function. Should take RGB image as input and it should
+            output a dictionary with key 'image' containing a visualization
+            of the inferences. Built-in pipelines can be found in
+            ``paz/processing/pipelines``.
+        camera: Instance of ``Camera``.
+        topic: String. Key of the ``pipeline`` output that is displayed.
+        queue_size: Int. Maximum number of captured frames waiting for the
+            ``pipeline``.
+        drop_oldest: Boolean. If ``True`` the oldest captured frame is
+            dropped when the queue is full, such that live camera inferences
+            are always done on the latest frames. Frames read from video
+            files are never dropped.
+        write_queue_size: Int. Maximum number of frames waiting to be
+            written.
+        show: Boolean. If ``True`` inferences are displayed in a window.
+        verbose: Boolean. If ``True`` statistics are printed every second.
+        timeout: Float. Seconds to wait for a blocked writer or for the
+            threads to finish before frames are dropped or threads are
+            abandoned. The camera, video or writer of an abandoned thread
+            is released by that thread once it finishes.
+
+    # Methods
+        run()
+        record()
+        record_from_file()
+        stop()
+    """
+    def __init__(self, image_size, pipeline, camera, topic='image',
+                 queue_size=2, drop_oldest=True, write_queue_size=30,
+                 show=True, verbose=True, timeout=5.0):
+        super(AsyncVideoPlayer, self).__init__(
+            image_size, pipeline, camera, topic)
+        self.queue_size = queue_size
+        self.drop_oldest = drop_oldest
+        self.write_queue_size = write_queue_size
+        self.show = show
+        self.verbose = verbose
+        self.timeout = timeout
+        self.statistics = {}
+        self._stop_event = threading.Event()
+        self._statistics_lock = threading.Lock()
+
+    def stop(self):
+        """Stops capturing and processing frames. Can be called from any
+        thread e.g. from inside the ``pipeline``.
+        """
+        self._stop_event.set()
+
+    def _camera_frames(self):
+        while not self._stop_event.is_set():
+            frame = self.camera.read()
+            if frame is None:
+                time.sleep(0.005)
+                continue
+            # all pipelines start with an RGB image
+            yield convert_color_space(frame, BGR2RGB)
+
+    def _video_frames(self, video):
+        while video.isOpened():
+            is_frame_received, frame = video.read()
+            if not is_frame_received:
+                print("Frame not received. Exiting ...")
+                break
+            yield frame
+
+    def _capture(self, frames, frame_queue, drop_oldest, release=None):
+        try:
+            for frame in frames:
+                if self._stop_event.is_set():
+                    break
+                num_dropped = put_frame(
+                    frame_queue, frame, drop_oldest, self._stop_event)
+                self._add_dropped_frames(num_dropped)
+            put_frame(frame_queue, None, drop_oldest, self._stop_event)
+        finally:
+            if release is not None:
+                release()
+
+    def _write(self, writer, write_queue, release=None):
+        try:
+            while True:
+                image = write_queue.get()
+                if image is None:
+                    break
+                writer.write(image)
+        finally:
+            if release is not None:
+                release()
+
+    def _add_dropped_frames(self, num_dropped):
+        # frames are dropped by the capture and the consumer threads
+        with self._statistics_lock:
+            self.statistics['dropped_frames'] += num_dropped
+
+    def _reset_statistics(self):
+        self.statistics = {'fps': 0.0, 'processed_frames': 0,
+                           'dropped_frames': 0, 'queue_depth': 0,
+                           'write_queue_depth': 0}
+
+    def _update_statistics(self, start_time, frame_queue, write_queue):
+        self.statistics['processed_frames'] += 1
+        elapsed_time = time.perf_counter() - start_time
+        self.statistics['fps'] = (
+            self.statistics['processed_frames'] / max(elapsed_time, 1e-6))
+        self.statistics['queue_depth'] = frame_queue.qsize()
+        if write_queue is not None:
+            self.statistics['write_queue_depth'] = write_queue.qsize()
+
+    def _print_statistics(self):
+        print('FPS: {fps:.1f} | queue depth: {queue_depth} | '
+              'dropped frames: {dropped_frames} | '
+              'write queue depth: {write_queue_depth}'.format(
+                  **self.statistics))
+
+    def _consume(self, frame_queue, write_queue):
+        start_time = last_print_time = time.perf_counter()
+        while not self._stop_event.is_set():
+            try:
+                frame = frame_queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            if frame is None:
+                break
+            output = self.pipeline(frame)
+            if output is None:
+                continue
+            image = resize_image(output[self.topic], tuple(self.image_size))
+            if self.show:
+                show_image(image, 'inference', wait=False)
+            if write_queue is not None:
+                self._add_dropped_frames(put_frame(
+                    write_queue, image, False, self._stop_event,
+                    max_wait=self.timeout))
+            self._update_statistics(start_time, frame_queue, write_queue)
+            if self.verbose and (time.perf_counter() - last_print_time) > 1:
+                last_print_time = time.perf_counter()
+                self._print_statistics()
+            if self.show and (cv2.waitKey(1) & 0xFF == ord('q')):
+                break
+
+    def _process(self, frames, drop_oldest, writer=None,
+                 release_frames=None, release_writer=None):
+        # resources are released by the threads using them, such that a
+        # thread outliving its join is never left with a released resource
+        self._stop_event.clear()
+        self._reset_statistics()
+        frame_queue = queue.Queue(self.queue_size)
+        capture_thread = threading.Thread(
+            target=self._capture,
+            args=(frames, frame_queue, drop_oldest, release_frames),
+            daemon=True)
+        write_queue, write_thread = None, None
+        if writer is not None:
+            write_queue = queue.Queue(self.write_queue_size)
+            write_thread = threading.Thread(
+                target=self._write,
+                args=(writer, write_queue, release_writer), daemon=True)
+            write_thread.start()
+        capture_thread.start()
+
+        try:
+            self._consume(frame_queue, write_queue)
+        finally:
+            self._stop_event.set()
+            capture_thread.join(self.timeout)
+            if write_thread is not None:
+                put_frame(write_queue, None, False, max_wait=self.timeout)
+                write_thread.join(self.timeout)
+        return self.statistics
+
+    def run(self):
+        """Opens camera and starts continuous inference using ``pipeline``,
+        until the user presses ``q`` inside the opened window or ``stop``
+        is called.
+
+        # Returns
+            Dictionary with the achieved ``fps``, the number of
+                ``processed_frames`` and ``dropped_frames`` and the last
+                ``queue_depth``.
+        """
+        self.camera.start()
+        statistics = self._process(
+            self._camera_frames(), self.drop_oldest,
+            release_frames=self.camera.stop)
+        if self.show:
+            cv2.destroyAllWindows()
+        return statistics
+
+    def record(self, name='video.avi', fps=20, fourCC='XVID'):
+        """Opens camera and records continuous inference using ``pipeline``.
+        Frames are written by a separate thread.
+
+        # Arguments
+            name: String. Video name. Must include the postfix .avi.
+            fps: Int. Frames per second.
+            fourCC: String. Indicates the four character code of the video.
+            e.g. XVID, MJPG, X264.
+
+        # Returns
+            Dictionary with the statistics of the recording.
+        """
+        self.camera.start()
+        fourCC = cv2.VideoWriter_fourcc(*fourCC)
+        writer = cv2.VideoWriter(name, fourCC, fps, self.image_size)
+        statistics = self._process(
+            self._camera_frames(), self.drop_oldest, writer,
+            self.camera.stop, writer.release)
+        if self.show:
+            cv2.destroyAllWindows()
+        return statistics
+
+    def record_from_file(self, video_file_path, name='video.avi',
+                         fps=20, fourCC='XVID'):
+        """Load video and records continuous inference using ``pipeline``.
+        Frames are read and written by separate threads and none of them
+        is dropped.
+
+        # Arguments
+            video_file_path: String. Path to the video file.
+            name: String. Output video name. Must include the postfix .avi.
+            fps: Int. Frames per second.
+            fourCC: String. Indicates the four character code of the video.
+            e.g. XVID, MJPG, X264.
+
+        # Returns
+            Dictionary with the statistics of the recording.
+        """
+        fourCC = cv2.VideoWriter_fourcc(*fourCC)
+        writer = cv2.VideoWriter(name, fourCC, fps, self.image_size)
+
+        video = cv2.VideoCapture(video_file_path)
+        if (video.isOpened() is False):
+            print("Error opening video  file")
+
+        statistics = self._process(
+            self._video_frames(video), False, writer,
+            video.release, writer.release)
+        if self.show:
+            cv2.destroyAllWindows()
+        return statistics
@@ -56,28 +56,48 @@ def get_keypoints_locations(indices, image_width):
 
 def get_top_k_keypoints_numpy(heatmaps, k):
     """Numpy implementation of get_top_k_keypoints from heatmaps.
+    The top k values of all objects and keypoints are selected at once
+    with a partial sort. As in ``tf.math.top_k`` values are sorted in
+    descending order and ties are resolved by the lowest index.
 
     # Arguments
         heatmaps: Keypoints heatmaps. Numpy array of shape
-                  (1, num_keypoints, H, W)
+                  (num_objects, num_keypoints, H x W)
         k: Int. Maximum number of instances to return.
 
     # Returns
         values: Numpy array. Value of heatmaps at top k keypoints
         indices: Numpy array. Indices of top k keypoints.
     """
-    num_of_objects, num_of_keypoints = heatmaps.shape[:2]
-    indices = np.zeros((num_of_objects, num_of_keypoints, k), dtype=int)
-    values = np.zeros((num_of_objects, num_of_keypoints, k))
-    for object_arg in range(num_of_objects):
-        for keypoint_arg in range(num_of_keypoints):
-            top_k_indices = np.argsort(heatmaps[object_arg][keypoint_arg])[-k:]
-            top_k_values = heatmaps[object_arg][keypoint_arg][top_k_indices]
-            indices[object_arg][keypoint_arg] = top_k_indices
-            values[object_arg][keypoint_arg] = top_k_values
+    heatmaps = np.asarray(heatmaps)
+    indices = np.argpartition(-heatmaps, k - 1, axis=-1)[..., :k]
+    values = np.take_along_axis(heatmaps, indices, axis=-1)
+    kth_values = np.min(values, axis=-1, keepdims=True)
+    num_candidates = np.sum(heatmaps >= kth_values, axis=-1)
+    if np.any(num_candidates > k):
+        indices = _get_lowest_tied_indices(heatmaps, kth_values, k)
+    indices = np.sort(indices, axis=-1)
+    values = np.take_along_axis(heatmaps, indices, axis=-1)
+    order = np.argsort(-values, axis=-1, kind='stable')
+    indices = np.take_along_axis(indices, order, axis=-1)
+    values = np.take_along_axis(values, order, axis=-1)
     return np.squeeze(values), indices
 
 
+def _get_lowest_tied_indices(heatmaps, kth_values, k):
+    """Selects the indices of the values above the k-th largest value and
+    fills the remaining places with the lowest indices of the values
+    equal to it.
+    """
+    is_greater = heatmaps > kth_values
+    is_equal = heatmaps == kth_values
+    num_missing = k - np.sum(is_greater, axis=-1, keepdims=True)
+    is_selected = np.logical_or(is_greater, np.logical_and(
+        is_equal, np.cumsum(is_equal, axis=-1) <= num_missing))
+    indices = np.nonzero(is_selected)[-1]
+    return np.reshape(indices, heatmaps.shape[:-1] + (k,))
+
+
 def get_valid_detections(detection, detection_thresh):
     """Accept the keypoints whose score is greater than the
        detection threshold.
@@ -1,3 +1,9 @@
 from .opencv_image import *
 from .image import *
-from .draw import *
\ No newline at end of file
+from .draw import *
+from .sources import ImageSource
+from .sources import ReducedImageSource
+from .sources import LRUImageCache
+from .sources import ShardedImageStore
+from .sources import build_image_store
+from .sources import compute_reduction
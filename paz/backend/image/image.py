@@ -325,13 +325,17 @@ def get_scaling_factor(image, scale=1, shape=(128, 128)):
     return np.array([W_scale * scale, H_scale * scale])
 
 
-def scale_resize(image, image_size):
+def scale_resize(image, image_size, dtype=np.float64, output_image=None):
     """Resizes and crops image by returning the scales to original
     image.
 
     Args:
         image: Numpy array, raw image.
         image_size: Int, size of the image.
+        dtype: Data type of the output image.
+        output_image: Numpy array of shape
+            ``(1, image_size, image_size, channels)``. If given the image
+            is resized directly into it and no new array is allocated.
 
     Returns:
         Tuple: output_image, image_scale.
@@ -340,14 +344,47 @@ def scale_resize(image, image_size):
     image_scale_x = image_size / W
     image_scale_y = image_size / H
     image_scale = min(image_scale_x, image_scale_y)
-    scaled_H = int(H * image_scale)
-    scaled_W = int(W * image_scale)
-    scaled_image = resize_image(image, (scaled_W, scaled_H))
-    scaled_image = scaled_image[:image_size, :image_size, :]
-    output_image = np.zeros((image_size, image_size, image.shape[2]))
-    output_image[:scaled_image.shape[0],
-                 :scaled_image.shape[1],
-                 :scaled_image.shape[2]] = scaled_image
+    scaled_H = min(int(H * image_scale), image_size)
+    scaled_W = min(int(W * image_scale), image_size)
+    if output_image is None:
+        output_image = np.zeros(
+            (1, image_size, image_size, image.shape[2]), dtype=dtype)
+    else:
+        output_image[:, scaled_H:] = 0
+        output_image[:, :scaled_H, scaled_W:] = 0
+    scaled_image = output_image[0, :scaled_H, :scaled_W]
+    if image.dtype == output_image.dtype:
+        resize_image(image, (scaled_W, scaled_H), output=scaled_image)
+    else:
+        scaled_image[...] = resize_image(image, (scaled_W, scaled_H))
     image_scale = np.array(1 / image_scale)
-    output_image = output_image[np.newaxis]
     return output_image, image_scale
+
+
+def standardize_image(image, mean, standard_deviation=None,
+                      dtype=np.float32, output=None):
+    """Subtracts the mean and divides by the standard deviation of an
+    image. The image is cast only once and all operations are computed
+    in ``dtype`` without intermediate arrays.
+
+    # Arguments
+        image: Numpy array.
+        mean: List or array with the mean of each channel.
+        standard_deviation: List or array with the standard deviation of
+            each channel. If ``None`` the image is only centered.
+        dtype: Data type of the standardized image.
+        output: Numpy array with the shape of ``image`` in which the
+            standardized image is written.
+
+    # Returns
+        Numpy array.
+    """
+    if output is None:
+        output = np.empty(image.shape, dtype=dtype)
+    # numpy only uses its fast loops when all operands share the dtype
+    np.copyto(output, image, casting='unsafe')
+    np.subtract(output, np.asarray(mean, output.dtype), out=output)
+    if standard_deviation is not None:
+        standard_deviation = np.asarray(standard_deviation, output.dtype)
+        np.divide(output, standard_deviation, out=output)
+    return output
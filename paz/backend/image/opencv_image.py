@@ -1,6 +1,7 @@
 import numpy as np
 import cv2
 import os
+import struct
 
 RGB2BGR = cv2.COLOR_RGB2BGR
 BGR2RGB = cv2.COLOR_BGR2RGB
@@ -11,11 +12,19 @@ HSV2RGB = cv2.COLOR_HSV2RGB
 _CHANNELS_TO_FLAG = {1: cv2.IMREAD_GRAYSCALE,
                      3: cv2.IMREAD_COLOR,
                      4: cv2.IMREAD_UNCHANGED}
+_REDUCED_FLAGS = {(1, 2): cv2.IMREAD_REDUCED_GRAYSCALE_2,
+                  (1, 4): cv2.IMREAD_REDUCED_GRAYSCALE_4,
+                  (1, 8): cv2.IMREAD_REDUCED_GRAYSCALE_8,
+                  (3, 2): cv2.IMREAD_REDUCED_COLOR_2,
+                  (3, 4): cv2.IMREAD_REDUCED_COLOR_4,
+                  (3, 8): cv2.IMREAD_REDUCED_COLOR_8}
+REDUCTIONS = [1, 2, 4, 8]
 CUBIC = cv2.INTER_CUBIC
 BILINEAR = cv2.INTER_LINEAR
+MAX_RESIZE_CHANNELS = 512
 
 
-def resize_image(image, size, method=BILINEAR):
+def resize_image(image, size, method=BILINEAR, output=None):
     """Resize image.
 
     # Arguments
@@ -23,6 +32,9 @@ def resize_image(image, size, method=BILINEAR):
         size: List of two ints.
         method: Flag indicating interpolation method i.e.
             paz.backend.image.CUBIC
+        output: Numpy array of shape ``(size[1], size[0], channels)`` and
+            the same dtype as ``image`` in which the resized image is
+            written e.g. a view of a preallocated model input.
 
     # Returns
         Numpy array.
@@ -30,8 +42,46 @@ def resize_image(image, size, method=BILINEAR):
     if (type(image) != np.ndarray):
         raise ValueError(
             'Recieved Image is not of type numpy array', type(image))
-    else:
+    elif image.ndim == 3 and image.shape[2] > MAX_RESIZE_CHANNELS:
+        resized_image = resize_image_channels(image, size, method)
+        if output is None:
+            return resized_image
+        output[...] = resized_image
+        return output
+    elif output is None:
         return cv2.resize(image, size, interpolation=method)
+    else:
+        return cv2.resize(image, size, dst=output, interpolation=method)
+
+
+def resize_image_channels(image, size, method=BILINEAR,
+                          max_channels=MAX_RESIZE_CHANNELS):
+    """Resizes all channels of a channel-last array e.g. heatmaps.
+    Channels are resized together in chunks of at most ``max_channels``,
+    which is the largest number of channels supported by openCV.
+
+    # Arguments
+        image: Numpy array of shape ``(H, W, num_channels)``.
+        size: List of two ints i.e. ``(new_W, new_H)``.
+        method: Flag indicating interpolation method i.e.
+            paz.backend.image.CUBIC
+        max_channels: Int. Maximum number of channels resized at once.
+
+    # Returns
+        Numpy array of shape ``(new_H, new_W, num_channels)``.
+    """
+    W, H = size
+    num_channels = image.shape[2]
+    if num_channels <= max_channels:
+        resized_image = cv2.resize(image, size, interpolation=method)
+        return resized_image.reshape(H, W, num_channels)
+    resized_image = np.empty((H, W, num_channels), dtype=image.dtype)
+    for start in range(0, num_channels, max_channels):
+        chunk = np.ascontiguousarray(image[:, :, start:start + max_channels])
+        resized_chunk = cv2.resize(chunk, size, interpolation=method)
+        resized_image[:, :, start:start + max_channels] = (
+            resized_chunk.reshape(H, W, -1))
+    return resized_image
 
 
 def convert_color_space(image, flag):
@@ -47,20 +97,32 @@ def convert_color_space(image, flag):
     return cv2.cvtColor(image, flag)
 
 
-def load_image(filepath, num_channels=3):
+def load_image(filepath, num_channels=3, reduction=1):
     """Load image from a ''filepath''.
 
     # Arguments
         filepath: String indicating full path to the image.
         num_channels: Int.
+        reduction: Int. Factor by which the image is downscaled while it is
+            decoded i.e. ``1``, ``2``, ``4`` or ``8``. JPEG images are then
+            decoded at a reduced resolution, which is much faster than
+            decoding and resizing them.
 
     # Returns
         Numpy array.
     """
     if num_channels not in [1, 3, 4]:
         raise ValueError('Invalid number of channels')
+    if reduction not in REDUCTIONS:
+        raise ValueError('Invalid reduction', reduction)
+    if reduction == 1:
+        flag = _CHANNELS_TO_FLAG[num_channels]
+    elif num_channels == 4:
+        raise ValueError('Images with 4 channels can not be reduced')
+    else:
+        flag = _REDUCED_FLAGS[(num_channels, reduction)]
 
-    image = cv2.imread(filepath, _CHANNELS_TO_FLAG[num_channels])
+    image = cv2.imread(filepath, flag)
     if num_channels == 3:
         image = convert_color_space(image, BGR2RGB)
     elif num_channels == 4:
@@ -68,6 +130,42 @@ def load_image(filepath, num_channels=3):
     return image
 
 
+def _read_JPEG_size(filedata):
+    filedata.seek(2)
+    while True:
+        marker = filedata.read(4)
+        if (len(marker) < 4) or (marker[0] != 0xFF):
+            return None
+        marker_type, length = marker[1], struct.unpack('>H', marker[2:])[0]
+        # start of frame markers excluding huffman and arithmetic tables
+        if (0xC0 <= marker_type <= 0xCF) and marker_type not in [
+                0xC4, 0xC8, 0xCC]:
+            height, width = struct.unpack('>xHH', filedata.read(5))
+            return height, width
+        filedata.seek(length - 2, 1)
+
+
+def get_image_size(filepath):
+    """Reads the size of a JPEG or PNG image from its header without
+    decoding it.
+
+    # Arguments
+        filepath: String indicating full path to the image.
+
+    # Returns
+        Tuple with the height and width of the image or ``None`` if the
+            image is neither a JPEG nor a PNG file.
+    """
+    with open(filepath, 'rb') as filedata:
+        header = filedata.read(24)
+        if header[:2] == b'\xff\xd8':
+            return _read_JPEG_size(filedata)
+        if header[:8] == b'\x89PNG\r\n\x1a\n':
+            width, height = struct.unpack('>II', header[16:24])
+            return height, width
+    return None
+
+
 def show_image(image, name='image', wait=True):
     """Shows RGB image in an external window.
 
@@ -0,0 +1,256 @@
+import os
+import json
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import cv2
+import numpy as np
+
+from .opencv_image import load_image, get_image_size, REDUCTIONS
+
+
+STORE_VERSION = 1
+INDEX_NAME = 'index.json'
+
+
+class ImageSource(object):
+    """Decodes images from disk. Image sources are given to ``LoadImage``
+    to change how images are loaded e.g. from a cache.
+
+    # Methods
+        load()
+    """
+    def load(self, filepath, num_channels=3):
+        """Loads an image.
+
+        # Arguments
+            filepath: String indicating full path to the image.
+            num_channels: Int.
+
+        # Returns
+            Numpy array of type ``uint8``.
+        """
+        return load_image(filepath, num_channels)
+
+    def __call__(self, filepath, num_channels=3):
+        return self.load(filepath, num_channels)
+
+
+def compute_reduction(image_size, target_size):
+    """Computes the largest factor by which an image can be reduced while
+    decoding without becoming smaller than a target size. Sides are
+    compared in sorted order such that rotated images give the same factor.
+
+    # Arguments
+        image_size: List of two ints with the size of the image.
+        target_size: List of two ints with the size to which the image is
+            later resized.
+
+    # Returns
+        Int. One of ``1``, ``2``, ``4`` or ``8``.
+    """
+    image_size, target_size = sorted(image_size), sorted(target_size)
+    for reduction in REDUCTIONS[::-1]:
+        if all((size // reduction) >= target for size, target in
+               zip(image_size, target_size)):
+            return reduction
+    return 1
+
+
+class ReducedImageSource(ImageSource):
+    """Decodes JPEG images at a reduced resolution if they are later
+    downscaled anyway. The factor is chosen from the image header such
+    that the decoded image is not smaller than ``target_size``.
+
+    # Arguments
+        target_size: List of two ints e.g. the input size of a model.
+    """
+    def __init__(self, target_size):
+        self.target_size = target_size
+
+    def load(self, filepath, num_channels=3):
+        if num_channels == 4:
+            return load_image(filepath, num_channels)
+        image_size = get_image_size(filepath)
+        reduction = 1
+        if image_size is not None:
+            reduction = compute_reduction(image_size, self.target_size)
+        return load_image(filepath, num_channels, reduction)
+
+
+class LRUImageCache(ImageSource):
+    """Keeps the decoded images of another source in memory. The least
+    recently used images are removed once the cache exceeds ``max_bytes``.
+    Images are copied when returned such that processors can modify them.
+
+    # Arguments
+        source: ``ImageSource`` used for images that are not cached.
+        max_bytes: Int. Maximum number of bytes of all cached images.
+
+    # Properties
+        num_bytes: Int. Number of bytes of the cached images.
+        hits: Int. Number of images returned from the cache.
+        misses: Int. Number of images loaded from ``source``.
+    """
+    def __init__(self, source=None, max_bytes=2 ** 30):
+        self.source = ImageSource() if source is None else source
+        self.max_bytes = max_bytes
+        self.clear()
+        self._lock = threading.Lock()
+
+    def clear(self):
+        """Removes all cached images."""
+        self._images = OrderedDict()
+        self.num_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._images)
+
+    def __getstate__(self):
+        # every process keeps its own cache
+        state = self.__dict__.copy()
+        state.update(_images=OrderedDict(), num_bytes=0, hits=0, misses=0)
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def load(self, filepath, num_channels=3):
+        key = (filepath, num_channels)
+        with self._lock:
+            image = self._images.get(key)
+            if image is not None:
+                self._images.move_to_end(key)
+                self.hits = self.hits + 1
+                return image.copy()
+            self.misses = self.misses + 1
+        image = self.source(filepath, num_channels)
+        if image.nbytes > self.max_bytes:
+            return image
+        with self._lock:
+            if key not in self._images:
+                self._images[key] = image
+                self.num_bytes = self.num_bytes + image.nbytes
+            while self.num_bytes > self.max_bytes:
+                removed_image = self._images.popitem(last=False)[1]
+                self.num_bytes = self.num_bytes - removed_image.nbytes
+        return image.copy()
+
+
+def _resize_to_max_size(image, max_size):
+    height, width = image.shape[:2]
+    if (max_size is None) or (max(height, width) <= max_size):
+        return image
+    scale = max_size / max(height, width)
+    size = (max(1, int(round(width * scale))),
+            max(1, int(round(height * scale))))
+    return cv2.resize(image, size, interpolation=cv2.INTER_AREA)
+
+
+def build_image_store(image_paths, directory, max_size=None, num_channels=3,
+                      shard_bytes=2 ** 28, source=None, num_workers=4):
+    """Decodes all images of a dataset once and writes them as ``uint8``
+    shards, which ``ShardedImageStore`` memory-maps in later epochs.
+
+    # Arguments
+        image_paths: List of strings with the paths of the images.
+        directory: String. Directory in which the shards are written.
+        max_size: Int or ``None``. Images with a larger side are downscaled
+            such that their largest side is ``max_size``. Boxes normalized
+            to the image size remain valid.
+        num_channels: Int.
+        shard_bytes: Int. Approximate number of bytes per shard.
+        source: ``ImageSource`` decoding the images. By default images
+            are decoded from disk.
+        num_workers: Int. Number of threads decoding images.
+
+    # Returns
+        ``ShardedImageStore``.
+    """
+    source = ImageSource() if source is None else source
+    os.makedirs(directory, exist_ok=True)
+    images, shard_images, shard_arg, offset = {}, [], 0, 0
+
+    def write_shard(shard_images, shard_arg):
+        shard = np.concatenate(
+            [image.ravel() for image in shard_images] +
+            [np.zeros(0, np.uint8)])
+        np.save(os.path.join(directory, 'shard_%05d.npy' % shard_arg), shard)
+
+    def load(image_path):
+        return _resize_to_max_size(source(image_path, num_channels), max_size)
+
+    with ThreadPoolExecutor(max(1, num_workers)) as executor:
+        for image_path, image in zip(
+                image_paths, executor.map(load, image_paths)):
+            if (offset > 0) and (offset + image.size > shard_bytes):
+                write_shard(shard_images, shard_arg)
+                shard_images, shard_arg, offset = [], shard_arg + 1, 0
+            images[image_path] = [shard_arg, offset] + list(image.shape)
+            shard_images.append(np.ascontiguousarray(image, np.uint8))
+            offset = offset + image.size
+    write_shard(shard_images, shard_arg)
+    index = {'version': STORE_VERSION, 'max_size': max_size,
+             'num_channels': num_channels, 'images': images}
+    with open(os.path.join(directory, INDEX_NAME), 'w') as filedata:
+        json.dump(index, filedata)
+    return ShardedImageStore(directory)
+
+
+class ShardedImageStore(ImageSource):
+    """Loads images from memory-mapped shards written by
+    ``build_image_store``. Pages of the shards are cached by the operating
+    system and shared by all processes. Images that are not in the store
+    are loaded from ``source``.
+
+    # Arguments
+        directory: String. Directory of the shards.
+        source: ``ImageSource`` used for images that are not in the store.
+
+    # Properties
+        max_size: Int or ``None``. Largest image side in the store.
+    """
+    def __init__(self, directory, source=None):
+        self.directory = directory
+        self.source = ImageSource() if source is None else source
+        with open(os.path.join(directory, INDEX_NAME), 'r') as filedata:
+            index = json.load(filedata)
+        if index['version'] != STORE_VERSION:
+            raise ValueError('Invalid image store version', index['version'])
+        self.max_size = index['max_size']
+        self.num_channels = index['num_channels']
+        self.images = index['images']
+        self._shards = {}
+
+    def __len__(self):
+        return len(self.images)
+
+    def __contains__(self, filepath):
+        return filepath in self.images
+
+    def __getstate__(self):
+        # shards are memory-mapped again by each process
+        state = self.__dict__.copy()
+        state['_shards'] = {}
+        return state
+
+    def _get_shard(self, shard_arg):
+        shard = self._shards.get(shard_arg)
+        if shard is None:
+            filename = 'shard_%05d.npy' % shard_arg
+            shard = np.load(os.path.join(self.directory, filename), 'r')
+            self._shards[shard_arg] = shard
+        return shard
+
+    def load(self, filepath, num_channels=3):
+        entry = self.images.get(filepath)
+        if (entry is None) or (num_channels != self.num_channels):
+            return self.source(filepath, num_channels)
+        shard_arg, offset, shape = entry[0], entry[1], entry[2:]
+        image = self._get_shard(shard_arg)[offset:offset + np.prod(shape)]
+        return np.array(image).reshape(shape)
@@ -1,4 +1,5 @@
 from warnings import warn
+from concurrent.futures import ThreadPoolExecutor
 
 import cv2
 import numpy as np
@@ -297,6 +298,108 @@ def solve_PnP_RANSAC(object_points3D, image_points2D, camera_intrinsics,
     return success, rotation_vector, translation
 
 
+def solve_PnP_RANSAC_batch(objects_points3D, images_points2D,
+                           camera_intrinsics, inlier_threshold=5,
+                           num_iterations=100, num_workers=4):
+    """Solves ``solve_PnP_RANSAC`` for many objects concurrently. OpenCV
+        releases the GIL while solving, therefore threads solve the
+        objects of an image in parallel.
+
+    # Arguments
+        objects_points3D: List of arrays (num_points, 3) with the points 3D
+            of each object in its reference frame.
+        images_points2D: List of arrays (num_points, 2) with the
+            corresponding points in camera UV space.
+        camera_intrinsics: Array of shape (3, 3).
+        inlier_threshold: Number of inliers for RANSAC method.
+        num_iterations: Maximum number of iterations.
+        num_workers: Int. Number of threads. If ``0`` objects are solved
+            sequentially.
+
+    # Returns
+        List with a tuple of success, rotation vector and translation
+            vector for each object. Objects with less than four points are
+            not solved and return ``(False, None, None)``.
+    """
+    def solve(points3D, points2D):
+        if ((len(points3D) < 4) or (len(points2D) < 4)):
+            return False, None, None
+        return solve_PnP_RANSAC(points3D, points2D, camera_intrinsics,
+                                inlier_threshold, num_iterations)
+
+    num_workers = min(num_workers, len(objects_points3D))
+    if num_workers < 2:
+        return list(map(solve, objects_points3D, images_points2D))
+    with ThreadPoolExecutor(num_workers) as executor:
+        return list(executor.map(solve, objects_points3D, images_points2D))
+
+
+def _stratify_points2D(points2D, num_samples):
+    """Returns the arguments of ``num_samples`` points distributed over a
+        grid of about ``num_samples`` cells covering the points.
+    """
+    points2D = np.asarray(points2D, dtype=np.float64)
+    min_point = np.min(points2D, axis=0)
+    extent = np.max(points2D, axis=0) - min_point + 1.0
+    cell_size = np.sqrt(np.prod(extent) / num_samples)
+    cells = ((points2D - min_point) / cell_size).astype(np.int64)
+    cell_args = cells[:, 1] * (np.max(cells[:, 0]) + 1) + cells[:, 0]
+    # rank of each point inside its cell
+    sorted_args = np.argsort(cell_args, kind='stable')
+    sorted_cell_args = cell_args[sorted_args]
+    is_first = np.concatenate(
+        [[True], sorted_cell_args[1:] != sorted_cell_args[:-1]])
+    first_args = np.flatnonzero(is_first)
+    cell_sizes = np.diff(np.append(first_args, len(points2D)))
+    ranks = np.empty(len(points2D), dtype=np.int64)
+    ranks[sorted_args] = (np.arange(len(points2D)) -
+                          np.repeat(first_args, cell_sizes))
+    # cells with the same rank are scattered with a multiplicative hash
+    # such that the last rank taken is not biased to the image top
+    hashes = (cell_args * 2654435761) % (2 ** 32)
+    args = np.lexsort((hashes, ranks))[:num_samples]
+    return np.sort(args)
+
+
+def subsample_correspondences(points3D, points2D, max_points,
+                              method='stratified', weights=None):
+    """Selects at most ``max_points`` correspondences between points 3D and
+        points 2D e.g. before solving PnP with RANSAC.
+
+    # Arguments
+        points3D: Array (num_points, 3).
+        points2D: Array (num_points, 2).
+        max_points: Int or ``None``. Maximum number of correspondences.
+            If ``None`` all correspondences are returned.
+        method: String. ``stratified`` takes points evenly over a grid
+            covering the points 2D. ``uniform`` takes evenly spaced points.
+            ``confidence`` samples points with a probability proportional
+            to ``weights``.
+        weights: Array (num_points) with the confidence of each
+            correspondence. Required by the ``confidence`` method.
+
+    # Returns
+        Points 3D and points 2D arrays with at most ``max_points`` rows.
+    """
+    num_points = len(points2D)
+    if (max_points is None) or (num_points <= max_points):
+        return points3D, points2D
+    if method == 'stratified':
+        args = _stratify_points2D(points2D, max_points)
+    elif method == 'uniform':
+        args = np.linspace(0, num_points - 1, max_points).astype(int)
+    elif method == 'confidence':
+        if weights is None:
+            raise ValueError('Confidence subsampling requires weights')
+        weights = np.asarray(weights, dtype=np.float64)
+        args = np.random.choice(num_points, max_points, False,
+                                weights / np.sum(weights))
+        args = np.sort(args)
+    else:
+        raise ValueError('Invalid subsampling method', method)
+    return points3D[args], points2D[args]
+
+
 def arguments_to_image_points2D(row_args, col_args):
     """Convert array arguments into UV coordinates.
 
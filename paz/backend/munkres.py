@@ -16,61 +16,6 @@ DISALLOWED = DISALLOWED_OBJ()
 DISALLOWED_PRINTVAL = "D"
 
 
-def get_cover_matrix(shape):
-    """Returns the initialized row and column cover matrix.
-
-    # Arguments
-        shape: Tuple. Shape of the cover matrix.
-    """
-    row_covered = np.zeros(shape, dtype='bool')
-    col_covered = np.zeros(shape, dtype='bool')
-    return row_covered, col_covered
-
-
-def find_uncovered_zero(n, cost_matrix, row_covered, col_covered, i0, j0):
-    row = -1
-    col = -1
-    done = False
-    for row_arg in range(i0, n):
-        for col_arg in range(j0, n):
-            if (cost_matrix[row_arg][col_arg] == 0) and \
-                    (not row_covered[row_arg]) and \
-                    (not col_covered[col_arg]):
-                row = row_arg
-                col = col_arg
-                done = True
-        if done:
-            break
-    return (row, col)
-
-
-def find_star_in_row(n, row_arg, marked):
-    col = -1
-    for col_arg in range(n):
-        if marked[row_arg][col_arg] == 1:
-            col = col_arg
-            break
-    return col
-
-
-def find_star_in_col(n, col_arg, marked):
-    row = -1
-    for row_arg in range(n):
-        if marked[row_arg][col_arg] == 1:
-            row = row_arg
-            break
-    return row
-
-
-def find_prime_in_row(n, row_arg, marked):
-    col = -1
-    for col_arg in range(n):
-        if marked[row_arg][col_arg] == 2:
-            col = col_arg
-            break
-    return col
-
-
 def get_min_value(series):
     values = []
     for x in series:
@@ -82,12 +27,131 @@ def get_min_value(series):
     return min_value
 
 
-def find_smallest_uncovered(n, row_covered, col_covered, cost_matrix):
-    minval = np.inf
-    for i in range(n):
-        for j in range(n):
-            if (not row_covered[i]) and (not col_covered[j]):
-                if cost_matrix[i][j] is not DISALLOWED and \
-                        minval > cost_matrix[i][j]:
-                    minval = cost_matrix[i][j]
-    return minval
+def to_cost_array(cost_matrix):
+    """Converts a cost matrix into a float array. Disallowed entries
+    are given an infinite cost.
+
+    # Arguments
+        cost_matrix: List of lists or array of shape ``(H, W)``. Entries
+            can be numbers or ``DISALLOWED`` objects.
+
+    # Returns
+        Float array of shape ``(H, W)``.
+    """
+    try:
+        return np.array(cost_matrix, dtype=np.float64)
+    except (TypeError, ValueError):
+        cost_matrix = np.array(cost_matrix, dtype=object)
+        is_disallowed = np.frompyfunc(
+            lambda x: type(x) is type(DISALLOWED), 1, 1)
+        disallowed_mask = is_disallowed(cost_matrix).astype(bool)
+        cost_matrix[disallowed_mask] = np.inf
+        return cost_matrix.astype(np.float64)
+
+
+def _find_shortest_path(cost_matrix, row_potential, col_potential,
+                        col_to_row, start_row):
+    """Finds the shortest augmenting path starting at a free row.
+
+    # Arguments
+        cost_matrix: Float array of shape ``(H, W)`` with ``H <= W``.
+        row_potential: Float array of shape ``(H)``.
+        col_potential: Float array of shape ``(W)``.
+        col_to_row: Int array of shape ``(W)`` with the row assigned to
+            each column or ``-1`` if the column is free.
+        start_row: Int. Free row in which the path starts.
+
+    # Returns
+        Tuple of: free column reached, path array with the previous row of
+            every column, shortest distances, boolean masks of the visited
+            rows and columns and the path length.
+    """
+    num_rows, num_cols = cost_matrix.shape
+    shortest = np.full(num_cols, np.inf)
+    path = np.full(num_cols, -1, dtype=int)
+    visited_rows = np.zeros(num_rows, dtype=bool)
+    visited_cols = np.zeros(num_cols, dtype=bool)
+    row, min_value, sink = start_row, 0.0, -1
+    while sink == -1:
+        visited_rows[row] = True
+        reduced_cost = (min_value + cost_matrix[row]
+                        - row_potential[row] - col_potential)
+        is_shorter = np.logical_and(~visited_cols, reduced_cost < shortest)
+        path[is_shorter] = row
+        shortest[is_shorter] = reduced_cost[is_shorter]
+        candidates = np.where(visited_cols, np.inf, shortest)
+        min_value = np.min(candidates)
+        if min_value == np.inf:
+            raise UnsolvableMatrix("Matrix cannot be solved!")
+        closest_cols = np.flatnonzero(candidates == min_value)
+        free_cols = closest_cols[col_to_row[closest_cols] == -1]
+        col = free_cols[0] if len(free_cols) > 0 else closest_cols[0]
+        visited_cols[col] = True
+        if col_to_row[col] == -1:
+            sink = col
+        else:
+            row = col_to_row[col]
+    return sink, path, shortest, visited_rows, visited_cols, min_value
+
+
+def solve_assignment(cost_matrix):
+    """Solves the linear sum assignment problem using the shortest
+    augmenting path method of Jonker and Volgenant. Each search for an
+    augmenting path is vectorized over the columns of the cost matrix.
+
+    # Arguments
+        cost_matrix: Float array of shape ``(H, W)``. Infinite values mark
+            disallowed assignments.
+
+    # Returns
+        Int array of shape ``(min(H, W), 2)`` with the assigned row and
+            column indices sorted by row.
+
+    # References
+        - [A shortest augmenting path algorithm for dense and sparse linear
+           assignment problems](https://doi.org/10.1007/BF02278710)
+        - [On implementing 2D rectangular assignment algorithms](
+           https://doi.org/10.1109/TAES.2016.140952)
+    """
+    cost_matrix = np.asarray(cost_matrix, dtype=np.float64)
+    if cost_matrix.ndim != 2:
+        raise ValueError('Cost matrix must be two dimensional')
+    if np.any(np.isnan(cost_matrix)) or np.any(cost_matrix == -np.inf):
+        raise ValueError('Cost matrix contains invalid numeric entries')
+    transposed = cost_matrix.shape[0] > cost_matrix.shape[1]
+    if transposed:
+        cost_matrix = cost_matrix.T
+    num_rows, num_cols = cost_matrix.shape
+    if np.any(np.all(np.isinf(cost_matrix), axis=1)) and (num_cols > 0):
+        raise UnsolvableMatrix("One row is entirely DISALLOWED.")
+
+    row_potential = np.zeros(num_rows)
+    col_potential = np.zeros(num_cols)
+    row_to_col = np.full(num_rows, -1, dtype=int)
+    col_to_row = np.full(num_cols, -1, dtype=int)
+    for start_row in range(num_rows):
+        sink, path, shortest, visited_rows, visited_cols, min_value = (
+            _find_shortest_path(cost_matrix, row_potential, col_potential,
+                                col_to_row, start_row))
+
+        row_potential[start_row] = row_potential[start_row] + min_value
+        visited_rows[start_row] = False
+        visited_row_cols = row_to_col[visited_rows]
+        row_potential[visited_rows] = (row_potential[visited_rows] +
+                                       min_value - shortest[visited_row_cols])
+        col_potential[visited_cols] = (col_potential[visited_cols] -
+                                       min_value + shortest[visited_cols])
+
+        col = sink
+        while True:
+            row = path[col]
+            col_to_row[col] = row
+            row_to_col[row], col = col, row_to_col[row]
+            if row == start_row:
+                break
+
+    assignments = np.stack([np.arange(num_rows), row_to_col], axis=1)
+    if transposed:
+        assignments = assignments[:, ::-1]
+        assignments = assignments[np.argsort(assignments[:, 0])]
+    return assignments
@@ -1,5 +1,6 @@
+import sys
+
 import numpy as np
-import tensorflow as tf
 
 
 def append_values(dictionary, lists, keys):
@@ -186,7 +187,7 @@ def tensor_to_numpy(tensor):
 
 def pad_matrix(matrix, pool_size=(3, 3), strides=(1, 1),
                padding='valid', value=0):
-    """Pad an array
+    """Pad an array along its first two axes
 
     # Arguments
         matrix: Array.
@@ -222,15 +223,20 @@ def pad_matrix(matrix, pool_size=(3, 3), strides=(1, 1),
         pad_left = width_pad // 2
         pad_right = width_pad - pad_left
         padding = ((pad_top, pad_bottom), (pad_left, pad_right))
+    padding = padding + ((0, 0),) * (matrix.ndim - 2)
     return np.pad(matrix, padding, mode='constant', constant_values=value)
 
 
 def max_pooling_2d(image, pool_size=3, strides=1, padding='same'):
-    """Returns the maximum pooled value of an image.
+    """Returns the maximum pooled value of an image. The maximum is
+    computed separably, first over rows and then over columns, using
+    strided views of the padded image.
 
     # Arguments
-        image: Array.
+        image: Array of shape ``(H, W)`` or ``(H, W, num_channels)``.
+            Channels are pooled independently.
         poolsize: Int or list of len 2. Window size for each pool
+        strides: Int or list of len 2. Step between consecutive windows.
         padding: String. Type of padding
     """
     if not isinstance(strides, int):
@@ -238,17 +244,18 @@ def max_pooling_2d(image, pool_size=3, strides=1, padding='same'):
     if not isinstance(pool_size, int):
         pool_size = pool_size[0]
 
-    if padding == 'valid':
-        max_image = np.zeros((image.shape[0] - pool_size + 1,
-                              image.shape[1] - pool_size + 1))
-    if padding == 'same':
-        max_image = np.zeros_like(image)
-
     image = pad_matrix(image, pool_size, strides, padding)
     H, W = image.shape[:2]
-    for y in range(0, H - pool_size + 1, strides):
-        for x in range(0, W - pool_size + 1, strides):
-            max_image[y][x] = np.max(image[y:y + pool_size, x:x + pool_size])
+    row_span = ((H - pool_size) // strides) * strides + 1
+    col_span = ((W - pool_size) // strides) * strides + 1
+    max_rows = image[0:row_span:strides]
+    for offset in range(1, pool_size):
+        rows = image[offset:offset + row_span:strides]
+        max_rows = np.maximum(max_rows, rows)
+    max_image = max_rows[:, 0:col_span:strides]
+    for offset in range(1, pool_size):
+        cols = max_rows[:, offset:offset + col_span:strides]
+        max_image = np.maximum(max_image, cols)
     return max_image
 
 
@@ -266,7 +273,9 @@ def predict(x, model, preprocess=None, postprocess=None):
     if preprocess is not None:
         x = preprocess(x)
     y = model(x)
-    if isinstance(y, tf.Tensor):
+    # outputs can only be tensors if TensorFlow has already been imported
+    tf = sys.modules.get('tensorflow')
+    if (tf is not None) and isinstance(y, tf.Tensor):
         y = y.numpy()
     if postprocess is not None:
         y = postprocess(y)
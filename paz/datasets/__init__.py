@@ -1,9 +1,7 @@
 from .utils import get_class_names
 from .voc import VOC
-from .fat import FAT
 from .open_images import OpenImages
 from .ferplus import FERPlus
-from .fer import FER
 from .cityscapes import CityScapes
 from .coco import JOINT_CONFIG
 from .coco import FLIP_CONFIG
@@ -13,4 +11,13 @@ from .CMU_poanoptic import IK_UNIT_LENGTH
 from .CMU_poanoptic import MANOHandJoints
 from .CMU_poanoptic import MPIIHandJoints
 from .shapes import Shapes
-from .omniglot import Omniglot
+from .cache import compile_annotations
+from .cache import load_compiled_annotations
+from .cache import load_cached_data
+from .cache import CompiledAnnotations
+
+from ..utils.lazy import lazy_attributes
+
+# loaders using keras utilities are only imported when accessed
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    '.fat': ['FAT'], '.fer': ['FER'], '.omniglot': ['Omniglot']})
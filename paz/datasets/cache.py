@@ -0,0 +1,239 @@
+import os
+import json
+import shutil
+import hashlib
+
+import numpy as np
+
+
+CACHE_VERSION = 1
+INDEX_NAME = 'index.json'
+
+
+def compute_sources_signature(filepaths):
+    """Computes a signature of the size and time of modification of files.
+    It changes whenever a file is added, removed or modified.
+
+    # Arguments
+        filepaths: List of strings with paths to files or directories.
+
+    # Returns
+        String with the hexadecimal signature.
+    """
+    signature = hashlib.sha256()
+    for filepath in filepaths:
+        stat = os.stat(filepath)
+        signature.update(('%s\t%d\t%d\n' % (
+            filepath, stat.st_size, stat.st_mtime_ns)).encode('utf-8'))
+    return signature.hexdigest()
+
+
+def get_cache_directory(cache_path, configuration):
+    """Returns the directory of the compiled annotations of a loader.
+
+    # Arguments
+        cache_path: String. Directory containing all compiled annotations.
+        configuration: List with the name, split, class names and options
+            of the loader. Different configurations use different caches.
+
+    # Returns
+        String.
+    """
+    key = hashlib.sha256(repr(configuration).encode('utf-8')).hexdigest()
+    return os.path.join(cache_path, key[:16])
+
+
+def _to_arrays(data):
+    boxes, class_args, difficulties, offsets = [], [], [], [0]
+    has_difficulties = len(data) > 0
+    for sample in data:
+        if not set(sample.keys()).issubset(['image', 'boxes', 'difficulties']):
+            raise ValueError('Only samples with an image, boxes and '
+                             'difficulties can be compiled')
+        sample_boxes = np.asarray(sample['boxes'], dtype=np.float64)
+        sample_boxes = sample_boxes.reshape(-1, 5)
+        boxes.append(sample_boxes[:, :4])
+        class_args.append(sample_boxes[:, 4])
+        if 'difficulties' in sample:
+            difficulties.append(sample['difficulties'])
+        else:
+            has_difficulties = False
+            difficulties.append(np.zeros(len(sample_boxes), dtype=bool))
+        offsets.append(offsets[-1] + len(sample_boxes))
+    boxes = np.concatenate(boxes + [np.zeros((0, 4))]).astype(np.float32)
+    class_args = np.concatenate(class_args + [np.zeros(0)]).astype(np.int32)
+    difficulties = np.concatenate(
+        difficulties + [np.zeros(0)]).astype(bool)
+    offsets = np.array(offsets, dtype=np.int32)
+    return boxes, class_args, difficulties, offsets, has_difficulties
+
+
+def _to_path_table(image_paths):
+    image_paths = [path.encode('utf-8') for path in image_paths]
+    lengths = [len(path) for path in image_paths]
+    path_offsets = np.cumsum([0] + lengths).astype(np.int64)
+    path_table = np.frombuffer(b''.join(image_paths), dtype=np.uint8)
+    return path_table, path_offsets
+
+
+def compile_annotations(data, directory, signature=None):
+    """Compiles the output of ``Loader.load_data`` into columnar arrays.
+    Boxes of all images are stored in one flat array and the boxes of
+    each image are selected with its offsets.
+
+    # Arguments
+        data: List of dictionaries with an 'image' path, 'boxes' array of
+            shape ``(num_boxes, 4 + 1)`` and optionally 'difficulties'.
+        directory: String. Directory in which the arrays are saved.
+        signature: String or ``None``. Signature of the source files
+            e.g. from ``compute_sources_signature``.
+
+    # Returns
+        ``CompiledAnnotations``.
+    """
+    boxes, class_args, difficulties, offsets, has_difficulties = (
+        _to_arrays(data))
+    path_table, path_offsets = _to_path_table(
+        [sample['image'] for sample in data])
+    arrays = {'boxes': boxes, 'class_args': class_args,
+              'difficulties': difficulties, 'offsets': offsets,
+              'path_table': path_table, 'path_offsets': path_offsets}
+    index = {'version': CACHE_VERSION, 'signature': signature,
+             'num_images': len(data), 'num_boxes': len(boxes),
+             'has_difficulties': has_difficulties}
+
+    # arrays are written aside and moved such that readers never see
+    # a partially written cache
+    temporal_directory = '%s.%d.tmp' % (directory.rstrip(os.sep), os.getpid())
+    os.makedirs(temporal_directory, exist_ok=True)
+    for name, array in arrays.items():
+        np.save(os.path.join(temporal_directory, name + '.npy'), array)
+    with open(os.path.join(temporal_directory, INDEX_NAME), 'w') as filedata:
+        json.dump(index, filedata)
+    if os.path.isdir(directory):
+        shutil.rmtree(directory)
+    os.rename(temporal_directory, directory)
+    return CompiledAnnotations(directory)
+
+
+class CompiledAnnotations(object):
+    """Memory-mapped annotations compiled by ``compile_annotations``.
+    It behaves as the list returned by ``Loader.load_data``, but samples
+    are only built when they are accessed.
+
+    # Arguments
+        directory: String. Directory of the compiled annotations.
+
+    # Properties
+        boxes: Array of shape ``(num_boxes, 4)`` with the box coordinates
+            of all images.
+        class_args: Array of shape ``(num_boxes)``.
+        difficulties: Array of shape ``(num_boxes)``.
+        offsets: Array of shape ``(num_images + 1)``. The boxes of image
+            ``i`` are ``boxes[offsets[i]:offsets[i + 1]]``.
+    """
+    def __init__(self, directory):
+        self.directory = directory
+        with open(os.path.join(directory, INDEX_NAME), 'r') as filedata:
+            self.index = json.load(filedata)
+        self.boxes = self._load('boxes')
+        self.class_args = self._load('class_args')
+        self.difficulties = self._load('difficulties')
+        self.offsets = self._load('offsets')
+        self._path_table = self._load('path_table')
+        self._path_offsets = self._load('path_offsets')
+
+    def _load(self, name):
+        filepath = os.path.join(self.directory, name + '.npy')
+        try:
+            return np.load(filepath, mmap_mode='r')
+        except ValueError:
+            # empty arrays can not be memory-mapped
+            return np.load(filepath)
+
+    @property
+    def signature(self):
+        return self.index['signature']
+
+    def get_image_path(self, arg):
+        start, stop = self._path_offsets[arg:arg + 2]
+        return self._path_table[start:stop].tobytes().decode('utf-8')
+
+    def _get_sample(self, arg):
+        start, stop = self.offsets[arg:arg + 2]
+        boxes = np.concatenate([self.boxes[start:stop],
+                                self.class_args[start:stop, None]], axis=1)
+        sample = {'image': self.get_image_path(arg),
+                  'boxes': boxes.astype(np.float64)}
+        if self.index['has_difficulties']:
+            sample['difficulties'] = np.array(
+                self.difficulties[start:stop], dtype=bool)
+        return sample
+
+    def __len__(self):
+        return self.index['num_images']
+
+    def __getitem__(self, arg):
+        if isinstance(arg, slice):
+            return [self._get_sample(sample_arg)
+                    for sample_arg in range(*arg.indices(len(self)))]
+        if arg < 0:
+            arg = arg + len(self)
+        if not (0 <= arg < len(self)):
+            raise IndexError('Sample index out of range')
+        return self._get_sample(arg)
+
+    def __iter__(self):
+        for sample_arg in range(len(self)):
+            yield self._get_sample(sample_arg)
+
+    def to_list(self):
+        """Returns all samples as the list of ``Loader.load_data``."""
+        return self[:]
+
+
+def load_compiled_annotations(directory, signature=None):
+    """Loads compiled annotations if they exist and are up to date.
+
+    # Arguments
+        directory: String. Directory of the compiled annotations.
+        signature: String or ``None``. Current signature of the source
+            files. If given, caches with a different signature are stale.
+
+    # Returns
+        ``CompiledAnnotations`` or ``None`` if the cache is missing or stale.
+    """
+    index_path = os.path.join(directory, INDEX_NAME)
+    if not os.path.isfile(index_path):
+        return None
+    with open(index_path, 'r') as filedata:
+        index = json.load(filedata)
+    if index.get('version') != CACHE_VERSION:
+        return None
+    if (signature is not None) and (index['signature'] != signature):
+        return None
+    return CompiledAnnotations(directory)
+
+
+def load_cached_data(load_data, cache_path, configuration, source_paths):
+    """Returns the annotations of a loader from its compiled cache. The
+    cache is compiled from ``load_data()`` if it is missing or if any of
+    the source files changed.
+
+    # Arguments
+        load_data: Function returning the samples of the loader.
+        cache_path: String. Directory containing all compiled annotations.
+        configuration: List with the options of the loader.
+            See ``get_cache_directory``.
+        source_paths: List of strings with the files parsed by
+            ``load_data``.
+
+    # Returns
+        ``CompiledAnnotations``.
+    """
+    directory = get_cache_directory(cache_path, configuration)
+    signature = compute_sources_signature(source_paths)
+    annotations = load_compiled_annotations(directory, signature)
+    if annotations is None:
+        annotations = compile_annotations(load_data(), directory, signature)
+    return annotations
@@ -2,6 +2,7 @@ import os
 import glob
 
 from paz.abstract import Loader
+from paz.abstract.loader import parse_files
 
 from .utils import get_class_names
 
@@ -16,12 +17,15 @@ class CityScapes(Loader):
         split: String. Valid option contain 'train', 'val' or 'test'.
         class_names: String or list: If 'all' then it loads all default
             class names.
+        num_workers: Int. Number of processes listing the city
+            directories. If ``0`` directories are listed serially.
 
     # References
         -[The Cityscapes Dataset for Semantic Urban Scene Understanding](
         https://www.cityscapes-dataset.com/citation/)
     """
-    def __init__(self, image_path, label_path, split, class_names='all'):
+    def __init__(self, image_path, label_path, split, class_names='all',
+                 num_workers=0):
         if split not in ['train', 'val', 'test']:
             raise ValueError('Invalid split name:', split)
         self.image_path = os.path.join(image_path, split)
@@ -29,13 +33,21 @@ class CityScapes(Loader):
         if class_names == 'all':
             class_names = get_class_names('CityScapes')
         super(CityScapes, self).__init__(
-            None, split, class_names, 'CityScapes')
+            None, split, class_names, 'CityScapes', num_workers)
 
     def load_data(self):
-        image_path = os.path.join(self.image_path, '*/*.png')
-        label_path = os.path.join(self.label_path, '*/*labelIds.png')
-        image_paths = glob.glob(image_path)
-        label_paths = glob.glob(label_path)
+        image_paths, label_paths = [], []
+        city_paths = (glob.glob(os.path.join(self.image_path, '*')) +
+                      glob.glob(os.path.join(self.label_path, '*')))
+        city_names = sorted(set(map(os.path.basename, city_paths)))
+        arguments = [(os.path.join(self.image_path, city_name, '*.png'),
+                      os.path.join(self.label_path, city_name,
+                                   '*labelIds.png'))
+                     for city_name in city_names]
+        for city_image_paths, city_label_paths in parse_files(
+                _list_city, arguments, self.num_workers):
+            image_paths.extend(city_image_paths)
+            label_paths.extend(city_label_paths)
         image_paths = sorted(image_paths)
         label_paths = sorted(label_paths)
         assert len(image_paths) == len(label_paths)
@@ -44,3 +56,8 @@ class CityScapes(Loader):
             sample = {'image_path': image_path, 'label_path': label_path}
             dataset.append(sample)
         return dataset
+
+
+def _list_city(patterns):
+    image_pattern, label_pattern = patterns
+    return glob.glob(image_pattern), glob.glob(label_pattern)
@@ -7,6 +7,7 @@ from tensorflow.keras.utils import Progbar
 
 from ..abstract import Loader
 from .utils import get_class_names
+from .cache import load_cached_data
 
 
 class FAT(Loader):
@@ -19,21 +20,41 @@ class FAT(Loader):
             e.g. `train`, `val` or `test`
         class_names: `all` or list. If list it should contain as elements
             strings indicating each class name.
+        cache_path: String or ``None``. If given, annotations are compiled
+            into this directory and memory-mapped in later loads.
+            The cache is compiled again if any label file changes.
+        num_workers: Int. Number of processes parsing the label files.
+            If ``0`` files are parsed serially.
 
     # References
         - [Deep Object Pose
             Estimation (DOPE)](https://github.com/NVlabs/Deep_Object_Pose)
     """
     # TODO: Allow selection of class_names.
-    def __init__(self, path, split='train', class_names='all'):
+    def __init__(self, path, split='train', class_names='all',
+                 cache_path=None, num_workers=0):
         if class_names == 'all':
             class_names = get_class_names('FAT')
         self.class_to_arg = dict(
             zip(class_names, list(range(len(class_names)))))
+        self.cache_path = cache_path
 
-        super(FAT, self).__init__(path, split, class_names, 'FAT')
+        super(FAT, self).__init__(
+            path, split, class_names, 'FAT', num_workers)
 
     def load_data(self):
+        if self.cache_path is None:
+            return self._load_data()
+        configuration = ['FAT', os.path.abspath(self.path), self.split,
+                         self.class_names]
+        # scene directories change when images are added or removed
+        scene_names = sorted(glob(self.path + 'mixed/*'))
+        label_paths = sorted(glob(self.path + 'mixed/*/0*.json'))
+        self.data = load_cached_data(self._load_data, self.cache_path,
+                                     configuration, scene_names + label_paths)
+        return self.data
+
+    def _load_data(self):
         scene_names = glob(self.path + 'mixed/*')
         image_paths, label_paths = [], []
         for scene_name in scene_names:
@@ -43,18 +64,20 @@ class FAT(Loader):
                 side_image_paths = sorted(image_names, key=self._base_number)
                 label_names = glob(scene_name + '/0*%s.json' % image_side)
                 side_label_paths = sorted(label_names, key=self._base_number)
-                scene_image_paths = scene_image_paths + side_image_paths
-                scene_label_paths = scene_label_paths + side_label_paths
-            image_paths = image_paths + scene_image_paths
-            label_paths = label_paths + scene_label_paths
+                scene_image_paths.extend(side_image_paths)
+                scene_label_paths.extend(side_label_paths)
+            image_paths.extend(scene_image_paths)
+            label_paths.extend(scene_label_paths)
 
-        self.data = []
-        progress_bar = Progbar(len(image_paths))
-        for sample_arg, sample in enumerate(zip(image_paths, label_paths)):
-            image_path, label_path = sample
+        for image_path, label_path in zip(image_paths, label_paths):
             if not self._valid_name_match(image_path, label_path):
                 raise ValueError('Invalid name match:', image_path, label_path)
-            boxes = self._extract_boxes(label_path)
+        # loader is copied to the workers without previously loaded data
+        self.data = []
+        label_boxes = self.parse_files(self._extract_boxes, label_paths)
+        progress_bar = Progbar(len(image_paths))
+        for sample_arg, sample in enumerate(zip(image_paths, label_boxes)):
+            image_path, boxes = sample
             if boxes is None:
                 continue
             self.data.append({'image': image_path, 'boxes': boxes})
@@ -4,6 +4,7 @@ import mmap
 import numpy as np
 
 from ..abstract import Loader
+from .cache import load_cached_data
 
 
 CLASS_DESCRIPTIONS_FILE = 'class-descriptions-boxable.csv'
@@ -20,10 +21,14 @@ class OpenImages(Loader):
             e.g. `train`, `val` or `test`
         class_names: `all` or list. If list it should contain as elements
             the strings of the class names.
+        cache_path: String or ``None``. If given, annotations are compiled
+            into this directory and memory-mapped in later loads.
+            The cache is compiled again if the annotation files change.
 
     """
     # TODO Allow selection of subset of class names.
-    def __init__(self, path, split='train', class_names='all'):
+    def __init__(self, path, split='train', class_names='all',
+                 cache_path=None):
 
         if split == 'val':
             split = 'validation'
@@ -34,6 +39,7 @@ class OpenImages(Loader):
         super(OpenImages, self).__init__(
             path, split, class_names, 'OpenImages')
 
+        self.cache_path = cache_path
         self.machine_to_human_name = dict()
         self.machine_to_arg = dict()
         self.load_class_names()
@@ -77,10 +83,34 @@ class OpenImages(Loader):
         return lines
 
     def load_data(self):
+        if self.cache_path is None:
+            return self._load_data()
+        configuration = ['OpenImages', os.path.abspath(self.path),
+                         self.split, self.class_names]
+        source_paths = [os.path.join(self.path, CLASS_DESCRIPTIONS_FILE),
+                        self._get_annotations_filepath()]
+        data = load_cached_data(self._load_data, self.cache_path,
+                                configuration, source_paths)
+        class_counts = np.bincount(
+            data.class_args, minlength=len(self.class_names))
+        for class_name in self.class_distribution.keys():
+            self.class_distribution[class_name] = 0
+        for class_arg, class_name in enumerate(self.class_names):
+            if class_arg > 0:
+                self.class_distribution[class_name] += int(
+                    class_counts[class_arg])
+        msg = '{} split: loaded {} images with {} bounding box annotations'
+        print(msg.format(self.split, len(data), len(data.class_args)))
+        return data
 
-        data = dict()
-        annotations_filepath = os.path.join(
+    def _get_annotations_filepath(self):
+        return os.path.join(
             self.path, BBOX_ANNOTATIONS_FILE.format(self.split))
+
+    def _load_data(self):
+
+        data = dict()
+        annotations_filepath = self._get_annotations_filepath()
         # num_lines = self._get_num_lines(annotations_filepath)
         machine_names = self.machine_to_human_name.keys()
         # load file manually, line by line, in order to reduce memory usage
@@ -1,9 +1,11 @@
 import os
 from xml.etree import ElementTree
 from .utils import get_class_names
+from .cache import load_cached_data
 
 import numpy as np
 from ..abstract import Loader
+from ..abstract.loader import parse_files
 
 
 class VOC(Loader):
@@ -21,6 +23,10 @@ class VOC(Loader):
             will be added to the returned data.
         evaluate: Boolean. If ``True`` returned data will be loaded without
             normalization for a direct evaluation.
+        cache_path: String or ``None``. If given, annotations are compiled
+            into this directory and memory-mapped in later loads.
+            The cache is compiled again if any annotation file changes.
+        num_workers: Int. Number of processes parsing the XML files.
 
     # Return
         data: List of dictionaries with keys corresponding to the image paths
@@ -31,12 +37,14 @@ class VOC(Loader):
     """
     # TODO check for split
     def __init__(self, path=None, split='train', class_names='all',
-                 name='VOC2007', with_difficult_samples=True, evaluate=False):
+                 name='VOC2007', with_difficult_samples=True, evaluate=False,
+                 cache_path=None, num_workers=0):
 
-        super(VOC, self).__init__(path, split, class_names, name)
+        super(VOC, self).__init__(path, split, class_names, name, num_workers)
 
         self.with_difficult_samples = with_difficult_samples
         self.evaluate = evaluate
+        self.cache_path = cache_path
         self._class_names = class_names
         if class_names == 'all':
             self._class_names = get_class_names('VOC')
@@ -44,6 +52,39 @@ class VOC(Loader):
         self.arg_to_class = None
 
     def load_data(self):
+        if self.cache_path is None:
+            return self._load_data()
+        configuration = ['VOC', os.path.abspath(self.path), self.name,
+                         self.split, self._class_names,
+                         self.with_difficult_samples, self.evaluate]
+        data = load_cached_data(self._load_data, self.cache_path,
+                                configuration, self._get_source_paths())
+        if self.arg_to_class is None:
+            names = self.name if isinstance(self.name, list) else [self.name]
+            self.images_path = os.path.join(
+                self.path, names[-1], 'JPEGImages/')
+            self.arg_to_class = dict(
+                zip(np.arange(len(self._class_names)), self._class_names))
+        return data
+
+    def _get_source_paths(self):
+        names, splits = self.name, self.split
+        if not isinstance(names, list):
+            names, splits = [names], [splits]
+        if not isinstance(splits, list):
+            raise Exception("'split' should also be a list")
+        source_paths = []
+        for name, split in zip(names, splits):
+            dataset_path = os.path.join(self.path, name)
+            split_file = os.path.join(
+                dataset_path, 'ImageSets/Main/', split + '.txt')
+            source_paths.append(split_file)
+            for line in open(split_file):
+                source_paths.append(os.path.join(
+                    dataset_path, 'Annotations/', line.strip() + '.xml'))
+        return source_paths
+
+    def _load_data(self):
         if ((self.name == 'VOC2007') or (self.name == 'VOC2012')):
             ground_truth_data = self._load_VOC(self.name, self.split)
         elif isinstance(self.name, list):
@@ -63,7 +104,8 @@ class VOC(Loader):
                                 self._class_names,
                                 self.with_difficult_samples,
                                 self.path,
-                                self.evaluate)
+                                self.evaluate,
+                                self.num_workers)
         self.images_path = self.parser.images_path
         self.arg_to_class = self.parser.arg_to_class
         ground_truth_data = self.parser.load_data()
@@ -77,6 +119,8 @@ class VOCParser(object):
 
     # Arguments
         data_path: Data path to VOC2007 annotations
+        num_workers: Int. Number of processes parsing the XML files.
+            If ``0`` files are parsed serially.
 
     # Return
         data: Dictionary which keys correspond to the image names
@@ -87,7 +131,7 @@ class VOCParser(object):
     def __init__(self, dataset_name='VOC2007', split='train',
                  class_names='all', with_difficult_samples=True,
                  dataset_path='../datasets/VOCdevkit/',
-                 evaluate=False):
+                 evaluate=False, num_workers=0):
 
         if dataset_name not in ['VOC2007', 'VOC2012']:
             raise Exception('Invalid dataset name.')
@@ -101,6 +145,7 @@ class VOCParser(object):
         self.images_path = os.path.join(self.dataset_path, 'JPEGImages/')
         self.with_difficult_samples = with_difficult_samples
         self.evaluate = evaluate
+        self.num_workers = num_workers
 
         self.class_names = class_names
         if self.class_names == 'all':
@@ -123,55 +168,60 @@ class VOCParser(object):
 
     def _preprocess_XML(self):
         filenames = self._load_filenames()
-        for filename in filenames:
-            filename_path = self.annotations_path + filename
-            tree = ElementTree.parse(filename_path)
-            root = tree.getroot()
-            image_name = root.find('filename').text
-
-            box_data = []
-            difficulties = []
-
-            size_tree = root.find('size')
-            width = float(size_tree.find('width').text)
-            height = float(size_tree.find('height').text)
-            # check evaluate flag
-            if self.evaluate:
-                width = 1
-                height = 1
-            for object_tree in root.findall('object'):
-                difficulty = int(object_tree.find('difficult').text)
-
-                if difficulty == 1 and not (self.with_difficult_samples):
-                    continue
-
-                class_name = object_tree.find('name').text
-                if class_name in self.class_names:
-                    class_arg = self.class_to_arg[class_name]
-                    bounding_box = object_tree.find('bndbox')
-                    # VOC dataset format follows Matlab,
-                    # in which indexes start from 0
-                    xmin = (float(bounding_box.find('xmin').text) - 1.0) / width
-                    ymin = (float(bounding_box.find('ymin').text) - 1.0) / height
-                    xmax = (float(bounding_box.find('xmax').text) - 1.0) / width
-                    ymax = (float(bounding_box.find('ymax').text) - 1.0) / height
-
-                    box_data.append([xmin, ymin, xmax, ymax, class_arg])
-                    difficulties.append(difficulty)
-
-            if len(box_data) == 0:
+        filename_paths = [self.annotations_path + filename
+                          for filename in filenames]
+        samples = parse_files(
+            self._parse_XML, filename_paths, self.num_workers)
+        self.data = [sample for sample in samples if sample is not None]
+
+    def _parse_XML(self, filename_path):
+        tree = ElementTree.parse(filename_path)
+        root = tree.getroot()
+        image_name = root.find('filename').text
+
+        box_data = []
+        difficulties = []
+
+        size_tree = root.find('size')
+        width = float(size_tree.find('width').text)
+        height = float(size_tree.find('height').text)
+        # check evaluate flag
+        if self.evaluate:
+            width = 1
+            height = 1
+        for object_tree in root.findall('object'):
+            difficulty = int(object_tree.find('difficult').text)
+
+            if difficulty == 1 and not (self.with_difficult_samples):
                 continue
 
-            # self.data[self.images_path + image_name] = label_data
-            image_path = self.images_path + image_name
-            box_data = np.asarray(box_data)
-            difficulties = np.asarray(difficulties, dtype=bool)
-            if self.evaluate:
-                self.data.append({'image': image_path,
-                                  'boxes': box_data,
-                                  'difficulties': difficulties})
-            else:
-                self.data.append({'image': image_path, 'boxes': box_data})
+            class_name = object_tree.find('name').text
+            if class_name in self.class_names:
+                class_arg = self.class_to_arg[class_name]
+                bounding_box = object_tree.find('bndbox')
+                # VOC dataset format follows Matlab,
+                # in which indexes start from 0
+                xmin = (float(bounding_box.find('xmin').text) - 1.0) / width
+                ymin = (float(bounding_box.find('ymin').text) - 1.0) / height
+                xmax = (float(bounding_box.find('xmax').text) - 1.0) / width
+                ymax = (float(bounding_box.find('ymax').text) - 1.0) / height
+
+                box_data.append([xmin, ymin, xmax, ymax, class_arg])
+                difficulties.append(difficulty)
+
+        if len(box_data) == 0:
+            return None
+
+        # self.data[self.images_path + image_name] = label_data
+        image_path = self.images_path + image_name
+        box_data = np.asarray(box_data)
+        difficulties = np.asarray(difficulties, dtype=bool)
+        if self.evaluate:
+            return {'image': image_path,
+                    'boxes': box_data,
+                    'difficulties': difficulties}
+        else:
+            return {'image': image_path, 'boxes': box_data}
 
     def load_data(self):
         return self.data
@@ -1 +1,6 @@
 from .detection import evaluateMAP
+from .detection import evaluate_detections
+from .detection import predict_detections
+from .detection import load_ground_truths
+from .detection import COCO_IOU_THRESHOLDS
+from .detection import DetectionEvaluator
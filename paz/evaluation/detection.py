@@ -1,8 +1,242 @@
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
+from ..abstract import Boxes2D
 from ..backend.boxes import compute_ious
 from ..backend.image import load_image
 
 
+COCO_IOU_THRESHOLDS = np.linspace(0.5, 0.95, 10)
+
+
+def _load_images(paths, batch_size, num_workers):
+    """Yields lists of ``batch_size`` decoded images. If ``num_workers``
+    is larger than zero images are decoded in a thread pool while the
+    previous batch is being processed.
+    """
+    batches = [paths[arg:arg + batch_size]
+               for arg in range(0, len(paths), batch_size)]
+    if num_workers == 0:
+        for batch in batches:
+            yield [load_image(path) for path in batch]
+        return
+    with ThreadPoolExecutor(num_workers) as executor:
+        futures = None
+        for batch_arg in range(len(batches)):
+            if futures is None:
+                futures = [executor.submit(load_image, path)
+                           for path in batches[batch_arg]]
+            images = [future.result() for future in futures]
+            futures = None
+            if batch_arg + 1 < len(batches):
+                futures = [executor.submit(load_image, path)
+                           for path in batches[batch_arg + 1]]
+            yield images
+
+
+def to_detection_arrays(boxes2D, class_to_arg):
+    """Converts the ``Box2D`` messages of a detector into arrays.
+
+    # Arguments
+        boxes2D: List of ``Box2D`` messages or ``Boxes2D`` message.
+        class_to_arg: Dict. of class names and their id
+
+    # Returns
+        Tuple of arrays with the predicted boxes of shape ``(num_boxes, 4)``,
+            their class args and scores.
+    """
+    if isinstance(boxes2D, Boxes2D):
+        class_args = [class_to_arg.get(class_name, -1) for class_name in
+                      boxes2D.class_names]
+        class_args = np.array(class_args, dtype=int)[boxes2D.class_args]
+        if np.any(class_args == -1):
+            raise KeyError('Unknown class names', boxes2D.class_names)
+        return (boxes2D.coordinates.astype(np.float32), class_args,
+                boxes2D.scores.astype(np.float32))
+    predicted_boxes, predicted_class_args, predicted_scores = [], [], []
+    for box2D in boxes2D:
+        predicted_scores.append(box2D.score)
+        predicted_class_args.append(class_to_arg[box2D.class_name])
+        predicted_boxes.append(list(box2D.coordinates))
+    predicted_boxes = np.array(predicted_boxes, dtype=np.float32)
+    predicted_boxes = predicted_boxes.reshape(-1, 4)
+    predicted_class_args = np.array(predicted_class_args, dtype=int)
+    predicted_scores = np.array(predicted_scores, dtype=np.float32)
+    return predicted_boxes, predicted_class_args, predicted_scores
+
+
+def predict_detections(detector, dataset, class_to_arg, batch_size=1,
+                       num_workers=0):
+    """Runs the detector over all images of a dataset. The returned
+    detections can be re-scored at different IoU thresholds without running
+    the detector again.
+
+    # Arguments
+        detector : Function for performing inference. If ``batch_size`` is
+            larger than one, the detector must have a ``predict_batch``
+            method e.g. ``DetectSingleShot``.
+        dataset: List of dictionaries containing 'image' as key and the
+            path to an image as value.
+        class_to_arg: Dict. of class names and their id
+        batch_size: Int. Number of images given at once to the detector.
+        num_workers: Int. Number of threads decoding images ahead of the
+            detector. If ``0`` images are decoded serially.
+
+    # Returns
+        List with a tuple of predicted boxes, class args and scores per
+            image.
+    """
+    paths = [sample['image'] for sample in dataset]
+    detections = []
+    for images in _load_images(paths, batch_size, num_workers):
+        if batch_size > 1:
+            results = detector.predict_batch(images)
+        else:
+            results = [detector(image) for image in images]
+        for result in results:
+            detections.append(
+                to_detection_arrays(result['boxes2D'], class_to_arg))
+    return detections
+
+
+def load_ground_truths(dataset):
+    """Converts the ground truth of a dataset into arrays. The output can
+    be cached and reused across evaluations of the same dataset.
+
+    # Arguments
+        dataset: List of dictionaries containing 'boxes' as key and a numpy
+            array of shape ``(num_boxes, 5)`` with the box coordinates and
+            class args as value. Samples can have a 'difficulties' key.
+
+    # Returns
+        List with a tuple of ground truth boxes, class args and
+            difficulties per image.
+    """
+    ground_truths = []
+    for sample in dataset:
+        ground_truth_boxes = np.array(sample['boxes'][:, :4])
+        ground_truth_class_args = np.array(sample['boxes'][:, 4]).astype(int)
+        if 'difficulties' in sample.keys():
+            difficulties = np.array(sample['difficulties'], dtype=bool)
+        else:
+            difficulties = np.zeros(len(ground_truth_boxes), dtype=bool)
+        ground_truths.append(
+            (ground_truth_boxes, ground_truth_class_args, difficulties))
+    return ground_truths
+
+
+def match_image_detections(detection, ground_truth, iou_thresholds):
+    """Matches the predictions of one image to its ground truth boxes for
+    all classes at once. A prediction is matched to the ground truth box of
+    its class with the largest IoU. Predictions are ordered per class from
+    maximum to minimum score and only the first prediction of a ground
+    truth box is a true positive.
+
+    # Arguments
+        detection: Tuple of predicted boxes, class args and scores.
+        ground_truth: Tuple of ground truth boxes, class args and
+            difficulties.
+        iou_thresholds: List of floats. A prediction is correct if its
+            Intersection over Union with the ground truth is above this
+            value.
+
+    # Returns
+        Sorted class args, sorted scores and an array of shape
+            ``(num_thresholds, num_predictions)`` with ``1`` for true
+            positives, ``0`` for false positives and ``-1`` for
+            predictions matching a difficult ground truth.
+    """
+    predicted_boxes, predicted_class_args, predicted_scores = detection
+    ground_truth_boxes, ground_truth_class_args, difficulties = ground_truth
+    num_predictions = len(predicted_boxes)
+    # sort per class from maximum to minimum score
+    order = np.lexsort((-np.arange(num_predictions), -predicted_scores,
+                        predicted_class_args))
+    predicted_boxes = predicted_boxes[order]
+    predicted_class_args = predicted_class_args[order]
+    predicted_scores = predicted_scores[order]
+    matches = np.zeros((len(iou_thresholds), num_predictions), dtype=np.int8)
+    if (num_predictions == 0) or (len(ground_truth_boxes) == 0):
+        return predicted_class_args, predicted_scores, matches
+
+    # evaluation on VOC follows integer typed bounding boxes.
+    predicted_boxes = predicted_boxes.copy()
+    predicted_boxes[:, 2:] = predicted_boxes[:, 2:] + 1
+    ground_truth_boxes = ground_truth_boxes.copy()
+    ground_truth_boxes[:, 2:] = ground_truth_boxes[:, 2:] + 1
+    ious = compute_ious(predicted_boxes, ground_truth_boxes)
+    same_class = (predicted_class_args[:, None] ==
+                  ground_truth_class_args[None, :])
+    ious = np.where(same_class, ious, -1.0)
+    ground_truth_args = ious.argmax(axis=1)
+    max_ious = ious[np.arange(num_predictions), ground_truth_args]
+    is_difficult = difficulties[ground_truth_args]
+    for threshold_arg, iou_thresh in enumerate(iou_thresholds):
+        is_matched = max_ious >= iou_thresh
+        matched_args = np.flatnonzero(is_matched)
+        first_args = np.unique(
+            ground_truth_args[matched_args], return_index=True)[1]
+        is_first = np.zeros(num_predictions, dtype=bool)
+        is_first[matched_args[first_args]] = True
+        matches[threshold_arg, is_first] = 1
+        matches[threshold_arg, is_matched & is_difficult] = -1
+    return predicted_class_args, predicted_scores, matches
+
+
+def score_detections(detections, ground_truths, num_classes,
+                     iou_thresholds=0.5):
+    """Computes the matches of cached detections at one or several IoU
+    thresholds.
+
+    # Arguments
+        detections: List of detections per image.
+            See ``predict_detections``.
+        ground_truths: List of ground truths per image.
+            See ``load_ground_truths``.
+        num_classes: Int. Number of classes including background.
+        iou_thresholds: Float or list of floats.
+
+    # Returns
+        num_positives: Dict. containing number of positives for each class
+        score: Dict. containing matching scores of boxes for each class
+        matches: List with a dict. per IoU threshold containing
+            match/non-match info of boxes in each class
+    """
+    iou_thresholds = np.atleast_1d(iou_thresholds)
+    class_args = list(range(1, num_classes + 1))
+    positives = np.zeros(num_classes + 2, dtype=int)
+    image_class_args, image_scores, image_matches = [], [], []
+    for detection, ground_truth in zip(detections, ground_truths):
+        ground_truth_class_args, difficulties = ground_truth[1:]
+        positives = positives + np.bincount(
+            ground_truth_class_args[np.logical_not(difficulties)],
+            minlength=num_classes + 2)[:num_classes + 2]
+        predicted_class_args, scores, matches = match_image_detections(
+            detection, ground_truth, iou_thresholds)
+        image_class_args.append(predicted_class_args)
+        image_scores.append(scores)
+        image_matches.append(matches)
+
+    predicted_class_args = np.concatenate(
+        image_class_args + [np.zeros(0, dtype=int)])
+    scores = np.concatenate(image_scores + [np.zeros(0, np.float32)])
+    matches = np.concatenate(
+        image_matches + [np.zeros((len(iou_thresholds), 0), np.int8)], 1)
+    order = np.argsort(predicted_class_args, kind='stable')
+    predicted_class_args = predicted_class_args[order]
+    scores, matches = scores[order], matches[:, order]
+    starts = np.searchsorted(predicted_class_args, class_args, 'left')
+    stops = np.searchsorted(predicted_class_args, class_args, 'right')
+
+    num_positives = {arg: int(positives[arg]) for arg in class_args}
+    score, match = {}, [{} for iou_thresh in iou_thresholds]
+    for class_arg, start, stop in zip(class_args, starts, stops):
+        score[class_arg] = list(scores[start:stop])
+        for threshold_arg in range(len(iou_thresholds)):
+            match[threshold_arg][class_arg] = list(
+                matches[threshold_arg, start:stop])
+    return num_positives, score, match
+
+
 def compute_matches(dataset, detector, class_to_arg, iou_thresh=0.5):
     """
     Arguments:
@@ -18,90 +252,11 @@ def compute_matches(dataset, detector, class_to_arg, iou_thresh=0.5):
         score: Dict. containing matching scores of boxes for each class
         match: Dict. containing match/non-match info of boxes in each class
     """
-    # classes_count = len(np.unique(np.concatenate(ground_truth_class_args)))
-    num_classes = len(class_to_arg)
-    num_positives = {label_id: 0 for label_id in range(1, num_classes + 1)}
-    score = {label_id: [] for label_id in range(1, num_classes + 1)}
-    match = {label_id: [] for label_id in range(1, num_classes + 1)}
-    for sample in dataset:
-        # obtaining ground truths
-        ground_truth_boxes = np.array(sample['boxes'][:, :4])
-        ground_truth_class_args = np.array(sample['boxes'][:, 4])
-        if 'difficulties' in sample.keys():
-            difficulties = np.array(sample['difficulties'])
-        else:
-            difficulties = None
-        # obtaining predictions
-        image = load_image(sample['image'])
-        results = detector(image)
-        predicted_boxes, predicted_class_args, predicted_scores = [], [], []
-        for box2D in results['boxes2D']:
-            predicted_scores.append(box2D.score)
-            predicted_class_args.append(class_to_arg[box2D.class_name])
-            predicted_boxes.append(list(box2D.coordinates))
-        predicted_boxes = np.array(predicted_boxes, dtype=np.float32)
-        predicted_class_args = np.array(predicted_class_args)
-        predicted_scores = np.array(predicted_scores, dtype=np.float32)
-        # setting difficulties to ``Easy`` if they are None
-        if difficulties is None:
-            difficulties = np.zeros(len(ground_truth_boxes), dtype=bool)
-        # iterating over each class present in the image
-        class_args = np.concatenate(
-            (predicted_class_args, ground_truth_class_args))
-        class_args = np.unique(class_args).astype(int)
-        for class_arg in class_args:
-            # masking predictions by class
-            class_mask = class_arg == predicted_class_args
-            class_predicted_boxes = predicted_boxes[class_mask]
-            class_predicted_scores = predicted_scores[class_mask]
-            # sort score from maximum to minimum for masked predictions
-            sorted_args = class_predicted_scores.argsort()[::-1]
-            class_predicted_boxes = class_predicted_boxes[sorted_args]
-            class_predicted_scores = class_predicted_scores[sorted_args]
-            # masking ground truths by class
-            class_mask = class_arg == ground_truth_class_args
-            class_ground_truth_boxes = ground_truth_boxes[class_mask]
-            class_difficulties = difficulties[class_mask]
-            # the number of positives equals the number of easy boxes
-            num_easy = np.logical_not(class_difficulties).sum()
-            num_positives[class_arg] = num_positives[class_arg] + num_easy
-            # add all predicted scores to scores
-            score[class_arg].extend(class_predicted_scores)
-            # if not predicted boxes for this class continue
-            if len(class_predicted_boxes) == 0:
-                continue
-            # if not ground truth boxes continue but add zeros as matches
-            if len(class_ground_truth_boxes) == 0:
-                match[class_arg].extend((0,) * len(class_predicted_boxes))
-                continue
-
-            # evaluation on VOC follows integer typed bounding boxes.
-            class_predicted_boxes = class_predicted_boxes.copy()
-            class_predicted_boxes[:, 2:] = (
-                class_predicted_boxes[:, 2:] + 1)
-            class_ground_truth_boxes = class_ground_truth_boxes.copy()
-            class_ground_truth_boxes[:, 2:] = (
-                class_ground_truth_boxes[:, 2:] + 1)
-
-            ious = compute_ious(
-                class_predicted_boxes, class_ground_truth_boxes)
-            ground_truth_args = ious.argmax(axis=1)
-            # set -1 if there is no matching ground truth
-            ground_truth_args[ious.max(axis=1) < iou_thresh] = -1
-            selected = np.zeros(len(class_ground_truth_boxes), dtype=bool)
-            for ground_truth_arg in ground_truth_args:
-                if ground_truth_arg >= 0:
-                    if class_difficulties[ground_truth_arg]:
-                        match[class_arg].append(-1)
-                    else:
-                        if not selected[ground_truth_arg]:
-                            match[class_arg].append(1)
-                        else:
-                            match[class_arg].append(0)
-                    selected[ground_truth_arg] = True
-                else:
-                    match[class_arg].append(0)
-    return num_positives, score, match
+    detections = predict_detections(detector, dataset, class_to_arg)
+    ground_truths = load_ground_truths(dataset)
+    num_positives, score, match = score_detections(
+        detections, ground_truths, len(class_to_arg), iou_thresh)
+    return num_positives, score, match[0]
 
 
 def calculate_relevance_metrics(num_positives, scores, matches):
@@ -130,63 +285,279 @@ def calculate_relevance_metrics(num_positives, scores, matches):
     return precision, recall
 
 
+def _reverse_segment_maximum(values, segment_args):
+    """Maximum from each value to the end of its segment along the last
+    axis. Values must be in ``[0, 1]`` and ``segment_args`` sorted.
+    """
+    # offsets keep the values of a segment above those of the next ones
+    offsets = -2.0 * segment_args
+    values = np.maximum.accumulate((values + offsets)[:, ::-1], axis=1)
+    return values[:, ::-1] - offsets
+
+
+def _compute_average_precisions(precisions, recalls, class_args,
+                                num_classes, use_07_metric=False):
+    """Calculates the average precisions of all classes at once.
+
+    # Arguments
+        precisions: Array of shape ``(num_curves, num_predictions)`` with
+            the precisions of the predictions sorted by class and score.
+        recalls: Array of shape ``(num_curves, num_predictions)``.
+        class_args: Array of shape ``(num_predictions)`` with the sorted
+            class args of the predictions.
+        num_classes: Int. Number of classes.
+        use_07_metric: Boolean. If ``True`` the 11 point metric of PASCAL
+            VOC 2007 is used.
+
+    # Returns
+        Array of shape ``(num_curves, num_classes)``.
+    """
+    num_curves = len(precisions)
+    precisions = np.nan_to_num(precisions)
+    counts = np.bincount(class_args, minlength=num_classes)
+    if use_07_metric:
+        average_precisions = np.zeros((num_curves, num_classes))
+        is_filled = counts > 0
+        if not np.any(is_filled):
+            return average_precisions
+        starts = (np.cumsum(counts) - counts)[is_filled]
+        for recall_thresh in np.arange(0., 1.1, 0.1):
+            values = np.where(recalls >= recall_thresh, precisions, 0.0)
+            p_interpolation = np.maximum.reduceat(values, starts, axis=1)
+            average_precisions[:, is_filled] = (
+                average_precisions[:, is_filled] + (p_interpolation / 11))
+        return average_precisions
+
+    # each class curve gets sentinel values at its start and end
+    lengths = counts + 2
+    padded_class_args = np.repeat(np.arange(num_classes), lengths)
+    positions = np.arange(len(class_args)) + (2 * class_args) + 1
+    average_precision = np.zeros((num_curves, len(padded_class_args)))
+    average_precision[:, positions] = precisions
+    average_recall = np.zeros_like(average_precision)
+    average_recall[:, positions] = recalls
+    average_recall[:, np.cumsum(lengths) - 1] = 1.0
+    average_precision = _reverse_segment_maximum(
+        average_precision, padded_class_args)
+
+    # sum (\Delta recall) * precision, which is zero where recall is equal
+    areas = ((average_recall[:, 1:] - average_recall[:, :-1]) *
+             average_precision[:, 1:])
+    areas = areas * (padded_class_args[1:] == padded_class_args[:-1])
+    curve_args = (padded_class_args[1:] +
+                  num_classes * np.arange(num_curves)[:, None])
+    average_precisions = np.bincount(
+        curve_args.ravel(), areas.ravel(), num_curves * num_classes)
+    return average_precisions.reshape(num_curves, num_classes)
+
+
 def calculate_average_precisions(precision, recall, use_07_metric=False):
-    """Calculate average precisions based based on PASCAL VOC evaluation
+    """Calculate average precisions based based on PASCAL VOC evaluation.
+    All classes are computed at once.
+
     Arguments:
-        num_positives: Dict. with number of positives for each class
-        scores: Dict. with matching scores of boxes for each class
-        matches: Dict. wth match/non-match info for boxes for each class
+        precision: List with an array of precisions per class or ``None``.
+        recall: List with an array of recalls per class or ``None``.
+        use_07_metric: Boolean. If ``True`` the 11 point metric of PASCAL
+            VOC 2007 is used.
     Returns:
+        Array with the average precision of each class. Classes without
+            precision or recall are ``np.nan``.
     """
-
     num_classes = len(precision)
-    average_precisions = np.empty(num_classes)
-    for class_arg in range(num_classes):
-        if precision[class_arg] is None or recall[class_arg] is None:
-            average_precisions[class_arg] = np.nan
-            continue
-
-        if use_07_metric:
-            # 11 point metric
-            average_precisions[class_arg] = 0
-            for t in np.arange(0., 1.1, 0.1):
-                if np.sum(recall[class_arg] >= t) == 0:
-                    p_interpolation = 0
-                else:
-                    p_interpolation = np.max(
-                        np.nan_to_num(
-                            precision[class_arg]
-                        )[recall[class_arg] >= t]
-                    )
-                average_precision_class = average_precisions[class_arg]
-                average_precision_class = (average_precision_class +
-                                           (p_interpolation / 11))
-                average_precisions[class_arg] = average_precision_class
-
-        else:
-            # first append sentinel values at the end
-            average_precision = np.concatenate(
-                ([0], np.nan_to_num(precision[class_arg]), [0]))
-            average_recall = np.concatenate(([0], recall[class_arg], [1]))
-
-            average_precision = np.maximum.accumulate(
-                average_precision[::-1])[::-1]
-
-            # to calculate area under PR curve, look for points
-            # where X axis (recall) changes value
-            recall_change_arg = np.where(
-                average_recall[1:] != average_recall[:-1])[0]
-
-            # and sum (\Delta recall) * precision
-            average_precisions[class_arg] = np.sum(
-                (average_recall[recall_change_arg + 1] -
-                 average_recall[recall_change_arg]) *
-                average_precision[recall_change_arg + 1])
+    is_valid = np.array([(class_precision is not None) and
+                         (class_recall is not None) for
+                         class_precision, class_recall in
+                         zip(precision, recall)], dtype=bool)
+    valid_args = np.flatnonzero(is_valid)
+    class_args = np.repeat(
+        valid_args, [len(precision[arg]) for arg in valid_args])
+    precisions = np.concatenate(
+        [precision[arg] for arg in valid_args] + [np.zeros(0)])
+    recalls = np.concatenate(
+        [recall[arg] for arg in valid_args] + [np.zeros(0)])
+    average_precisions = _compute_average_precisions(
+        precisions[None], recalls[None], class_args, num_classes,
+        use_07_metric)[0]
+    average_precisions[np.logical_not(is_valid)] = np.nan
     return average_precisions
 
 
+def _grow(array, capacity):
+    grown_array = np.zeros(array.shape[:-1] + (capacity, ), array.dtype)
+    grown_array[..., :array.shape[-1]] = array
+    return grown_array
+
+
+class DetectionEvaluator(object):
+    """Streaming evaluation of object detections. Each ``update`` matches
+    the predictions of one image and appends them to preallocated typed
+    arrays i.e. memory grows by a few bytes per prediction and average
+    precisions can be reported at any point with ``result``. Evaluators
+    of different workers are combined with ``merge``.
+
+    # Arguments
+        num_classes: Int. Number of classes including background.
+        iou_thresholds: Float or list of floats e.g.
+            ``COCO_IOU_THRESHOLDS``.
+        use_07_metric: Boolean. If ``True`` the 11 point metric of PASCAL
+            VOC 2007 is used.
+        capacity: Int. Number of predictions allocated at the start.
+            Arrays double their size when they are full.
+
+    # Methods
+        update()
+        merge()
+        result()
+        reset()
+    """
+    def __init__(self, num_classes, iou_thresholds=0.5, use_07_metric=False,
+                 capacity=1024):
+        self.num_classes = num_classes
+        self.iou_thresholds = np.atleast_1d(iou_thresholds).astype(float)
+        self.use_07_metric = use_07_metric
+        self.capacity = capacity
+        self.reset()
+
+    def reset(self):
+        """Removes all accumulated predictions and ground truths."""
+        self.num_images = 0
+        self.num_predictions = 0
+        self.num_positives = np.zeros(self.num_classes + 1, dtype=np.int64)
+        num_thresholds = len(self.iou_thresholds)
+        class_dtype = np.min_scalar_type(self.num_classes)
+        self.class_args = np.zeros(self.capacity, dtype=class_dtype)
+        self.scores = np.zeros(self.capacity, dtype=np.float32)
+        self.matches = np.zeros((num_thresholds, self.capacity), np.int8)
+
+    def _append(self, class_args, scores, matches):
+        start = self.num_predictions
+        stop = start + len(scores)
+        if stop > len(self.scores):
+            capacity = max(stop, 2 * len(self.scores))
+            self.class_args = _grow(self.class_args, capacity)
+            self.scores = _grow(self.scores, capacity)
+            self.matches = _grow(self.matches, capacity)
+        self.class_args[start:stop] = class_args
+        self.scores[start:stop] = scores
+        self.matches[:, start:stop] = matches
+        self.num_predictions = stop
+
+    def update(self, detection, ground_truth):
+        """Matches the predictions of one image and accumulates them.
+
+        # Arguments
+            detection: Tuple of predicted boxes, class args and scores.
+                See ``to_detection_arrays``.
+            ground_truth: Tuple of ground truth boxes, class args and
+                difficulties. See ``load_ground_truths``.
+        """
+        ground_truth_class_args, difficulties = ground_truth[1:]
+        positives = np.bincount(
+            ground_truth_class_args[np.logical_not(difficulties)],
+            minlength=self.num_classes + 1)
+        self.num_positives += positives[:self.num_classes + 1]
+        class_args, scores, matches = match_image_detections(
+            detection, ground_truth, self.iou_thresholds)
+        is_valid = (class_args >= 1) & (class_args <= self.num_classes)
+        self._append(class_args[is_valid], scores[is_valid],
+                     matches[:, is_valid])
+        self.num_images = self.num_images + 1
+
+    def merge(self, evaluator):
+        """Adds the accumulated state of another evaluator.
+
+        # Arguments
+            evaluator: ``DetectionEvaluator`` with the same number of
+                classes and IoU thresholds.
+
+        # Returns
+            This evaluator.
+        """
+        if ((evaluator.num_classes != self.num_classes) or not
+                np.array_equal(evaluator.iou_thresholds, self.iou_thresholds)):
+            raise ValueError('Evaluators with different number of classes '
+                             'or IoU thresholds cannot be merged')
+        size = evaluator.num_predictions
+        self._append(evaluator.class_args[:size], evaluator.scores[:size],
+                     evaluator.matches[:, :size])
+        self.num_positives += evaluator.num_positives
+        self.num_images = self.num_images + evaluator.num_images
+        return self
+
+    def result(self):
+        """Calculates the average precisions of the accumulated images.
+
+        # Returns
+            Dictionary with the average precisions ``ap`` of shape
+                ``(num_thresholds, num_classes + 1)``, the mean average
+                precision ``map`` per threshold and ``map`` averaged over
+                thresholds as ``mean_map``.
+        """
+        size = self.num_predictions
+        class_args = self.class_args[:size].astype(int)
+        scores = self.scores[:size]
+        # sort per class from maximum to minimum score
+        order = np.lexsort((-np.arange(size), -scores, class_args))
+        class_args = class_args[order]
+        matches = self.matches[:, order]
+        counts = np.bincount(class_args, minlength=self.num_classes + 1)
+        starts = (np.cumsum(counts) - counts)[class_args]
+        true_positives = np.cumsum(matches == 1, axis=1)
+        false_positives = np.cumsum(matches == 0, axis=1)
+        # cumulative sums restart at the first prediction of each class
+        true_positives = true_positives - np.pad(
+            true_positives, ((0, 0), (1, 0)))[:, starts]
+        false_positives = false_positives - np.pad(
+            false_positives, ((0, 0), (1, 0)))[:, starts]
+        with np.errstate(invalid='ignore'):
+            precisions = true_positives / (false_positives + true_positives)
+        recalls = true_positives / np.maximum(
+            self.num_positives[class_args], 1)
+        average_precisions = _compute_average_precisions(
+            precisions, recalls, class_args, self.num_classes + 1,
+            self.use_07_metric)
+        has_positives = self.num_positives > 0
+        has_positives[0] = False
+        average_precisions[:, np.logical_not(has_positives)] = np.nan
+        mean_average_precisions = np.nanmean(average_precisions, axis=1)
+        return {'iou_thresholds': self.iou_thresholds,
+                'ap': average_precisions,
+                'map': mean_average_precisions,
+                'mean_map': np.mean(mean_average_precisions)}
+
+
+def evaluate_detections(detections, ground_truths, num_classes,
+                        iou_thresholds=0.5, use_07_metric=False):
+    """Calculate average precisions of cached detections at one or
+    several IoU thresholds e.g. ``COCO_IOU_THRESHOLDS``.
+
+    # Arguments
+        detections: List of detections per image.
+            See ``predict_detections``.
+        ground_truths: List of ground truths per image.
+            See ``load_ground_truths``.
+        num_classes: Int. Number of classes including background.
+        iou_thresholds: Float or list of floats.
+        use_07_metric: Boolean. If ``True`` the 11 point metric of PASCAL
+            VOC 2007 is used.
+
+    # Returns
+        Dictionary with the average precisions ``ap`` of shape
+            ``(num_thresholds, num_classes)``, the mean average precision
+            ``map`` per threshold and ``map`` averaged over thresholds as
+            ``mean_map``.
+    """
+    evaluator = DetectionEvaluator(
+        num_classes, iou_thresholds, use_07_metric)
+    for detection, ground_truth in zip(detections, ground_truths):
+        evaluator.update(detection, ground_truth)
+    return evaluator.result()
+
+
 def evaluateMAP(detector, dataset, class_to_arg, iou_thresh=0.5,
-                use_07_metric=False):
+                use_07_metric=False, batch_size=1, num_workers=0,
+                ground_truths=None):
     """Calculate average precisions based on evaluation code of PASCAL VOC.
     Arguments:
         dataset: List of dictionaries containing 'image' as key and a
@@ -195,11 +566,17 @@ def evaluateMAP(detector, dataset, class_to_arg, iou_thresh=0.5,
         class_to_arg: Dict. of class names and their id
         iou_thresh: Float indicating intersection over union threshold for
             assigning a prediction as correct.
+        batch_size: Int. Number of images given at once to the detector.
+            See ``predict_detections``.
+        num_workers: Int. Number of threads decoding images.
+        ground_truths: List of cached ground truths. If ``None`` they are
+            loaded from ``dataset``. See ``load_ground_truths``.
     # Returns:
     """
-    positives, score, match = compute_matches(
-        dataset, detector, class_to_arg, iou_thresh)
-    precision, recall = calculate_relevance_metrics(positives, score, match)
-    average_precisions = calculate_average_precisions(
-        precision, recall, use_07_metric)
-    return {'ap': average_precisions, 'map': np.nanmean(average_precisions)}
+    detections = predict_detections(
+        detector, dataset, class_to_arg, batch_size, num_workers)
+    if ground_truths is None:
+        ground_truths = load_ground_truths(dataset)
+    result = evaluate_detections(detections, ground_truths,
+                                 len(class_to_arg), iou_thresh, use_07_metric)
+    return {'ap': result['ap'][0], 'map': result['map'][0]}
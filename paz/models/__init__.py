@@ -27,3 +27,8 @@ from .segmentation import UNET_VGG16
 from .segmentation import UNET_VGG19
 from .segmentation import UNET_RESNET50
 from .pose_estimation import HigherHRNet
+from .registry import get_model
+from .registry import preload_models
+from .registry import warm_up_model
+from .registry import clear_models
+from .registry import WeightsFile
@@ -4,7 +4,7 @@ from tensorflow.keras.layers import GlobalAveragePooling2D
 from tensorflow.keras import Model
 from tensorflow.keras.regularizers import l2
 from tensorflow.keras.models import load_model
-from tensorflow.keras.utils import get_file
+from ...utils.weights import get_weights_file
 
 
 URL = 'https://github.com/oarriaga/altamira-data/releases/download/v0.6/'
@@ -102,7 +102,8 @@ def MiniXception(input_shape, num_classes, weights=None):
     """
     if weights == 'FER':
         filename = 'fer2013_mini_XCEPTION.119-0.65.hdf5'
-        path = get_file(filename, URL + filename, cache_subdir='paz/models')
+        path = get_weights_file(filename, URL + filename,
+                                cache_subdir='paz/models')
         model = load_model(path)
     else:
         stem_kernels = [32, 64]
@@ -1,6 +1,6 @@
 from tensorflow.keras.layers import Input
 from tensorflow.keras.models import Model
-from tensorflow.keras.utils import get_file
+from ....utils.weights import get_weights_file, load_weights
 from ....backend.anchors import build_anchors
 from .efficientdet_blocks import (
     BiFPN, build_detector_head, EfficientNet_to_BiFPN)
@@ -77,8 +77,9 @@ def EFFICIENTDET(image, num_classes, base_weights, head_weights,
                                    str(head_weights) + '_weights.hdf5'])
 
     if not ((base_weights is None) and (head_weights is None)):
-        weights_path = get_file(model_filename, WEIGHT_PATH + model_filename,
-                                cache_subdir='paz/models')
+        weights_path = get_weights_file(
+            model_filename, WEIGHT_PATH + model_filename,
+            cache_subdir='paz/models')
         print('Loading %s model weights' % weights_path)
         finetunning_model_names = ['efficientdet-d0-COCO-None_weights.hdf5',
                                    'efficientdet-d1-COCO-None_weights.hdf5',
@@ -89,7 +90,7 @@ def EFFICIENTDET(image, num_classes, base_weights, head_weights,
                                    'efficientdet-d6-COCO-None_weights.hdf5',
                                    'efficientdet-d7-COCO-None_weights.hdf5']
         by_name = True if model_filename in finetunning_model_names else False
-        model.load_weights(weights_path, by_name=by_name)
+        load_weights(model, weights_path, by_name=by_name)
 
     image_shape = image.shape[1:3].as_list()
     model.prior_boxes = build_anchors(
@@ -1,6 +1,6 @@
 import cv2
 import numpy as np
-from tensorflow.keras.utils import get_file
+from ...utils.weights import get_weights_file
 
 WEIGHT_PATH = ('https://raw.githubusercontent.com/opencv/opencv/'
                'master/data/haarcascades/')
@@ -26,7 +26,8 @@ class HaarCascadeDetector(object):
         self.weights = weights
         self.name = 'haarcascade_' + weights + '.xml'
         self.url = WEIGHT_PATH + self.name
-        self.path = get_file(self.name, self.url, cache_subdir='paz/models')
+        self.path = get_weights_file(
+            self.name, self.url, cache_subdir='paz/models')
         self.model = cv2.CascadeClassifier(self.path)
         self.class_arg = class_arg
         self.scale = scale
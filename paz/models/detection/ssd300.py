@@ -4,7 +4,7 @@ from tensorflow.keras.layers import MaxPooling2D
 from tensorflow.keras.layers import ZeroPadding2D
 from tensorflow.keras.models import Model
 from tensorflow.keras.regularizers import l2
-from tensorflow.keras.utils import get_file
+from ...utils.weights import get_weights_file, load_weights
 
 from ..layers import Conv2DNormalization
 from .utils import create_multibox_head
@@ -191,12 +191,13 @@ def SSD300(num_classes=21, base_weights='VOC', head_weights='VOC',
     if ((base_weights is not None) or (head_weights is not None)):
         model_filename = ['SSD300', str(base_weights), str(head_weights)]
         model_filename = '_'.join(['-'.join(model_filename), 'weights.hdf5'])
-        weights_path = get_file(model_filename, WEIGHT_PATH + model_filename,
-                                cache_subdir='paz/models')
+        weights_path = get_weights_file(
+            model_filename, WEIGHT_PATH + model_filename,
+            cache_subdir='paz/models')
         print('Loading %s model weights' % weights_path)
         finetunning_model_names = ['SSD300-VGG-None_weights.hdf5',
                                    'SSD300-VOC-None_weights.hdf5']
         by_name = True if model_filename in finetunning_model_names else False
-        model.load_weights(weights_path, by_name=by_name)
+        load_weights(model, weights_path, by_name=by_name)
     model.prior_boxes = create_prior_boxes('VOC')
     return model
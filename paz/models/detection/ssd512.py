@@ -5,7 +5,7 @@ from tensorflow.keras.layers import MaxPooling2D
 from tensorflow.keras.layers import ZeroPadding2D
 from tensorflow.keras.models import Model
 from tensorflow.keras.regularizers import l2
-from tensorflow.keras.utils import get_file
+from ...utils.weights import get_weights_file, load_weights
 
 from ..layers import Conv2DNormalization
 from .utils import create_multibox_head
@@ -208,11 +208,12 @@ def SSD512(num_classes=81, base_weights='COCO', head_weights='COCO',
         model_filename = [str(base_weights), str(head_weights)]
         model_filename = '_'.join(['SSD512', '-'.join(model_filename),
                                    'weights.hdf5'])
-        weights_path = get_file(model_filename, WEIGHT_PATH + model_filename,
-                                cache_subdir='paz/models')
+        weights_path = get_weights_file(
+            model_filename, WEIGHT_PATH + model_filename,
+            cache_subdir='paz/models')
         print('Loading %s model weights' % weights_path)
 
-        model.load_weights(weights_path)
+        load_weights(model, weights_path)
 
     model.prior_boxes = create_prior_boxes('COCO')
     return model
@@ -10,7 +10,7 @@ import tensorflow.keras.backend as K
 from ..layers import Conv2DNormalization
 
 import numpy as np
-from itertools import product
+from functools import lru_cache
 
 
 def create_multibox_head(tensors, num_classes, num_priors, l2_loss=0.0005,
@@ -67,6 +67,23 @@ def create_multibox_head(tensors, num_classes, num_priors, l2_loss=0.0005,
 
 
 def create_prior_boxes(configuration_name='VOC'):
+    """Creates the prior boxes of a single-shot detector. Prior boxes of
+    a configuration are computed once per process and copies are returned
+    for every following call.
+
+    # Arguments
+        configuration_name: String. Either ``VOC``, ``FAT``, ``COCO`` or
+            ``YCBVideo``.
+
+    # Returns
+        Numpy array of shape ``(num_prior_boxes, 4)`` with boxes in
+            center form.
+    """
+    return _create_prior_boxes(configuration_name).copy()
+
+
+@lru_cache(maxsize=None)
+def _create_prior_boxes(configuration_name):
     configuration = get_prior_box_configuration(configuration_name)
     image_size = configuration['image_size']
     feature_map_sizes = configuration['feature_map_sizes']
@@ -74,31 +91,53 @@ def create_prior_boxes(configuration_name='VOC'):
     max_sizes = configuration['max_sizes']
     steps = configuration['steps']
     model_aspect_ratios = configuration['aspect_ratios']
-    mean = []
+    prior_boxes = []
     for feature_map_arg, feature_map_size in enumerate(feature_map_sizes):
         step = steps[feature_map_arg]
         min_size = min_sizes[feature_map_arg]
         max_size = max_sizes[feature_map_arg]
         aspect_ratios = model_aspect_ratios[feature_map_arg]
-        for y, x in product(range(feature_map_size), repeat=2):
-            f_k = image_size / step
-            center_x = (x + 0.5) / f_k
-            center_y = (y + 0.5) / f_k
-            s_k = min_size / image_size
-            mean = mean + [center_x, center_y, s_k, s_k]
-            s_k_prime = np.sqrt(s_k * (max_size / image_size))
-            mean = mean + [center_x, center_y, s_k_prime, s_k_prime]
-            for aspect_ratio in aspect_ratios:
-                mean = mean + [center_x, center_y, s_k * np.sqrt(aspect_ratio),
-                               s_k / np.sqrt(aspect_ratio)]
-                mean = mean + [center_x, center_y, s_k / np.sqrt(aspect_ratio),
-                               s_k * np.sqrt(aspect_ratio)]
-
-    output = np.asarray(mean).reshape((-1, 4))
+        prior_sizes = compute_prior_sizes(
+            image_size, min_size, max_size, aspect_ratios)
+        f_k = image_size / step
+        centers = (np.arange(feature_map_size) + 0.5) / f_k
+        center_y, center_x = np.meshgrid(centers, centers, indexing='ij')
+        centers = np.stack([center_x.ravel(), center_y.ravel()], axis=1)
+        num_centers, num_sizes = len(centers), len(prior_sizes)
+        shape = (num_centers, num_sizes, 2)
+        centers = np.broadcast_to(centers[:, None], shape)
+        sizes = np.broadcast_to(prior_sizes, shape)
+        boxes = np.concatenate([centers, sizes], axis=2)
+        prior_boxes.append(boxes.reshape(-1, 4))
+    output = np.concatenate(prior_boxes, axis=0)
+    output.flags.writeable = False
     # output = np.clip(output, 0, 1)
     return output
 
 
+def compute_prior_sizes(image_size, min_size, max_size, aspect_ratios):
+    """Computes the normalized widths and heights of the prior boxes placed
+    at every location of a feature map.
+
+    # Arguments
+        image_size: Int. Input image size.
+        min_size: Int. Size of the smallest square prior box.
+        max_size: Int. Used for the second square prior box.
+        aspect_ratios: List of aspect ratios.
+
+    # Returns
+        Numpy array of shape ``(2 + 2 * len(aspect_ratios), 2)``.
+    """
+    s_k = min_size / image_size
+    s_k_prime = np.sqrt(s_k * (max_size / image_size))
+    sizes = [[s_k, s_k], [s_k_prime, s_k_prime]]
+    for aspect_ratio in aspect_ratios:
+        root_ratio = np.sqrt(aspect_ratio)
+        sizes.append([s_k * root_ratio, s_k / root_ratio])
+        sizes.append([s_k / root_ratio, s_k * root_ratio])
+    return np.array(sizes)
+
+
 def get_prior_box_configuration(configuration_name='VOC'):
     if configuration_name in {'VOC', 'FAT'}:
         configuration = {
@@ -2,7 +2,7 @@
 import numpy as np
 import os
 import tensorflow as tf
-from tensorflow.keras.utils import get_file
+from ...utils.weights import get_weights_file, load_weights
 from tensorflow.keras.layers import MaxPool2D
 from tensorflow.keras.layers import Conv2D
 from tensorflow.keras.layers import BatchNormalization
@@ -127,7 +127,7 @@ def tf_heatmap_to_uv(heatmap):
     return uv
 
 
-def DetNet(input_shape=(128, 128, 3), num_keypoints=21):
+def DetNet(input_shape=(128, 128, 3), num_keypoints=21, batch_outputs=False):
     """DetNet: Estimate 3D keypoint positions of minimal hand from input
                color image.
 
@@ -136,12 +136,17 @@ def DetNet(input_shape=(128, 128, 3), num_keypoints=21):
                      List of integers. Input shape to the model including only
                      spatial and channel resolution e.g. (128, 128, 3).
         num_keypoints: Int. Number of keypoints.
+        batch_outputs: Boolean. If ``True`` the outputs keep the batch
+            dimension, otherwise only the outputs of the first image
+            are returned.
 
     # Returns
         Tensorflow-Keras model.
         xyz: Numpy array [num_keypoints, 3]. Normalized 3D keypoint locations.
         uv: Numpy array [num_keypoints, 2]. The uv coordinates of the keypoints
             on the heat map, whose resolution is 32x32.
+        If ``batch_outputs`` is ``True`` both arrays have an additional
+            leading batch dimension.
 
     # Reference
         -[Monocular Real-time Hand Shape and Motion Capture using Multi-modal
@@ -169,15 +174,16 @@ def DetNet(input_shape=(128, 128, 3), num_keypoints=21):
 
     uv = tf_heatmap_to_uv(heat_map)
     xyz = tf.gather_nd(
-        tf.transpose(location_map, perm=[0, 3, 1, 2, 4]), uv, batch_dims=2)[0]
-    uv = uv[0]
+        tf.transpose(location_map, perm=[0, 3, 1, 2, 4]), uv, batch_dims=2)
+    if not batch_outputs:
+        xyz, uv = xyz[0], uv[0]
 
     model = Model(image, outputs=[xyz, uv])
 
     URL = ('https://github.com/oarriaga/altamira-data/releases/download'
            '/v0.14/detnet_weights.hdf5')
     filename = os.path.basename(URL)
-    weights_path = get_file(filename, URL, cache_subdir='paz/models')
+    weights_path = get_weights_file(filename, URL, cache_subdir='paz/models')
     print('==> Loading %s model weights' % weights_path)
-    model.load_weights(weights_path)
+    load_weights(model, weights_path)
     return model
@@ -1,7 +1,7 @@
 
 import os
 import tensorflow as tf
-from tensorflow.keras.utils import get_file
+from ...utils.weights import get_weights_file, load_weights
 from tensorflow.keras.layers import Dense
 from tensorflow.keras.layers import BatchNormalization
 from tensorflow.keras.initializers import truncated_normal
@@ -75,7 +75,7 @@ def IKNet(input_shape=(84, 3), num_keypoints=21, depth=6, width=1024):
     URL = ('https://github.com/oarriaga/altamira-data/releases/download/'
            'v0.14/iknet_weight.hdf5')
     filename = os.path.basename(URL)
-    weights_path = get_file(filename, URL, cache_subdir='paz/models')
+    weights_path = get_weights_file(filename, URL, cache_subdir='paz/models')
     print('==> Loading %s model weights' % weights_path)
-    model.load_weights(weights_path)
+    load_weights(model, weights_path)
     return model
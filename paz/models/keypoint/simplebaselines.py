@@ -1,5 +1,5 @@
 import os
-from tensorflow.keras.utils import get_file
+from ...utils.weights import get_weights_file, load_weights
 from tensorflow.keras.models import Model
 from tensorflow.keras.initializers import HeNormal
 from tensorflow.keras.constraints import MaxNorm
@@ -65,6 +65,7 @@ def SimpleBaseline(input_shape=(32,), num_keypoints=16, keypoints_dim=3,
         URL = ('https://github.com/oarriaga/altamira-data/releases/download/'
                'v0.17/SIMPLE-BASELINES.hdf5')
         filename = os.path.basename(URL)
-        weights_path = get_file(filename, URL, cache_subdir='paz/models')
-        model.load_weights(weights_path)
+        weights_path = get_weights_file(
+            filename, URL, cache_subdir='paz/models')
+        load_weights(model, weights_path)
     return model
@@ -1,5 +1,5 @@
 import os
-from tensorflow.keras.utils import get_file
+from ...utils.weights import get_weights_file, load_weights
 from tensorflow.keras.layers import Conv2D
 from tensorflow.keras.layers import BatchNormalization
 from tensorflow.keras.layers import ReLU
@@ -296,7 +296,8 @@ def HigherHRNet(weights='COCO', input_shape=(None, None, 3), num_keypoints=17,
         URL = ('https://github.com/oarriaga/altamira-data/releases/download'
                '/v0.10/HigherHRNet_weights.hdf5')
         filename = os.path.basename(URL)
-        weights_path = get_file(filename, URL, cache_subdir='paz/models')
+        weights_path = get_weights_file(
+            filename, URL, cache_subdir='paz/models')
         print('==> Loading %s model weights' % weights_path)
-        model.load_weights(weights_path)
+        load_weights(model, weights_path)
     return model
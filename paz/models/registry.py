@@ -0,0 +1,155 @@
+import inspect
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from ..utils.weights import get_weights_file, load_weights
+
+
+WeightsFile = namedtuple('WeightsFile', ['filename', 'URL', 'cache_subdir'])
+WeightsFile.__new__.__defaults__ = ('paz/models', )
+WeightsFile.__doc__ = """Weights file that is downloaded only if the model
+    using it is not in the registry yet.
+
+    # Arguments
+        filename: String. Name of the weights file.
+        URL: String. URL from which the weights file is downloaded.
+        cache_subdir: String. Keras cache directory of the weights file.
+    """
+
+_models = {}
+_lock = threading.RLock()
+
+
+def _to_hashable(value):
+    if isinstance(value, (list, tuple)):
+        return tuple(_to_hashable(element) for element in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, _to_hashable(element))
+                            for key, element in value.items()))
+    if isinstance(value, np.ndarray):
+        return (value.dtype.str, value.shape, value.tobytes())
+    return value
+
+
+def _make_model_key(architecture, args=(), kwargs={}, weights_path=None):
+    """Builds the registry key of a model. Arguments are bound to the
+    signature of ``architecture`` such that calls with default arguments
+    given explicitly or implicitly share the same key.
+
+    # Arguments
+        architecture: Function or class building a model.
+        args: List with the positional arguments of ``architecture``.
+        kwargs: Dictionary with the keyword arguments of ``architecture``.
+        weights_path: String, ``WeightsFile`` or ``None``. Weights loaded
+            after building the model.
+
+    # Returns
+        Tuple.
+    """
+    try:
+        arguments = inspect.signature(architecture).bind(*args, **kwargs)
+        arguments.apply_defaults()
+        arguments = dict(arguments.arguments)
+    except (TypeError, ValueError):
+        arguments = {'args': args, 'kwargs': kwargs}
+    return (architecture, _to_hashable(arguments), _to_hashable(weights_path))
+
+
+def get_weights_path(weights_path):
+    """Returns the local path of the weights. Files are resolved by the
+    current ``WeightsStore`` and downloaded only if required.
+
+    # Arguments
+        weights_path: String or ``WeightsFile``.
+
+    # Returns
+        String.
+    """
+    if isinstance(weights_path, WeightsFile):
+        weights_path = get_weights_file(*weights_path)
+    return weights_path
+
+
+def get_model(architecture, *args, weights_path=None, **kwargs):
+    """Returns the model built by ``architecture(*args, **kwargs)``.
+    Models are built once per process and the same instance is returned
+    for all later calls with equal architecture, arguments and weights.
+    Therefore, pipelines sharing a model build and load it only once.
+    Returned models are shared and must be treated as read-only e.g.
+    their ``prior_boxes`` must not be modified in place or reassigned.
+
+    # Arguments
+        architecture: Function or class building a model e.g. ``SSD512``.
+        *args: Positional arguments of ``architecture``.
+        weights_path: String, ``WeightsFile`` or ``None``. Weights loaded
+            with ``load_weights`` after building the model.
+        **kwargs: Keyword arguments of ``architecture``.
+
+    # Returns
+        Model.
+    """
+    key = _make_model_key(architecture, args, kwargs, weights_path)
+    # keras does not support building models from several threads
+    with _lock:
+        if key not in _models:
+            model = architecture(*args, **kwargs)
+            if weights_path is not None:
+                load_weights(model, get_weights_path(weights_path))
+            _models[key] = model
+        return _models[key]
+
+
+def warm_up_model(model):
+    """Calls a model once with zeros such that the first prediction of a
+    pipeline does not include the tracing and allocation time.
+
+    # Arguments
+        model: Keras model. Objects without ``inputs`` are skipped.
+    """
+    if not hasattr(model, 'inputs'):
+        return
+    inputs = []
+    for model_input in model.inputs:
+        shape = [1 if size is None else size for size in model_input.shape]
+        inputs.append(np.zeros(shape, dtype=model_input.dtype.as_numpy_dtype))
+    model(inputs[0] if len(inputs) == 1 else inputs, training=False)
+
+
+def preload_models(model_calls, num_workers=4, warm_up=False):
+    """Builds several models and adds them to the registry. Their weight
+    files are downloaded in parallel before the models are built.
+
+    # Arguments
+        model_calls: List of tuples ``(architecture, args, kwargs)``. The
+            keyword arguments can include ``weights_path``.
+        num_workers: Int. Number of parallel downloads.
+        warm_up: Boolean. If ``True`` each model is called once with zeros.
+
+    # Returns
+        List of models in the order of ``model_calls``.
+    """
+    weights_paths = []
+    for architecture, args, kwargs in model_calls:
+        kwargs = dict(kwargs)
+        weights_path = kwargs.pop('weights_path', None)
+        key = _make_model_key(architecture, args, kwargs, weights_path)
+        if key not in _models:
+            weights_paths.append(weights_path)
+    with ThreadPoolExecutor(max(1, num_workers)) as executor:
+        list(executor.map(get_weights_path, weights_paths))
+    models = []
+    for architecture, args, kwargs in model_calls:
+        model = get_model(architecture, *args, **kwargs)
+        if warm_up:
+            warm_up_model(model)
+        models.append(model)
+    return models
+
+
+def clear_models():
+    """Removes all models from the registry."""
+    with _lock:
+        _models.clear()
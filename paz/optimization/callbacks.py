@@ -7,6 +7,7 @@ import tensorflow.keras.backend as K
 from ..backend.image import write_image
 
 from paz.evaluation import evaluateMAP
+from paz.evaluation import load_ground_truths
 
 
 class DrawInferences(Callback):
@@ -93,16 +94,21 @@ class EvaluateMAP(Callback):
         period: Int. Indicates how often the evaluation is performed.
         save_path: Str.
         iou_thresh: Float.
+        batch_size: Int. Number of images given at once to the detector.
+        num_workers: Int. Number of threads decoding images.
     """
-    def __init__(
-            self, data_manager, detector, period, save_path, iou_thresh=0.5):
+    def __init__(self, data_manager, detector, period, save_path,
+                 iou_thresh=0.5, batch_size=1, num_workers=0):
         super(EvaluateMAP, self).__init__()
         self.data_manager = data_manager
         self.detector = detector
         self.period = period
         self.save_path = save_path
         self.dataset = data_manager.load_data()
+        self.ground_truths = load_ground_truths(self.dataset)
         self.iou_thresh = iou_thresh
+        self.batch_size = batch_size
+        self.num_workers = num_workers
         self.class_names = self.data_manager.class_names
         self.class_dict = {}
         for class_arg, class_name in enumerate(self.class_names):
@@ -115,7 +121,10 @@ class EvaluateMAP(Callback):
                 self.dataset,
                 self.class_dict,
                 iou_thresh=self.iou_thresh,
-                use_07_metric=True)
+                use_07_metric=True,
+                batch_size=self.batch_size,
+                num_workers=self.num_workers,
+                ground_truths=self.ground_truths)
 
             result_str = 'mAP: {:.4f}\n'.format(result['map'])
             metrics = {'mAP': result['map']}
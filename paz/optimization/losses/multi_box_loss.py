@@ -9,15 +9,30 @@ class MultiBoxLoss(object):
         neg_pos_ratio: Int. Number of negatives used per positive box.
         alpha: Float. Weight parameter for localization loss.
         max_num_negatives: Int. Maximum number of negatives per batch.
+        sparse_labels: Boolean. If ``True`` ``y_true`` contains the class
+            argument instead of a one-hot vector i.e. it has shape
+            '[batch_size, num_boxes, 4 + 1]'. Labels are expanded to
+            one-hot vectors inside the loss.
 
     # References
         - [SSD: Single Shot MultiBox
             Detector](https://arxiv.org/abs/1512.02325)
     """
-    def __init__(self, neg_pos_ratio=3, alpha=1.0, max_num_negatives=300):
+    def __init__(self, neg_pos_ratio=3, alpha=1.0, max_num_negatives=300,
+                 sparse_labels=False):
         self.alpha = alpha
         self.neg_pos_ratio = neg_pos_ratio
         self.max_num_negatives = max_num_negatives
+        self.sparse_labels = sparse_labels
+
+    def _to_dense(self, y_true, y_pred):
+        if not self.sparse_labels:
+            return y_true
+        num_classes = tf.shape(y_pred)[-1] - 4
+        class_args = tf.cast(y_true[:, :, 4], tf.int32)
+        one_hot_vectors = tf.one_hot(class_args, num_classes, dtype=tf.float32)
+        boxes = tf.cast(y_true[:, :, :4], tf.float32)
+        return tf.concat([boxes, one_hot_vectors], axis=-1)
 
     def _smooth_l1(self, y_true, y_pred):
         absolute_value_loss = K.abs(y_true - y_pred)
@@ -66,6 +81,7 @@ class MultiBoxLoss(object):
         # Returns
             Tensor with localization loss per sample in batch.
         """
+        y_true = self._to_dense(y_true, y_pred)
         batch_size = tf.cast(tf.shape(y_pred)[0], tf.float32)
         local_loss = self._smooth_l1(y_true[:, :, :4], y_pred[:, :, :4])
         positive_mask, negative_mask = self._calculate_masks(y_true)
@@ -88,6 +104,7 @@ class MultiBoxLoss(object):
         # Returns
             Tensor with positive classification loss per sample in batch.
         """
+        y_true = self._to_dense(y_true, y_pred)
         batch_size = tf.cast(tf.shape(y_pred)[0], tf.float32)
         class_loss = self._cross_entropy(y_true[:, :, 4:], y_pred[:, :, 4:])
         positive_mask, negative_mask = self._calculate_masks(y_true)
@@ -110,6 +127,7 @@ class MultiBoxLoss(object):
         # Returns
             Tensor with negative classification loss per sample in batch.
         """
+        y_true = self._to_dense(y_true, y_pred)
         batch_size = tf.cast(tf.shape(y_pred)[0], tf.float32)
         class_loss = self._cross_entropy(y_true[:, :, 4:], y_pred[:, :, 4:])
         positive_mask, negative_mask = self._calculate_masks(y_true)
@@ -1,75 +1,42 @@
-from .image import AugmentImage
-from .image import PreprocessImage
-from .image import AutoEncoderPredictor
-from .image import EncoderPredictor
-from .image import DecoderPredictor
-from .image import PreprocessImageHigherHRNet
-
-from .detection import AugmentBoxes
-from .detection import PreprocessBoxes
-from .detection import AugmentDetection
-from .detection import PostprocessBoxes2D
-from .detection import DetectSingleShot
-from .detection import SSD512COCO
-from .detection import SSD512YCBVideo
-from .detection import SSD300VOC
-from .detection import SSD300FAT
-from .detection import DetectHaarCascade
-from .detection import HaarCascadeFrontalFace
-from .detection import DetectMiniXceptionFER
-from .detection import DetectKeypoints2D
-from .detection import DetectFaceKeypointNet2D32
-from .detection import SSD512HandDetection
-from .detection import SSD512MinimalHandPose
-from .detection import SSDPreprocess
-from .detection import SSDPostprocess
-from .detection import DetectSingleShotEfficientDet
-from .detection import EfficientDetPreprocess
-from .detection import EfficientDetPostprocess
-from .detection import EFFICIENTDETD0COCO
-from .detection import EFFICIENTDETD1COCO
-from .detection import EFFICIENTDETD2COCO
-from .detection import EFFICIENTDETD3COCO
-from .detection import EFFICIENTDETD4COCO
-from .detection import EFFICIENTDETD5COCO
-from .detection import EFFICIENTDETD6COCO
-from .detection import EFFICIENTDETD7COCO
-from .detection import EFFICIENTDETD0VOC
-
-from .keypoints import KeypointNetSharedAugmentation
-from .keypoints import KeypointNetInference
-from .keypoints import EstimateKeypoints2D
-from .keypoints import FaceKeypointNet2D32
-from .keypoints import GetKeypoints
-from .keypoints import TransformKeypoints
-from .keypoints import HigherHRNetHumanPose2D
-from .keypoints import DetNetHandKeypoints
-from .keypoints import MinimalHandPoseEstimation
-from .keypoints import DetectMinimalHand
-from .keypoints import EstimateHumanPose3D
-from .keypoints import EstimateHumanPose
-
-from .renderer import RenderTwoViews
-from .renderer import RandomizeRenderedImage
-
-from .classification import MiniXceptionFER
-from .classification import ClassifyHandClosure
-
-from .pose import EstimatePoseKeypoints
-from .pose import HeadPoseKeypointNet2D32
-from .pose import SingleInstancePIX2POSE6D
-from .pose import MultiInstancePIX2POSE6D
-from .pose import MultiInstanceMultiClassPIX2POSE6D
-from .pose import SinglePowerDrillPIX2POSE6D
-from .pose import MultiPowerDrillPIX2POSE6D
-from .pose import PIX2POSEPowerDrill
-from .pose import PIX2YCBTools6D
-
-from .masks import RGBMaskToImagePoints2D
-from .masks import RGBMaskToObjectPoints3D
-from .masks import PredictRGBMask
-from .masks import Pix2Points
-
-from .heatmaps import GetHeatmapsAndTags
-
-from .angles import IKNetHandJointAngles
+from ..utils.lazy import lazy_attributes
+
+# pipelines build TensorFlow models and are only imported when accessed
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    '.image': [
+        'AugmentImage', 'PreprocessImage', 'AutoEncoderPredictor',
+        'EncoderPredictor', 'DecoderPredictor', 'PreprocessImageHigherHRNet'],
+    '.detection': [
+        'AugmentBoxes', 'PreprocessBoxes', 'PreprocessBoxesBatch',
+        'AugmentDetection', 'PostprocessBoxes2D', 'DetectSingleShot',
+        'SSD512COCO', 'SSD512YCBVideo', 'SSD300VOC', 'SSD300FAT',
+        'DetectHaarCascade', 'HaarCascadeFrontalFace', 'DetectMiniXceptionFER',
+        'DetectKeypoints2D', 'DetectFaceKeypointNet2D32',
+        'SSD512HandDetection', 'SSD512MinimalHandPose', 'SSDPreprocess',
+        'SSDPostprocess', 'SSDPostprocessBatch',
+        'DetectSingleShotEfficientDet', 'EfficientDetPreprocess',
+        'EfficientDetPostprocess', 'EFFICIENTDETD0COCO', 'EFFICIENTDETD1COCO',
+        'EFFICIENTDETD2COCO', 'EFFICIENTDETD3COCO', 'EFFICIENTDETD4COCO',
+        'EFFICIENTDETD5COCO', 'EFFICIENTDETD6COCO', 'EFFICIENTDETD7COCO',
+        'EFFICIENTDETD0VOC'],
+    '.keypoints': [
+        'KeypointNetSharedAugmentation', 'KeypointNetInference',
+        'EstimateKeypoints2D', 'FaceKeypointNet2D32', 'GetKeypoints',
+        'TransformKeypoints', 'HigherHRNetHumanPose2D', 'DetNetHandKeypoints',
+        'MinimalHandPoseEstimation', 'DetectMinimalHand',
+        'EstimateHumanPose3D', 'EstimateHumanPose'],
+    '.renderer': [
+        'RenderTwoViews', 'RandomizeRenderedImage'],
+    '.classification': [
+        'MiniXceptionFER', 'ClassifyHandClosure'],
+    '.pose': [
+        'EstimatePoseKeypoints', 'HeadPoseKeypointNet2D32',
+        'SingleInstancePIX2POSE6D', 'MultiInstancePIX2POSE6D',
+        'MultiInstanceMultiClassPIX2POSE6D', 'SinglePowerDrillPIX2POSE6D',
+        'MultiPowerDrillPIX2POSE6D', 'PIX2POSEPowerDrill', 'PIX2YCBTools6D'],
+    '.masks': [
+        'RGBMaskToImagePoints2D', 'RGBMaskToObjectPoints3D', 'PredictRGBMask',
+        'Pix2Points'],
+    '.heatmaps': [
+        'GetHeatmapsAndTags'],
+    '.angles': [
+        'IKNetHandJointAngles']})
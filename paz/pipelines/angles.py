@@ -1,5 +1,8 @@
+import numpy as np
+
 from paz import processors as pr
 from paz.models import IKNet
+from paz.models.registry import get_model
 from paz.datasets import MPIIHandJoints
 from paz.backend.keypoints import flip_along_x_axis
 
@@ -29,16 +32,40 @@ class IKNetHandJointAngles(pr.Processor):
             self.links_origin = flip_along_x_axis(self.links_origin)
         self.links_delta = self.calculate_orientation(self.links_origin)
         self.concatenate = pr.Concatenate(0)
+        self.iknet = get_model(IKNet)
         self.compute_absolute_angles = pr.SequentialProcessor(
-            [pr.ExpandDims(0), IKNet(), pr.Squeeze(0)])
+            [pr.ExpandDims(0), self.iknet, pr.Squeeze(0)])
         self.compute_relative_angles = pr.CalculateRelativeAngles()
         self.wrap = pr.WrapOutput(['absolute_angles', 'relative_angles'])
 
     def call(self, keypoints3D):
-        delta = self.calculate_orientation(keypoints3D)
-        pack = self.concatenate(
-            [keypoints3D, delta, self.links_origin, self.links_delta])
+        pack = self._pack(keypoints3D)
         absolute_angles = self.compute_absolute_angles(pack)
         relative_angles = self.compute_relative_angles(absolute_angles)
         return self.wrap(absolute_angles, relative_angles)
 
+    def predict_batch(self, batch_keypoints3D):
+        """Estimates the joint angles of a list of hands with a single
+        model call.
+
+        # Arguments
+            batch_keypoints3D: List of arrays [num_joints, 3].
+
+        # Returns
+            List with the output of ``call`` for each hand.
+        """
+        if len(batch_keypoints3D) == 0:
+            return []
+        packs = np.array([self._pack(x) for x in batch_keypoints3D])
+        batch_absolute_angles = self.iknet(packs)
+        inferences = []
+        for absolute_angles in np.array(batch_absolute_angles):
+            relative_angles = self.compute_relative_angles(absolute_angles)
+            inferences.append(self.wrap(absolute_angles, relative_angles))
+        return inferences
+
+    def _pack(self, keypoints3D):
+        delta = self.calculate_orientation(keypoints3D)
+        return self.concatenate(
+            [keypoints3D, delta, self.links_origin, self.links_delta])
+
@@ -1,7 +1,10 @@
+import numpy as np
+
 from ..abstract import SequentialProcessor
 from .. import processors as pr
 from . import PreprocessImage
 from ..models.classification import MiniXception
+from ..models.registry import get_model
 from ..datasets import get_class_names
 from .keypoints import MinimalHandPoseEstimation
 
@@ -35,17 +38,40 @@ class MiniXceptionFER(SequentialProcessor):
     """
     def __init__(self):
         super(MiniXceptionFER, self).__init__()
-        self.classifier = MiniXception((48, 48, 1), 7, weights='FER')
+        self.classifier = get_model(
+            MiniXception, (48, 48, 1), 7, weights='FER')
         self.class_names = get_class_names('FER')
 
         preprocess = PreprocessImage(self.classifier.input_shape[1:3], None)
         preprocess.insert(0, pr.ConvertColorSpace(pr.RGB2GRAY))
         preprocess.add(pr.ExpandDims(0))
         preprocess.add(pr.ExpandDims(-1))
+        self.preprocess = preprocess
+        self.predict_scores = pr.Predict(self.classifier)
+        self.to_class_name = pr.ToClassName(self.class_names)
+        self.wrap = pr.WrapOutput(['class_name', 'scores'])
         self.add(pr.Predict(self.classifier, preprocess))
         self.add(pr.CopyDomain([0], [1]))
-        self.add(pr.ControlMap(pr.ToClassName(self.class_names), [0], [0]))
-        self.add(pr.WrapOutput(['class_name', 'scores']))
+        self.add(pr.ControlMap(self.to_class_name, [0], [0]))
+        self.add(self.wrap)
+
+    def predict_batch(self, images):
+        """Classifies a list of RGB faces with a single model call.
+
+        # Arguments
+            images: List of RGB images.
+
+        # Returns
+            List with the output of the pipeline for each image.
+        """
+        if len(images) == 0:
+            return []
+        inputs = np.concatenate([self.preprocess(x) for x in images], axis=0)
+        batch_scores = self.predict_scores(inputs)
+        inferences = []
+        for scores in np.split(batch_scores, len(images)):
+            inferences.append(self.wrap(self.to_class_name(scores), scores))
+        return inferences
 
 
 class ClassifyHandClosure(SequentialProcessor):
@@ -6,6 +6,7 @@ from ..models import (
     SSD512, SSD300, HaarCascadeDetector, EFFICIENTDETD0, EFFICIENTDETD1,
     EFFICIENTDETD2, EFFICIENTDETD3, EFFICIENTDETD4, EFFICIENTDETD5,
     EFFICIENTDETD6, EFFICIENTDETD7)
+from ..models.registry import get_model
 from ..datasets import get_class_names
 
 from .image import AugmentImage, PreprocessImage
@@ -40,12 +41,46 @@ class PreprocessBoxes(SequentialProcessor):
         IOU: Float. Intersection over union used to match boxes.
         variances: List of two floats indicating variances to be encoded
             for encoding bounding boxes.
+        sparse_labels: Boolean. If ``True`` the class argument is kept
+            instead of a one-hot vector i.e. outputs have shape
+            ``[num_boxes, 4 + 1]``. Use with ``MultiBoxLoss(sparse_labels)``.
     """
-    def __init__(self, num_classes, prior_boxes, IOU, variances):
+    def __init__(self, num_classes, prior_boxes, IOU, variances,
+                 sparse_labels=False):
         super(PreprocessBoxes, self).__init__()
         self.add(pr.MatchBoxes(prior_boxes, IOU),)
         self.add(pr.EncodeBoxes(prior_boxes, variances))
-        self.add(pr.BoxClassToOneHotVector(num_classes))
+        if not sparse_labels:
+            self.add(pr.BoxClassToOneHotVector(num_classes))
+
+
+class PreprocessBoxesBatch(SequentialProcessor):
+    """Preprocess the bounding boxes of a whole batch at once.
+
+    # Arguments
+        num_classes: Int.
+        prior_boxes: Numpy array of shape ``[num_boxes, 4]`` containing
+            prior/default bounding boxes.
+        IOU: Float. Intersection over union used to match boxes.
+        variances: List of two floats indicating variances to be encoded
+            for encoding bounding boxes.
+        sparse_labels: Boolean. If ``True`` the class argument is kept
+            instead of a one-hot vector i.e. outputs have shape
+            ``[batch_size, num_boxes, 4 + 1]``.
+        dtype: Numpy dtype of the encoded boxes.
+
+    # Returns
+        Numpy array of shape ``[batch_size, num_boxes, 4 + num_classes]``
+            given a list with the boxes of each sample.
+    """
+    def __init__(self, num_classes, prior_boxes, IOU, variances,
+                 sparse_labels=False, dtype=np.float32):
+        super(PreprocessBoxesBatch, self).__init__()
+        prior_boxes = prior_boxes.astype(dtype)
+        self.add(pr.MatchBoxesBatch(prior_boxes, IOU, dtype))
+        self.add(pr.EncodeBoxes(prior_boxes, variances))
+        if not sparse_labels:
+            self.add(pr.BoxClassToOneHotVector(num_classes))
 
 
 class AugmentDetection(SequentialProcessor):
@@ -63,10 +98,23 @@ class AugmentDetection(SequentialProcessor):
         IOU: Float. Intersection over union used to match boxes.
         variances: List of two floats indicating variances to be encoded
             for encoding bounding boxes.
+        sparse_labels: Boolean. If ``True`` box labels contain the class
+            argument instead of a one-hot vector.
+        image_source: ``ImageSource`` used by ``LoadImage`` e.g. an
+            ``LRUImageCache`` of decoded images. If ``None`` images are
+            decoded from disk.
+        batch_boxes: Boolean. If ``True`` boxes are matched and encoded
+            for a whole batch at once with ``PreprocessBoxesBatch``, which
+            is given to the sequence in ``batch_processors``.
+
+    # Properties
+        batch_processors: Dictionary with the label names that are
+            processed for a whole batch by ``SequenceExtra`` sequences.
     """
     def __init__(self, prior_boxes, split=pr.TRAIN, num_classes=21, size=300,
                  mean=pr.BGR_IMAGENET_MEAN, IOU=.5,
-                 variances=[0.1, 0.1, 0.2, 0.2]):
+                 variances=[0.1, 0.1, 0.2, 0.2], sparse_labels=False,
+                 image_source=None, batch_boxes=False):
         super(AugmentDetection, self).__init__()
         # image processors
         self.augment_image = AugmentImage()
@@ -76,20 +124,25 @@ class AugmentDetection(SequentialProcessor):
 
         # box processors
         self.augment_boxes = AugmentBoxes()
-        args = (num_classes, prior_boxes, IOU, variances)
+        args = (num_classes, prior_boxes, IOU, variances, sparse_labels)
         self.preprocess_boxes = PreprocessBoxes(*args)
+        self.batch_processors = {}
+        if batch_boxes:
+            self.batch_processors['boxes'] = PreprocessBoxesBatch(*args)
+        label_size = 1 if sparse_labels else num_classes
 
         # pipeline
         self.add(pr.UnpackDictionary(['image', 'boxes']))
-        self.add(pr.ControlMap(pr.LoadImage(), [0], [0]))
+        self.add(pr.ControlMap(pr.LoadImage(source=image_source), [0], [0]))
         if split == pr.TRAIN:
             self.add(pr.ControlMap(self.augment_image, [0], [0]))
             self.add(pr.ControlMap(self.augment_boxes, [0, 1], [0, 1]))
         self.add(pr.ControlMap(self.preprocess_image, [0], [0]))
-        self.add(pr.ControlMap(self.preprocess_boxes, [1], [1]))
+        if not batch_boxes:
+            self.add(pr.ControlMap(self.preprocess_boxes, [1], [1]))
         self.add(pr.SequenceWrapper(
             {0: {'image': [size, size, 3]}},
-            {1: {'boxes': [len(prior_boxes), 4 + num_classes]}}))
+            {1: {'boxes': [len(prior_boxes), 4 + label_size]}}))
 
 
 class PostprocessBoxes2D(SequentialProcessor):
@@ -120,10 +173,21 @@ class DetectSingleShot(Processor):
         variances: List, of floats.
         draw: Boolean. If ``True`` prediction are drawn in the
             returned image.
+        postprocess_batch: Callable, post-processing pipeline used in
+            ``predict_batch``. It receives the model outputs of a batch
+            and returns a list of ``Boxes2D`` per image. If ``None`` and
+            ``postprocess`` is ``None`` the default SSD post-processing is
+            used. If ``None`` and ``postprocess`` is given
+            ``predict_batch`` is not available.
+
+    # Methods
+        call()
+        predict_batch()
     """
     def __init__(self, model, class_names, score_thresh, nms_thresh,
                  preprocess=None, postprocess=None,
-                 variances=[0.1, 0.1, 0.2, 0.2], draw=True):
+                 variances=[0.1, 0.1, 0.2, 0.2], draw=True,
+                 postprocess_batch=None):
         self.model = model
         self.class_names = class_names
         self.score_thresh = score_thresh
@@ -132,12 +196,20 @@ class DetectSingleShot(Processor):
         self.draw = draw
         if preprocess is None:
             preprocess = SSDPreprocess(model)
+        if (postprocess_batch is None) and (postprocess is None):
+            postprocess_batch = SSDPostprocessBatch(
+                model, class_names, score_thresh, nms_thresh)
         if postprocess is None:
             postprocess = SSDPostprocess(
                 model, class_names, score_thresh, nms_thresh)
 
         super(DetectSingleShot, self).__init__()
         self.predict = pr.Predict(self.model, preprocess, postprocess)
+        self.preprocess = preprocess
+        self.predict_boxes = None
+        if postprocess_batch is not None:
+            self.predict_boxes = pr.Predict(
+                self.model, None, postprocess_batch)
         self.denormalize = pr.DenormalizeBoxes2D()
         self.draw_boxes2D = pr.DrawBoxes2D(self.class_names)
         self.wrap = pr.WrapOutput(['image', 'boxes2D'])
@@ -149,6 +221,39 @@ class DetectSingleShot(Processor):
             image = self.draw_boxes2D(image, boxes2D)
         return self.wrap(image, boxes2D)
 
+    def predict_batch(self, images):
+        """Detects objects in a batch of images with a single model call.
+
+        # Arguments
+            images: List of RGB images. The images can have different
+                shapes, but ``preprocess`` must return each of them with
+                the same shape and a leading batch dimension of one.
+
+        # Returns
+            List with the output of ``call`` for each image i.e. a
+                dictionary with ``keys``: ``image`` and ``boxes2D``.
+        """
+        if self.predict_boxes is None:
+            raise ValueError('``predict_batch`` requires ``postprocess_batch``'
+                             ' when a custom ``postprocess`` is given')
+        if len(images) == 0:
+            return []
+        # preprocessing can return the same reused buffer for every image
+        for image_arg, image in enumerate(images):
+            image = self.preprocess(image)
+            if image_arg == 0:
+                inputs = np.empty((len(images), ) + image.shape[1:],
+                                  dtype=image.dtype)
+            inputs[image_arg] = image[0]
+        batch_boxes2D = self.predict_boxes(inputs)
+        outputs = []
+        for image, boxes2D in zip(images, batch_boxes2D):
+            boxes2D = self.denormalize(image, boxes2D)
+            if self.draw:
+                image = self.draw_boxes2D(image, boxes2D)
+            outputs.append(self.wrap(image, boxes2D))
+        return outputs
+
 
 class SSDPreprocess(SequentialProcessor):
     """Preprocessing pipeline for SSD.
@@ -157,15 +262,25 @@ class SSDPreprocess(SequentialProcessor):
         model: Keras model.
         mean: List, of three elements indicating the per channel mean.
         color_space: Int, specifying the color space to transform.
+        dtype: Data type of the model input. ``float`` keeps the original
+            chain of processors, any other type e.g. ``np.float32``
+            subtracts the mean and casts in a single pass.
+        reuse_buffer: Boolean. If ``True`` the model input is written into
+            the same preallocated array in every call. The previous output
+            is then overwritten by the next call.
     """
-    def __init__(
-            self, model, mean=pr.BGR_IMAGENET_MEAN, color_space=pr.RGB2BGR):
+    def __init__(self, model, mean=pr.BGR_IMAGENET_MEAN,
+                 color_space=pr.RGB2BGR, dtype=float, reuse_buffer=False):
         super(SSDPreprocess, self).__init__()
         self.add(pr.ResizeImage(model.input_shape[1:3]))
         self.add(pr.ConvertColorSpace(color_space))
-        self.add(pr.SubtractMeanImage(mean))
-        self.add(pr.CastImage(float))
-        self.add(pr.ExpandDims(axis=0))
+        if (dtype is float) and not reuse_buffer:
+            self.add(pr.SubtractMeanImage(mean))
+            self.add(pr.CastImage(float))
+            self.add(pr.ExpandDims(axis=0))
+        else:
+            self.add(pr.StandardizeImage(
+                mean, None, dtype, True, reuse_buffer))
 
 
 class SSDPostprocess(SequentialProcessor):
@@ -192,6 +307,43 @@ class SSDPostprocess(SequentialProcessor):
         self.add(pr.ToBoxes2D(class_names, box_method))
 
 
+class SSDPostprocessBatch(Processor):
+    """Postprocessing pipeline for a batch of SSD predictions.
+    Boxes of all images are decoded and suppressed at once, and the
+    outputs are then split into one list of ``Boxes2D`` per image.
+
+    # Arguments
+        model: Keras model.
+        class_names: List, of strings indicating the class names.
+        score_thresh: Float, between [0, 1]
+        nms_thresh: Float, between [0, 1].
+        variances: List, of floats.
+        class_arg: Int, index of class to be removed.
+        box_method: Int, type of boxes to boxes2D conversion method.
+    """
+    def __init__(self, model, class_names, score_thresh, nms_thresh,
+                 variances=[0.1, 0.1, 0.2, 0.2], class_arg=0, box_method=0):
+        super(SSDPostprocessBatch, self).__init__()
+        # ``RemoveClass`` deletes the class name from the given list
+        class_names = list(class_names)
+        self.decode = pr.DecodeBoxes(model.prior_boxes, variances)
+        self.remove_class = pr.RemoveClass(class_names, class_arg)
+        self.nms_per_image = pr.NonMaximumSuppressionPerImage(nms_thresh)
+        self.merge_box_and_class = pr.MergeNMSBoxWithClass()
+        self.filter_boxes = pr.FilterBoxes(class_names, score_thresh)
+        self.to_boxes2D = pr.ToBoxes2D(class_names, box_method=box_method)
+
+    def call(self, batch_box_data):
+        batch_box_data = self.decode(batch_box_data)
+        batch_box_data = self.remove_class(batch_box_data)
+        batch_boxes2D = []
+        for box_data, class_labels in self.nms_per_image(batch_box_data):
+            box_data = self.merge_box_and_class(box_data, class_labels)
+            box_data = self.filter_boxes(box_data)
+            batch_boxes2D.append(self.to_boxes2D(box_data))
+        return batch_boxes2D
+
+
 class DetectSingleShotEfficientDet(Processor):
     """Single-shot object detection prediction for EfficientDet models.
 
@@ -221,10 +373,12 @@ class DetectSingleShotEfficientDet(Processor):
         self.draw_boxes2D = pr.DrawBoxes2D(class_names)
         self.wrap = pr.WrapOutput(['image', 'boxes2D'])
         if preprocess is None:
-            self.preprocess = EfficientDetPreprocess(model)
+            preprocess = EfficientDetPreprocess(model)
+        self.preprocess = preprocess
         if postprocess is None:
-            self.postprocess = EfficientDetPostprocess(
+            postprocess = EfficientDetPostprocess(
                 model, class_names, score_thresh, nms_thresh)
+        self.postprocess = postprocess
         super(DetectSingleShotEfficientDet, self).__init__()
 
     def call(self, image):
@@ -245,14 +399,28 @@ class EfficientDetPreprocess(SequentialProcessor):
         mean: Tuple, containing mean per channel on ImageNet.
         standard_deviation: Tuple, containing standard deviations
             per channel on ImageNet.
+        dtype: Data type of the model input. ``float`` keeps the original
+            chain of processors, any other type e.g. ``np.float32``
+            standardizes the image in a single pass.
+        reuse_buffer: Boolean. If ``True`` the standardized image and the
+            model input are written into the same preallocated arrays in
+            every call. The previous output is then overwritten by the
+            next call.
     """
     def __init__(self, model, mean=pr.RGB_IMAGENET_MEAN,
-                 standard_deviation=pr.RGB_IMAGENET_STDEV):
+                 standard_deviation=pr.RGB_IMAGENET_STDEV, dtype=float,
+                 reuse_buffer=False):
         super(EfficientDetPreprocess, self).__init__()
-        self.add(pr.CastImage(float))
-        self.add(pr.SubtractMeanImage(mean=mean))
-        self.add(pr.DivideStandardDeviationImage(standard_deviation))
-        self.add(pr.ScaledResize(image_size=model.input_shape[1]))
+        image_size = model.input_shape[1]
+        if (dtype is float) and not reuse_buffer:
+            self.add(pr.CastImage(float))
+            self.add(pr.SubtractMeanImage(mean=mean))
+            self.add(pr.DivideStandardDeviationImage(standard_deviation))
+            self.add(pr.ScaledResize(image_size=image_size))
+        else:
+            self.add(pr.StandardizeImage(
+                mean, standard_deviation, dtype, False, reuse_buffer))
+            self.add(pr.ScaledResize(image_size, dtype, reuse_buffer))
 
 
 class EfficientDetPostprocess(Processor):
@@ -271,10 +439,11 @@ class EfficientDetPostprocess(Processor):
     def __init__(self, model, class_names, score_thresh, nms_thresh,
                  variances=[1.0, 1.0, 1.0, 1.0], class_arg=None):
         super(EfficientDetPostprocess, self).__init__()
-        model.prior_boxes = model.prior_boxes * model.input_shape[1]
+        # models of the registry are shared and must not be modified
+        prior_boxes = model.prior_boxes * model.input_shape[1]
         self.postprocess = pr.SequentialProcessor([
             pr.Squeeze(axis=None),
-            pr.DecodeBoxes(model.prior_boxes, variances),
+            pr.DecodeBoxes(prior_boxes, variances),
             pr.RemoveClass(class_names, class_arg)])
         self.scale = pr.ScaleBox()
         self.nms_per_class = pr.NonMaximumSuppressionPerClass(nms_thresh)
@@ -322,7 +491,7 @@ class SSD512COCO(DetectSingleShot):
             Detector](https://arxiv.org/abs/1512.02325)
     """
     def __init__(self, score_thresh=0.60, nms_thresh=0.45, draw=True):
-        model = SSD512()
+        model = get_model(SSD512)
         names = get_class_names('COCO')
         super(SSD512COCO, self).__init__(
             model, names, score_thresh, nms_thresh, draw=draw)
@@ -354,7 +523,8 @@ class SSD512YCBVideo(DetectSingleShot):
     """
     def __init__(self, score_thresh=0.60, nms_thresh=0.45, draw=True):
         names = get_class_names('YCBVideo')
-        model = SSD512(head_weights='YCBVideo', num_classes=len(names))
+        model = get_model(
+            SSD512, head_weights='YCBVideo', num_classes=len(names))
         super(SSD512YCBVideo, self).__init__(
             model, names, score_thresh, nms_thresh, draw=draw)
 
@@ -388,7 +558,7 @@ class SSD300VOC(DetectSingleShot):
             Detector](https://arxiv.org/abs/1512.02325)
     """
     def __init__(self, score_thresh=0.60, nms_thresh=0.45, draw=True):
-        model = SSD300()
+        model = get_model(SSD300)
         names = get_class_names('VOC')
         super(SSD300VOC, self).__init__(
             model, names, score_thresh, nms_thresh, draw=draw)
@@ -419,7 +589,7 @@ class SSD300FAT(DetectSingleShot):
 
     """
     def __init__(self, score_thresh=0.60, nms_thresh=0.45, draw=True):
-        model = SSD300(22, 'FAT', 'FAT')
+        model = get_model(SSD300, 22, 'FAT', 'FAT')
         names = get_class_names('FAT')
         super(SSD300FAT, self).__init__(
             model, names, score_thresh, nms_thresh, draw=draw)
@@ -482,7 +652,8 @@ class HaarCascadeFrontalFace(DetectHaarCascade):
 
     """
     def __init__(self, class_name='Face', color=[0, 255, 0], draw=True):
-        self.model = HaarCascadeDetector('frontalface_default', class_arg=0)
+        self.model = get_model(
+            HaarCascadeDetector, 'frontalface_default', class_arg=0)
         super(HaarCascadeFrontalFace, self).__init__(
             self.model, [class_name], [color], draw)
 
@@ -512,14 +683,21 @@ class DetectMiniXceptionFER(Processor):
         The corresponding values of these keys contain the image with the drawn
         inferences and a list of ``paz.abstract.messages.Boxes2D``.
 
+    # Arguments
+        offsets: List of two elements. Each element must be between [0, 1].
+        colors: List of lists containing the color values of each emotion.
+        batch: Boolean. If ``True`` all faces are classified with a single
+            model call.
+
     # References
        - [Real-time Convolutional Neural Networks for Emotion and
             Gender Classification](https://arxiv.org/abs/1710.07557)
     """
-    def __init__(self, offsets=[0, 0], colors=EMOTION_COLORS):
+    def __init__(self, offsets=[0, 0], colors=EMOTION_COLORS, batch=False):
         super(DetectMiniXceptionFER, self).__init__()
         self.offsets = offsets
         self.colors = colors
+        self.batch = batch
 
         # detection
         self.detect = HaarCascadeFrontalFace()
@@ -542,8 +720,11 @@ class DetectMiniXceptionFER(Processor):
         boxes2D = self.square(boxes2D)
         boxes2D = self.clip(image, boxes2D)
         cropped_images = self.crop(image, boxes2D)
-        for cropped_image, box2D in zip(cropped_images, boxes2D):
-            predictions = self.classify(cropped_image)
+        if self.batch:
+            batch_predictions = self.classify.predict_batch(cropped_images)
+        else:
+            batch_predictions = map(self.classify, cropped_images)
+        for predictions, box2D in zip(batch_predictions, boxes2D):
             box2D.class_name = predictions['class_name']
             box2D.score = np.amax(predictions['scores'])
         image = self.draw(image, boxes2D)
@@ -551,7 +732,8 @@ class DetectMiniXceptionFER(Processor):
 
 
 class DetectKeypoints2D(Processor):
-    def __init__(self, detect, estimate_keypoints, offsets=[0, 0], radius=3):
+    def __init__(self, detect, estimate_keypoints, offsets=[0, 0], radius=3,
+                 batch=False):
         """General detection and keypoint estimator pipeline.
 
         # Arguments
@@ -563,8 +745,11 @@ class DetectKeypoints2D(Processor):
                 a numpy array of keypoints.
             offsets: List of two elements. Each element must be between [0, 1].
             radius: Int indicating the radius of the keypoints to be drawn.
+            batch: Boolean. If ``True`` all crops are estimated with a
+                single call to ``estimate_keypoints.predict_batch``.
         """
         super(DetectKeypoints2D, self).__init__()
+        self.batch = batch
         self.detect = detect
         self.estimate_keypoints = estimate_keypoints
         self.num_keypoints = estimate_keypoints.num_keypoints
@@ -574,6 +759,8 @@ class DetectKeypoints2D(Processor):
         self.clip = pr.ClipBoxes2D()
         self.crop = pr.CropBoxes2D()
         self.change_coordinates = pr.ChangeKeypointsCoordinateSystem()
+        self.change_coordinates_batch = (
+            pr.ChangeKeypointsCoordinateSystemBatch())
         self.draw = pr.DrawKeypoints2D(self.num_keypoints, radius, False)
         self.draw_boxes = pr.DrawBoxes2D(detect.class_names, detect.colors)
         self.wrap = pr.WrapOutput(['image', 'boxes2D', 'keypoints'])
@@ -583,6 +770,8 @@ class DetectKeypoints2D(Processor):
         boxes2D = self.square(boxes2D)
         boxes2D = self.clip(image, boxes2D)
         cropped_images = self.crop(image, boxes2D)
+        if self.batch:
+            return self._call_batch(image, boxes2D, cropped_images)
         keypoints2D = []
         for cropped_image, box2D in zip(cropped_images, boxes2D):
             keypoints = self.estimate_keypoints(cropped_image)['keypoints']
@@ -592,6 +781,19 @@ class DetectKeypoints2D(Processor):
         image = self.draw_boxes(image, boxes2D)
         return self.wrap(image, boxes2D, keypoints2D)
 
+    def _call_batch(self, image, boxes2D, cropped_images):
+        keypoints2D = []
+        if len(boxes2D) > 0:
+            inferences = self.estimate_keypoints.predict_batch(cropped_images)
+            keypoints2D = np.array(
+                [inference['keypoints'] for inference in inferences])
+            keypoints2D = list(self.change_coordinates_batch(
+                keypoints2D, boxes2D))
+        for keypoints in keypoints2D:
+            image = self.draw(image, keypoints)
+        image = self.draw_boxes(image, boxes2D)
+        return self.wrap(image, boxes2D, keypoints2D)
+
 
 class DetectFaceKeypointNet2D32(DetectKeypoints2D):
     """Frontal face detection pipeline with facial keypoint estimation.
@@ -599,6 +801,8 @@ class DetectFaceKeypointNet2D32(DetectKeypoints2D):
     # Arguments
         offsets: List of two elements. Each element must be between [0, 1].
         radius: Int indicating the radius of the keypoints to be drawn.
+        batch: Boolean. If ``True`` all faces are estimated with a single
+            model call.
 
     # Example
         ``` python
@@ -616,11 +820,11 @@ class DetectFaceKeypointNet2D32(DetectKeypoints2D):
         inferences and a list of ``paz.abstract.messages.Boxes2D``.
 
     """
-    def __init__(self, offsets=[0, 0], radius=3):
+    def __init__(self, offsets=[0, 0], radius=3, batch=False):
         detect = HaarCascadeFrontalFace(draw=False)
         estimate_keypoints = FaceKeypointNet2D32(draw=False)
         super(DetectFaceKeypointNet2D32, self).__init__(
-            detect, estimate_keypoints, offsets, radius)
+            detect, estimate_keypoints, offsets, radius, batch)
 
 
 class SSD512HandDetection(DetectSingleShot):
@@ -653,8 +857,8 @@ class SSD512HandDetection(DetectSingleShot):
     def __init__(self, score_thresh=0.40, nms_thresh=0.45, draw=True):
         class_names = ['background', 'hand']
         num_classes = len(class_names)
-        model = SSD512(num_classes, base_weights='OIV6Hand',
-                       head_weights='OIV6Hand')
+        model = get_model(SSD512, num_classes, base_weights='OIV6Hand',
+                          head_weights='OIV6Hand')
         super(SSD512HandDetection, self).__init__(
             model, class_names, score_thresh, nms_thresh, draw=draw)
 
@@ -665,6 +869,8 @@ class SSD512MinimalHandPose(DetectMinimalHand):
     # Arguments
         right_hand: Boolean. True for right hand inference.
         offsets: List of two elements. Each element must be between [0, 1].
+        batch: Boolean. If ``True`` all hands are estimated with a single
+            call to each model.
 
     # Example
         ``` python
@@ -683,11 +889,11 @@ class SSD512MinimalHandPose(DetectMinimalHand):
         The corresponding values of these keys contain the image with the drawn
         inferences.
     """
-    def __init__(self, right_hand=False, offsets=[0.25, 0.25]):
+    def __init__(self, right_hand=False, offsets=[0.25, 0.25], batch=False):
         detector = SSD512HandDetection()
         keypoint_estimator = MinimalHandPoseEstimation(right_hand)
         super(SSD512MinimalHandPose, self).__init__(
-            detector, keypoint_estimator, offsets)
+            detector, keypoint_estimator, offsets, batch=batch)
 
 
 class EFFICIENTDETD0COCO(DetectSingleShotEfficientDet):
@@ -706,8 +912,8 @@ class EFFICIENTDETD0COCO(DetectSingleShotEfficientDet):
     """
     def __init__(self, score_thresh=0.60, nms_thresh=0.45, draw=True):
         names = get_class_names('COCO_EFFICIENTDET')
-        model = EFFICIENTDETD0(num_classes=len(names),
-                               base_weights='COCO', head_weights='COCO')
+        model = get_model(EFFICIENTDETD0, num_classes=len(names),
+                          base_weights='COCO', head_weights='COCO')
         super(EFFICIENTDETD0COCO, self).__init__(
             model, names, score_thresh, nms_thresh, draw=draw)
 
@@ -728,8 +934,8 @@ class EFFICIENTDETD1COCO(DetectSingleShotEfficientDet):
     """
     def __init__(self, score_thresh=0.60, nms_thresh=0.45, draw=True):
         names = get_class_names('COCO_EFFICIENTDET')
-        model = EFFICIENTDETD1(num_classes=len(names),
-                               base_weights='COCO', head_weights='COCO')
+        model = get_model(EFFICIENTDETD1, num_classes=len(names),
+                          base_weights='COCO', head_weights='COCO')
         super(EFFICIENTDETD1COCO, self).__init__(
             model, names, score_thresh, nms_thresh, draw=draw)
 
@@ -750,8 +956,8 @@ class EFFICIENTDETD2COCO(DetectSingleShotEfficientDet):
     """
     def __init__(self, score_thresh=0.60, nms_thresh=0.45, draw=True):
         names = get_class_names('COCO_EFFICIENTDET')
-        model = EFFICIENTDETD2(num_classes=len(names),
-                               base_weights='COCO', head_weights='COCO')
+        model = get_model(EFFICIENTDETD2, num_classes=len(names),
+                          base_weights='COCO', head_weights='COCO')
         super(EFFICIENTDETD2COCO, self).__init__(
             model, names, score_thresh, nms_thresh, draw=draw)
 
@@ -772,8 +978,8 @@ class EFFICIENTDETD3COCO(DetectSingleShotEfficientDet):
     """
     def __init__(self, score_thresh=0.60, nms_thresh=0.45, draw=True):
         names = get_class_names('COCO_EFFICIENTDET')
-        model = EFFICIENTDETD3(num_classes=len(names),
-                               base_weights='COCO', head_weights='COCO')
+        model = get_model(EFFICIENTDETD3, num_classes=len(names),
+                          base_weights='COCO', head_weights='COCO')
         super(EFFICIENTDETD3COCO, self).__init__(
             model, names, score_thresh, nms_thresh, draw=draw)
 
@@ -794,8 +1000,8 @@ class EFFICIENTDETD4COCO(DetectSingleShotEfficientDet):
     """
     def __init__(self, score_thresh=0.60, nms_thresh=0.45, draw=True):
         names = get_class_names('COCO_EFFICIENTDET')
-        model = EFFICIENTDETD4(num_classes=len(names),
-                               base_weights='COCO', head_weights='COCO')
+        model = get_model(EFFICIENTDETD4, num_classes=len(names),
+                          base_weights='COCO', head_weights='COCO')
         super(EFFICIENTDETD4COCO, self).__init__(
             model, names, score_thresh, nms_thresh, draw=draw)
 
@@ -816,8 +1022,8 @@ class EFFICIENTDETD5COCO(DetectSingleShotEfficientDet):
     """
     def __init__(self, score_thresh=0.60, nms_thresh=0.45, draw=True):
         names = get_class_names('COCO_EFFICIENTDET')
-        model = EFFICIENTDETD5(num_classes=len(names),
-                               base_weights='COCO', head_weights='COCO')
+        model = get_model(EFFICIENTDETD5, num_classes=len(names),
+                          base_weights='COCO', head_weights='COCO')
         super(EFFICIENTDETD5COCO, self).__init__(
             model, names, score_thresh, nms_thresh, draw=draw)
 
@@ -838,8 +1044,8 @@ class EFFICIENTDETD6COCO(DetectSingleShotEfficientDet):
     """
     def __init__(self, score_thresh=0.60, nms_thresh=0.45, draw=True):
         names = get_class_names('COCO_EFFICIENTDET')
-        model = EFFICIENTDETD6(num_classes=len(names),
-                               base_weights='COCO', head_weights='COCO')
+        model = get_model(EFFICIENTDETD6, num_classes=len(names),
+                          base_weights='COCO', head_weights='COCO')
         super(EFFICIENTDETD6COCO, self).__init__(
             model, names, score_thresh, nms_thresh, draw=draw)
 
@@ -860,8 +1066,8 @@ class EFFICIENTDETD7COCO(DetectSingleShotEfficientDet):
     """
     def __init__(self, score_thresh=0.60, nms_thresh=0.45, draw=True):
         names = get_class_names('COCO_EFFICIENTDET')
-        model = EFFICIENTDETD7(num_classes=len(names),
-                               base_weights='COCO', head_weights='COCO')
+        model = get_model(EFFICIENTDETD7, num_classes=len(names),
+                          base_weights='COCO', head_weights='COCO')
         super(EFFICIENTDETD7COCO, self).__init__(
             model, names, score_thresh, nms_thresh, draw=draw)
 
@@ -882,7 +1088,7 @@ class EFFICIENTDETD0VOC(DetectSingleShot):
     """
     def __init__(self, score_thresh=0.60, nms_thresh=0.45, draw=True):
         names = get_class_names('VOC')
-        model = EFFICIENTDETD0(num_classes=len(names),
-                               base_weights='VOC', head_weights='VOC')
+        model = get_model(EFFICIENTDETD0, num_classes=len(names),
+                          base_weights='VOC', head_weights='VOC')
         super(EFFICIENTDETD0VOC, self).__init__(
             model, names, score_thresh, nms_thresh, draw=draw)
@@ -10,6 +10,12 @@ class GetHeatmapsAndTags(pr.Processor):
             Flipped list of keypoint order.
         data_with_center: Boolean. True is the model is trained using the
             center.
+        axes: List of four ints. Axes that transpose the model outputs to
+            (batch_size, num_channels, H, W) e.g. ``[0, 3, 1, 2]`` for
+            channel last outputs.
+        batch_flip: Boolean. If ``True`` and ``with_flip`` is ``True`` the
+            image and its flipped version are predicted in a single forward
+            pass with a batch of two images.
         image: Numpy array. Input image of shape (H, W)
 
     # Returns
@@ -17,25 +23,50 @@ class GetHeatmapsAndTags(pr.Processor):
         Tags: Numpy array of shape (1, num_keypoints, H, W)
     """
     def __init__(self, model, flipped_keypoint_order, with_flip,
-                 data_with_center, scale_output=True, axes=[0, 3, 1, 2]):
+                 data_with_center, scale_output=True, axes=[0, 3, 1, 2],
+                 batch_flip=False):
         super(GetHeatmapsAndTags, self).__init__()
         self.with_flip = with_flip
+        self.batch_flip = batch_flip
+        self.predict_model = pr.Predict(model)
+        # outputs are kept channel last until the end to resize all
+        # channels at once and to avoid gathering channels of transposes
+        self.process_output = pr.SequentialProcessor()
+        channels_last_axes = [axes[arg] for arg in [0, 2, 3, 1]]
+        if channels_last_axes != [0, 1, 2, 3]:
+            self.process_output.add(pr.TransposeOutput(channels_last_axes))
+        self.process_output.add(pr.ScaleOutput(2, channels_last=True))
         self.predict = pr.SequentialProcessor(
-            [pr.Predict(model), pr.TransposeOutput(axes), pr.ScaleOutput(2)])
-        self.get_heatmaps = pr.GetHeatmaps(flipped_keypoint_order)
-        self.get_tags = pr.GetTags(flipped_keypoint_order)
+            [self.predict_model, self.process_output])
+        self.get_heatmaps = pr.GetHeatmaps(flipped_keypoint_order, True)
+        self.get_tags = pr.GetTags(flipped_keypoint_order, True)
         self.postprocess = pr.SequentialProcessor()
         if data_with_center:
-            self.postprocess.add(pr.RemoveLastElement())
+            self.postprocess.add(pr.RemoveLastElement(channels_last=True))
         if scale_output:
-            self.postprocess.add(pr.ScaleOutput(2, full_scaling=True))
+            self.postprocess.add(pr.ScaleOutput(2, True, channels_last=True))
+        self.postprocess.add(pr.TransposeOutput([0, 3, 1, 2]))
+
+    def _predict_with_flip(self, image):
+        images = np.concatenate([image, np.flip(image, [2])], axis=0)
+        outputs = self.predict_model(images)
+        flipped_outputs = [output[1:2] for output in outputs]
+        outputs = [output[0:1] for output in outputs]
+        outputs = self.process_output(outputs)
+        flipped_outputs = self.process_output(flipped_outputs)
+        return outputs, flipped_outputs
 
     def call(self, image):
-        outputs = self.predict(image)
+        if self.with_flip and self.batch_flip:
+            outputs, flipped_outputs = self._predict_with_flip(image)
+        else:
+            outputs = self.predict(image)
         heatmaps = self.get_heatmaps(outputs, with_flip=False)
         tags = self.get_tags(outputs, with_flip=False)
         if self.with_flip:
-            outputs = self.predict(np.flip(image, [2]))
+            if not self.batch_flip:
+                flipped_outputs = self.predict(np.flip(image, [2]))
+            outputs = flipped_outputs
             heatmaps_flip = self.get_heatmaps(outputs, self.with_flip)
             tags_flip = self.get_tags(outputs, self.with_flip)
             heatmaps = [heatmaps, heatmaps_flip]
@@ -1,6 +1,6 @@
 import numpy as np
 
-from tensorflow.keras.utils import get_file
+from ..utils.weights import get_weights_file
 
 from .renderer import RenderTwoViews
 from .image import PreprocessImageHigherHRNet
@@ -9,6 +9,7 @@ from .heatmaps import GetHeatmapsAndTags
 from .. import processors as pr
 from ..abstract import SequentialProcessor, Processor
 from ..models import KeypointNet2D, HigherHRNet, DetNet, SimpleBaseline
+from ..models.registry import get_model, WeightsFile
 from .angles import IKNetHandJointAngles
 
 from ..backend.image import get_affine_transform, lincolor
@@ -108,6 +109,28 @@ class EstimateKeypoints2D(Processor):
             image = self.draw(image, keypoints)
         return self.wrap(image, keypoints)
 
+    def predict_batch(self, images):
+        """Estimates the keypoints of a list of images with a single
+        model call.
+
+        # Arguments
+            images: List of RGB images.
+
+        # Returns
+            List with the output of ``call`` for each image.
+        """
+        if len(images) == 0:
+            return []
+        inputs = np.concatenate([self.preprocess(x) for x in images], axis=0)
+        batch_keypoints = pr.Predict(self.model)(inputs)
+        inferences = []
+        for image, keypoints in zip(images, batch_keypoints):
+            keypoints = self.denormalize(keypoints, image)
+            if self.draw:
+                image = self.draw(image, keypoints)
+            inferences.append(self.wrap(image, keypoints))
+        return inferences
+
 
 class FaceKeypointNet2D32(EstimateKeypoints2D):
     """KeypointNet2D model trained with Kaggle Facial Detection challenge.
@@ -132,11 +155,13 @@ class FaceKeypointNet2D32(EstimateKeypoints2D):
         inferences and a numpy array representing the keypoints.
     """
     def __init__(self, draw=True, radius=3):
-        model = KeypointNet2D((96, 96, 1), 15, 32, 0.1)
         self.weights_URL = ('https://github.com/oarriaga/altamira-data/'
                             'releases/download/v0.7/')
-        weights_path = self.get_weights_path(model)
-        model.load_weights(weights_path)
+        model_name = '_'.join(['FaceKP', 'keypointnet2D', '32', '15'])
+        model_name = '%s_weights.hdf5' % model_name
+        weights_file = WeightsFile(model_name, self.weights_URL + model_name)
+        model = get_model(KeypointNet2D, (96, 96, 1), 15, 32, 0.1,
+                          weights_path=weights_file)
         super(FaceKeypointNet2D32, self).__init__(
             model, 15, draw, radius, pr.RGB2GRAY)
 
@@ -144,7 +169,7 @@ class FaceKeypointNet2D32(EstimateKeypoints2D):
         model_name = '_'.join(['FaceKP', model.name, '32', '15'])
         model_name = '%s_weights.hdf5' % model_name
         URL = self.weights_URL + model_name
-        return get_file(model_name, URL, cache_subdir='paz/models')
+        return get_weights_file(model_name, URL, cache_subdir='paz/models')
 
 
 class GetKeypoints(Processor):
@@ -154,6 +179,8 @@ class GetKeypoints(Processor):
     # Arguments
         max_num_instance: Int. Maximum number of instances to be detected.
         keypoint_order: List of length 17 (number of keypoints).
+        use_numpy: Boolean. If ``True`` the top k detections are extracted
+            with numpy instead of tensorflow operations.
         heatmaps: Numpy array of shape (1, num_keypoints, H, W)
         Tags: Numpy array of shape (1, num_keypoints, H, W, 2)
 
@@ -162,10 +189,11 @@ class GetKeypoints(Processor):
         scores: int: score for the keypoint
     """
     def __init__(self, max_num_instance, keypoint_order, detection_thresh=0.2,
-                 tag_thresh=1):
+                 tag_thresh=1, use_numpy=False):
         super(GetKeypoints, self).__init__()
         self.group_keypoints = pr.SequentialProcessor(
-            [pr.TopKDetections(max_num_instance), pr.GroupKeypointsByTag(
+            [pr.TopKDetections(max_num_instance, use_numpy),
+             pr.GroupKeypointsByTag(
                 keypoint_order, tag_thresh, detection_thresh)])
         self.adjust_keypoints = pr.AdjustKeypointsLocations()
         self.get_scores = pr.GetScores()
@@ -225,6 +253,10 @@ class HigherHRNetHumanPose2D(Processor):
         dataset: String. Name of the dataset used for training the model.
         data_with_center: Boolean. True is the model is trained using the
             center.
+        use_numpy: Boolean. If ``True`` the top k detections are extracted
+            with numpy instead of tensorflow operations.
+        batch_flip: Boolean. If ``True`` the flipped image is predicted
+            together with the image in a single forward pass.
 
     # Returns
         dictonary with the following keys:
@@ -233,18 +265,21 @@ class HigherHRNetHumanPose2D(Processor):
             score: score of detection
     """
     def __init__(self, dataset='COCO', data_with_center=False,
-                 max_num_people=30, with_flip=True, draw=True):
+                 max_num_people=30, with_flip=True, draw=True,
+                 use_numpy=False, batch_flip=True):
         super(HigherHRNetHumanPose2D, self).__init__()
         keypoint_order = JOINT_CONFIG[dataset]
         flipped_keypoint_order = FLIP_CONFIG[dataset]
         self.with_flip = with_flip
         self.draw = draw
-        self.model = HigherHRNet(weights=dataset)
+        self.model = get_model(HigherHRNet, weights=dataset)
         self.transform_image = PreprocessImageHigherHRNet()
         self.get_heatmaps_and_tags = pr.SequentialProcessor(
             [GetHeatmapsAndTags(self.model, flipped_keypoint_order,
-             with_flip, data_with_center), pr.AggregateResults(with_flip)])
-        self.get_keypoints = GetKeypoints(max_num_people, keypoint_order)
+             with_flip, data_with_center, batch_flip=batch_flip),
+             pr.AggregateResults(with_flip)])
+        self.get_keypoints = GetKeypoints(max_num_people, keypoint_order,
+                                          use_numpy=use_numpy)
         self.transform_keypoints = TransformKeypoints(inverse=True)
         self.draw_skeleton = pr.DrawHumanSkeleton(dataset, check_scores=True)
         self.extract_keypoints_locations = pr.ExtractKeypointsLocations()
@@ -286,15 +321,42 @@ class DetNetHandKeypoints(pr.Processor):
         self.preprocess.add(pr.ExpandDims(axis=0))
         if self.right_hand:
             self.preprocess.add(pr.FlipLeftRightImage())
-        self.predict = pr.Predict(model=DetNet(), preprocess=self.preprocess)
+        self.model = get_model(DetNet, batch_outputs=True)
+        self.predict = pr.Predict(self.model, self.preprocess)
         self.scale_keypoints = pr.ScaleKeypoints(scale=4, shape=shape)
         self.draw_skeleton = pr.DrawHandSkeleton()
         self.wrap = pr.WrapOutput(['image', 'keypoints3D', 'keypoints2D'])
 
     def call(self, image):
         keypoints3D, keypoints2D = self.predict(image)
-        keypoints3D = keypoints3D.numpy()
-        keypoints2D = keypoints2D.numpy()
+        keypoints3D = keypoints3D.numpy()[0]
+        keypoints2D = keypoints2D.numpy()[0]
+        return self._postprocess(image, keypoints3D, keypoints2D)
+
+    def predict_batch(self, images):
+        """Estimates the keypoints of a list of hand images with a single
+        model call.
+
+        # Arguments
+            images: List of RGB images.
+
+        # Returns
+            List with the output of ``call`` for each image.
+        """
+        if len(images) == 0:
+            return []
+        inputs = np.concatenate([self.preprocess(x) for x in images], axis=0)
+        batch_keypoints3D, batch_keypoints2D = pr.Predict(self.model)(inputs)
+        batch_keypoints3D = batch_keypoints3D.numpy()
+        batch_keypoints2D = batch_keypoints2D.numpy()
+        inferences = []
+        for image, keypoints3D, keypoints2D in zip(
+                images, batch_keypoints3D, batch_keypoints2D):
+            inferences.append(
+                self._postprocess(image, keypoints3D, keypoints2D))
+        return inferences
+
+    def _postprocess(self, image, keypoints3D, keypoints2D):
         if self.right_hand:
             keypoints2D = flip_keypoints_left_right(keypoints2D)
         keypoints2D = uv_to_vu(keypoints2D)
@@ -336,9 +398,31 @@ class MinimalHandPoseEstimation(pr.Processor):
                          keypoints['keypoints2D'], angles['absolute_angles'],
                          angles['relative_angles'])
 
+    def predict_batch(self, images):
+        """Estimates keypoints and joint angles of a list of hand images
+        with a single call to each model.
+
+        # Arguments
+            images: List of RGB images.
+
+        # Returns
+            List with the output of ``call`` for each image.
+        """
+        batch_keypoints = self.keypoints_estimator.predict_batch(images)
+        batch_angles = self.angle_estimator.predict_batch(
+            [keypoints['keypoints3D'] for keypoints in batch_keypoints])
+        inferences = []
+        for keypoints, angles in zip(batch_keypoints, batch_angles):
+            inferences.append(self.wrap(
+                keypoints['image'], keypoints['keypoints3D'],
+                keypoints['keypoints2D'], angles['absolute_angles'],
+                angles['relative_angles']))
+        return inferences
+
 
 class DetectMinimalHand(pr.Processor):
-    def __init__(self, detect, estimate_keypoints, offsets=[0, 0], radius=3):
+    def __init__(self, detect, estimate_keypoints, offsets=[0, 0], radius=3,
+                 batch=False):
         """Minimal hand detection and keypoint estimator pipeline.
 
         # Arguments
@@ -350,8 +434,11 @@ class DetectMinimalHand(pr.Processor):
                 a numpy array of keypoints.
             offsets: List of two elements. Each element must be between [0, 1].
             radius: Int indicating the radius of the keypoints to be drawn.
+            batch: Boolean. If ``True`` all hand crops are estimated with a
+                single call to ``estimate_keypoints.predict_batch``.
         """
         super(DetectMinimalHand, self).__init__()
+        self.batch = batch
         self.class_names = ['OPEN', 'CLOSE']
         self.colors = lincolor(len(self.class_names))
         self.detect = detect
@@ -364,6 +451,8 @@ class DetectMinimalHand(pr.Processor):
         self.clip = pr.ClipBoxes2D()
         self.crop = pr.CropBoxes2D()
         self.change_coordinates = pr.ChangeKeypointsCoordinateSystem()
+        self.change_coordinates_batch = (
+            pr.ChangeKeypointsCoordinateSystemBatch())
         self.draw = pr.DrawHandSkeleton(keypoint_radius=radius)
         self.draw_boxes = pr.DrawBoxes2D(self.class_names, self.colors,
                                          with_score=False)
@@ -375,6 +464,8 @@ class DetectMinimalHand(pr.Processor):
         boxes2D = self.square(boxes2D)
         boxes2D = self.clip(image, boxes2D)
         cropped_images = self.crop(image, boxes2D)
+        if self.batch:
+            return self._call_batch(image, boxes2D, cropped_images)
         keypoints2D = []
         keypoints3D = []
         for cropped_image, box2D in zip(cropped_images, boxes2D):
@@ -390,6 +481,23 @@ class DetectMinimalHand(pr.Processor):
         image = self.draw_boxes(image, boxes2D)
         return self.wrap(image, boxes2D, keypoints2D, keypoints3D)
 
+    def _call_batch(self, image, boxes2D, cropped_images):
+        keypoints2D, keypoints3D = [], []
+        if len(boxes2D) > 0:
+            inferences = self.estimate_keypoints.predict_batch(cropped_images)
+            keypoints2D = np.array(
+                [inference['keypoints2D'] for inference in inferences])
+            keypoints2D = list(self.change_coordinates_batch(
+                keypoints2D, boxes2D))
+            for inference, box2D in zip(inferences, boxes2D):
+                box2D.class_name = self.classify_hand_closure(
+                    inference['relative_angles'])
+                keypoints3D.append(inference['keypoints3D'])
+        for keypoints in keypoints2D:
+            image = self.draw(image, keypoints)
+        image = self.draw_boxes(image, boxes2D)
+        return self.wrap(image, boxes2D, keypoints2D, keypoints3D)
+
 
 class EstimateHumanPose3D(Processor):
     """ Estimate human pose 3D from 2D human pose.
@@ -403,7 +511,7 @@ class EstimateHumanPose3D(Processor):
     """
     def __init__(self, input_shape=(32,), num_keypoints=16):
         super(EstimateHumanPose3D, self).__init__()
-        self.model = SimpleBaseline(input_shape, num_keypoints)
+        self.model = get_model(SimpleBaseline, input_shape, num_keypoints)
         self.preprocessing = SequentialProcessor(
             [pr.MergeKeypoints2D(args_to_mean),
              pr.FilterKeypoints2D(args_to_mean, h36m_to_coco_joints2D),
@@ -1,9 +1,9 @@
 import numpy as np
-from tensorflow.keras.utils import get_file
 
 from .. import processors as pr
 from ..abstract import Processor, SequentialProcessor, Pose6D
 from ..models import UNET_VGG16
+from ..models.registry import get_model, preload_models, WeightsFile
 from ..backend.image.draw import draw_points2D, points3D_to_RGB
 from ..backend.standard import append_lists
 from ..backend.keypoints import (
@@ -147,6 +147,24 @@ class HeadPoseKeypointNet2D32(EstimatePoseKeypoints):
             KEYPOINTS3D, {None: [900, 1200, 800]}, radius, thickness)
 
 
+def _build_subsample_correspondences(max_points, sampling):
+    """Builds the subsampling of Pix2Pose correspondences. ``Pix2Points``
+        does not predict confidences, therefore ``confidence`` sampling
+        is not valid.
+
+    # Arguments
+        max_points: Int or ``None``.
+        sampling: String. Either ``stratified`` or ``uniform``.
+
+    # Returns
+        Instance of ``pr.SubsampleCorrespondences``.
+    """
+    if sampling not in ['stratified', 'uniform']:
+        raise ValueError('Pix2Pose sampling must be stratified or uniform',
+                         sampling)
+    return pr.SubsampleCorrespondences(max_points, sampling)
+
+
 class SingleInstancePIX2POSE6D(Processor):
     """Predicts a single pose6D from an image. Optionally if a box2D message is
         given it translates the predicted points2D to new origin located at
@@ -160,13 +178,19 @@ class SingleInstancePIX2POSE6D(Processor):
         resize: Boolean. If True RGB mask is resized before computing PnP.
         class_name: Str indicating object name.
         draw: Boolean. If True drawing functions are applied to output image.
+        max_points: Int or ``None``. Maximum number of correspondences
+            given to PnP. If ``None`` all points of the RGB mask are used.
+        sampling: String. Method selecting the correspondences, either
+            ``stratified`` or ``uniform``. See ``pr.SubsampleCorrespondences``.
 
     # Returns
         Dictionary with inferred points2D, points3D, pose6D and image.
     """
-    def __init__(self, model, object_sizes, camera,
-                 epsilon=0.15, resize=False, class_name=None, draw=True):
+    def __init__(self, model, object_sizes, camera, epsilon=0.15,
+                 resize=False, class_name=None, draw=True, max_points=None,
+                 sampling='stratified'):
         super(SingleInstancePIX2POSE6D, self).__init__()
+        self.subsample = _build_subsample_correspondences(max_points, sampling)
         self.camera = camera
         self.pix2points = Pix2Points(model, object_sizes, epsilon, resize)
         self.solvePnP = pr.SolveChangingObjectPnPRANSAC(self.camera.intrinsics)
@@ -186,7 +210,7 @@ class SingleInstancePIX2POSE6D(Processor):
             self.class_name = box2D.class_name
         pose6D = None
         if len(points3D) > self.solvePnP.MIN_REQUIRED_POINTS:
-            success, R, T = self.solvePnP(points3D, points2D)
+            success, R, T = self.solvePnP(*self.subsample(points3D, points2D))
             if success:
                 pose6D = Pose6D.from_rotation_vector(R, T, self.class_name)
         if (self.draw and (box2D is None) and (pose6D is not None)):
@@ -260,13 +284,11 @@ class SinglePowerDrillPIX2POSE6D(SingleInstancePIX2POSE6D):
         Dictionary with inferred points2D, points3D, pose6D and image.
     """
     def __init__(self, camera, epsilon=0.15, resize=False, draw=True):
-        model = UNET_VGG16(3, (128, 128, 3))
         URL = ('https://github.com/oarriaga/altamira-data/'
                'releases/download/v0.13/')
         name = 'UNET-VGG16_POWERDRILL_weights.hdf5'
-        weights_path = get_file(name, URL + name, cache_subdir='paz/models')
-        print('Loading %s model weights' % weights_path)
-        model.load_weights(weights_path)
+        model = get_model(UNET_VGG16, 3, (128, 128, 3),
+                          weights_path=WeightsFile(name, URL + name))
         object_sizes = np.array([1840, 1870, 520]) / 10000
         class_name = '035_power_drill'
         super(SinglePowerDrillPIX2POSE6D, self).__init__(
@@ -333,32 +355,42 @@ class MultiInstanceMultiClassPIX2POSE6D(Processor):
         epsilon: Float. Values below this value would be replaced by 0.
         resize: Boolean. If True RGB mask is resized before computing PnP.
         draw: Boolean. If True drawing functions are applied to output image.
+        max_points: Int or ``None``. Maximum number of correspondences
+            given to PnP for each object. If ``None`` all points of the RGB
+            mask are used.
+        sampling: String. Method selecting the correspondences, either
+            ``stratified`` or ``uniform``. See ``pr.SubsampleCorrespondences``.
+        num_workers: Int. Number of threads solving the poses of all
+            objects of an image. If ``0`` poses are solved sequentially.
 
     # Returns
         Dictionary with inferred boxes2D, poses6D and image.
     """
     def __init__(self, detect, name_to_model, name_to_size, camera, offsets,
-                 epsilon=0.15, resize=False, draw=True):
+                 epsilon=0.15, resize=False, draw=True, max_points=None,
+                 sampling='stratified', num_workers=4):
         super(MultiInstanceMultiClassPIX2POSE6D, self).__init__()
         if set(name_to_model.keys()) != set(name_to_size.keys()):
             raise ValueError('models and sizes must have same class names')
         self.detect = detect
+        self.subsample = _build_subsample_correspondences(max_points, sampling)
         self.name_to_pix2points = self._build_pix2points(
             name_to_model, name_to_size, epsilon, resize)
-        valid_names = list(self.name_to_model.keys())
+        valid_names = list(name_to_model.keys())
         self.postprocess_boxes = PostprocessBoxes2D(offsets, valid_names)
         self.draw_boxes2D = pr.DrawBoxes2D(valid_names)
         self.draw_RGBmask = self._build_draw_RGBmask(name_to_size)
         self.draw_pose6D = self._build_draw_pose6D(name_to_size, camera)
         self.wrap = pr.WrapOutput(['image', 'boxes2D', 'points3D', 'poses6D'])
         self.solvePnP = pr.SolveChangingObjectPnPRANSAC(camera.intrinsics)
+        self.solvePnP_batch = pr.SolveChangingObjectPnPRANSACBatch(
+            camera.intrinsics, num_workers=num_workers)
         self.clip = pr.ClipBoxes2D()
         self.crop = pr.CropBoxes2D()
         self.draw = draw
 
     def _build_pix2points(self, name_to_model, name_to_size, epsilon, resize):
         name_to_pix2points = {}
-        print(name_to_model)
         for name, model in name_to_model.items():
             pix2points = Pix2Points(model, name_to_size[name], epsilon, resize)
             name_to_pix2points[name] = pix2points
@@ -378,28 +410,50 @@ class MultiInstanceMultiClassPIX2POSE6D(Processor):
             name_to_draw[name] = draw
         return name_to_draw
 
-    def estimate_pose(self, image, box2D):
+    def estimate_points(self, image, box2D):
         inferences = self.name_to_pix2points[box2D.class_name](image)
         points2D = inferences['points2D']
         points3D = inferences['points3D']
         points2D = denormalize_keypoints2D(points2D, *image.shape[:2])
         points2D = translate_points2D_origin(points2D, box2D.coordinates)
+        return points2D, points3D
+
+    def estimate_pose(self, image, box2D):
+        points2D, points3D = self.estimate_points(image, box2D)
         pose6D = None
         if len(points3D) > self.solvePnP.MIN_REQUIRED_POINTS:
-            success, R, T = self.solvePnP(points3D, points2D)
+            success, R, T = self.solvePnP(*self.subsample(points3D, points2D))
             if success:
                 pose6D = Pose6D.from_rotation_vector(R, T, box2D.class_name)
         return points2D, points3D, pose6D
 
+    def estimate_poses(self, boxes2D, points2D, points3D):
+        """Solves the poses of all objects of an image concurrently."""
+        objects_points3D, images_points2D, solved_args = [], [], []
+        for arg, (p2D, p3D) in enumerate(zip(points2D, points3D)):
+            if len(p3D) > self.solvePnP.MIN_REQUIRED_POINTS:
+                p3D, p2D = self.subsample(p3D, p2D)
+                objects_points3D.append(p3D)
+                images_points2D.append(p2D)
+                solved_args.append(arg)
+        solutions = self.solvePnP_batch(objects_points3D, images_points2D)
+        poses6D = [None] * len(points3D)
+        for arg, (success, R, T) in zip(solved_args, solutions):
+            if success:
+                class_name = boxes2D[arg].class_name
+                poses6D[arg] = Pose6D.from_rotation_vector(R, T, class_name)
+        return poses6D
+
     def call(self, image):
         boxes2D = self.detect(image)['boxes2D']
         boxes2D = self.postprocess_boxes(boxes2D)
         boxes2D = self.clip(image, boxes2D)
         cropped_images = self.crop(image, boxes2D)
-        points2D, points3D, poses6D = [], [], []
+        points2D, points3D = [], []
         for crop, box2D in zip(cropped_images, boxes2D):
-            inferences = self.estimate_pose(crop, box2D)
-            append_lists(inferences, [points2D, points3D, poses6D])
+            inferences = self.estimate_points(crop, box2D)
+            append_lists(inferences, [points2D, points3D])
+        poses6D = self.estimate_poses(boxes2D, points2D, points3D)
         if self.draw:
             image = self.draw_boxes2D(image, boxes2D)
             for box2D, pose6D in zip(boxes2D, poses6D):
@@ -422,43 +476,43 @@ class PIX2YCBTools6D(MultiInstanceMultiClassPIX2POSE6D):
         epsilon: Float. Values below this value would be replaced by 0.
         resize: Boolean. If True RGB mask is resized before computing PnP.
         draw: Boolean. If True drawing functions are applied to output image.
+        max_points: Int or ``None``. Maximum number of correspondences
+            given to PnP for each object.
+        sampling: String. Method selecting the correspondences, either
+            ``stratified`` or ``uniform``. See ``pr.SubsampleCorrespondences``.
+        num_workers: Int. Number of threads solving the poses of all
+            objects of an image.
 
     # Returns
         Dictionary with inferred boxes2D, poses6D and image.
     """
     def __init__(self, camera, score_thresh=0.45, nms_thresh=0.15,
-                 offsets=[0.25, 0.25], epsilon=0.15, resize=False, draw=True):
+                 offsets=[0.25, 0.25], epsilon=0.15, resize=False, draw=True,
+                 max_points=None, sampling='stratified', num_workers=4):
 
         self.detect = SSD300FAT(score_thresh, nms_thresh, draw=False)
         self.name_to_sizes = self._build_name_to_sizes()
         self.name_to_model = self._build_name_to_model()
         super(PIX2YCBTools6D, self).__init__(
             self.detect, self.name_to_model, self.name_to_sizes, camera,
-            offsets, epsilon, resize, draw)
+            offsets, epsilon, resize, draw, max_points, sampling, num_workers)
 
     def _build_name_to_model(self):
         URL = ('https://github.com/oarriaga/altamira-data/'
                'releases/download/v0.13/')
 
-        UNET_power_drill = UNET_VGG16(3, (128, 128, 3))
-        name = 'UNET-VGG16_POWERDRILL_weights.hdf5'
-        weights_path = get_file(name, URL + name, cache_subdir='paz/models')
-        UNET_power_drill.load_weights(weights_path)
-
-        UNET_large_clamp = UNET_VGG16(3, (128, 128, 3))
-        name = 'UNET-VGG16_LARGE-CLAMP_weights.hdf5'
-        weights_path = get_file(name, URL + name, cache_subdir='paz/models')
-        UNET_large_clamp.load_weights(weights_path)
-
-        UNET_scissors = UNET_VGG16(3, (128, 128, 3))
-        name = 'UNET-VGG16_SCISSORS_weights.hdf5'
-        weights_path = get_file(name, URL + name, cache_subdir='paz/models')
-        UNET_scissors.load_weights(weights_path)
-
-        name_to_model = {'035_power_drill': UNET_power_drill,
-                         '051_large_clamp': UNET_large_clamp,
-                         '037_scissors': UNET_scissors
-                         }
+        name_to_weights = {
+            '035_power_drill': 'UNET-VGG16_POWERDRILL_weights.hdf5',
+            '051_large_clamp': 'UNET-VGG16_LARGE-CLAMP_weights.hdf5',
+            '037_scissors': 'UNET-VGG16_SCISSORS_weights.hdf5'
+        }
+        model_calls = []
+        for name in name_to_weights.values():
+            weights_file = WeightsFile(name, URL + name)
+            kwargs = {'weights_path': weights_file}
+            model_calls.append((UNET_VGG16, (3, (128, 128, 3)), kwargs))
+        models = preload_models(model_calls)
+        name_to_model = dict(zip(name_to_weights.keys(), models))
         return name_to_model
 
     def _build_name_to_sizes(self):
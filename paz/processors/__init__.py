@@ -8,9 +8,11 @@ from .detection import FilterClassBoxes2D
 from .detection import CropBoxes2D
 from .detection import ToBoxes2D
 from .detection import MatchBoxes
+from .detection import MatchBoxesBatch
 from .detection import EncodeBoxes
 from .detection import DecodeBoxes
 from .detection import NonMaximumSuppressionPerClass
+from .detection import NonMaximumSuppressionPerImage
 from .detection import FilterBoxes
 from .detection import OffsetBoxes2D
 from .detection import CropImage
@@ -67,6 +69,7 @@ from .image import GetNonZeroValues
 from .image import FlipLeftRightImage
 from .image import ImagenetPreprocessInput
 from .image import DivideStandardDeviationImage
+from .image import StandardizeImage
 from .image import ScaledResize
 
 
@@ -95,6 +98,7 @@ from .geometric import WarpAffine
 
 
 from .keypoints import ChangeKeypointsCoordinateSystem
+from .keypoints import ChangeKeypointsCoordinateSystemBatch
 from .keypoints import DenormalizeKeypoints
 from .keypoints import NormalizeKeypoints
 from .keypoints import PartitionKeypoints
@@ -139,6 +143,8 @@ from .standard import PrintTopics
 
 from .pose import SolvePNP
 from .pose import SolveChangingObjectPnPRANSAC
+from .pose import SolveChangingObjectPnPRANSACBatch
+from .pose import SubsampleCorrespondences
 from .pose import Translation3DFromBoxWidth
 
 from .groups import ToAffineMatrix
@@ -160,24 +166,14 @@ from ..backend.image.draw import LINE
 
 from ..abstract import Processor
 from ..abstract import SequentialProcessor
-
-
-from .heatmaps import TransposeOutput
-from .heatmaps import ScaleOutput
-from .heatmaps import GetHeatmaps
-from .heatmaps import GetTags
-from .heatmaps import RemoveLastElement
-from .heatmaps import AggregateResults
-from .heatmaps import TopKDetections
-from .heatmaps import GroupKeypointsByTag
-from .heatmaps import AdjustKeypointsLocations
-from .heatmaps import GetScores
-from .heatmaps import RefineKeypointsLocations
-from .heatmaps import TransformKeypoints
-from .heatmaps import ExtractKeypointsLocations
+from ..utils.lazy import lazy_attributes
 
 from .munkres import Munkres
 
+from .compiler import FuseElementwise
+from .compiler import compile_pipeline
+from .compiler import is_elementwise
+
 from .angles import ChangeLinkOrder
 from .angles import CalculateRelativeAngles
 from .angles import IsHandOpen
@@ -186,3 +182,13 @@ from .angles import IsHandOpen
 TRAIN = 0
 VAL = 1
 TEST = 2
+
+
+# heatmap processors use TensorFlow and are only imported when accessed
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    '.heatmaps': [
+        'TransposeOutput', 'ScaleOutput', 'GetHeatmaps', 'GetTags',
+        'RemoveLastElement', 'AggregateResults', 'TopKDetections',
+        'GroupKeypointsByTag', 'AdjustKeypointsLocations', 'GetScores',
+        'RefineKeypointsLocations', 'TransformKeypoints',
+        'ExtractKeypointsLocations']})
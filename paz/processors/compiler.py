@@ -0,0 +1,193 @@
+import copy
+
+import numpy as np
+
+from ..abstract import Processor, SequentialProcessor
+from .image import CastImage
+from .image import SubtractMeanImage
+from .image import AddMeanImage
+from .image import NormalizeImage
+from .image import DenormalizeImage
+from .image import DivideStandardDeviationImage
+from .image import ReplaceLowerThanThreshold
+from .standard import ExpandDims
+from .standard import Squeeze
+
+
+def _arithmetic(function, get_operand):
+    return lambda processor: ('arithmetic', function, get_operand(processor))
+
+
+# processors whose ``call`` is a pure array operation. Only these exact
+# classes are fused since subclasses can change the behaviour of ``call``.
+ELEMENTWISE_KERNELS = {
+    SubtractMeanImage: _arithmetic(np.subtract, lambda p: p.mean),
+    AddMeanImage: _arithmetic(np.add, lambda p: p.mean),
+    NormalizeImage: _arithmetic(np.divide, lambda p: 255.0),
+    DenormalizeImage: _arithmetic(np.multiply, lambda p: 255.0),
+    DivideStandardDeviationImage: _arithmetic(
+        np.divide, lambda p: p.standard_deviation),
+    CastImage: lambda processor: ('cast', np.dtype(processor.dtype)),
+    ExpandDims: lambda processor: ('view', processor),
+    Squeeze: lambda processor: ('view', processor),
+    ReplaceLowerThanThreshold: lambda processor: (
+        'replace', processor.threshold, processor.replacement)
+}
+
+
+def _is_integer_cast(processor):
+    return ((type(processor) is CastImage) and
+            not np.issubdtype(np.dtype(processor.dtype), np.inexact))
+
+
+def is_elementwise(processor):
+    """Checks if a processor can be fused by ``FuseElementwise``.
+
+    # Arguments
+        processor: ``Processor`` or ``SequentialProcessor``.
+
+    # Returns
+        Boolean.
+    """
+    return type(processor) in ELEMENTWISE_KERNELS
+
+
+class FuseElementwise(Processor):
+    """Applies a chain of elementwise array processors as a single
+    computation. All arithmetic is done in place in one buffer that is
+    cast once to the computation dtype, instead of allocating a new array
+    per processor. The computation dtype is the floating dtype that the
+    chain reaches, such that results equal the unfused chain up to the
+    rounding of that dtype. Casts to integer dtypes can only be the last
+    processor of the chain.
+
+    # Arguments
+        processors: List of processors for which ``is_elementwise`` holds.
+        reuse_buffers: Boolean. If ``True`` the buffers are allocated once
+            per input shape and dtype and reused in the following calls.
+            Outputs are then overwritten by the next call.
+        name: String indicating name of the processing unit.
+    """
+    def __init__(self, processors, reuse_buffers=False, name=None):
+        for processor_arg, processor in enumerate(processors):
+            if not is_elementwise(processor):
+                raise ValueError('Processor %s can not be fused' %
+                                 processor.name)
+            is_last = processor_arg == (len(processors) - 1)
+            if _is_integer_cast(processor) and not is_last:
+                raise ValueError('Integer casts are only fused at the end')
+        if name is None:
+            names = [processor.name for processor in processors]
+            name = 'Fused(%s)' % '+'.join(names)
+        super(FuseElementwise, self).__init__(name)
+        self.processors = processors
+        self.kernels = [ELEMENTWISE_KERNELS[type(processor)](processor)
+                        for processor in processors]
+        self.reuse_buffers = reuse_buffers
+        self._plans = {}
+        self._buffers = {}
+
+    def _compute_dtypes(self, image):
+        # dry run of the unfused chain with a single pixel per channel
+        sample = np.zeros((1,) * (image.ndim - 1) + image.shape[-1:],
+                          dtype=image.dtype)
+        compute_dtype = None
+        for processor in self.processors:
+            sample = processor(sample)
+            if np.issubdtype(sample.dtype, np.floating):
+                compute_dtype = sample.dtype
+        return compute_dtype, sample.dtype
+
+    def _get_plan(self, image):
+        key = (image.shape, image.dtype)
+        if key not in self._plans:
+            self._plans[key] = self._compute_dtypes(image)
+        return self._plans[key]
+
+    def _get_buffer(self, name, shape, dtype):
+        if not self.reuse_buffers:
+            return np.empty(shape, dtype=dtype)
+        key = (name, shape, np.dtype(dtype))
+        if key not in self._buffers:
+            self._buffers[key] = np.empty(shape, dtype=dtype)
+        return self._buffers[key]
+
+    def call(self, image):
+        compute_dtype, output_dtype = self._get_plan(image)
+        if compute_dtype is None:
+            for processor in self.processors:
+                image = processor(image)
+            return image
+        x, buffer = image, None
+        for kernel in self.kernels:
+            if kernel[0] == 'view':
+                x = kernel[1](x)
+            elif kernel[0] == 'replace':
+                x[x < kernel[1]] = kernel[2]
+            elif kernel[0] == 'cast':
+                if buffer is None:
+                    buffer = self._get_buffer(
+                        'compute', x.shape, compute_dtype)
+                    np.copyto(buffer, x, casting='unsafe')
+                    x = buffer
+            elif kernel[0] == 'arithmetic':
+                if buffer is None:
+                    buffer = self._get_buffer(
+                        'compute', x.shape, compute_dtype)
+                    x = kernel[1](x, kernel[2], out=buffer,
+                                  dtype=compute_dtype, casting='unsafe')
+                else:
+                    x = kernel[1](x, kernel[2], out=x, casting='unsafe')
+        if buffer is None:
+            buffer = self._get_buffer('compute', x.shape, compute_dtype)
+            np.copyto(buffer, x, casting='unsafe')
+            x = buffer
+        if x.dtype != output_dtype:
+            output = self._get_buffer('output', x.shape, output_dtype)
+            np.copyto(output, x, casting='unsafe')
+            x = output
+        return x
+
+
+def compile_pipeline(pipeline, reuse_buffers=False):
+    """Returns a copy of a ``SequentialProcessor`` in which consecutive
+    elementwise processors e.g. mean subtraction, normalization and casts
+    are fused into a single ``FuseElementwise`` processor. Nested
+    ``SequentialProcessor`` are compiled recursively. All other
+    processors are called as before.
+
+    # Arguments
+        pipeline: ``SequentialProcessor``.
+        reuse_buffers: Boolean. If ``True`` fused processors reuse their
+            output buffers between calls.
+
+    # Returns
+        ``SequentialProcessor`` of the same class as ``pipeline``.
+    """
+    processors, elementwise_run = [], []
+
+    def add_elementwise_run():
+        is_arithmetic = [ELEMENTWISE_KERNELS[type(processor)](processor)[0]
+                         in ['arithmetic', 'cast']
+                         for processor in elementwise_run]
+        if len(elementwise_run) > 1 and any(is_arithmetic):
+            processors.append(
+                FuseElementwise(list(elementwise_run), reuse_buffers))
+        else:
+            processors.extend(elementwise_run)
+        del elementwise_run[:]
+
+    for processor in pipeline.processors:
+        if is_elementwise(processor):
+            elementwise_run.append(processor)
+            if _is_integer_cast(processor):
+                add_elementwise_run()
+            continue
+        add_elementwise_run()
+        if isinstance(processor, SequentialProcessor):
+            processor = compile_pipeline(processor, reuse_buffers)
+        processors.append(processor)
+    add_elementwise_run()
+    compiled_pipeline = copy.copy(pipeline)
+    compiled_pipeline.processors = processors
+    return compiled_pipeline
@@ -2,16 +2,23 @@ from __future__ import division
 
 import numpy as np
 
-from ..abstract import Processor, Box2D
+from ..abstract import Processor, Box2D, Boxes2D
 from ..backend.boxes import match
+from ..backend.boxes import match_batch
 from ..backend.boxes import encode
 from ..backend.boxes import decode
 from ..backend.boxes import offset
+from ..backend.boxes import offset_boxes
 from ..backend.boxes import clip
+from ..backend.boxes import clip_boxes
 from ..backend.boxes import nms_per_class
+from ..backend.boxes import batched_nms_per_class
+from ..backend.boxes import batched_nms_per_image
 from ..backend.boxes import merge_nms_box_with_class
 from ..backend.boxes import denormalize_box
+from ..backend.boxes import denormalize_boxes
 from ..backend.boxes import make_box_square
+from ..backend.boxes import make_boxes_square
 from ..backend.boxes import filter_boxes
 from ..backend.boxes import scale_box
 
@@ -23,6 +30,9 @@ class SquareBoxes2D(Processor):
         super(SquareBoxes2D, self).__init__()
 
     def call(self, boxes2D):
+        if isinstance(boxes2D, Boxes2D):
+            boxes2D.coordinates = make_boxes_square(boxes2D.coordinates)
+            return boxes2D
         for box2D in boxes2D:
             box2D.coordinates = make_box_square(box2D.coordinates)
         return boxes2D
@@ -40,6 +50,9 @@ class DenormalizeBoxes2D(Processor):
 
     def call(self, image, boxes2D):
         shape = image.shape[:2]
+        if isinstance(boxes2D, Boxes2D):
+            boxes2D.coordinates = denormalize_boxes(boxes2D.coordinates, shape)
+            return boxes2D
         for box2D in boxes2D:
             box2D.coordinates = denormalize_box(box2D.coordinates, shape)
         return boxes2D
@@ -52,6 +65,9 @@ class RoundBoxes2D(Processor):
         super(RoundBoxes2D, self).__init__()
 
     def call(self, boxes2D):
+        if isinstance(boxes2D, Boxes2D):
+            boxes2D.coordinates = boxes2D.coordinates.astype(int)
+            return boxes2D
         for box2D in boxes2D:
             box2D.coordinates = [int(x) for x in box2D.coordinates]
         return boxes2D
@@ -68,6 +84,8 @@ class FilterClassBoxes2D(Processor):
         super(FilterClassBoxes2D, self).__init__()
 
     def call(self, boxes2D):
+        if isinstance(boxes2D, Boxes2D):
+            return boxes2D[boxes2D.select_classes(self.valid_class_names)]
         filtered_boxes2D = []
         for box2D in boxes2D:
             if box2D.class_name in self.valid_class_names:
@@ -85,9 +103,12 @@ class CropBoxes2D(Processor):
         super(CropBoxes2D, self).__init__()
 
     def call(self, image, boxes2D):
+        if isinstance(boxes2D, Boxes2D):
+            boxes = boxes2D.coordinates.tolist()
+        else:
+            boxes = [box2D.coordinates for box2D in boxes2D]
         image_crops = []
-        for box2D in boxes2D:
-            x_min, y_min, x_max, y_max = box2D.coordinates
+        for x_min, y_min, x_max, y_max in boxes:
             image_crops.append(image[y_min:y_max, x_min:x_max])
         return image_crops
 
@@ -98,7 +119,10 @@ class ClipBoxes2D(Processor):
         super(ClipBoxes2D, self).__init__()
 
     def call(self, image, boxes2D):
-        image_height, image_width = image.shape[:2]
+        if isinstance(boxes2D, Boxes2D):
+            boxes2D.coordinates = clip_boxes(
+                boxes2D.coordinates, image.shape[:2])
+            return boxes2D
         for box2D in boxes2D:
             box2D.coordinates = clip(box2D.coordinates, image.shape[:2])
         return boxes2D
@@ -115,6 +139,10 @@ class OffsetBoxes2D(Processor):
         self.offsets = offsets
 
     def call(self, boxes2D):
+        if isinstance(boxes2D, Boxes2D):
+            boxes2D.coordinates = offset_boxes(
+                boxes2D.coordinates, self.offsets)
+            return boxes2D
         for box2D in boxes2D:
             box2D.coordinates = offset(box2D.coordinates, self.offsets)
         return boxes2D
@@ -130,6 +158,8 @@ class ToBoxes2D(Processor):
         default_score: Float, score to set.
         default_class: Str, class to set.
         box_method: Int, method to convert boxes to ``Boxes2D``.
+        array_backed: Bool. If ``True`` boxes are returned as a single
+            ``Boxes2D`` message instead of a list of ``Box2D`` messages.
 
     # Properties
         one_hot_encoded: Bool.
@@ -140,14 +170,16 @@ class ToBoxes2D(Processor):
     """
     def __init__(
             self, class_names=None, one_hot_encoded=False,
-            default_score=1.0, default_class=None, box_method=0):
+            default_score=1.0, default_class=None, box_method=0,
+            array_backed=False):
         if class_names is not None:
             arg_to_class = dict(zip(range(len(class_names)), class_names))
         self.one_hot_encoded = one_hot_encoded
         method_to_processor = {
-            0: BoxesWithOneHotVectorsToBoxes2D(arg_to_class),
-            1: BoxesToBoxes2D(default_score, default_class),
-            2: BoxesWithClassArgToBoxes2D(arg_to_class, default_score)}
+            0: BoxesWithOneHotVectorsToBoxes2D(arg_to_class, array_backed),
+            1: BoxesToBoxes2D(default_score, default_class, array_backed),
+            2: BoxesWithClassArgToBoxes2D(
+                arg_to_class, default_score, array_backed)}
         self.box_processor = method_to_processor[box_method]
         super(ToBoxes2D, self).__init__()
 
@@ -162,6 +194,7 @@ class BoxesToBoxes2D(Processor):
     # Arguments
         default_score: Float, score to set.
         default_class: Str, class to set.
+        array_backed: Bool. If ``True`` a ``Boxes2D`` message is returned.
 
     # Properties
         default_score: Float.
@@ -170,12 +203,18 @@ class BoxesToBoxes2D(Processor):
     # Methods
         call()
     """
-    def __init__(self, default_score=1.0, default_class=None):
+    def __init__(self, default_score=1.0, default_class=None,
+                 array_backed=False):
         self.default_score = default_score
         self.default_class = default_class
+        self.array_backed = array_backed
         super(BoxesToBoxes2D, self).__init__()
 
     def call(self, box_data):
+        if self.array_backed:
+            box_data = np.asarray(box_data)
+            return Boxes2D(box_data[:, :4], self.default_score, 0,
+                           [self.default_class])
         boxes2D = []
         for box in box_data:
             boxes2D.append(
@@ -189,6 +228,7 @@ class BoxesWithOneHotVectorsToBoxes2D(Processor):
 
     # Arguments
         arg_to_class: List, of classes.
+        array_backed: Bool. If ``True`` a ``Boxes2D`` message is returned.
 
     # Properties
         arg_to_class: List.
@@ -196,11 +236,20 @@ class BoxesWithOneHotVectorsToBoxes2D(Processor):
     # Methods
         call()
     """
-    def __init__(self, arg_to_class):
+    def __init__(self, arg_to_class, array_backed=False):
         self.arg_to_class = arg_to_class
+        self.array_backed = array_backed
         super(BoxesWithOneHotVectorsToBoxes2D, self).__init__()
 
     def call(self, box_data):
+        if self.array_backed:
+            box_data = np.asarray(box_data)
+            class_scores = box_data[:, 4:]
+            class_args = np.argmax(class_scores, axis=1)
+            scores = class_scores[np.arange(len(box_data)), class_args]
+            class_names = [self.arg_to_class[class_arg] for class_arg in
+                           range(len(self.arg_to_class))]
+            return Boxes2D(box_data[:, :4], scores, class_args, class_names)
         boxes2D = []
         for box in box_data:
             class_scores = box[4:]
@@ -218,6 +267,7 @@ class BoxesWithClassArgToBoxes2D(Processor):
     # Arguments
         default_score: Float, score to set.
         arg_to_class: List, of classes.
+        array_backed: Bool. If ``True`` a ``Boxes2D`` message is returned.
 
     # Properties
         default_score: Float.
@@ -226,12 +276,19 @@ class BoxesWithClassArgToBoxes2D(Processor):
     # Methods
         call()
     """
-    def __init__(self, arg_to_class, default_score=1.0):
+    def __init__(self, arg_to_class, default_score=1.0, array_backed=False):
         self.default_score = default_score
         self.arg_to_class = arg_to_class
+        self.array_backed = array_backed
         super(BoxesWithClassArgToBoxes2D, self).__init__()
 
     def call(self, box_data):
+        if self.array_backed:
+            box_data = np.asarray(box_data)
+            class_names = [self.arg_to_class[class_arg] for class_arg in
+                           range(len(self.arg_to_class))]
+            return Boxes2D(box_data[:, :4], self.default_score,
+                           box_data[:, -1].astype(int), class_names)
         boxes2D = []
         for box in box_data:
             class_name = self.arg_to_class[box[-1]]
@@ -275,6 +332,27 @@ class MatchBoxes(Processor):
         return boxes
 
 
+class MatchBoxesBatch(Processor):
+    """Match prior boxes with the ground truth boxes of a whole batch.
+
+    # Arguments
+        prior_boxes: Numpy array of shape (num_boxes, 4).
+        iou: Float in [0, 1]. Intersection over union in which prior boxes
+            will be considered positive. A positive box is box with a class
+            different than `background`.
+        dtype: Numpy dtype of the matched boxes.
+    """
+    def __init__(self, prior_boxes, iou=.5, dtype=np.float32):
+        self.prior_boxes = prior_boxes
+        self.iou = iou
+        self.dtype = dtype
+        super(MatchBoxesBatch, self).__init__()
+
+    def call(self, boxes):
+        boxes = match_batch(boxes, self.prior_boxes, self.iou, self.dtype)
+        return boxes
+
+
 class EncodeBoxes(Processor):
     """Encodes bounding boxes.
 
@@ -315,18 +393,48 @@ class NonMaximumSuppressionPerClass(Processor):
     # Arguments
         nms_thresh: Float between [0, 1].
         epsilon: Float between [0, 1].
+        top_k: Int, maximum number of boxes per class.
+        batched: Bool. If ``True`` all classes are suppressed at once
+            with ``batched_nms_per_class``, otherwise classes are
+            suppressed one after another with ``nms_per_class``.
+            Both return the same output for float32 and float64 boxes.
     """
-    def __init__(self, nms_thresh=.45, epsilon=0.01):
+    def __init__(self, nms_thresh=.45, epsilon=0.01, top_k=200, batched=True):
         self.nms_thresh = nms_thresh
         self.epsilon = epsilon
+        self.top_k = top_k
+        self.batched = batched
+        if batched:
+            self._nms_per_class = batched_nms_per_class
+        else:
+            self._nms_per_class = nms_per_class
         super(NonMaximumSuppressionPerClass, self).__init__()
 
     def call(self, box_data):
-        box_data, class_labels = nms_per_class(
-            box_data, self.nms_thresh, self.epsilon)
+        box_data, class_labels = self._nms_per_class(
+            box_data, self.nms_thresh, self.epsilon, self.top_k)
         return box_data, class_labels
 
 
+class NonMaximumSuppressionPerImage(Processor):
+    """Applies non maximum suppression per class to a batch of images.
+
+    # Arguments
+        nms_thresh: Float between [0, 1].
+        epsilon: Float between [0, 1].
+        top_k: Int, maximum number of boxes per class.
+    """
+    def __init__(self, nms_thresh=.45, epsilon=0.01, top_k=200):
+        self.nms_thresh = nms_thresh
+        self.epsilon = epsilon
+        self.top_k = top_k
+        super(NonMaximumSuppressionPerImage, self).__init__()
+
+    def call(self, box_data):
+        return batched_nms_per_image(
+            box_data, self.nms_thresh, self.epsilon, self.top_k)
+
+
 class MergeNMSBoxWithClass(Processor):
     """Merges box coordinates with their corresponding class
     defined by `class_labels` which is decided by best box geometry
@@ -396,7 +504,7 @@ class RemoveClass(Processor):
 
     def call(self, box_data):
         if not self.renormalize and self.class_arg is not None:
-            box_data = np.delete(box_data, 4 + self.class_arg, axis=1)
+            box_data = np.delete(box_data, 4 + self.class_arg, axis=-1)
         elif self.renormalize:
             raise NotImplementedError
         return box_data
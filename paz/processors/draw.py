@@ -1,6 +1,6 @@
 import numpy as np
 
-from ..abstract import Processor
+from ..abstract import Processor, Boxes2D
 from ..backend.image import lincolor
 from ..backend.image import draw_rectangle
 from ..backend.image import put_text
@@ -56,14 +56,18 @@ class DrawBoxes2D(Processor):
         super(DrawBoxes2D, self).__init__()
 
     def call(self, image, boxes2D):
-        for box2D in boxes2D:
-            x_min, y_min, x_max, y_max = box2D.coordinates
-            class_name = box2D.class_name
+        if isinstance(boxes2D, Boxes2D):
+            boxes = zip(boxes2D.coordinates.tolist(), boxes2D.scores.tolist(),
+                        boxes2D.get_class_names())
+        else:
+            boxes = ((box2D.coordinates, box2D.score, box2D.class_name)
+                     for box2D in boxes2D)
+        for (x_min, y_min, x_max, y_max), score, class_name in boxes:
             color = self.class_to_color[class_name]
             if self.weighted:
-                color = [int(channel * box2D.score) for channel in color]
+                color = [int(channel * score) for channel in color]
             if self.with_score:
-                text = '{:0.2f}, {}'.format(box2D.score, class_name)
+                text = '{:0.2f}, {}'.format(score, class_name)
             if not self.with_score:
                 text = '{}'.format(class_name)
             put_text(image, text, (x_min, y_min - 10), self.scale, color, 1)
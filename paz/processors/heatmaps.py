@@ -6,6 +6,7 @@ from paz import processors as pr
 
 from ..backend.keypoints import transform_keypoint
 from ..backend.image import resize_image
+from ..backend.image import resize_image_channels
 from ..backend.keypoints import add_offset_to_point
 from ..backend.heatmaps import get_keypoints_locations, get_keypoints_heatmap
 from ..backend.heatmaps import get_top_k_keypoints_numpy
@@ -38,29 +39,40 @@ class ScaleOutput(Processor):
     # Arguments
         scaling_factor: Int.
         full_scaling: Boolean. If all the array of array are to be scaled.
+        channels_last: Boolean. If ``True`` outputs have shape
+            (batch_size, H, W, num_keypoints) i.e. the layout of the model
+            outputs, otherwise (batch_size, num_keypoints, H, W).
         Output: List of numpy array
 
     """
-    def __init__(self, scale_factor, full_scaling=False):
+    def __init__(self, scale_factor, full_scaling=False, channels_last=False):
         super(ScaleOutput, self).__init__()
         self.scale_factor = int(scale_factor)
         self.full_scaling = full_scaling
+        self.channels_last = channels_last
 
     def _resize_output(self, output, size):
-        resized_output = []
-        for heatmap_arg, heatmap in enumerate(output):
-            resized_heatmaps = []
-            for keypoint_arg in range(len(heatmap)):
-                resized = resize_image(output[heatmap_arg][keypoint_arg], size)
-                resized_heatmaps.append(resized)
-            resized_heatmaps = np.stack(resized_heatmaps, axis=0)
-        resized_output.append(resized_heatmaps)
-        resized_output = np.stack(resized_output, axis=0)
+        output = np.asarray(output)
+        if self.channels_last:
+            resized_output = [resize_image_channels(heatmaps, size)
+                              for heatmaps in output]
+            if len(resized_output) == 1:
+                return resized_output[0][np.newaxis]
+            return np.stack(resized_output, axis=0)
+        W, H = size
+        resized_output = np.empty(output.shape[:2] + (H, W), output.dtype)
+        for sample_arg, heatmaps in enumerate(output):
+            for keypoint_arg, heatmap in enumerate(heatmaps):
+                resized_output[sample_arg, keypoint_arg] = resize_image(
+                    heatmap, size)
         return resized_output
 
     def call(self, outputs):
         for arg in range(len(outputs)):
-            H, W = outputs[arg].shape[-2:]
+            if self.channels_last:
+                H, W = outputs[arg].shape[1:3]
+            else:
+                H, W = outputs[arg].shape[-2:]
             H, W = self.scale_factor * H, self.scale_factor * W
             if self.full_scaling:
                 outputs[arg] = self._resize_output(outputs[arg], (W, H))
@@ -75,31 +87,34 @@ class GetHeatmaps(Processor):
     # Arguments
         flipped_keypoint_order: List of length 17 (number of keypoints).
             Flipped list of keypoint order.
+        channels_last: Boolean. If ``True`` outputs have shape
+            (1, H, W, num_channels) instead of (1, num_channels, H, W).
         outputs: List of numpy arrays. Output of HigherHRNet model
         with_flip: Boolean. indicates whether to flip the output
 
     # Returns
         heatmaps: Numpy array of shape (1, num_keypoints, H, W)
     """
-    def __init__(self, flipped_keypoint_order):
+    def __init__(self, flipped_keypoint_order, channels_last=False):
         super(GetHeatmaps, self).__init__()
         self.indices = flipped_keypoint_order
         self.num_keypoints = len(flipped_keypoint_order)
+        self.axis, self.flip_axis = (3, 2) if channels_last else (1, 3)
 
     def call(self, outputs, with_flip):
         num_heatmaps = 0
         heatmap_sum = 0
         if with_flip:
             for output in outputs:
-                output = np.flip(output, [3])
+                output = np.flip(output, [self.flip_axis])
                 heatmap_sum = heatmap_sum + get_keypoints_heatmap(
-                    output, self.num_keypoints, indices=self.indices)
+                    output, self.num_keypoints, self.indices, self.axis)
                 num_heatmaps = num_heatmaps + 1
 
         if not with_flip:
             for output in outputs:
                 heatmap_sum = heatmap_sum + get_keypoints_heatmap(
-                    output, self.num_keypoints)
+                    output, self.num_keypoints, axis=self.axis)
                 num_heatmaps = num_heatmaps + 1
 
         heatmaps = heatmap_sum / num_heatmaps
@@ -111,42 +126,55 @@ class GetTags(Processor):
     # Arguments
         flipped_keypoint_order: List of length 17 (number of keypoints).
             Flipped list of keypoint order.
+        channels_last: Boolean. If ``True`` outputs have shape
+            (1, H, W, num_channels) instead of (1, num_channels, H, W).
         outputs: List of numpy arrays. Output of HigherHRNet model
         with_flip: Boolean. indicates whether to flip the output
 
     # Returns
         Tags: Numpy array of shape (1, num_keypoints, H, W)
     """
-    def __init__(self, flipped_keypoint_order):
+    def __init__(self, flipped_keypoint_order, channels_last=False):
         super(GetTags, self).__init__()
         self.indices = flipped_keypoint_order
         self.num_keypoints = len(flipped_keypoint_order)
+        self.axis, self.flip_axis = (3, 2) if channels_last else (1, 3)
 
     def call(self, outputs, with_flip):
         output = outputs[0]
         if not with_flip:
-            tags = get_tags_heatmap(output, self.num_keypoints)
+            tags = get_tags_heatmap(
+                output, self.num_keypoints, axis=self.axis)
 
         if with_flip:
-            output = np.flip(output, [3])
-            tags = get_tags_heatmap(output, self.num_keypoints, self.indices)
+            output = np.flip(output, [self.flip_axis])
+            tags = get_tags_heatmap(
+                output, self.num_keypoints, self.indices, self.axis)
         return tags
 
 
 class RemoveLastElement(Processor):
     """Remove last element of array
     # Arguments
+        channels_last: Boolean. If ``True`` the last element of the last
+            axis is removed instead of the last element of the second axis.
         x: array or list of arrays
 
     """
-    def __init__(self):
+    def __init__(self, channels_last=False):
         super(RemoveLastElement, self).__init__()
+        self.channels_last = channels_last
+
+    def _remove_last_element(self, x):
+        if self.channels_last:
+            return x[..., :-1]
+        return x[:, :-1]
 
     def call(self, x):
         if all(isinstance(each, list) for each in x):
-            return [each[:, :-1] for each in x]
+            return [self._remove_last_element(each) for each in x]
         else:
-            return x[:, :-1]
+            return self._remove_last_element(x)
 
 
 class AggregateResults(Processor):
@@ -206,14 +234,11 @@ class TopKDetections(Processor):
     def _max_pooing_2d(self, heatmaps, pool_size, strides, padding,
                        use_numpy=False):
         if use_numpy:
-            heatmaps = np.squeeze(heatmaps)
-            heatmaps = np.transpose(heatmaps, [2, 0, 1])
-            max_heatmaps = np.zeros_like(heatmaps)
-            for arg, heatmap in enumerate(heatmaps):
-                max_heatmaps[arg] = max_pooling_2d(heatmap, pool_size,
-                                                   strides, padding)
-            max_heatmaps = np.transpose(max_heatmaps, [1, 2, 0])
-            max_pooled_values = np.expand_dims(max_heatmaps, 0)
+            max_pooled_values = []
+            for heatmap in heatmaps:
+                max_pooled_values.append(max_pooling_2d(
+                    heatmap, pool_size, strides, padding))
+            max_pooled_values = np.array(max_pooled_values)
         else:
             max_pooled_values = tf.keras.layers.MaxPooling2D(
                 pool_size, strides, padding)(heatmaps)
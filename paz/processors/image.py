@@ -10,6 +10,7 @@ from ..backend.image import random_contrast
 from ..backend.image import random_hue
 from ..backend.image import resize_image
 from ..backend.image import scale_resize
+from ..backend.image import standardize_image
 from ..backend.image import random_image_blur
 from ..backend.image import random_flip_left_right
 from ..backend.image import convert_color_space
@@ -25,7 +26,6 @@ from ..backend.image import image_to_normalized_device_coordinates
 from ..backend.image import replace_lower_than_threshold
 from ..backend.image import flip_left_right
 from ..backend.image import BILINEAR
-from ..backend.image.tensorflow_image import imagenet_preprocess_input
 
 
 B_IMAGENET_MEAN, G_IMAGENET_MEAN, R_IMAGENET_MEAN = 104, 117, 123
@@ -102,13 +102,17 @@ class LoadImage(Processor):
 
     # Arguments
         num_channels: Integer, valid integers are: 1, 3 and 4.
+        source: ``ImageSource`` e.g. ``LRUImageCache``, ``ShardedImageStore``
+            or ``ReducedImageSource``. If ``None`` images are decoded from
+            disk.
     """
-    def __init__(self, num_channels=3):
+    def __init__(self, num_channels=3, source=None):
         self.num_channels = num_channels
+        self.source = load_image if source is None else source
         super(LoadImage, self).__init__()
 
     def call(self, image):
-        return load_image(image, self.num_channels)
+        return self.source(image, self.num_channels)
 
 
 class RandomSaturation(Processor):
@@ -500,6 +504,8 @@ class ImagenetPreprocessInput(Processor):
         super(ImagenetPreprocessInput, self).__init__()
 
     def call(self, image):
+        # imported here since it is the only processor requiring TensorFlow
+        from ..backend.image.tensorflow_image import imagenet_preprocess_input
         return imagenet_preprocess_input(image)
 
 
@@ -537,11 +543,63 @@ class DivideStandardDeviationImage(Processor):
         return image / self.standard_deviation
 
 
+class StandardizeImage(Processor):
+    """Subtracts the mean and divides by the standard deviation of an
+    image in a single pass computed directly in ``dtype``.
+
+    # Arguments
+        mean: List or array with the mean of each channel.
+        standard_deviation: List or array with the standard deviation of
+            each channel. If ``None`` the image is only centered.
+        dtype: Data type of the standardized image.
+        expand_dims: Boolean. If ``True`` a leading batch axis is added.
+        reuse_buffer: Boolean. If ``True`` the image is written into the
+            same preallocated array in every call. The previous output is
+            then overwritten by the next call.
+    """
+    def __init__(self, mean, standard_deviation=None, dtype=np.float32,
+                 expand_dims=False, reuse_buffer=False):
+        self.mean = mean
+        self.standard_deviation = standard_deviation
+        self.dtype = dtype
+        self.expand_dims = expand_dims
+        self.reuse_buffer = reuse_buffer
+        self._buffer = None
+        super(StandardizeImage, self).__init__()
+
+    def call(self, image):
+        shape = image.shape
+        if self.expand_dims:
+            shape = (1, ) + shape
+        if self.reuse_buffer:
+            self._buffer = _get_buffer(self._buffer, shape, self.dtype)
+            output = self._buffer
+        else:
+            output = np.empty(shape, dtype=self.dtype)
+        standardize_image(image, self.mean, self.standard_deviation,
+                          self.dtype, output.reshape(image.shape))
+        return output
+
+
+def _get_buffer(buffer, shape, dtype):
+    """Returns ``buffer`` if it has the given shape and dtype, otherwise
+    a new uninitialized array.
+    """
+    if (buffer is None or buffer.shape != shape or
+            buffer.dtype != np.dtype(dtype)):
+        buffer = np.empty(shape, dtype=dtype)
+    return buffer
+
+
 class ScaledResize(Processor):
     """Resizes image by returning the scales to original image.
 
     # Arguments
         image_size: Int, desired size of the model input.
+        dtype: Data type of the resized image.
+        reuse_buffer: Boolean. If ``True`` the image is resized into the
+            same preallocated array in every call. The previous output is
+            then overwritten by the next call.
 
     # Properties
         image_size: Int.
@@ -549,8 +607,11 @@ class ScaledResize(Processor):
     # Methods
         call()
     """
-    def __init__(self, image_size):
+    def __init__(self, image_size, dtype=np.float64, reuse_buffer=False):
         self.image_size = image_size
+        self.dtype = dtype
+        self.reuse_buffer = reuse_buffer
+        self._buffer = None
         super(ScaledResize, self).__init__()
 
     def call(self, image):
@@ -558,5 +619,11 @@ class ScaledResize(Processor):
         # Arguments
             image: Array, raw input image.
         """
-        output_image, image_scale = scale_resize(image, self.image_size)
+        output_image = None
+        if self.reuse_buffer:
+            shape = (1, self.image_size, self.image_size, image.shape[2])
+            self._buffer = _get_buffer(self._buffer, shape, self.dtype)
+            output_image = self._buffer
+        output_image, image_scale = scale_resize(
+            image, self.image_size, self.dtype, output_image)
         return output_image, image_scale
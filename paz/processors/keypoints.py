@@ -146,6 +146,21 @@ class ChangeKeypointsCoordinateSystem(Processor):
         return keypoints
 
 
+class ChangeKeypointsCoordinateSystemBatch(Processor):
+    """Changes the 2D coordinate system of the keypoints of all ``boxes2D``
+        at once, locating the new origin at the openCV image origin (top-left).
+        ``keypoints`` is an array of shape ``(num_boxes, num_keypoints, 2)``.
+    """
+    def __init__(self):
+        super(ChangeKeypointsCoordinateSystemBatch, self).__init__()
+
+    def call(self, keypoints, boxes2D):
+        origins = np.array([box2D.coordinates[:2] for box2D in boxes2D])
+        keypoints[:, :, 0] = keypoints[:, :, 0] + origins[:, 0:1]
+        keypoints[:, :, 1] = keypoints[:, :, 1] + origins[:, 1:2]
+        return keypoints
+
+
 class TranslateKeypoints(Processor):
     """Applies a translation to keypoints.
     The translation is a list of length two indicating the x, y values.
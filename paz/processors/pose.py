@@ -4,6 +4,8 @@ from ..abstract import Processor, Pose6D
 from ..backend.keypoints import solve_PNP
 from ..backend.keypoints import LEVENBERG_MARQUARDT
 from ..backend.keypoints import solve_PnP_RANSAC
+from ..backend.keypoints import solve_PnP_RANSAC_batch
+from ..backend.keypoints import subsample_correspondences
 
 
 class SolvePNP(Processor):
@@ -93,6 +95,68 @@ class SolveChangingObjectPnPRANSAC(Processor):
         return success, rotation_vector, translation
 
 
+class SolveChangingObjectPnPRANSACBatch(Processor):
+    """Solves ``SolveChangingObjectPnPRANSAC`` for all objects of an image
+        concurrently.
+
+    # Arguments
+        camera_intrinsics: Array of shape (3, 3). Diagonal elements represent
+            focal lenghts and last column the image center translation.
+        inlier_thresh: Number of inliers for RANSAC method.
+        num_iterations: Maximum number of iterations.
+        num_workers: Int. Number of threads solving objects. If ``0``
+            objects are solved sequentially.
+
+    # Returns
+        List with a tuple of success, rotation vector (3) and translation
+            vector (3) for each object.
+    """
+    def __init__(self, camera_intrinsics, inlier_thresh=5, num_iterations=100,
+                 num_workers=4):
+        super(SolveChangingObjectPnPRANSACBatch, self).__init__()
+        self.camera_intrinsics = camera_intrinsics
+        self.inlier_thresh = inlier_thresh
+        self.num_iterations = num_iterations
+        self.num_workers = num_workers
+        self.MIN_REQUIRED_POINTS = 4
+
+    def call(self, objects_points3D, images_points2D):
+        solutions = solve_PnP_RANSAC_batch(
+            objects_points3D, images_points2D, self.camera_intrinsics,
+            self.inlier_thresh, self.num_iterations, self.num_workers)
+        outputs = []
+        for success, rotation_vector, translation in solutions:
+            if rotation_vector is not None:
+                rotation_vector = np.squeeze(rotation_vector)
+            outputs.append((success, rotation_vector, translation))
+        return outputs
+
+
+class SubsampleCorrespondences(Processor):
+    """Selects at most ``max_points`` correspondences between points 3D and
+        points 2D.
+
+    # Arguments
+        max_points: Int or ``None``. Maximum number of correspondences.
+            If ``None`` all correspondences are kept.
+        method: String. ``stratified``, ``uniform`` or ``confidence``.
+            See ``paz.backend.keypoints.subsample_correspondences``.
+
+    # Returns
+        Points 3D and points 2D.
+    """
+    def __init__(self, max_points=1000, method='stratified'):
+        super(SubsampleCorrespondences, self).__init__()
+        if method not in ['stratified', 'uniform', 'confidence']:
+            raise ValueError('Invalid subsampling method', method)
+        self.max_points = max_points
+        self.method = method
+
+    def call(self, points3D, points2D, weights=None):
+        return subsample_correspondences(
+            points3D, points2D, self.max_points, self.method, weights)
+
+
 class Translation3DFromBoxWidth(Processor):
     """Computes 3D translation from box width and real width ratio.
 
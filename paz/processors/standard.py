@@ -286,6 +286,7 @@ class SelectElement(Processor):
 
 class BoxClassToOneHotVector(Processor):
     """Transform box data with class index to a one-hot encoded vector.
+    Boxes can have shape `(num_boxes, 5)` or `(batch_size, num_boxes, 5)`.
 
     # Arguments
         num_classes: Integer. Total number of classes.
@@ -295,10 +296,11 @@ class BoxClassToOneHotVector(Processor):
         super(BoxClassToOneHotVector, self).__init__()
 
     def call(self, boxes):
-        class_indices = boxes[:, 4].astype('int')
+        class_indices = boxes[..., 4].astype('int')
         one_hot_vectors = to_one_hot(class_indices, self.num_classes)
-        one_hot_vectors = one_hot_vectors.reshape(-1, self.num_classes)
-        boxes = np.hstack([boxes[:, :4], one_hot_vectors.astype('float')])
+        one_hot_vectors = one_hot_vectors.astype(
+            np.result_type(boxes.dtype, np.float32))
+        boxes = np.concatenate([boxes[..., :4], one_hot_vectors], axis=-1)
         return boxes
 
 
@@ -369,7 +371,7 @@ class StochasticProcessor(Processor):
 
     def __call__(self, X):
         if self.probability >= np.random.rand():
-            return self.call(X)
+            return super(StochasticProcessor, self).__call__(X)
         return X
 
 
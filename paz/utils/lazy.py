@@ -0,0 +1,63 @@
+import importlib
+import importlib.util
+import sys
+
+
+def lazy_attributes(module_name, module_to_attributes):
+    """Builds the module level ``__getattr__`` and ``__dir__`` functions
+    (PEP 562) of a module whose attributes are imported from their
+    submodules only when they are accessed for the first time. This keeps
+    heavy dependencies such as TensorFlow out of ``import`` statements that
+    do not need them.
+
+    # Arguments
+        module_name: String. Name of the module with the lazy attributes
+            i.e. its ``__name__``.
+        module_to_attributes: Dictionary with (relative) module names as
+            keys and lists of attribute names defined in them as values.
+
+    # Returns
+        Tuple with the functions ``__getattr__`` and ``__dir__``. The
+            ``__getattr__`` function also returns the ``__all__`` list of
+            the module, such that star imports include lazy attributes.
+
+    # Example
+    ```python
+    __getattr__, __dir__ = lazy_attributes(__name__, {
+        '.heatmaps': ['GetHeatmaps', 'GetTags']})
+    ```
+    """
+    attribute_to_module = {}
+    for submodule_name, attributes in module_to_attributes.items():
+        for attribute in attributes:
+            attribute_to_module[attribute] = submodule_name
+
+    def __getattr__(name):
+        module = sys.modules[module_name]
+        if name == '__all__':
+            # star imports include the attributes that are not loaded yet
+            return [attribute for attribute in __dir__()
+                    if not attribute.startswith('_') and
+                    getattr(module, attribute, None) is not lazy_attributes]
+        if name not in attribute_to_module:
+            # submodules were attributes after the eager imports as well.
+            # Dunder names e.g. ``__path__`` are never submodules and
+            # ``hasattr`` would call this function again for them
+            submodule_name = module_name + '.' + name
+            if ((not name.startswith('__')) and ('__path__' in vars(module))
+                    and importlib.util.find_spec(submodule_name) is not None):
+                return importlib.import_module(submodule_name)
+            raise AttributeError(
+                'module %r has no attribute %r' % (module_name, name))
+        submodule = importlib.import_module(
+            attribute_to_module[name], module.__package__)
+        value = getattr(submodule, name)
+        # later accesses are normal attribute lookups
+        setattr(module, name, value)
+        return value
+
+    def __dir__():
+        module = sys.modules[module_name]
+        return sorted(set(vars(module)) | set(attribute_to_module))
+
+    return __getattr__, __dir__
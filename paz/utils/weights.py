@@ -0,0 +1,397 @@
+import argparse
+import hashlib
+import inspect
+import json
+import os
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+
+MANIFEST_NAME = 'manifest.json'
+
+
+def compute_file_hash(filepath, chunk_size=2 ** 20):
+    """Computes the SHA-256 hash of a file.
+
+    # Arguments
+        filepath: String. Path to the file.
+        chunk_size: Int. Number of bytes read at once.
+
+    # Returns
+        String with the hexadecimal hash.
+    """
+    file_hash = hashlib.sha256()
+    with open(filepath, 'rb') as filedata:
+        for chunk in iter(lambda: filedata.read(chunk_size), b''):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
+
+
+def get_keras_cache_directory():
+    """Returns the directory in which keras ``get_file`` caches files."""
+    return os.path.join(os.path.expanduser('~'), '.keras')
+
+
+class WeightsStore(object):
+    """Resolves the local path of weight files. Files are searched in a
+    local directory and the keras cache before being downloaded from a
+    mirror or their original URL. Files listed in the manifest of the
+    directory are checked against their SHA-256 hash.
+
+    # Arguments
+        directory: String or ``None``. Directory of the store. Downloaded
+            files are saved in it and its ``manifest.json`` lists the
+            hash, size and URL of each file.
+        mirror_URL: String or ``None``. If given files are downloaded from
+            ``mirror_URL/filename`` instead of their original URL.
+        offline: Boolean. If ``True`` missing files raise an error instead
+            of being downloaded.
+        verify: Boolean. If ``True`` files with a hash in the manifest are
+            verified the first time they are resolved in a process.
+        memory_map: Boolean. If ``True`` ``load_weights`` stores the arrays
+            of loaded weights as ``.npy`` files and memory-maps them in
+            later loads.
+        collect: Boolean. If ``True`` files found outside of ``directory``
+            e.g. in the keras cache are copied into it.
+
+    # Methods
+        resolve()
+        prefetch()
+        verify_file()
+    """
+    def __init__(self, directory=None, mirror_URL=None, offline=False,
+                 verify=True, memory_map=False, collect=False):
+        self.directory = directory
+        self.mirror_URL = mirror_URL
+        self.offline = offline
+        self.verify = verify
+        self.memory_map = memory_map
+        self.collect = collect
+        self._verified = {}
+        self._lock = threading.Lock()
+        self.manifest = self._load_manifest()
+
+    @property
+    def manifest_path(self):
+        if self.directory is None:
+            return None
+        return os.path.join(self.directory, MANIFEST_NAME)
+
+    def _load_manifest(self):
+        if self.manifest_path is None:
+            return {}
+        if not os.path.isfile(self.manifest_path):
+            return {}
+        with open(self.manifest_path, 'r') as filedata:
+            return json.load(filedata)
+
+    def _write_manifest(self):
+        os.makedirs(self.directory, exist_ok=True)
+        temporal_path = self.manifest_path + '.tmp'
+        with open(temporal_path, 'w') as filedata:
+            json.dump(self.manifest, filedata, indent=4, sort_keys=True)
+        os.replace(temporal_path, self.manifest_path)
+
+    def _find_local_file(self, filename, cache_subdir):
+        directories = [get_keras_cache_directory()]
+        if self.directory is not None:
+            directories = [self.directory] + directories
+        for directory in directories:
+            for filepath in [os.path.join(directory, cache_subdir, filename),
+                             os.path.join(directory, filename)]:
+                if os.path.isfile(filepath):
+                    return filepath
+        return None
+
+    def verify_file(self, filepath, filename=None):
+        """Checks the hash of a file listed in the manifest. Each file is
+        hashed once per process unless its size or time of modification
+        changes.
+
+        # Arguments
+            filepath: String. Path to the file.
+            filename: String. Name of the file in the manifest. By default
+                the base name of ``filepath``.
+
+        # Returns
+            Boolean. ``False`` if the file is not listed in the manifest.
+        """
+        if filename is None:
+            filename = os.path.basename(filepath)
+        if filename not in self.manifest:
+            return False
+        stat = os.stat(filepath)
+        file_state = (stat.st_size, stat.st_mtime_ns)
+        if self._verified.get(filepath) == file_state:
+            return True
+        expected_hash = self.manifest[filename]['sha256']
+        if compute_file_hash(filepath) != expected_hash:
+            raise ValueError('Hash of %s does not match the manifest %s' %
+                             (filepath, self.manifest_path))
+        self._verified[filepath] = file_state
+        return True
+
+    def _download(self, filename, URL, cache_subdir):
+        if self.offline:
+            raise FileNotFoundError(
+                'Weights %s are not in the store %s or in the keras cache '
+                'and downloading is disabled' % (filename, self.directory))
+        from tensorflow.keras.utils import get_file
+        if self.mirror_URL is not None:
+            URL = '/'.join([self.mirror_URL.rstrip('/'), filename])
+        cache_dir = self.directory
+        if cache_dir is not None:
+            cache_dir = os.path.abspath(cache_dir)
+        return get_file(filename, URL, cache_subdir=cache_subdir,
+                        cache_dir=cache_dir)
+
+    def _is_in_directory(self, filepath):
+        directory = os.path.abspath(self.directory)
+        return os.path.abspath(filepath).startswith(directory + os.sep)
+
+    def _add_to_store(self, filepath, filename, URL, cache_subdir):
+        if not self._is_in_directory(filepath):
+            store_path = os.path.join(self.directory, cache_subdir, filename)
+            os.makedirs(os.path.dirname(store_path), exist_ok=True)
+            shutil.copyfile(filepath, store_path)
+            filepath = store_path
+        with self._lock:
+            if filename not in self.manifest:
+                self.manifest[filename] = {
+                    'sha256': compute_file_hash(filepath),
+                    'size': os.path.getsize(filepath),
+                    'URL': URL, 'cache_subdir': cache_subdir}
+                self._write_manifest()
+        return filepath
+
+    def resolve(self, filename, URL, cache_subdir='paz/models'):
+        """Returns the local path of a weights file.
+
+        # Arguments
+            filename: String. Name of the weights file.
+            URL: String. Original URL of the weights file.
+            cache_subdir: String. Subdirectory in which the file is cached.
+
+        # Returns
+            String with the path to the file.
+        """
+        return self._resolve(filename, URL, cache_subdir, self.collect)
+
+    def _resolve(self, filename, URL, cache_subdir, collect):
+        filepath = self._find_local_file(filename, cache_subdir)
+        downloaded = filepath is None
+        if downloaded:
+            filepath = self._download(filename, URL, cache_subdir)
+        if (self.directory is not None) and (downloaded or collect):
+            filepath = self._add_to_store(
+                filepath, filename, URL, cache_subdir)
+        if self.verify:
+            self.verify_file(filepath, filename)
+        return filepath
+
+    def prefetch(self, files, num_workers=4):
+        """Downloads several weight files in parallel into the store.
+
+        # Arguments
+            files: List of tuples ``(filename, URL, cache_subdir)``.
+            num_workers: Int. Number of parallel downloads.
+
+        # Returns
+            List of local paths.
+        """
+        with ThreadPoolExecutor(max(1, num_workers)) as executor:
+            return list(executor.map(
+                lambda file: self._resolve(*file, collect=True), files))
+
+
+def _build_default_store():
+    directory = os.environ.get('PAZ_WEIGHTS_DIR')
+    mirror_URL = os.environ.get('PAZ_WEIGHTS_MIRROR')
+    offline = os.environ.get('PAZ_OFFLINE', '0') not in ['', '0']
+    memory_map = os.environ.get('PAZ_WEIGHTS_MMAP', '0') not in ['', '0']
+    return WeightsStore(directory, mirror_URL, offline, True, memory_map)
+
+
+_store = None
+
+
+def get_weights_store():
+    """Returns the weights store used by all paz models. By default it is
+    configured by the environment variables ``PAZ_WEIGHTS_DIR``,
+    ``PAZ_WEIGHTS_MIRROR``, ``PAZ_OFFLINE`` and ``PAZ_WEIGHTS_MMAP``.
+
+    # Returns
+        ``WeightsStore``.
+    """
+    global _store
+    if _store is None:
+        _store = _build_default_store()
+    return _store
+
+
+def set_weights_store(store):
+    """Sets the weights store used by all paz models.
+
+    # Arguments
+        store: ``WeightsStore`` or ``None`` to use the default store.
+    """
+    global _store
+    _store = store
+
+
+def get_weights_file(filename, URL, cache_subdir='paz/models'):
+    """Returns the local path of a weights file using the current store.
+    It replaces keras ``get_file`` for all weights of paz.
+
+    # Arguments
+        filename: String. Name of the weights file.
+        URL: String. Original URL of the weights file.
+        cache_subdir: String. Subdirectory in which the file is cached.
+
+    # Returns
+        String with the path to the file.
+    """
+    return get_weights_store().resolve(filename, URL, cache_subdir)
+
+
+def _get_arrays_directory(weights_path):
+    return os.path.splitext(weights_path)[0] + '_arrays'
+
+
+def _load_arrays(arrays_directory, weights_path, model):
+    index_path = os.path.join(arrays_directory, 'index.json')
+    if not os.path.isfile(index_path):
+        return None
+    with open(index_path, 'r') as filedata:
+        index = json.load(filedata)
+    stat = os.stat(weights_path)
+    if index['source'] != [stat.st_size, stat.st_mtime_ns]:
+        return None
+    shapes = [list(weight.shape) for weight in model.weights]
+    if index['shapes'] != shapes:
+        return None
+    return [np.load(os.path.join(arrays_directory, '%05d.npy' % arg),
+                    mmap_mode='r') for arg in range(len(shapes))]
+
+
+def _save_arrays(arrays_directory, weights_path, model):
+    os.makedirs(arrays_directory, exist_ok=True)
+    arrays = model.get_weights()
+    for arg, array in enumerate(arrays):
+        np.save(os.path.join(arrays_directory, '%05d.npy' % arg), array)
+    stat = os.stat(weights_path)
+    index = {'source': [stat.st_size, stat.st_mtime_ns],
+             'shapes': [list(array.shape) for array in arrays]}
+    with open(os.path.join(arrays_directory, 'index.json'), 'w') as filedata:
+        json.dump(index, filedata)
+
+
+def load_weights(model, weights_path, by_name=False):
+    """Loads the weights of a model. If the current store has
+    ``memory_map`` enabled the arrays of the weights are also saved as
+    ``.npy`` files, which are memory-mapped in later loads instead of
+    parsing the HDF5 file, which makes these loads faster.
+    ``model.set_weights`` copies the arrays, so every model still holds
+    its own weights in memory.
+
+    # Arguments
+        model: Keras model.
+        weights_path: String. Path to the weights file.
+        by_name: Boolean. Passed to ``model.load_weights``. Weights loaded
+            by name are never memory-mapped.
+    """
+    if not get_weights_store().memory_map or by_name:
+        model.load_weights(weights_path, by_name=by_name)
+        return
+    arrays_directory = _get_arrays_directory(weights_path)
+    arrays = _load_arrays(arrays_directory, weights_path, model)
+    if arrays is not None:
+        model.set_weights(arrays)
+        return
+    model.load_weights(weights_path)
+    try:
+        _save_arrays(arrays_directory, weights_path, model)
+    except OSError:
+        pass
+
+
+def _requires_camera(application):
+    """Checks if an application has a required positional argument, which
+    for ``paz.applications`` is the camera of pose estimation pipelines.
+
+    # Arguments
+        application: Class of ``paz.applications``.
+
+    # Returns
+        Boolean.
+    """
+    positional_kinds = [inspect.Parameter.POSITIONAL_ONLY,
+                        inspect.Parameter.POSITIONAL_OR_KEYWORD]
+    for parameter in inspect.signature(application).parameters.values():
+        if ((parameter.kind in positional_kinds) and
+                (parameter.default is inspect.Parameter.empty)):
+            return True
+    return False
+
+
+def prefetch_applications(application_names, store=None):
+    """Builds applications once such that all their weight files are
+    downloaded into the store and listed in its manifest.
+
+    # Arguments
+        application_names: List of strings with names of
+            ``paz.applications`` e.g. ``['SSD300VOC', 'PIX2YCBTools6D']``.
+        store: ``WeightsStore``. By default the current store.
+
+    # Returns
+        Dictionary with the manifest of the store.
+    """
+    from .. import applications
+    from ..backend.camera import Camera
+    previous_store = _store
+    if store is not None:
+        set_weights_store(store)
+    try:
+        for application_name in application_names:
+            application = getattr(applications, application_name)
+            if _requires_camera(application):
+                application(Camera())
+            else:
+                application()
+        return get_weights_store().manifest
+    finally:
+        set_weights_store(previous_store)
+
+
+def main(args=None):
+    description = 'Downloads the weights of paz applications into a store'
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument('command', choices=['prefetch', 'verify'])
+    parser.add_argument('applications', nargs='*',
+                        help='Names of paz.applications to prefetch')
+    parser.add_argument('-d', '--directory', required=True,
+                        help='Directory of the weights store')
+    parser.add_argument('-m', '--mirror_URL', default=None,
+                        help='URL of a mirror with all weight files')
+    args = parser.parse_args(args)
+    store = WeightsStore(args.directory, args.mirror_URL, collect=True)
+    if args.command == 'prefetch':
+        manifest = prefetch_applications(args.applications, store)
+        print('%d weight files in %s' % (len(manifest), store.manifest_path))
+    else:
+        for filename in sorted(store.manifest):
+            cache_subdir = store.manifest[filename].get(
+                'cache_subdir', 'paz/models')
+            filepath = store._find_local_file(filename, cache_subdir)
+            if filepath is None:
+                print('missing  %s' % filename)
+            else:
+                store.verify_file(filepath, filename)
+                print('verified %s' % filename)
+
+
+if __name__ == '__main__':
+    main()
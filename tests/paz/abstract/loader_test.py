@@ -0,0 +1,34 @@
+import os
+
+import pytest
+
+from paz.abstract import Loader
+from paz.abstract.loader import parse_files
+
+
+class FileLoader(Loader):
+    def __init__(self, num_workers=0):
+        super(FileLoader, self).__init__(None, 'test', [], 'Files',
+                                         num_workers)
+
+    def parse_name(self, filepath):
+        return os.path.basename(filepath)
+
+
+@pytest.mark.parametrize('num_workers', [0, 1, 3])
+def test_parse_files_order(num_workers):
+    filepaths = ['/data/%03d.json' % arg for arg in range(50)]
+    basenames = parse_files(os.path.basename, filepaths, num_workers)
+    assert basenames == ['%03d.json' % arg for arg in range(50)]
+
+
+def test_parse_files_empty():
+    assert parse_files(os.path.basename, [], 2) == []
+
+
+def test_loader_parse_files():
+    filepaths = ['/data/a.xml', '/data/b.xml', '/data/c.xml']
+    loader = FileLoader(num_workers=2)
+    assert loader.num_workers == 2
+    assert loader.parse_files(loader.parse_name, filepaths) == [
+        'a.xml', 'b.xml', 'c.xml']
@@ -1,5 +1,5 @@
 import numpy as np
-from paz.abstract.messages import Box2D, Pose6D
+from paz.abstract.messages import Box2D, Boxes2D, Pose6D
 import pytest
 
 
@@ -48,3 +48,46 @@ def test_Pose6D(quaternion, translation, rotation_vector, quaternion_result):
     pose6D = Pose6D(quaternion, translation)
     result = pose6D.from_rotation_vector(rotation_vector, translation)
     assert(result.quaternion.all() == quaternion_result.all())
+
+
+def test_Boxes2D():
+    coordinates = np.array([[0, 0, 10, 20], [5, 5, 15, 10], [1, 2, 3, 4]])
+    boxes2D = Boxes2D(coordinates, [0.9, 0.5, 0.1], [1, 0, 1], ['cat', 'dog'])
+    assert len(boxes2D) == 3
+    assert boxes2D.get_class_names() == ['dog', 'cat', 'dog']
+    assert np.array_equal(boxes2D.widths, [10, 10, 2])
+    assert np.array_equal(boxes2D.centers[1], [10.0, 7.5])
+    dogs = boxes2D[boxes2D.select_classes(['dog'])]
+    assert len(dogs) == 2
+    assert np.array_equal(dogs.scores, [0.9, 0.1])
+    with pytest.raises(ValueError):
+        Boxes2D([[10, 0, 5, 20]])
+
+
+def test_Boxes2D_views():
+    boxes2D = Boxes2D(np.array([[0, 0, 10, 20], [5, 5, 15, 10]]), 0.5)
+    box2D = boxes2D[-1]
+    assert isinstance(box2D, Box2D)
+    assert box2D.contains([10, 7])
+    assert (box2D.width, box2D.height) == (10, 5)
+    box2D.coordinates = [5.5, 5, 15, 10]
+    box2D.score = 0.8
+    box2D.class_name = 'cat'
+    assert np.array_equal(boxes2D.coordinates[1], [5.5, 5, 15, 10])
+    assert boxes2D.scores[1] == 0.8
+    assert boxes2D.get_class_names() == [None, 'cat']
+    with pytest.raises(ValueError):
+        box2D.coordinates = [20, 5, 15, 10]
+    with pytest.raises(IndexError):
+        boxes2D[2]
+
+
+def test_Boxes2D_to_boxes2D_inverse():
+    boxes2D = [Box2D([0, 0, 10, 20], 0.9, 'cat'),
+               Box2D([5, 5, 15, 10], 0.5, 'dog')]
+    array_boxes2D = Boxes2D.from_boxes2D(boxes2D)
+    assert array_boxes2D.class_names == ['cat', 'dog']
+    for box2D, copied_box2D in zip(boxes2D, array_boxes2D.to_boxes2D()):
+        assert list(box2D.coordinates) == copied_box2D.coordinates
+        assert box2D.score == copied_box2D.score
+        assert box2D.class_name == copied_box2D.class_name
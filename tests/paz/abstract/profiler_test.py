@@ -0,0 +1,121 @@
+import json
+import threading
+
+import numpy as np
+import pytest
+
+from paz.abstract import Processor, SequentialProcessor, Profiler
+from paz.abstract import processor as processor_module
+from paz.abstract.profiler import compute_output_bytes
+
+
+class AddOne(Processor):
+    def __init__(self, name=None):
+        super(AddOne, self).__init__(name)
+
+    def call(self, x):
+        return x + 1.0
+
+
+class Nested(Processor):
+    def __init__(self):
+        super(Nested, self).__init__()
+        self.pipeline = SequentialProcessor(
+            [AddOne('first'), AddOne('second')], name='Inner')
+
+    def call(self, x):
+        return self.pipeline(x)
+
+
+@pytest.fixture
+def pipeline():
+    return SequentialProcessor([Nested(), AddOne()], name='Outer')
+
+
+def test_profiler_records_nested_paths(pipeline):
+    with Profiler() as profiler:
+        for call_arg in range(3):
+            pipeline(np.zeros((2, 2)))
+    paths = list(profiler.records.keys())
+    assert ('Outer',) in paths
+    assert ('Outer', 'Nested', 'Inner', 'first') in paths
+    assert ('Outer', 'AddOne') in paths
+    assert all(record['calls'] == 3 for record in profiler.records.values())
+    outer = profiler.records[('Outer',)]
+    assert outer['self_time'] <= outer['time']
+
+
+def test_profiler_is_disabled_outside_context(pipeline):
+    with Profiler() as profiler:
+        pipeline(np.zeros(2))
+    pipeline(np.zeros(2))
+    assert processor_module._profiler is None
+    assert profiler.records[('Outer',)]['calls'] == 1
+
+
+def test_profiler_records_bytes(pipeline):
+    with Profiler(record_bytes=True) as profiler:
+        pipeline(np.zeros(10, dtype=np.float32))
+    assert profiler.records[('Outer',)]['bytes'] == 40
+    assert 'output [MB]' in profiler.to_table()
+
+
+def test_compute_output_bytes():
+    outputs = (np.zeros(4, np.uint8), [np.zeros(2)], {'a': np.zeros(1)}, 1)
+    assert compute_output_bytes(outputs) == 4 + 16 + 8
+
+
+def test_profiler_table(pipeline):
+    with Profiler() as profiler:
+        pipeline(np.zeros(2))
+    lines = profiler.to_table().split('\n')
+    names = [line.split()[0] for line in lines[2:]]
+    assert names == ['Outer', 'Nested', 'Inner', 'first', 'second', 'AddOne']
+    assert lines[4].startswith('    Inner')
+
+
+def test_profiler_chrome_trace(pipeline, tmpdir):
+    filepath = str(tmpdir.join('trace.json'))
+    with Profiler() as profiler:
+        pipeline(np.zeros(2))
+    trace = profiler.to_chrome_trace(filepath)
+    with open(filepath, 'r') as filedata:
+        assert json.load(filedata) == trace
+    events = trace['traceEvents']
+    assert len(events) == 6
+    assert all(event['ph'] == 'X' for event in events)
+    outer = [event for event in events if event['name'] == 'Outer'][0]
+    for event in events:
+        assert event['ts'] >= outer['ts']
+        assert event['ts'] + event['dur'] <= outer['ts'] + outer['dur']
+
+
+def test_profiler_max_events(pipeline):
+    with Profiler(max_events=4) as profiler:
+        pipeline(np.zeros(2))
+        pipeline(np.zeros(2))
+    assert len(profiler.events) == 4
+    assert profiler.records[('Outer',)]['calls'] == 2
+
+
+def test_profiler_threads(pipeline):
+    with Profiler() as profiler:
+        threads = [threading.Thread(target=pipeline, args=(np.zeros(2),))
+                   for thread_arg in range(4)]
+        [thread.start() for thread in threads]
+        [thread.join() for thread in threads]
+    assert len(profiler.records) == 6
+    assert profiler.records[('Outer', 'AddOne')]['calls'] == 4
+
+
+def test_profiler_exception_keeps_stack():
+    class Fail(Processor):
+        def call(self, x):
+            raise ValueError('failed')
+
+    pipeline = SequentialProcessor([AddOne(), Fail()])
+    with Profiler() as profiler:
+        with pytest.raises(ValueError):
+            pipeline(np.zeros(2))
+        AddOne('after')(np.zeros(2))
+    assert ('after',) in profiler.records
@@ -1,4 +1,6 @@
 from paz.abstract import Processor, SequentialProcessor, ProcessingSequence
+from paz.abstract import GeneratingSequence
+from paz.abstract.sequence import seed_worker
 from paz import processors as pr
 import numpy as np
 
@@ -28,3 +30,108 @@ for _ in range(10):
     batch = sequence.__getitem__(0)
     value_A, value_B = batch[0]['value_A'][0], batch[1]['value_B'][0]
     print(value_B)
+
+
+class RandomSample(Processor):
+    def __init__(self):
+        super(RandomSample, self).__init__()
+
+    def call(self):
+        return np.random.rand(1), np.random.rand(1)
+
+
+def build_generating_processor():
+    return SequentialProcessor([RandomSample(), pr.SequenceWrapper(
+        {0: {'value_A': [1]}}, {1: {'value_B': [1]}})])
+
+
+def build_processing_data(num_samples):
+    data = []
+    for sample_arg in range(num_samples):
+        value_A = np.full((1, 4), float(sample_arg))
+        value_B = np.full((2, 3), float(sample_arg))
+        data.append({'value_A': value_A, 'value_B': value_B})
+    return data
+
+
+def test_ProcessingSequence_workers():
+    data = build_processing_data(10)
+    processor = SequentialProcessor([
+        pr.UnpackDictionary(['value_A', 'value_B']),
+        pr.SequenceWrapper({0: {'value_A': [1, 4]}},
+                           {1: {'value_B': [2, 3]}})])
+    serial_sequence = ProcessingSequence(processor, 4, data)
+    parallel_sequence = ProcessingSequence(
+        processor, 4, data, num_workers=2, prefetch=2)
+    for batch_index in [0, 1, 2, 0]:
+        serial_inputs, serial_labels = serial_sequence[batch_index]
+        parallel_inputs, parallel_labels = parallel_sequence[batch_index]
+        assert np.allclose(serial_inputs['value_A'],
+                           parallel_inputs['value_A'])
+        assert np.allclose(serial_labels['value_B'],
+                           parallel_labels['value_B'])
+    parallel_sequence.close()
+
+
+def test_GeneratingSequence_multiprocessing_seeds():
+    sequence = GeneratingSequence(
+        build_generating_processor(), 8, 3, num_workers=2,
+        use_multiprocessing=True, prefetch=1, seed=777)
+    values = []
+    for batch_index in range(len(sequence)):
+        inputs, labels = sequence[batch_index]
+        values.append(inputs['value_A'])
+    sequence.close()
+    values = np.concatenate(values)
+    assert len(np.unique(values)) == len(values)
+
+
+def test_seed_worker():
+    seed_worker(777, 0)
+    values_A = np.random.rand(3)
+    seed_worker(777, 1)
+    values_B = np.random.rand(3)
+    seed_worker(777, 0)
+    assert np.allclose(np.random.rand(3), values_A)
+    assert not np.allclose(values_A, values_B)
+
+
+def test_ProcessingSequence_dtypes():
+    data = build_processing_data(3)
+    sequence = ProcessingSequence(processor, 2, data, dtypes={
+        'value_A': 'float32', 'value_B': 'uint8'})
+    inputs, labels = sequence[0]
+    assert inputs['value_A'].dtype == np.float32
+    assert labels['value_B'].dtype == np.uint8
+
+
+def test_ProcessingSequence_reused_buffers():
+    data = build_processing_data(3)
+    processor = SequentialProcessor([
+        pr.UnpackDictionary(['value_A', 'value_B']),
+        pr.SequenceWrapper({0: {'value_A': [1, 4]}},
+                           {1: {'value_B': [2, 3]}})])
+    sequence = ProcessingSequence(processor, 2, data, num_buffers=1)
+    inputs_A, labels_A = sequence[0]
+    assert np.allclose(inputs_A['value_A'][:, 0, 0], [0.0, 1.0])
+    inputs_B, labels_B = sequence[1]
+    assert inputs_A['value_A'] is inputs_B['value_A']
+    assert np.allclose(inputs_B['value_A'][:, 0, 0], [2.0, 0.0])
+    assert np.allclose(labels_B['value_B'][1], 0.0)
+
+
+def test_ProcessingSequence_batch_processors():
+    data = build_processing_data(3)
+    processor = SequentialProcessor([
+        pr.UnpackDictionary(['value_A', 'value_B']),
+        pr.SequenceWrapper({0: {'value_A': [1, 4]}},
+                           {1: {'value_B': [2]}})])
+    batch_processors = {'value_B': lambda values: np.array(
+        [np.sum(value, axis=1) for value in values])}
+    sequence = ProcessingSequence(processor, 2, data, num_buffers=1,
+                                  batch_processors=batch_processors)
+    inputs, labels = sequence[0]
+    assert np.allclose(inputs['value_A'][:, 0, 0], [0.0, 1.0])
+    assert np.allclose(labels['value_B'], [[0.0, 0.0], [3.0, 3.0]])
+    inputs, labels = sequence[1]
+    assert np.allclose(labels['value_B'], [[6.0, 6.0], [0.0, 0.0]])
@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+from paz.backend.anchors import build_anchors
+from paz.backend.anchors import build_octaves
+from paz.backend.anchors import build_aspect
+from paz.backend.anchors import build_scales
+from paz.backend.anchors import build_strides
+from paz.backend.anchors import compute_box_coordinates
+from paz.backend.boxes import to_center_form
+
+
+class Branch(object):
+    def __init__(self, size):
+        self.shape = (None, size, size, 64)
+
+
+@pytest.fixture
+def branches():
+    return [Branch(size) for size in [64, 32, 16, 8, 4]]
+
+
+def build_anchors_per_box(image_shape, branches, num_scales,
+                          aspect_ratios, scale):
+    num_scale_aspect = num_scales * len(aspect_ratios)
+    octave = build_octaves(num_scales, aspect_ratios)
+    aspect = build_aspect(num_scales, aspect_ratios)
+    scales = build_scales(scale, num_scale_aspect)
+    anchor_boxes = []
+    for branch_arg in range(len(branches)):
+        strides = build_strides(
+            branch_arg, image_shape, branches, num_scale_aspect)
+        branch_boxes = []
+        for config in zip(*strides, scales, octave, aspect):
+            boxes = compute_box_coordinates(image_shape, *config)
+            branch_boxes.append(np.expand_dims(boxes.T, axis=1))
+        branch_boxes = np.concatenate(branch_boxes, axis=1)
+        anchor_boxes.append(branch_boxes.reshape([-1, 4]))
+    anchor_boxes = np.concatenate(anchor_boxes, axis=0).astype('float32')
+    return to_center_form(anchor_boxes)
+
+
+def test_build_anchors(branches):
+    args = ((512, 512), branches, 3, [1.0, 2.0, 0.5], 4.0)
+    anchor_boxes = build_anchors(*args)
+    assert anchor_boxes.shape == (49104, 4)
+    assert np.array_equal(anchor_boxes, build_anchors_per_box(*args))
+
+
+def test_build_anchors_are_copies(branches):
+    args = ((512, 512), branches, 3, [1.0, 2.0, 0.5], 4.0)
+    anchor_boxes = build_anchors(*args)
+    anchor_boxes[:] = 0.0
+    assert np.array_equal(build_anchors(*args), build_anchors_per_box(*args))
+
+
+def test_build_anchors_shape_key(branches):
+    anchor_boxes = build_anchors((512, 512), branches, 3, [1.0], 4.0)
+    small_branches = [Branch(size) for size in [32, 16, 8, 4, 2]]
+    small_anchor_boxes = build_anchors(
+        (256, 256), small_branches, 3, [1.0], 4.0)
+    assert len(anchor_boxes) == 4 * len(small_anchor_boxes)
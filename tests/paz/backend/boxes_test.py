@@ -4,10 +4,19 @@ import pytest
 from paz.backend.boxes import compute_iou
 from paz.backend.boxes import compute_ious
 from paz.backend.boxes import denormalize_box
+from paz.backend.boxes import denormalize_boxes
+from paz.backend.boxes import make_box_square
+from paz.backend.boxes import make_boxes_square
+from paz.backend.boxes import offset
+from paz.backend.boxes import offset_boxes
+from paz.backend.boxes import clip
+from paz.backend.boxes import clip_boxes
 from paz.backend.boxes import to_corner_form
 from paz.backend.boxes import to_center_form
 from paz.backend.boxes import encode
 from paz.backend.boxes import match
+from paz.backend.boxes import match_batch
+from paz.backend.boxes import to_one_hot
 from paz.backend.boxes import decode
 from paz.backend.boxes import flip_left_right
 from paz.backend.boxes import to_image_coordinates
@@ -15,6 +24,8 @@ from paz.backend.boxes import to_normalized_coordinates
 from paz.models.detection.utils import create_prior_boxes
 from paz.backend.boxes import extract_bounding_box_corners
 from paz.backend.boxes import nms_per_class
+from paz.backend.boxes import batched_nms_per_class
+from paz.backend.boxes import batched_nms_per_image
 from paz.backend.boxes import merge_nms_box_with_class
 from paz.models import SSD300
 
@@ -175,6 +186,25 @@ def test_denormalize_box(box):
     assert (box == (30, 40, 90, 80))
 
 
+@pytest.mark.parametrize('dtype', [np.float32, np.float64, int])
+@pytest.mark.parametrize('function, vectorized_function, arguments', [
+    (make_box_square, make_boxes_square, []),
+    (offset, offset_boxes, [[0.1, 0.2]]),
+    (clip, clip_boxes, [(200, 250)]),
+    (denormalize_box, denormalize_boxes, [(200, 300)])])
+def test_vectorized_box_functions(
+        dtype, function, vectorized_function, arguments):
+    coordinates = np.random.uniform(-10, 300, (100, 2))
+    sizes = np.random.uniform(1, 100, (100, 2))
+    boxes = np.concatenate([coordinates, coordinates + sizes], axis=1)
+    if function is denormalize_box:
+        boxes = boxes / 400
+    boxes = boxes.astype(dtype)
+    expected_boxes = [function(box, *arguments) for box in boxes]
+    assert np.array_equal(vectorized_function(boxes, *arguments),
+                          np.array(expected_boxes))
+
+
 def test_to_center_form_inverse(boxes):
     box_A = boxes[0]
     assert np.all(to_corner_form(to_center_form(box_A)) == box_A)
@@ -198,6 +228,50 @@ def test_match_box(boxes_with_label, target_unique_matches):
                           np.unique(matched_boxes[:, :-1], axis=0))
 
 
+def test_match_batch_equals_match(boxes_with_label):
+    priors = create_prior_boxes('VOC')
+    boxes = [boxes_with_label, boxes_with_label[:2], boxes_with_label[3:]]
+    matches = match_batch(boxes, priors, dtype=np.float64)
+    for sample_boxes, sample_matches in zip(boxes, matches):
+        assert np.array_equal(match(sample_boxes, priors), sample_matches)
+
+
+def test_match_batch_float32(boxes_with_label):
+    priors = create_prior_boxes('VOC')
+    boxes = [boxes_with_label, boxes_with_label[1:4]]
+    matches = match_batch(boxes, priors)
+    assert matches.dtype == np.float32
+    assert matches.shape == (2, len(priors), 5)
+    for sample_boxes, sample_matches in zip(boxes, matches):
+        assert np.allclose(match(sample_boxes, priors), sample_matches)
+
+
+def test_match_batch_without_boxes(boxes_with_label):
+    priors = create_prior_boxes('VOC')
+    empty_boxes = np.zeros((0, 5))
+    matches = match_batch([empty_boxes, boxes_with_label], priors)
+    assert np.all(matches[0] == 0.0)
+    assert np.allclose(matches[1], match(boxes_with_label, priors))
+
+
+def test_encode_batch(boxes_with_label):
+    priors = create_prior_boxes('VOC')
+    variances = [0.1, 0.1, 0.2, 0.2]
+    boxes = [boxes_with_label, boxes_with_label[:3]]
+    matches = match_batch(boxes, priors, dtype=np.float64)
+    encoded_boxes = encode(matches, priors, variances)
+    for sample_matches, sample_encoded in zip(matches, encoded_boxes):
+        assert np.array_equal(
+            encode(sample_matches, priors, variances), sample_encoded)
+
+
+def test_to_one_hot():
+    one_hot_vectors = to_one_hot(np.array([[2, 0], [1, 1]]), 3)
+    assert one_hot_vectors.shape == (2, 2, 3)
+    assert np.array_equal(one_hot_vectors.argmax(axis=-1), [[2, 0], [1, 1]])
+    assert np.all(one_hot_vectors.sum(axis=-1) == 1.0)
+
+
 def test_to_encode(boxes_with_label):
     priors = create_prior_boxes('VOC')
     matches = match(boxes_with_label, priors)
@@ -221,6 +295,19 @@ def test_prior_boxes(target_prior_boxes):
     assert np.all(prior_boxes[:10].astype('float32') == target_prior_boxes)
 
 
+@pytest.mark.parametrize('configuration_name, num_boxes',
+                         [('VOC', 8732), ('COCO', 24564)])
+def test_prior_boxes_shape(configuration_name, num_boxes):
+    prior_boxes = create_prior_boxes(configuration_name)
+    assert prior_boxes.shape == (num_boxes, 4)
+
+
+def test_prior_boxes_are_copies():
+    prior_boxes = create_prior_boxes('VOC')
+    prior_boxes[:] = 0.0
+    assert np.any(create_prior_boxes('VOC') != 0.0)
+
+
 def test_flip_left_right_pass_by_value(boxes_with_label):
     initial_boxes_with_label = boxes_with_label.copy()
     flip_left_right(boxes_with_label, 1.0)
@@ -278,6 +365,108 @@ def test_nms_per_class_and_merge_box(
     assert np.all(retained_scores == row_wise_score_sum), (
         'Other scores are not all zeros')
 
+
+@pytest.mark.parametrize(('arg, nms_thresh, epsilon'),
+                         [(0, 0.45, 0.01),
+                          (1, 0.45, 0.2),
+                          (2, 0.75, 0.01),
+                          (3, 0.75, 0.2),
+                          (4, 0.50, 0.01)])
+def test_batched_nms_per_class(
+    arg, nms_thresh, epsilon, prior_boxes_SSD300, input_box_indices,
+        class_predictions, target_nms_box_indices, target_class_labels):
+    target_nms_box_indices = target_nms_box_indices[arg]
+    target_class_labels = target_class_labels[arg]
+    boxes = prior_boxes_SSD300[input_box_indices]
+    box_data = np.concatenate((boxes, class_predictions), axis=1)
+    nms_boxes, class_labels = batched_nms_per_class(
+        box_data, nms_thresh, epsilon, 200)
+    assert np.all(
+        nms_boxes[:, :4] == prior_boxes_SSD300[target_nms_box_indices])
+    assert np.all(class_labels == target_class_labels)
+
+
+@pytest.mark.parametrize(('nms_thresh, epsilon, top_k'),
+                         [(0.45, 0.01, 200),
+                          (0.75, 0.2, 20),
+                          (0.30, 0.5, 5)])
+def test_batched_nms_per_class_equals_nms_per_class(
+        nms_thresh, epsilon, top_k):
+    random_state = np.random.RandomState(777)
+    x_min, y_min = random_state.rand(2, 500, 1)
+    W, H = 0.3 * random_state.rand(2, 500, 1)
+    class_predictions = random_state.rand(500, 21) ** 4
+    box_data = np.concatenate(
+        [x_min, y_min, x_min + W, y_min + H, class_predictions], axis=1)
+    nms_boxes, class_labels = nms_per_class(
+        box_data, nms_thresh, epsilon, top_k)
+    batched_nms_boxes, batched_class_labels = batched_nms_per_class(
+        box_data, nms_thresh, epsilon, top_k)
+    assert np.array_equal(nms_boxes, batched_nms_boxes)
+    assert np.array_equal(class_labels, batched_class_labels)
+
+
+@pytest.mark.parametrize('chunk_size', [1, 5000, 2 ** 22])
+def test_batched_nms_per_image_chunks(chunk_size):
+    random_state = np.random.RandomState(777)
+    x_min, y_min = random_state.rand(2, 4, 300, 1)
+    W, H = 0.3 * random_state.rand(2, 4, 300, 1)
+    class_predictions = random_state.rand(4, 300, 11) ** 4
+    box_data = np.concatenate(
+        [x_min, y_min, x_min + W, y_min + H, class_predictions], axis=2)
+    box_data = box_data.astype(np.float32)
+    batch_nms = batched_nms_per_image(box_data, 0.45, 0.01, 100, chunk_size)
+    for image_box_data, (nms_boxes, class_labels) in zip(box_data, batch_nms):
+        target_boxes, target_labels = nms_per_class(
+            image_box_data, 0.45, 0.01, 100)
+        assert np.array_equal(nms_boxes, target_boxes)
+        assert np.array_equal(class_labels, target_labels)
+
+
+def test_batched_nms_per_class_float64_threshold_edge():
+    box_data = np.array([[0.0, 0.0, 1.0, 1.0, 0.1, 0.9],
+                         [0.0, 0.0, 0.45 + 1e-9, 1.0, 0.2, 0.8]])
+    nms_boxes, class_labels = batched_nms_per_class(box_data, 0.45, 0.01)
+    target_boxes, target_labels = nms_per_class(box_data, 0.45, 0.01)
+    assert np.sum(target_labels == 1) == 1
+    assert nms_boxes.dtype == np.float64
+    assert np.array_equal(nms_boxes, target_boxes)
+    assert np.array_equal(class_labels, target_labels)
+
+
+def test_batched_nms_per_class_without_candidates():
+    box_data = np.array([[0.1, 0.1, 0.5, 0.5, 0.001, 0.002]])
+    nms_boxes, class_labels = batched_nms_per_class(box_data, 0.45, 0.01)
+    assert nms_boxes.shape == (0, 6)
+    assert len(class_labels) == 0
+
+
+def test_batched_nms_per_image_equals_nms_per_class():
+    random_state = np.random.RandomState(777)
+    x_min, y_min = random_state.rand(2, 3, 500, 1)
+    W, H = 0.3 * random_state.rand(2, 3, 500, 1)
+    class_predictions = random_state.rand(3, 500, 21) ** 4
+    class_predictions[1] = 0.0
+    box_data = np.concatenate(
+        [x_min, y_min, x_min + W, y_min + H, class_predictions], axis=2)
+    batch_nms = batched_nms_per_image(box_data, 0.45, 0.01, 200)
+    assert len(batch_nms) == 3
+    for image_box_data, (nms_boxes, class_labels) in zip(box_data, batch_nms):
+        target_boxes, target_labels = nms_per_class(
+            image_box_data, 0.45, 0.01, 200)
+        assert np.array_equal(nms_boxes, target_boxes)
+        assert np.array_equal(class_labels, target_labels)
+
+
+def test_decode_batch(boxes_with_label, target_prior_boxes):
+    predictions = np.random.rand(2, len(target_prior_boxes), 5)
+    decoded_boxes = decode(predictions, target_prior_boxes)
+    assert decoded_boxes.shape == predictions.shape
+    for image_predictions, image_decoded_boxes in zip(
+            predictions, decoded_boxes):
+        target = decode(image_predictions, target_prior_boxes)
+        assert np.array_equal(image_decoded_boxes, target)
+
 # def test_data_loader_check():
 #     voc_root = './examples/object_detection/data/VOCdevkit/'
 #     data_names = [['VOC2007', 'VOC2012'], 'VOC2007']
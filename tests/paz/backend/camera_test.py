@@ -0,0 +1,167 @@
+import queue
+import threading
+import time
+import cv2
+import numpy as np
+import pytest
+from paz.backend.camera import Camera, AsyncVideoPlayer, put_frame
+
+
+class SyntheticCamera(Camera):
+    def __init__(self, image_shape=(48, 64, 3)):
+        super(SyntheticCamera, self).__init__()
+        self.image_shape = image_shape
+        self.num_reads = 0
+
+    def start(self):
+        self._is_open = True
+
+    def stop(self):
+        self._is_open = False
+
+    def is_open(self):
+        return self._is_open
+
+    def read(self):
+        self.num_reads = self.num_reads + 1
+        return np.full(self.image_shape, self.num_reads % 256, np.uint8)
+
+
+class CountFrames(object):
+    def __init__(self, max_frames=None):
+        self.max_frames = max_frames
+        self.num_frames = 0
+        self.player = None
+
+    def __call__(self, image):
+        self.num_frames = self.num_frames + 1
+        if self.num_frames == self.max_frames:
+            self.player.stop()
+        return {'image': image}
+
+
+@pytest.fixture
+def video_path(tmp_path):
+    path = str(tmp_path / 'input.avi')
+    writer = cv2.VideoWriter(
+        path, cv2.VideoWriter_fourcc(*'MJPG'), 10, (64, 48))
+    for frame_arg in range(12):
+        writer.write(np.full((48, 64, 3), 20 * frame_arg, np.uint8))
+    writer.release()
+    return path
+
+
+def test_put_frame_drop_oldest():
+    frame_queue = queue.Queue(2)
+    num_dropped = 0
+    for frame_arg in range(5):
+        num_dropped += put_frame(frame_queue, frame_arg, drop_oldest=True)
+    assert num_dropped == 3
+    assert [frame_queue.get(), frame_queue.get()] == [3, 4]
+
+
+def test_AsyncVideoPlayer_run():
+    pipeline = CountFrames(max_frames=10)
+    camera = SyntheticCamera()
+    player = AsyncVideoPlayer((64, 48), pipeline, camera,
+                              show=False, verbose=False)
+    pipeline.player = player
+    statistics = player.run()
+    assert statistics['processed_frames'] == 10
+    assert statistics['fps'] > 0
+    assert camera.num_reads >= 10
+    assert not camera.is_open()
+
+
+def test_AsyncVideoPlayer_record_from_file(video_path, tmp_path):
+    pipeline = CountFrames()
+    player = AsyncVideoPlayer((64, 48), pipeline, SyntheticCamera(),
+                              queue_size=1, show=False, verbose=False)
+    output_path = str(tmp_path / 'output.avi')
+    statistics = player.record_from_file(
+        video_path, output_path, fourCC='MJPG')
+    assert statistics['processed_frames'] == 12
+    assert statistics['dropped_frames'] == 0
+    video = cv2.VideoCapture(output_path)
+    assert int(video.get(cv2.CAP_PROP_FRAME_COUNT)) == 12
+    video.release()
+
+
+class NoFramesCamera(SyntheticCamera):
+    def read(self):
+        self.num_reads = self.num_reads + 1
+        return None
+
+
+def test_put_frame_max_wait():
+    frame_queue = queue.Queue(1)
+    put_frame(frame_queue, 0, drop_oldest=False)
+    num_dropped = put_frame(frame_queue, 1, drop_oldest=False, max_wait=0.05)
+    assert num_dropped == 1
+    assert frame_queue.get() == 0
+
+
+def test_AsyncVideoPlayer_stops_without_camera_frames():
+    camera = NoFramesCamera()
+    player = AsyncVideoPlayer((64, 48), CountFrames(), camera,
+                              show=False, verbose=False, timeout=1.0)
+    timer = threading.Timer(0.2, player.stop)
+    timer.start()
+    statistics = player.run()
+    timer.join()
+    assert statistics['processed_frames'] == 0
+    assert camera.num_reads > 0
+
+
+class BrokenWriter(object):
+    def write(self, image):
+        raise IOError('Writer failed')
+
+
+def test_AsyncVideoPlayer_with_failed_writer():
+    pipeline = CountFrames(max_frames=20)
+    player = AsyncVideoPlayer((64, 48), pipeline, SyntheticCamera(),
+                              write_queue_size=2, show=False, verbose=False,
+                              timeout=0.05)
+    pipeline.player = player
+    statistics = player._process(player._camera_frames(), True,
+                                 BrokenWriter())
+    assert statistics['processed_frames'] == 20
+    assert statistics['dropped_frames'] > 0
+
+
+class BlockingCamera(SyntheticCamera):
+    def __init__(self):
+        super(BlockingCamera, self).__init__()
+        self.unblock = threading.Event()
+        self.is_reading = False
+        self.stopped_while_reading = False
+
+    def read(self):
+        self.is_reading = True
+        self.unblock.wait()
+        image = super(BlockingCamera, self).read()
+        self.is_reading = False
+        return image
+
+    def stop(self):
+        self.stopped_while_reading = self.is_reading
+        super(BlockingCamera, self).stop()
+
+
+def test_AsyncVideoPlayer_does_not_stop_camera_while_reading():
+    camera = BlockingCamera()
+    player = AsyncVideoPlayer((64, 48), CountFrames(), camera,
+                              show=False, verbose=False, timeout=0.05)
+    timer = threading.Timer(0.1, player.stop)
+    timer.start()
+    player.run()
+    timer.join()
+    assert camera.is_open()
+    camera.unblock.set()
+    for _ in range(100):
+        if not camera.is_open():
+            break
+        time.sleep(0.01)
+    assert not camera.is_open()
+    assert not camera.stopped_while_reading
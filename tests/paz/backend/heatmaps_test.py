@@ -85,3 +85,24 @@ def test_get_keypoints_coordinates(keypoint_indices, output,
 def test_get_valid_detections(detections, valid_detections):
     estimated_detection = heatmaps.get_valid_detections(detections, 0.2)
     assert np.allclose(estimated_detection, valid_detections)
+
+
+@pytest.mark.parametrize('k', [1, 5, 30])
+def test_get_top_k_keypoints_numpy(k):
+    values = np.random.rand(1, 17, 64 * 48)
+    values[values < 0.9] = 0.0
+    top_k_values, top_k_indices = heatmaps.get_top_k_keypoints_numpy(
+        values, k)
+    assert top_k_indices.shape == (1, 17, k)
+    target_indices = np.argsort(-values, axis=-1, kind='stable')[..., :k]
+    target_values = np.take_along_axis(values, target_indices, axis=-1)
+    assert np.allclose(top_k_values, np.squeeze(target_values))
+    assert np.all(top_k_indices == target_indices)
+
+
+def test_get_top_k_keypoints_numpy_ties():
+    values = np.array([[[0.0, 1.0, 0.0, 0.5, 0.5, 0.5]]])
+    top_k_values, top_k_indices = heatmaps.get_top_k_keypoints_numpy(
+        values, 3)
+    assert np.allclose(top_k_values, [1.0, 0.5, 0.5])
+    assert np.all(top_k_indices == [[[1, 3, 4]]])
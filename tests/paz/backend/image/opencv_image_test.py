@@ -54,6 +54,25 @@ def test_resize_image(load_image, image_shape, rgb_channel, resized_shape):
     assert resized_image.size == size
 
 
+@pytest.mark.parametrize('num_channels, max_channels',
+                         [(17, 512), (34, 512), (600, 512), (17, 4)])
+def test_resize_image_channels(num_channels, max_channels):
+    image = np.random.rand(32, 48, num_channels).astype(np.float32)
+    resized_image = opencv_image.resize_image_channels(
+        image, (96, 64), max_channels=max_channels)
+    assert resized_image.shape == (64, 96, num_channels)
+    for channel_arg in range(num_channels):
+        resized_channel = opencv_image.resize_image(
+            image[:, :, channel_arg].copy(), (96, 64))
+        assert np.allclose(resized_image[:, :, channel_arg], resized_channel)
+
+
+def test_resize_image_more_than_512_channels():
+    image = np.random.rand(16, 16, 600).astype(np.float32)
+    resized_image = opencv_image.resize_image(image, (32, 32))
+    assert resized_image.shape == (32, 32, 600)
+
+
 def test_convert_color_space(load_image, image_shape, rgb_channel):
     test_image = load_image(image_shape, rgb_channel)
     converted_colorspace = opencv_image.convert_color_space(
@@ -0,0 +1,110 @@
+import pickle
+
+import cv2
+import numpy as np
+import pytest
+
+from paz.backend.image import load_image, get_image_size, compute_reduction
+from paz.backend.image import ImageSource, ReducedImageSource, LRUImageCache
+from paz.backend.image import ShardedImageStore, build_image_store
+from paz import processors as pr
+
+
+@pytest.fixture
+def image_paths(tmp_path):
+    image_paths = []
+    for image_arg, shape in enumerate([(375, 500), (500, 333), (64, 48)]):
+        image = np.random.randint(0, 256, shape + (3, ), dtype=np.uint8)
+        image_path = str(tmp_path / ('%06d.jpg' % image_arg))
+        cv2.imwrite(image_path, image)
+        image_paths.append(image_path)
+    return image_paths
+
+
+class CountingSource(ImageSource):
+    def __init__(self):
+        self.num_loads = 0
+
+    def load(self, filepath, num_channels=3):
+        self.num_loads = self.num_loads + 1
+        return super(CountingSource, self).load(filepath, num_channels)
+
+
+def test_get_image_size(tmp_path, image_paths):
+    assert get_image_size(image_paths[0]) == (375, 500)
+    assert get_image_size(image_paths[1]) == (500, 333)
+    image_path = str(tmp_path / 'image.png')
+    cv2.imwrite(image_path, np.zeros((20, 30, 3), dtype=np.uint8))
+    assert get_image_size(image_path) == (20, 30)
+    text_path = tmp_path / 'image.txt'
+    text_path.write_text('not an image')
+    assert get_image_size(str(text_path)) is None
+
+
+@pytest.mark.parametrize('num_channels, reduction, shape', [
+    (3, 2, (188, 250, 3)), (3, 4, (94, 125, 3)), (1, 8, (47, 63))])
+def test_load_reduced_image(image_paths, num_channels, reduction, shape):
+    image = load_image(image_paths[0], num_channels, reduction)
+    assert image.shape == shape
+    with pytest.raises(ValueError):
+        load_image(image_paths[0], 4, reduction)
+
+
+def test_compute_reduction():
+    assert compute_reduction((375, 500), (300, 300)) == 1
+    assert compute_reduction((768, 1024), (300, 300)) == 2
+    assert compute_reduction((1024, 768), (128, 128)) == 4
+    assert compute_reduction((1024, 768), (32, 64)) == 8
+
+
+def test_reduced_image_source(image_paths):
+    source = ReducedImageSource((150, 100))
+    assert source(image_paths[0]).shape == (188, 250, 3)
+    assert source(image_paths[2]).shape == (64, 48, 3)
+
+
+def test_LRU_image_cache(image_paths):
+    counting_source = CountingSource()
+    image_bytes = 375 * 500 * 3
+    max_bytes = image_bytes + 100000
+    cache = LRUImageCache(counting_source, max_bytes=max_bytes)
+    image = cache(image_paths[0])
+    image[:] = 0
+    assert np.array_equal(cache(image_paths[0]), load_image(image_paths[0]))
+    assert (cache.hits, cache.misses) == (1, 1)
+    cache(image_paths[1])
+    cache(image_paths[2])
+    # the least recently used image is removed
+    assert cache.num_bytes <= max_bytes
+    cache(image_paths[0])
+    assert counting_source.num_loads == 4
+    copied_cache = pickle.loads(pickle.dumps(cache))
+    assert len(copied_cache) == 0
+
+
+@pytest.mark.parametrize('shard_bytes', [1, 2 ** 28])
+def test_sharded_image_store(tmp_path, image_paths, shard_bytes):
+    directory = str(tmp_path / 'store')
+    store = build_image_store(
+        image_paths[:2], directory, max_size=250, shard_bytes=shard_bytes)
+    assert isinstance(store, ShardedImageStore)
+    assert len(store) == 2
+    image = store(image_paths[0])
+    assert image.shape == (188, 250, 3)
+    assert image.dtype == np.uint8
+    expected_image = cv2.resize(load_image(image_paths[0]), (250, 188),
+                                interpolation=cv2.INTER_AREA)
+    assert np.array_equal(image, expected_image)
+    assert store(image_paths[1]).shape == (250, 166, 3)
+    # images that are not in the store are decoded from disk
+    assert image_paths[2] not in store
+    assert store(image_paths[2]).shape == (64, 48, 3)
+    copied_store = pickle.loads(pickle.dumps(ShardedImageStore(directory)))
+    assert np.array_equal(copied_store(image_paths[0]), image)
+
+
+def test_load_image_processor_with_source(image_paths):
+    cache = LRUImageCache()
+    load = pr.LoadImage(source=cache)
+    assert np.array_equal(load(image_paths[0]), load_image(image_paths[0]))
+    assert cache.misses == 1
@@ -6,6 +6,9 @@ from paz.backend.image import image_to_normalized_device_coordinates
 from paz.backend.image import normalized_device_coordinates_to_image
 from paz.backend.image import normalize_min_max
 from paz.backend.image import get_scaling_factor
+from paz.backend.image import scale_resize
+from paz.backend.image import standardize_image
+from paz.backend.image import resize_image
 
 
 def test_replace_lower_than_threshold():
@@ -41,3 +44,37 @@ def test_get_scaling_factor(output_scaling_factor, scale=2, shape=(128, 128)):
     image = np.ones((512, 768, 3))
     scaling_factor = get_scaling_factor(image, scale, shape)
     assert np.allclose(output_scaling_factor, scaling_factor)
+
+
+@pytest.mark.parametrize('shape', [(48, 64, 3), (64, 48, 3)])
+def test_scale_resize_into_output_image(shape):
+    image = np.random.rand(*shape)
+    output_image = np.full((1, 32, 32, 3), np.nan)
+    values, scale = scale_resize(image, 32, output_image=output_image)
+    assert values is output_image
+    scaled_H, scaled_W = int(shape[0] / scale), int(shape[1] / scale)
+    assert np.allclose(values[0, :scaled_H, :scaled_W],
+                       resize_image(image, (scaled_W, scaled_H)))
+    assert np.allclose(values[0, scaled_H:], 0.0)
+    assert np.allclose(values[0, :, scaled_W:], 0.0)
+    assert np.allclose(values, scale_resize(image, 32)[0])
+
+
+def test_scale_resize_dtype():
+    image = np.random.rand(48, 64, 3).astype(np.float32)
+    values, scale = scale_resize(image, 32, np.float32)
+    assert values.dtype == np.float32
+    assert values.shape == (1, 32, 32, 3)
+    assert np.allclose(scale, 2.0)
+
+
+def test_standardize_image():
+    image = np.random.randint(0, 256, (16, 16, 3)).astype(np.uint8)
+    mean, standard_deviation = [120.0, 110.0, 100.0], [50.0, 60.0, 70.0]
+    values = standardize_image(image, mean, standard_deviation)
+    assert values.dtype == np.float32
+    assert np.allclose(values, (image - mean) / standard_deviation)
+    output = np.empty((16, 16, 3), np.float64)
+    values = standardize_image(image, mean, output=output)
+    assert values is output
+    assert np.allclose(values, image - mean)
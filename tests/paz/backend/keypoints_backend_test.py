@@ -7,6 +7,9 @@ from paz.backend.keypoints import denormalize_keypoints2D
 from paz.backend.keypoints import normalize_keypoints2D
 from paz.backend.keypoints import arguments_to_image_points2D
 from paz.backend.keypoints import project_to_image
+from paz.backend.keypoints import solve_PnP_RANSAC
+from paz.backend.keypoints import solve_PnP_RANSAC_batch
+from paz.backend.keypoints import subsample_correspondences
 
 
 @pytest.fixture
@@ -108,3 +111,60 @@ def test_project_to_image():
     points2D = project_to_image(rotation, translation,
                                 points3D, camera_intrinsics)
     assert np.allclose(points2D, np.array([0.5, -0.5]))
+
+
+@pytest.fixture
+def correspondences():
+    rows, cols = np.nonzero(np.ones((100, 80)))
+    points2D = np.stack([cols, rows], axis=1).astype(np.float64)
+    points3D = np.random.uniform(-0.1, 0.1, (len(points2D), 3))
+    return points3D, points2D
+
+
+@pytest.mark.parametrize('method', ['stratified', 'uniform', 'confidence'])
+def test_subsample_correspondences(correspondences, method):
+    points3D, points2D = correspondences
+    weights = np.ones(len(points2D))
+    sampled_points3D, sampled_points2D = subsample_correspondences(
+        points3D, points2D, 400, method, weights)
+    assert sampled_points3D.shape == (400, 3)
+    assert sampled_points2D.shape == (400, 2)
+    # correspondences remain paired
+    args = (sampled_points2D[:, 1] * 80 + sampled_points2D[:, 0]).astype(int)
+    assert np.array_equal(points3D[args], sampled_points3D)
+    assert subsample_correspondences(points3D, points2D, None)[0] is points3D
+
+
+def test_stratified_subsampling_covers_points(correspondences):
+    points3D, points2D = correspondences
+    points2D = subsample_correspondences(points3D, points2D, 80)[1]
+    counts = np.histogram2d(points2D[:, 0], points2D[:, 1], [4, 5])[0]
+    assert np.all(counts > 0)
+    with pytest.raises(ValueError):
+        subsample_correspondences(points3D, points2D, 10, 'confidence')
+
+
+def test_solve_PnP_RANSAC_batch():
+    camera_intrinsics = np.array([[500.0, 0.0, 320.0],
+                                  [0.0, 500.0, 240.0],
+                                  [0.0, 0.0, 1.0]])
+    objects_points3D, images_points2D = [], []
+    for translation_z in [0.8, 1.0, 1.2]:
+        points3D = np.random.uniform(-0.1, 0.1, (50, 3))
+        points2D = points3D[:, :2] / (points3D[:, 2:] + translation_z)
+        points2D = (500.0 * points2D) + np.array([320.0, 240.0])
+        objects_points3D.append(points3D)
+        images_points2D.append(points2D)
+    objects_points3D.append(np.zeros((3, 3)))
+    images_points2D.append(np.zeros((3, 2)))
+    solutions = solve_PnP_RANSAC_batch(
+        objects_points3D, images_points2D, camera_intrinsics, num_workers=2)
+    for points3D, points2D, solution in zip(
+            objects_points3D, images_points2D, solutions[:3]):
+        success, rotation_vector, translation = solve_PnP_RANSAC(
+            points3D, points2D, camera_intrinsics)
+        assert solution[0] == success
+        assert np.allclose(solution[2], translation)
+    assert np.allclose([solution[2][2] for solution in solutions[:3]],
+                       [0.8, 1.0, 1.2], atol=1e-3)
+    assert solutions[3] == (False, None, None)
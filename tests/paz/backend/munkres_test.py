@@ -1,5 +1,7 @@
+from itertools import permutations
 from paz.processors import Munkres
 from paz.backend import munkres
+import numpy as np
 import pytest
 
 
@@ -104,3 +106,42 @@ def test_matrix_cost(cost_matrices):
 def test_get_min_value(rectangular_cost_matrix, expected_min_value):
     min_value = munkres.get_min_value(rectangular_cost_matrix[0])
     assert (min_value == expected_min_value)
+
+
+def brute_force_cost(cost_matrix):
+    H, W = cost_matrix.shape
+    if H > W:
+        return brute_force_cost(cost_matrix.T)
+    costs = []
+    for cols in permutations(range(W), H):
+        costs.append(cost_matrix[np.arange(H), list(cols)].sum())
+    return min(costs)
+
+
+@pytest.mark.parametrize('shape', [(1, 1), (3, 3), (4, 6), (6, 4), (6, 6)])
+def test_solve_assignment_brute_force(shape):
+    rng = np.random.default_rng(777)
+    for _ in range(20):
+        cost_matrix = rng.integers(0, 4, shape).astype(float)
+        assignments = munkres.solve_assignment(cost_matrix)
+        assert len(assignments) == min(shape)
+        assert len(np.unique(assignments[:, 0])) == min(shape)
+        assert len(np.unique(assignments[:, 1])) == min(shape)
+        total_cost = cost_matrix[assignments[:, 0], assignments[:, 1]].sum()
+        assert np.isclose(total_cost, brute_force_cost(cost_matrix))
+
+
+def test_solve_assignment_empty_matrix():
+    assignments = munkres.solve_assignment(np.zeros((0, 3)))
+    assert assignments.shape == (0, 2)
+
+
+def test_matrix_disallowed_row():
+    with pytest.raises(munkres.UnsolvableMatrix):
+        Munkres().compute([[1, 2], [DISALLOWED, DISALLOWED]])
+
+
+def test_matrix_infeasible():
+    cost_matrix = [[1, DISALLOWED], [2, DISALLOWED]]
+    with pytest.raises(munkres.UnsolvableMatrix):
+        Munkres().compute(cost_matrix)
@@ -172,3 +172,20 @@ def test_max_pooling_2d(max_pooling_2d_test_matrix,
 
     assert np.allclose(valid_max_pool, valid_max_pooled_2d_matrix)
     assert np.allclose(same_max_pool, same_max_pooled_2d_matrix)
+
+
+def test_max_pooling_2d_strides(max_pooling_2d_test_matrix):
+    max_pool = standard.max_pooling_2d(
+        max_pooling_2d_test_matrix, pool_size=3, strides=2, padding='valid')
+    assert np.allclose(max_pool, [[8, 13], [27, 37]])
+
+
+def test_max_pooling_2d_channels(max_pooling_2d_test_matrix,
+                                 same_max_pooled_2d_matrix):
+    image = np.stack([max_pooling_2d_test_matrix,
+                      2 * max_pooling_2d_test_matrix], axis=-1)
+    max_pool = standard.max_pooling_2d(
+        image, pool_size=3, strides=1, padding='same')
+    assert max_pool.shape == image.shape
+    assert np.allclose(max_pool[..., 0], same_max_pooled_2d_matrix)
+    assert np.allclose(max_pool[..., 1], 2 * same_max_pooled_2d_matrix)
@@ -0,0 +1,90 @@
+import os
+
+import numpy as np
+import pytest
+
+from paz.datasets import VOC, OpenImages
+from paz.datasets import compile_annotations, load_compiled_annotations
+from paz.datasets.cache import compute_sources_signature
+
+
+def assert_equal_data(data, expected_data):
+    assert len(data) == len(expected_data)
+    for sample, expected_sample in zip(data, expected_data):
+        assert sample.keys() == expected_sample.keys()
+        assert sample['image'] == expected_sample['image']
+        assert np.allclose(sample['boxes'], expected_sample['boxes'])
+        if 'difficulties' in sample:
+            assert np.array_equal(
+                sample['difficulties'], expected_sample['difficulties'])
+
+
+@pytest.mark.parametrize('evaluate', [False, True])
+def test_compiled_VOC(tmp_path, write_VOC, evaluate):
+    write_VOC(tmp_path, ['000001', '000002', '000003'])
+    path, cache_path = str(tmp_path) + '/', str(tmp_path / 'cache')
+    expected_data = VOC(path, 'test', evaluate=evaluate).load_data()
+    data = VOC(path, 'test', evaluate=evaluate,
+               cache_path=cache_path).load_data()
+    assert_equal_data(data, expected_data)
+    data = VOC(path, 'test', evaluate=evaluate,
+               cache_path=cache_path).load_data()
+    assert isinstance(data.boxes, np.memmap)
+    assert data.offsets.dtype == np.int32
+    assert_equal_data(data, expected_data)
+    assert_equal_data(data[1:], expected_data[1:])
+    assert_equal_data([data[-1]], expected_data[-1:])
+
+
+def test_compiled_VOC_is_invalidated(tmp_path, write_VOC):
+    write_VOC(tmp_path, ['000001', '000002'])
+    path, cache_path = str(tmp_path) + '/', str(tmp_path / 'cache')
+    data = VOC(path, 'test', cache_path=cache_path).load_data()
+    assert np.allclose(data.class_args, [12, 8, 12, 8])
+    write_VOC(tmp_path, ['000001', '000002'], 'bird')
+    annotation_path = str(tmp_path / 'VOC2007/Annotations/000002.xml')
+    os.utime(annotation_path, ns=(0, 0))
+    data = VOC(path, 'test', cache_path=cache_path).load_data()
+    assert np.allclose(data.class_args, [12, 3, 12, 3])
+
+
+def test_compiled_OpenImages(tmp_path):
+    (tmp_path / 'class-descriptions-boxable.csv').write_text(
+        '/m/01,Cat\n/m/02,Dog\n')
+    (tmp_path / 'test-annotations-bbox.csv').write_text(
+        'ImageID,Source,LabelName,Confidence,XMin,XMax,YMin,YMax\n'
+        'a,xclick,/m/02,1,0.1,0.5,0.2,0.6\n'
+        'b,xclick,/m/01,1,0.0,0.3,0.1,0.4\n'
+        'a,xclick,/m/01,1,0.2,0.9,0.3,0.7\n')
+    path, cache_path = str(tmp_path), str(tmp_path / 'cache')
+    expected_data = OpenImages(path, 'test').load_data()
+    for repeat_arg in range(2):
+        data_manager = OpenImages(path, 'test', cache_path=cache_path)
+        data = data_manager.load_data()
+        assert_equal_data(data, expected_data)
+        assert data_manager.class_distribution == {
+            'background': 0, 'Cat': 2, 'Dog': 1}
+
+
+def test_compile_annotations(tmp_path):
+    data = [{'image': 'a.jpg', 'boxes': np.array([[0, 0, 1, 1, 2]])},
+            {'image': 'b.jpg', 'boxes': np.zeros((0, 5))},
+            {'image': 'é.jpg', 'boxes': [[0, 0, .5, .5, 1], [0, 0, 1, 1, 3]]}]
+    directory = str(tmp_path / 'annotations')
+    compile_annotations(data, directory, 'signature')
+    assert load_compiled_annotations(directory, 'changed') is None
+    annotations = load_compiled_annotations(directory, 'signature')
+    assert_equal_data(annotations, data)
+    assert np.array_equal(annotations.offsets, [0, 1, 1, 3])
+    assert annotations.to_list()[2]['image'] == 'é.jpg'
+    with pytest.raises(ValueError):
+        compile_annotations([{'image': 'a.jpg', 'mask': None}], directory)
+
+
+def test_compute_sources_signature(tmp_path):
+    filepath = tmp_path / 'annotation.xml'
+    filepath.write_text('annotation')
+    signature = compute_sources_signature([str(filepath)])
+    assert signature == compute_sources_signature([str(filepath)])
+    filepath.write_text('changed annotation')
+    assert signature != compute_sources_signature([str(filepath)])
@@ -0,0 +1,37 @@
+import pytest
+
+
+XML = """<annotation>
+    <filename>{0}.jpg</filename>
+    <size><width>100</width><height>50</height></size>
+    <object>
+        <name>dog</name><difficult>0</difficult>
+        <bndbox><xmin>11</xmin><ymin>6</ymin><xmax>51</xmax><ymax>26</ymax>
+        </bndbox>
+    </object>
+    <object>
+        <name>{1}</name><difficult>1</difficult>
+        <bndbox><xmin>1</xmin><ymin>1</ymin><xmax>21</xmax><ymax>11</ymax>
+        </bndbox>
+    </object>
+</annotation>
+"""
+
+
+def _write_VOC(path, image_names, class_name='cat'):
+    annotations_path = path / 'VOC2007' / 'Annotations'
+    split_path = path / 'VOC2007' / 'ImageSets' / 'Main'
+    annotations_path.mkdir(parents=True, exist_ok=True)
+    split_path.mkdir(parents=True, exist_ok=True)
+    for image_name in image_names:
+        annotation = XML.format(image_name, class_name)
+        (annotations_path / (image_name + '.xml')).write_text(annotation)
+    (split_path / 'test.txt').write_text('\n'.join(image_names) + '\n')
+
+
+@pytest.fixture
+def write_VOC():
+    """Returns a function writing VOC2007 annotations of a ``test`` split
+    with a dog and a difficult box of ``class_name`` per image.
+    """
+    return _write_VOC
@@ -0,0 +1,74 @@
+import json
+
+import numpy as np
+import pytest
+
+from paz.datasets import VOC, CityScapes
+
+
+def write_FAT(path, num_scenes, num_frames):
+    for scene_arg in range(num_scenes):
+        scene_path = path / 'mixed' / ('scene_%d' % scene_arg)
+        scene_path.mkdir(parents=True)
+        for frame_arg in range(num_frames):
+            for side in ['left', 'right']:
+                name = '%06d.%s' % (frame_arg, side)
+                (scene_path / (name + '.jpg')).write_bytes(b'')
+                objects = [{'class': '002_master_chef_can_16k',
+                            'bounding_box': {
+                                'top_left': [frame_arg, scene_arg],
+                                'bottom_right': [100, 200 + frame_arg]}}]
+                objects = objects[:frame_arg % 2]
+                (scene_path / (name + '.json')).write_text(
+                    json.dumps({'objects': objects}))
+
+
+def assert_equal_boxes(data, expected_data):
+    assert len(data) == len(expected_data)
+    for sample, expected_sample in zip(data, expected_data):
+        assert sample['image'] == expected_sample['image']
+        assert np.allclose(sample['boxes'], expected_sample['boxes'])
+
+
+def test_parallel_VOC(tmp_path, write_VOC):
+    write_VOC(tmp_path, ['%06d' % arg for arg in range(10)])
+    path = str(tmp_path) + '/'
+    expected_data = VOC(path, 'test', evaluate=True).load_data()
+    data = VOC(path, 'test', evaluate=True, num_workers=2).load_data()
+    assert_equal_boxes(data, expected_data)
+    for sample, expected_sample in zip(data, expected_data):
+        assert np.array_equal(
+            sample['difficulties'], expected_sample['difficulties'])
+
+
+def test_parallel_FAT(tmp_path):
+    from paz.datasets import FAT
+    write_FAT(tmp_path, 2, 6)
+    path = str(tmp_path) + '/'
+    expected_data = FAT(path).load_data()
+    assert len(expected_data) == 12
+    assert_equal_boxes(FAT(path, num_workers=2).load_data(), expected_data)
+
+
+@pytest.mark.parametrize('num_workers', [0, 2])
+def test_parallel_CityScapes(tmp_path, num_workers):
+    for city_name in ['aachen', 'bremen', 'zurich']:
+        (tmp_path / 'images' / 'val' / city_name).mkdir(parents=True)
+        (tmp_path / 'labels' / 'val' / city_name).mkdir(parents=True)
+        for frame_arg in range(3):
+            name = '%s_%06d' % (city_name, frame_arg)
+            (tmp_path / 'images' / 'val' / city_name /
+             (name + '_leftImg8bit.png')).write_bytes(b'')
+            (tmp_path / 'labels' / 'val' / city_name /
+             (name + '_gtFine_labelIds.png')).write_bytes(b'')
+    data = CityScapes(str(tmp_path / 'images'), str(tmp_path / 'labels'),
+                      'val', num_workers=num_workers).load_data()
+    assert len(data) == 9
+    image_paths = [sample['image_path'] for sample in data]
+    assert image_paths == sorted(image_paths)
+    for sample in data:
+        assert sample['label_path'].endswith('_gtFine_labelIds.png')
+        image_name = sample['image_path'].split('/')[-1]
+        label_name = sample['label_path'].split('/')[-1]
+        assert image_name[:-len('_leftImg8bit.png')] == (
+            label_name[:-len('_gtFine_labelIds.png')])
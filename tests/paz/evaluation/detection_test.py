@@ -0,0 +1,112 @@
+import numpy as np
+import pytest
+from paz.evaluation.detection import match_image_detections
+from paz.evaluation.detection import load_ground_truths
+from paz.evaluation.detection import calculate_average_precisions
+from paz.evaluation import evaluate_detections, DetectionEvaluator
+from paz.evaluation import COCO_IOU_THRESHOLDS
+
+
+@pytest.fixture
+def ground_truth():
+    boxes = np.array([[0, 0, 9, 9, 1],
+                      [20, 20, 29, 29, 1],
+                      [40, 40, 49, 49, 2]], dtype=float)
+    sample = {'boxes': boxes, 'difficulties': [False, True, False]}
+    return load_ground_truths([sample])[0]
+
+
+@pytest.fixture
+def detection():
+    boxes = np.array([[0, 0, 9, 9],
+                      [0, 0, 9, 7],
+                      [20, 20, 29, 29],
+                      [40, 40, 49, 49],
+                      [60, 60, 69, 69]], dtype=np.float32)
+    class_args = np.array([1, 1, 1, 1, 2])
+    scores = np.array([0.6, 0.9, 0.5, 0.8, 0.7], dtype=np.float32)
+    return boxes, class_args, scores
+
+
+def test_match_image_detections(detection, ground_truth):
+    class_args, scores, matches = match_image_detections(
+        detection, ground_truth, [0.5, 0.9])
+    assert np.allclose(class_args, [1, 1, 1, 1, 2])
+    assert np.allclose(scores, [0.9, 0.8, 0.6, 0.5, 0.7])
+    # duplicated and wrongly classified boxes are false positives
+    assert np.allclose(matches[0], [1, 0, 0, -1, 0])
+    # at a high IoU only the exact box matches the first ground truth
+    assert np.allclose(matches[1], [0, 0, 1, -1, 0])
+
+
+def test_match_image_detections_empty(ground_truth):
+    detection = (np.zeros((0, 4)), np.zeros(0, int), np.zeros(0))
+    class_args, scores, matches = match_image_detections(
+        detection, ground_truth, [0.5])
+    assert matches.shape == (1, 0)
+
+
+def test_evaluate_detections(detection, ground_truth):
+    result = evaluate_detections(
+        [detection], [ground_truth], 2, [0.5, 0.9])
+    assert result['ap'].shape == (2, 3)
+    assert np.allclose(result['ap'][:, 1], [1.0, 1.0 / 3.0])
+    assert np.allclose(result['ap'][:, 2], [0.0, 0.0])
+    assert np.allclose(result['map'], np.nanmean(result['ap'], axis=1))
+    assert np.isclose(result['mean_map'], np.mean(result['map']))
+
+
+def random_dataset(num_images, num_classes, seed=777):
+    random_state = np.random.RandomState(seed)
+    detections, ground_truths = [], []
+    for image_arg in range(num_images):
+        num_boxes = random_state.randint(0, 5)
+        min_xy = random_state.uniform(0, 100, (num_boxes, 2))
+        boxes = np.concatenate([min_xy, min_xy + 20], axis=1).round()
+        class_args = random_state.randint(1, num_classes + 1, num_boxes)
+        difficulties = random_state.uniform(size=num_boxes) < 0.1
+        ground_truths.append((boxes, class_args, difficulties))
+        box_args = random_state.randint(0, max(num_boxes, 1), num_boxes)
+        noise = random_state.normal(0, 4, (num_boxes, 4))
+        predicted_boxes = (boxes[box_args] + noise).astype(np.float32)
+        scores = random_state.uniform(size=num_boxes).astype(np.float32)
+        detections.append((predicted_boxes, class_args[box_args], scores))
+    return detections, ground_truths
+
+
+def test_calculate_average_precisions():
+    precision = [None, np.array([1.0, 0.5, 2.0 / 3.0]), np.zeros(0), None]
+    recall = [None, np.array([0.5, 0.5, 1.0]), np.zeros(0), None]
+    average_precisions = calculate_average_precisions(precision, recall)
+    assert np.allclose(average_precisions, [np.nan, 5.0 / 6.0, 0.0, np.nan],
+                       equal_nan=True)
+    average_precisions = calculate_average_precisions(
+        precision, recall, use_07_metric=True)
+    assert np.allclose(average_precisions[1:3], [(6 + 5 * 2 / 3) / 11, 0])
+
+
+def test_detection_evaluator_merge():
+    detections, ground_truths = random_dataset(40, 3)
+    evaluators = [DetectionEvaluator(3, COCO_IOU_THRESHOLDS, capacity=1),
+                  DetectionEvaluator(3, COCO_IOU_THRESHOLDS, capacity=1)]
+    for image_arg, sample in enumerate(zip(detections, ground_truths)):
+        evaluators[image_arg % 2].update(*sample)
+    result = evaluators[0].merge(evaluators[1]).result()
+    expected_result = evaluate_detections(
+        detections, ground_truths, 3, COCO_IOU_THRESHOLDS)
+    assert evaluators[0].num_images == 40
+    assert np.allclose(result['ap'], expected_result['ap'], equal_nan=True)
+    assert np.isclose(result['mean_map'], expected_result['mean_map'])
+
+
+def test_detection_evaluator_streaming(detection, ground_truth):
+    evaluator = DetectionEvaluator(2, [0.5, 0.9])
+    evaluator.update(detection, ground_truth)
+    assert np.allclose(evaluator.result()['ap'][:, 1], [1.0, 1.0 / 3.0])
+    evaluator.update(detection, ground_truth)
+    assert evaluator.num_predictions == 10
+    assert evaluator.matches.dtype == np.int8
+    evaluator.reset()
+    assert evaluator.num_predictions == 0
+    with pytest.raises(ValueError):
+        evaluator.merge(DetectionEvaluator(3, [0.5, 0.9]))
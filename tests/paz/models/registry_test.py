@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+from tensorflow.keras.layers import Input, Dense
+from tensorflow.keras.models import Model
+
+from paz.models import get_model, preload_models, clear_models
+from paz.models import warm_up_model, WeightsFile
+
+
+def DenseModel(num_units=4, input_shape=(3,), weights=None):
+    inputs = Input(input_shape)
+    outputs = Dense(num_units)(inputs)
+    return Model(inputs, outputs, name='dense_model')
+
+
+@pytest.fixture(autouse=True)
+def empty_registry():
+    clear_models()
+    yield
+    clear_models()
+
+
+@pytest.fixture
+def weights_path(tmp_path):
+    model = DenseModel()
+    filepath = str(tmp_path / 'dense_model_weights.hdf5')
+    model.save_weights(filepath)
+    return filepath, model.get_weights()
+
+
+def test_get_model_returns_same_instance():
+    model = get_model(DenseModel, 4)
+    assert get_model(DenseModel, 4) is model
+    assert get_model(DenseModel) is model
+    assert get_model(DenseModel, num_units=4, input_shape=[3]) is model
+
+
+def test_get_model_with_different_arguments():
+    model = get_model(DenseModel, 4)
+    assert get_model(DenseModel, 5) is not model
+    assert get_model(DenseModel, input_shape=(2,)) is not model
+
+
+def test_get_model_loads_weights(weights_path):
+    filepath, weights = weights_path
+    model = get_model(DenseModel, weights_path=filepath)
+    for values, loaded_values in zip(weights, model.get_weights()):
+        assert np.allclose(values, loaded_values)
+    assert get_model(DenseModel) is not model
+
+
+def test_clear_models():
+    model = get_model(DenseModel)
+    clear_models()
+    assert get_model(DenseModel) is not model
+
+
+def test_preload_models(weights_path):
+    filepath, weights = weights_path
+    models = preload_models([
+        (DenseModel, (4,), {}),
+        (DenseModel, (4,), {'weights_path': filepath}),
+        (DenseModel, (), {'num_units': 2})], warm_up=True)
+    assert len(models) == 3
+    assert get_model(DenseModel, 4) is models[0]
+    assert get_model(DenseModel, weights_path=filepath) is models[1]
+    assert get_model(DenseModel, 2) is models[2]
+
+
+def test_warm_up_model():
+    warm_up_model(DenseModel())
+    warm_up_model(object())
+
+
+def test_weights_file_defaults():
+    weights_file = WeightsFile('weights.hdf5', 'https://url/weights.hdf5')
+    assert weights_file.cache_subdir == 'paz/models'
@@ -121,3 +121,11 @@ def test_negative_classification_loss(y_true, y_pred, loss,
         negative_classification_loss, dtype='float32')
     assert np.allclose(
         negative_classification_loss, target_negative_classification_loss)
+
+
+def test_sparse_multiboxloss(y_true, y_pred, target_multibox_loss):
+    class_args = np.argmax(y_true[:, :, 4:], axis=-1)[..., None]
+    sparse_y_true = np.concatenate([y_true[:, :, :4], class_args], axis=-1)
+    sparse_loss = MultiBoxLoss(sparse_labels=True)
+    total_loss = sparse_loss.compute_loss(sparse_y_true, y_pred)
+    assert np.allclose(float(total_loss), target_multibox_loss)
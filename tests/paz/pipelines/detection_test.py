@@ -14,6 +14,12 @@ from paz.pipelines import (
 from paz.pipelines import HaarCascadeFrontalFace
 from paz.pipelines import DetectFaceKeypointNet2D32
 from paz.pipelines import DetectMiniXceptionFER
+from paz.pipelines import SSDPreprocess, EfficientDetPreprocess
+from paz.pipelines import EfficientDetPostprocess
+from paz.pipelines import AugmentDetection
+from paz.pipelines import DetectSingleShot
+from paz.abstract import ProcessingSequence
+from paz import processors as pr
 from paz.abstract.messages import Box2D
 
 
@@ -268,6 +274,22 @@ def test_SSD512YCBVideo(image_with_tools, boxes_SSD512YCBVideo):
     assert_inferences(detector, image_with_tools, boxes_SSD512YCBVideo)
 
 
+def test_SSD300VOC_predict_batch(image_with_everyday_objects,
+                                 boxes_SSD300VOC):
+    detector = SSD300VOC(draw=False)
+    images = [image_with_everyday_objects, image_with_everyday_objects]
+    inferences = detector.predict_batch(images)
+    assert len(inferences) == len(images)
+    for inference in inferences:
+        predicted_boxes2D = inference['boxes2D']
+        assert len(predicted_boxes2D) == len(boxes_SSD300VOC)
+        for box2D, predicted_box2D in zip(boxes_SSD300VOC, predicted_boxes2D):
+            assert np.allclose(
+                box2D.coordinates, predicted_box2D.coordinates, atol=1)
+            assert np.allclose(box2D.score, predicted_box2D.score, atol=1e-4)
+            assert (box2D.class_name == predicted_box2D.class_name)
+
+
 # TODO: OpenCV is not deterministic with it's output
 def test_HaarCascadeFrontalFace(image_with_faces, boxes_HaarCascadeFace):
     cv2.ocl.setUseOpenCL(False)
@@ -294,6 +316,23 @@ def test_boxes_DetectFaceKeypointNet2D32(image_with_faces,
     assert_inferences(detector, image_with_faces, boxes_FaceKeypointNet2D32)
 
 
+def test_DetectMiniXceptionFER_batch(image_with_faces, boxes_MiniXceptionFER):
+    cv2.ocl.setUseOpenCL(False)
+    cv2.setNumThreads(1)
+    cv2.setRNGSeed(777)
+    detector = DetectMiniXceptionFER(batch=True)
+    assert_inferences(detector, image_with_faces, boxes_MiniXceptionFER)
+
+
+def test_boxes_DetectFaceKeypointNet2D32_batch(image_with_faces,
+                                               boxes_FaceKeypointNet2D32):
+    cv2.ocl.setUseOpenCL(False)
+    cv2.setNumThreads(1)
+    cv2.setRNGSeed(777)
+    detector = DetectFaceKeypointNet2D32(batch=True)
+    assert_inferences(detector, image_with_faces, boxes_FaceKeypointNet2D32)
+
+
 @pytest.mark.parametrize(('detection_pipeline, boxes_EFFICIENTDETDXCOCO'),
                          [
                             (EFFICIENTDETD0COCO, boxes_EFFICIENTDETD0COCO),
@@ -312,3 +351,81 @@ def test_EFFICIENTDETDXCOCO(
     boxes_EFFICIENTDETDXCOCO = boxes_EFFICIENTDETDXCOCO()
     assert_inferences(
         detector, image_with_multiple_objects, boxes_EFFICIENTDETDXCOCO)
+
+
+def test_EFFICIENTDETD0COCO_built_twice(image_with_multiple_objects):
+    # both pipelines share the model of the registry
+    boxes2D = EFFICIENTDETD0COCO()(image_with_multiple_objects)['boxes2D']
+    detector = EFFICIENTDETD0COCO()
+    assert_inferences(detector, image_with_multiple_objects, boxes2D)
+
+
+class InputShapeModel(object):
+    def __init__(self, input_shape):
+        self.input_shape = input_shape
+
+
+def test_DetectSingleShot_custom_postprocess_without_batch():
+    model = InputShapeModel((None, 32, 32, 3))
+    detect = DetectSingleShot(model, ['a', 'b'], 0.5, 0.45,
+                              postprocess=lambda outputs: [])
+    image = np.zeros((32, 32, 3), dtype=np.uint8)
+    with pytest.raises(ValueError):
+        detect.predict_batch([image])
+
+
+def test_EfficientDetPostprocess_keeps_model_prior_boxes():
+    model = InputShapeModel((None, 32, 32, 3))
+    model.prior_boxes = np.random.uniform(0, 1, (10, 4))
+    prior_boxes = model.prior_boxes.copy()
+    for repeat_arg in range(2):
+        postprocess = EfficientDetPostprocess(model, ['a', 'b'], 0.5, 0.45)
+        decode = postprocess.postprocess.processors[1]
+        assert np.allclose(decode.prior_boxes, prior_boxes * 32)
+    assert np.array_equal(model.prior_boxes, prior_boxes)
+
+
+def test_SSDPreprocess_float32():
+    model = InputShapeModel((None, 32, 32, 3))
+    image = np.random.randint(0, 256, (60, 80, 3)).astype('uint8')
+    preprocess = SSDPreprocess(model, dtype=np.float32, reuse_buffer=True)
+    values = preprocess(image)
+    assert values.dtype == np.float32
+    assert values is preprocess(image)
+    assert np.allclose(values, SSDPreprocess(model)(image), atol=1e-4)
+
+
+def test_EfficientDetPreprocess_float32():
+    model = InputShapeModel((None, 32, 32, 3))
+    image = np.random.randint(0, 256, (60, 80, 3)).astype('uint8')
+    preprocess = EfficientDetPreprocess(
+        model, dtype=np.float32, reuse_buffer=True)
+    values, scale = preprocess(image)
+    default_values, default_scale = EfficientDetPreprocess(model)(image)
+    assert values.dtype == np.float32
+    assert np.allclose(values, default_values, atol=1e-4)
+    assert np.allclose(scale, default_scale)
+
+
+def test_AugmentDetection_batch_boxes(tmp_path):
+    prior_boxes = np.random.uniform(0.0, 0.5, (50, 4)).astype(np.float32)
+    prior_boxes[:, 2:] = prior_boxes[:, 2:] + 0.5
+    data = []
+    for sample_arg in range(3):
+        image_path = str(tmp_path / ('image_%d.png' % sample_arg))
+        cv2.imwrite(image_path, np.full((64, 48, 3), sample_arg, np.uint8))
+        boxes = np.array([[0.1, 0.1, 0.6, 0.7, 1.0],
+                          [0.3, 0.2, 0.9, 0.9, sample_arg + 2.0]])
+        data.append({'image': image_path, 'boxes': boxes})
+    sequences = []
+    for batch_boxes in [False, True]:
+        augmentator = AugmentDetection(
+            prior_boxes, pr.TEST, 5, 32, batch_boxes=batch_boxes)
+        sequences.append(ProcessingSequence(augmentator, 2, data))
+    assert sequences[0].batch_processors == {}
+    assert 'boxes' in sequences[1].batch_processors
+    for batch_arg in range(len(sequences[0])):
+        inputs, labels = sequences[0][batch_arg]
+        batch_inputs, batch_labels = sequences[1][batch_arg]
+        assert np.allclose(inputs['image'], batch_inputs['image'])
+        assert np.allclose(labels['boxes'], batch_labels['boxes'], atol=1e-5)
@@ -4,6 +4,8 @@ import numpy as np
 from tensorflow.keras.utils import get_file
 from paz.backend.image import load_image
 from paz.applications import HigherHRNetHumanPose2D
+from paz.models import HigherHRNet
+from paz.pipelines.heatmaps import GetHeatmapsAndTags
 
 
 @pytest.fixture
@@ -148,3 +150,41 @@ def test_DetectHumanPose2D_multi_person(image_with_multi_person,
     inferences = detect(image_with_multi_person)
     assert np.allclose(inferences['scores'], labeled_scores_multi_person)
     assert np.allclose(inferences['keypoints'], labeled_joint_multi_person)
+
+
+def test_GetHeatmapsAndTags_batch_flip(flipped_joint_order):
+    model = HigherHRNet(weights=None)
+    image = np.random.rand(1, 128, 128, 3).astype('float32')
+    get_heatmaps_and_tags = GetHeatmapsAndTags(
+        model, flipped_joint_order, True, False)
+    heatmaps, tags = get_heatmaps_and_tags(image)
+    get_heatmaps_and_tags = GetHeatmapsAndTags(
+        model, flipped_joint_order, True, False, batch_flip=True)
+    batch_heatmaps, batch_tags = get_heatmaps_and_tags(image)
+    for output, batch_output in zip(heatmaps, batch_heatmaps):
+        assert np.allclose(output, batch_output, atol=1e-5)
+    for output, batch_output in zip(tags, batch_tags):
+        assert np.allclose(output, batch_output, atol=1e-5)
+
+
+class ChannelsFirstModel(object):
+    def __init__(self, model):
+        self.model = model
+
+    def __call__(self, x):
+        outputs = self.model(x)
+        return [np.transpose(output.numpy(), [0, 3, 1, 2])
+                for output in outputs]
+
+
+def test_GetHeatmapsAndTags_axes(flipped_joint_order):
+    model = HigherHRNet(weights=None)
+    image = np.random.rand(1, 128, 128, 3).astype('float32')
+    heatmaps, tags = GetHeatmapsAndTags(
+        model, flipped_joint_order, True, False)(image)
+    get_heatmaps_and_tags = GetHeatmapsAndTags(
+        ChannelsFirstModel(model), flipped_joint_order, True, False,
+        axes=[0, 1, 2, 3])
+    first_heatmaps, first_tags = get_heatmaps_and_tags(image)
+    assert np.allclose(heatmaps, first_heatmaps, atol=1e-5)
+    assert np.allclose(tags, first_tags, atol=1e-5)
@@ -134,3 +134,17 @@ def test_MinimalHandPoseEstimation(image, keypoints3D, keypoints2D,
         inferences['absolute_angles'], absolute_angles, rtol=1e-03)
     assert np.allclose(
         inferences['relative_angles'], relative_angles, rtol=1e-03)
+
+
+def test_MinimalHandPoseEstimation_predict_batch(
+        image, keypoints3D, keypoints2D, absolute_angles, relative_angles):
+    detect = MinimalHandPoseEstimation(draw=False)
+    batch_inferences = detect.predict_batch([image, image.copy()])
+    assert len(batch_inferences) == 2
+    for inferences in batch_inferences:
+        assert np.allclose(inferences['keypoints3D'], keypoints3D, rtol=1e-03)
+        assert np.allclose(inferences['keypoints2D'], keypoints2D, rtol=1e-03)
+        assert np.allclose(
+            inferences['absolute_angles'], absolute_angles, rtol=1e-03)
+        assert np.allclose(
+            inferences['relative_angles'], relative_angles, rtol=1e-03)
@@ -7,6 +7,8 @@ from paz.abstract import Box2D, Pose6D
 from paz.backend.image import load_image
 from paz.backend.camera import Camera
 from paz.pipelines import PIX2YCBTools6D
+from paz.pipelines import SingleInstancePIX2POSE6D
+from paz.pipelines import MultiInstanceMultiClassPIX2POSE6D
 
 
 @pytest.fixture
@@ -81,3 +83,17 @@ def test_PIX2YCBTools6D(image_with_YCB_objects, true_boxes2D, true_poses6D):
     inferences = pipeline(image_with_YCB_objects)
     assert_boxes2D(true_boxes2D, inferences['boxes2D'])
     assert_poses6D(true_poses6D, inferences['poses6D'])
+
+
+@pytest.mark.parametrize('sampling', ['confidence', 'random'])
+def test_PIX2POSE6D_rejects_invalid_sampling(sampling):
+    camera = Camera()
+    camera.intrinsics_from_HFOV(55, (480, 640))
+    object_sizes = np.array([0.1, 0.1, 0.1])
+    with pytest.raises(ValueError):
+        SingleInstancePIX2POSE6D(
+            None, object_sizes, camera, max_points=100, sampling=sampling)
+    with pytest.raises(ValueError):
+        MultiInstanceMultiClassPIX2POSE6D(
+            None, {'tool': None}, {'tool': object_sizes}, camera,
+            [0.25, 0.25], max_points=100, sampling=sampling)
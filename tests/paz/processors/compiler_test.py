@@ -0,0 +1,119 @@
+import numpy as np
+import pytest
+
+from paz.abstract import SequentialProcessor, Processor
+from paz import processors as pr
+from paz.pipelines import SSDPreprocess, EfficientDetPreprocess
+from paz.pipelines import PreprocessImage
+
+
+class Model(object):
+    def __init__(self, input_shape):
+        self.input_shape = input_shape
+
+
+class DummyPredict(Processor):
+    def __init__(self):
+        super(DummyPredict, self).__init__()
+
+    def call(self, x):
+        return x / 255.0
+
+
+@pytest.fixture
+def image():
+    return np.random.randint(0, 256, (60, 80, 3)).astype('uint8')
+
+
+def get_names(pipeline):
+    return [processor.name for processor in pipeline.processors]
+
+
+def compile_and_check(pipeline):
+    compiled_pipeline = pr.compile_pipeline(pipeline)
+    assert type(compiled_pipeline) is type(pipeline)
+    assert compiled_pipeline is not pipeline
+    assert compiled_pipeline.processors is not pipeline.processors
+    return compiled_pipeline
+
+
+def test_fuse_SSD_preprocess(image):
+    pipeline = SSDPreprocess(Model((None, 32, 32, 3)))
+    compiled_pipeline = compile_and_check(pipeline)
+    assert get_names(compiled_pipeline) == [
+        'ResizeImage', 'ConvertColorSpace',
+        'Fused(SubtractMeanImage+CastImage+ExpandDims)']
+    assert np.allclose(pipeline(image), compiled_pipeline(image))
+    assert compiled_pipeline(image).dtype == pipeline(image).dtype
+
+
+def test_fuse_EfficientDet_preprocess(image):
+    pipeline = EfficientDetPreprocess(Model((None, 64, 64, 3)))
+    compiled_pipeline = compile_and_check(pipeline)
+    assert isinstance(compiled_pipeline.processors[0], pr.FuseElementwise)
+    assert isinstance(compiled_pipeline.processors[1], pr.ScaledResize)
+    outputs, compiled_outputs = pipeline(image), compiled_pipeline(image)
+    assert np.allclose(outputs[0], compiled_outputs[0])
+    assert np.allclose(outputs[1], compiled_outputs[1])
+
+
+def test_fuse_preprocess_image(image):
+    pipeline = PreprocessImage((32, 32), pr.BGR_IMAGENET_MEAN)
+    compiled_pipeline = compile_and_check(pipeline)
+    assert np.allclose(pipeline(image), compiled_pipeline(image))
+
+
+def test_fuse_mask_postprocessing(image):
+    pipeline = SequentialProcessor([
+        pr.NormalizeImage(), pr.ExpandDims(0), DummyPredict(), pr.Squeeze(0),
+        pr.ReplaceLowerThanThreshold(0.1), pr.DenormalizeImage(),
+        pr.CastImage('uint8')])
+    compiled_pipeline = pr.compile_pipeline(pipeline)
+    assert len(compiled_pipeline.processors) == 3
+    assert np.array_equal(pipeline(image), compiled_pipeline(image))
+
+
+def test_fuse_nested_pipelines(image):
+    inner_pipeline = SequentialProcessor(
+        [pr.CastImage('float32'), pr.NormalizeImage()])
+    pipeline = SequentialProcessor([pr.ResizeImage((16, 16)), inner_pipeline])
+    compiled_pipeline = pr.compile_pipeline(pipeline)
+    assert len(compiled_pipeline.processors[1].processors) == 1
+    assert len(inner_pipeline.processors) == 2
+    outputs = compiled_pipeline(image)
+    assert outputs.dtype == np.float32
+    assert np.allclose(pipeline(image), outputs)
+
+
+def test_fallback_for_non_elementwise_processors(image):
+    pipeline = SequentialProcessor([pr.ExpandDims(0), pr.Squeeze(0)])
+    compiled_pipeline = pr.compile_pipeline(pipeline)
+    assert compiled_pipeline.processors == pipeline.processors
+
+
+def test_intermediate_integer_cast_is_not_fused(image):
+    pipeline = SequentialProcessor([
+        pr.NormalizeImage(), pr.CastImage('uint8'), pr.DenormalizeImage()])
+    compiled_pipeline = pr.compile_pipeline(pipeline)
+    assert isinstance(compiled_pipeline.processors[0], pr.FuseElementwise)
+    assert compiled_pipeline.processors[1] is pipeline.processors[2]
+    assert np.array_equal(pipeline(image), compiled_pipeline(image))
+    with pytest.raises(ValueError):
+        pr.FuseElementwise(pipeline.processors)
+
+
+def test_fused_processors_do_not_modify_inputs(image):
+    fused = pr.FuseElementwise([pr.SubtractMeanImage(pr.BGR_IMAGENET_MEAN),
+                                pr.CastImage('float32')])
+    image_copy = image.copy()
+    fused(image)
+    assert np.array_equal(image, image_copy)
+
+
+def test_reuse_buffers(image):
+    fused = pr.FuseElementwise(
+        [pr.CastImage('float32'), pr.NormalizeImage()], reuse_buffers=True)
+    outputs_A = fused(image)
+    outputs_B = fused(image.copy())
+    assert outputs_A is outputs_B
+    assert np.allclose(outputs_B, image / 255.0)
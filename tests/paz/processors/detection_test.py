@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+
+import paz.processors as pr
+from paz.abstract import Box2D, Boxes2D
+
+
+CLASS_NAMES = ['background', 'cat', 'dog']
+
+
+@pytest.fixture
+def box_data():
+    rng = np.random.default_rng(777)
+    boxes = rng.uniform(0.0, 0.6, (50, 2))
+    boxes = np.concatenate([boxes, boxes + rng.uniform(0.1, 0.4, (50, 2))], 1)
+    class_scores = rng.uniform(0.0, 1.0, (50, len(CLASS_NAMES)))
+    return np.concatenate([boxes, class_scores], axis=1)
+
+
+@pytest.fixture
+def image():
+    return np.zeros((240, 320, 3), dtype=np.uint8)
+
+
+def assert_equal_boxes2D(boxes2D, array_boxes2D):
+    assert isinstance(array_boxes2D, Boxes2D)
+    assert len(boxes2D) == len(array_boxes2D)
+    for box2D, array_box2D in zip(boxes2D, array_boxes2D):
+        assert np.array_equal(box2D.coordinates, array_box2D.coordinates)
+        assert np.isclose(box2D.score, array_box2D.score)
+        assert box2D.class_name == array_box2D.class_name
+
+
+@pytest.mark.parametrize('box_method', [0, 1, 2])
+def test_ToBoxes2D_array_backed(box_data, box_method):
+    if box_method == 2:
+        box_data = np.concatenate([box_data[:, :4], np.argmax(
+            box_data[:, 4:], axis=1, keepdims=True)], axis=1)
+    boxes2D = pr.ToBoxes2D(CLASS_NAMES, box_method=box_method)(box_data)
+    array_boxes2D = pr.ToBoxes2D(
+        CLASS_NAMES, box_method=box_method, array_backed=True)(box_data)
+    assert_equal_boxes2D(boxes2D, array_boxes2D)
+
+
+def test_box_processors_array_backed(box_data, image):
+    to_boxes2D = pr.ToBoxes2D(CLASS_NAMES)
+    array_boxes2D = pr.ToBoxes2D(CLASS_NAMES, array_backed=True)(box_data)
+    boxes2D = to_boxes2D(box_data)
+    processors = [
+        pr.FilterClassBoxes2D(['cat', 'dog']), pr.DenormalizeBoxes2D(),
+        pr.OffsetBoxes2D([0.1, 0.05]), pr.SquareBoxes2D(),
+        pr.ClipBoxes2D(), pr.RoundBoxes2D()]
+    for processor in processors:
+        arguments = []
+        if isinstance(processor, (pr.DenormalizeBoxes2D, pr.ClipBoxes2D)):
+            arguments = [image]
+        boxes2D = processor(*arguments, boxes2D)
+        array_boxes2D = processor(*arguments, array_boxes2D)
+        assert_equal_boxes2D(boxes2D, array_boxes2D)
+
+    crops = pr.CropBoxes2D()(image, boxes2D)
+    array_crops = pr.CropBoxes2D()(image, array_boxes2D)
+    for crop, array_crop in zip(crops, array_crops):
+        assert crop.shape == array_crop.shape
+
+    draw = pr.DrawBoxes2D(CLASS_NAMES, weighted=True)
+    assert np.array_equal(draw(image.copy(), boxes2D),
+                          draw(image.copy(), array_boxes2D))
+
+
+def test_box_processors_accept_Box2D_views(box_data, image):
+    array_boxes2D = pr.ToBoxes2D(CLASS_NAMES, array_backed=True)(box_data)
+    boxes2D = pr.ToBoxes2D(CLASS_NAMES)(box_data)
+    processors = [pr.DenormalizeBoxes2D(), pr.SquareBoxes2D()]
+    for processor in processors:
+        arguments = [image] if processor.name == 'DenormalizeBoxes2D' else []
+        boxes2D = processor(*arguments, boxes2D)
+        # lists of views are transformed by the per box implementation
+        box2D_views = list(array_boxes2D)
+        assert all(isinstance(box2D, Box2D) for box2D in box2D_views)
+        processor(*arguments, box2D_views)
+        assert_equal_boxes2D(boxes2D, array_boxes2D)
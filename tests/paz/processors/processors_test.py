@@ -2,6 +2,7 @@ import pytest
 import numpy as np
 
 import paz.processors as pr
+from paz.abstract import Box2D
 
 
 @pytest.fixture
@@ -99,6 +100,19 @@ def test_ArgumentsToImagePoints2D():
     assert np.allclose(image_points2D, np.array([[3, 66], [44, 0], [6, 5]]))
 
 
+def test_ChangeKeypointsCoordinateSystemBatch():
+    keypoints = np.random.rand(3, 5, 2)
+    boxes2D = [Box2D([10, 20, 30, 40], 1.0),
+               Box2D([0, 5, 15, 25], 1.0),
+               Box2D([7, 3, 9, 8], 1.0)]
+    change_coordinates = pr.ChangeKeypointsCoordinateSystem()
+    targets = [change_coordinates(keypoints_per_box.copy(), box2D)
+               for keypoints_per_box, box2D in zip(keypoints, boxes2D)]
+    change_coordinates_batch = pr.ChangeKeypointsCoordinateSystemBatch()
+    values = change_coordinates_batch(keypoints.copy(), boxes2D)
+    assert np.allclose(values, np.array(targets))
+
+
 def test_UnwrapDictionary():
     dictionary = {'a': 1, 'b': 2, 'c': 3}
     unwrap = pr.UnwrapDictionary(['b', 'a', 'c'])
@@ -110,3 +124,58 @@ def test_Scale(object_sizes):
     values = np.array([1.0, 0.5, 0.25])
     scaled_values = scale(values)
     assert np.allclose(scaled_values, values * object_sizes)
+
+
+def test_TopKDetections_numpy():
+    heatmaps = np.random.rand(1, 17, 64, 48).astype(np.float32)
+    tags = np.random.rand(1, 17, 64, 48, 2).astype(np.float32)
+    numpy_detections = pr.TopKDetections(30, use_numpy=True)(heatmaps, tags)
+    tensorflow_detections = pr.TopKDetections(30)(heatmaps, tags)
+    assert np.allclose(numpy_detections, tensorflow_detections)
+
+
+def test_ScaleOutput_channels_last():
+    outputs = [np.random.rand(1, 16, 24, 34).astype('float32'),
+               np.random.rand(1, 32, 48, 17).astype('float32')]
+    channels_first = [np.transpose(output, [0, 3, 1, 2]) for output in outputs]
+    scaled = pr.ScaleOutput(2, full_scaling=True)(channels_first)
+    scaled_last = pr.ScaleOutput(2, True, channels_last=True)(list(outputs))
+    for output, output_last in zip(scaled, scaled_last):
+        assert np.allclose(output, np.transpose(output_last, [0, 3, 1, 2]))
+    assert scaled[0].shape == (1, 34, 32, 48)
+
+
+def test_GetHeatmapsAndTags_channels_last():
+    order = [0, 2, 1, 4, 3]
+    outputs = [np.random.rand(1, 8, 8, 10), np.random.rand(1, 8, 8, 5)]
+    channels_first = [np.transpose(output, [0, 3, 1, 2]) for output in outputs]
+    for with_flip in [False, True]:
+        heatmaps = pr.GetHeatmaps(order)(channels_first, with_flip)
+        heatmaps_last = pr.GetHeatmaps(order, True)(outputs, with_flip)
+        assert np.allclose(heatmaps, np.transpose(heatmaps_last, [0, 3, 1, 2]))
+        tags = pr.GetTags(order)(channels_first, with_flip)
+        tags_last = pr.GetTags(order, True)(outputs, with_flip)
+        assert np.allclose(tags, np.transpose(tags_last, [0, 3, 1, 2]))
+
+
+def test_StandardizeImage_reuse_buffer():
+    standardize = pr.StandardizeImage(
+        pr.BGR_IMAGENET_MEAN, expand_dims=True, reuse_buffer=True)
+    image_A = np.random.randint(0, 256, (8, 8, 3)).astype(np.uint8)
+    image_B = np.random.randint(0, 256, (8, 8, 3)).astype(np.uint8)
+    values_A = standardize(image_A)
+    values_B = standardize(image_B)
+    assert values_A is values_B
+    assert values_B.shape == (1, 8, 8, 3)
+    assert values_B.dtype == np.float32
+    assert np.allclose(values_B[0], image_B - pr.BGR_IMAGENET_MEAN)
+
+
+def test_ScaledResize_reuse_buffer():
+    scaled_resize = pr.ScaledResize(32, np.float32, reuse_buffer=True)
+    image_A = np.random.rand(64, 48, 3).astype(np.float32)
+    image_B = np.random.rand(48, 64, 3).astype(np.float32)
+    values_A, scale_A = scaled_resize(image_A)
+    values_B, scale_B = scaled_resize(image_B)
+    assert values_A is values_B
+    assert np.allclose(values_B, pr.ScaledResize(32)(image_B)[0])
@@ -0,0 +1,69 @@
+import subprocess
+import sys
+
+import pytest
+
+from paz.utils.lazy import lazy_attributes
+
+
+def imports_tensorflow(module_name):
+    script = 'import sys, {}; print("tensorflow" in sys.modules)'
+    outputs = subprocess.run(
+        [sys.executable, '-c', script.format(module_name)],
+        stdout=subprocess.PIPE, check=True)
+    return outputs.stdout.decode().strip() == 'True'
+
+
+@pytest.mark.parametrize('module_name', [
+    'paz.backend.boxes', 'paz.backend.image', 'paz.abstract',
+    'paz.processors', 'paz.pipelines', 'paz.applications'])
+def test_import_without_tensorflow(module_name):
+    assert not imports_tensorflow(module_name)
+
+
+def test_lazy_attributes():
+    __getattr__, __dir__ = lazy_attributes(
+        'paz.processors', {'.munkres': ['Munkres']})
+    from paz.processors.munkres import Munkres
+    assert __getattr__('Munkres') is Munkres
+    assert 'Munkres' in __dir__()
+    with pytest.raises(AttributeError):
+        __getattr__('NotAProcessor')
+
+
+def test_lazy_processors_and_pipelines():
+    from paz import processors as pr
+    from paz import pipelines
+    from paz.processors.heatmaps import GetHeatmaps
+    from paz.pipelines.detection import SSDPreprocess
+    assert pr.GetHeatmaps is GetHeatmaps
+    assert pipelines.SSDPreprocess is SSDPreprocess
+    assert pipelines.detection.SSDPreprocess is SSDPreprocess
+
+
+def run_script(script):
+    outputs = subprocess.run(
+        [sys.executable, '-c', script], stdout=subprocess.PIPE, check=True)
+    return outputs.stdout.decode().strip()
+
+
+def test_from_import_of_lazy_attribute():
+    script = ('from paz.applications import SSD512COCO\n'
+              'from paz.pipelines import SSDPreprocess\n'
+              'from paz.pipelines.detection import SSD512COCO as pipeline\n'
+              'print(SSD512COCO is pipeline)')
+    assert run_script(script) == 'True'
+
+
+@pytest.mark.parametrize('module_name, attributes', [
+    ('paz.applications', ['SSD512COCO', 'PIX2YCBTools6D']),
+    ('paz.pipelines', ['SSD512COCO', 'SSDPreprocess']),
+    ('paz.processors', ['GetHeatmaps', 'ToBoxes2D']),
+    ('paz.abstract', ['Box2D', 'ProcessingSequence'])])
+def test_star_import_of_lazy_attributes(module_name, attributes):
+    script = ('from {} import *\n'
+              'names = dir()\n'
+              'print(all(name in names for name in {}))\n'
+              'print("lazy_attributes" in names)')
+    assert run_script(script.format(module_name, attributes)).split() == [
+        'True', 'False']
@@ -0,0 +1,147 @@
+import os
+import json
+
+import numpy as np
+import pytest
+from tensorflow.keras.layers import Input, Dense
+from tensorflow.keras.models import Model
+
+from paz.utils.weights import WeightsStore, compute_file_hash
+from paz.utils.weights import get_weights_store, set_weights_store
+from paz.utils.weights import get_weights_file, load_weights, main
+from paz.utils.weights import prefetch_applications
+from paz.backend.camera import Camera
+from paz import applications
+
+
+URL = 'https://github.com/oarriaga/altamira-data/releases/download/'
+
+
+def DenseModel():
+    inputs = Input((3,))
+    outputs = Dense(4)(inputs)
+    return Model(inputs, outputs, name='dense_model')
+
+
+@pytest.fixture(autouse=True)
+def default_store():
+    set_weights_store(None)
+    yield
+    set_weights_store(None)
+
+
+@pytest.fixture
+def weights_file(tmp_path):
+    directory = tmp_path / 'source'
+    directory.mkdir()
+    model = DenseModel()
+    filepath = str(directory / 'dense_weights.hdf5')
+    model.save_weights(filepath)
+    return filepath, model.get_weights()
+
+
+def test_resolve_file_in_store_directory(tmp_path):
+    directory = tmp_path / 'store' / 'paz' / 'models'
+    directory.mkdir(parents=True)
+    filepath = directory / 'weights.hdf5'
+    filepath.write_bytes(b'weights')
+    store = WeightsStore(str(tmp_path / 'store'), offline=True)
+    assert store.resolve('weights.hdf5', URL) == str(filepath)
+
+
+def test_offline_store_raises_on_missing_file(tmp_path):
+    store = WeightsStore(str(tmp_path), offline=True)
+    with pytest.raises(FileNotFoundError):
+        store.resolve('missing_weights_of_paz.hdf5', URL)
+
+
+def test_collect_adds_file_to_manifest(tmp_path, weights_file):
+    filepath, weights = weights_file
+    store = WeightsStore(str(tmp_path / 'store'), offline=True)
+    store._find_local_file = lambda filename, cache_subdir: filepath
+    paths = store.prefetch([('dense_weights.hdf5', URL, 'paz/models')])
+    store_path = str(tmp_path / 'store' / 'paz' / 'models' /
+                     'dense_weights.hdf5')
+    assert paths == [store_path]
+    with open(store.manifest_path, 'r') as filedata:
+        manifest = json.load(filedata)
+    assert manifest['dense_weights.hdf5']['sha256'] == (
+        compute_file_hash(filepath))
+    assert WeightsStore(str(tmp_path / 'store')).manifest == manifest
+
+
+def test_verify_file_detects_hash_mismatch(tmp_path):
+    filepath = tmp_path / 'weights.hdf5'
+    filepath.write_bytes(b'weights')
+    store = WeightsStore(str(tmp_path))
+    assert not store.verify_file(str(filepath))
+    store.manifest['weights.hdf5'] = {'sha256': compute_file_hash(filepath)}
+    assert store.verify_file(str(filepath))
+    filepath.write_bytes(b'corrupted weights')
+    with pytest.raises(ValueError):
+        store.verify_file(str(filepath))
+
+
+def test_get_weights_file_uses_current_store(tmp_path):
+    filepath = tmp_path / 'weights.hdf5'
+    filepath.write_bytes(b'weights')
+    store = WeightsStore(str(tmp_path), offline=True)
+    set_weights_store(store)
+    assert get_weights_store() is store
+    assert get_weights_file('weights.hdf5', URL) == str(filepath)
+
+
+@pytest.mark.parametrize('memory_map', [False, True])
+def test_load_weights(weights_file, memory_map):
+    filepath, weights = weights_file
+    set_weights_store(WeightsStore(memory_map=memory_map))
+    for repeat_arg in range(2):
+        model = DenseModel()
+        load_weights(model, filepath)
+        for values, loaded_values in zip(weights, model.get_weights()):
+            assert np.allclose(values, loaded_values)
+    arrays_directory = os.path.splitext(filepath)[0] + '_arrays'
+    assert os.path.isdir(arrays_directory) == memory_map
+
+
+def test_verify_command(tmp_path, capsys):
+    filepath = tmp_path / 'weights.hdf5'
+    filepath.write_bytes(b'weights')
+    store = WeightsStore(str(tmp_path))
+    store.manifest['weights.hdf5'] = {'sha256': compute_file_hash(filepath)}
+    store.manifest['missing.hdf5'] = {'sha256': ''}
+    store._write_manifest()
+    main(['verify', '-d', str(tmp_path)])
+    outputs = capsys.readouterr().out.split('\n')
+    assert outputs[:2] == ['missing  missing.hdf5', 'verified weights.hdf5']
+
+
+built_applications = []
+
+
+class CameraApplication(object):
+    def __init__(self, camera, score_thresh=0.5):
+        self.camera = camera
+        built_applications.append(self)
+
+
+class BrokenApplication(object):
+    def __init__(self, score_thresh=0.5):
+        raise TypeError('error inside the constructor')
+
+
+def test_prefetch_applications_with_camera(tmp_path, monkeypatch):
+    monkeypatch.setattr(applications, 'CameraApplication',
+                        CameraApplication, raising=False)
+    store = WeightsStore(str(tmp_path), offline=True)
+    prefetch_applications(['CameraApplication'], store)
+    assert isinstance(built_applications[-1].camera, Camera)
+
+
+def test_prefetch_applications_raises_constructor_errors(tmp_path,
+                                                         monkeypatch):
+    monkeypatch.setattr(applications, 'BrokenApplication',
+                        BrokenApplication, raising=False)
+    store = WeightsStore(str(tmp_path), offline=True)
+    with pytest.raises(TypeError, match='inside the constructor'):
+        prefetch_applications(['BrokenApplication'], store)